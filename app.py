@@ -1,3 +1,11 @@
+import os  # Para verificar o arquivo de entrada
+import sys  # Para os argumentos da linha de comando e a saída do modo em lote
+import json  # Para ler as instâncias e escrever os resultados (JSON Lines)
+import argparse  # Para o modo em lote (não interativo)
+from src import registro  # Registro dos problemas (os módulos são carregados somente quando escolhidos)
+from src import lote  # Resolução de muitas instâncias em paralelo
+from src import solver  # Para desligar o log do solver no modo em lote
+
 def main():
     while True:
         print("="*50)
@@ -15,16 +23,8 @@ def main():
         print("="*50)
         print("MENU DE PROBLEMAS")
         print("="*50)
-        print("1. Problema da Ração")
-        print("2. Problema da Dieta")
-        print("3. Problema do Plantio")
-        print("4. Problema das Tintas")
-        print("5. Problema do Transporte")
-        print("6. Problema do Fluxo Máximo")
-        print("7. Problema de Escalonamento de Horários")
-        print("8. Problema de Cobertura")
-        print("9. Problema da Mochila")
-        print("10. Problema dos Padrões")
+        for chave, titulo in registro.listar_problemas():
+            print(f"{chave}. {titulo}")  # Menu montado a partir do registro de problemas
         print("0. Sair")
 
         escolha = input("\nDigite o número do problema que deseja executar: ")
@@ -32,35 +32,84 @@ def main():
         if escolha == "0":
             print("Encerrando o programa.")
             break
-        elif escolha == "1":
-            import src.problema_01_racao
-        elif escolha == "2":
-            import src.problema_02_dieta
-        elif escolha == "3":
-            import src.problema_03_plantio
-        elif escolha == "4":
-            import src.problema_04_tintas
-        elif escolha == "5":
-            import src.problema_05_transporte
-        elif escolha == "6":
-            import src.problema_06_fluxo_maximo
-        elif escolha == "7":
-            import src.problema_07_escalonamento
-        elif escolha == "8":
-            import src.problema_08_cobertura
-        elif escolha == "9":
-            import src.problema_09_mochila
-        elif escolha == "10":
-            import src.problema_10_padroes
-        elif escolha == "11":
-            import src.problema_11_facilidades
-        elif escolha == "12":
-            import src.problema_12_frequencia                        
-        elif escolha == "13":
-            import src.problema_13_clique_maxima                        
+        elif escolha in registro.PROBLEMAS:
+            registro.executar_exemplos(escolha)  # Carrega o módulo sob demanda e executa os exemplos
         else:
             print("Opção inválida. Tente novamente.")
 
+# Função que lê as instâncias de um arquivo (ou da entrada padrão, com "-"), uma por vez
+# Aceita JSON Lines (uma instância por linha) ou um arquivo .json com uma lista de instâncias
+def ler_instancias(caminho):
+    arquivo = sys.stdin if caminho == "-" else open(caminho, encoding="utf-8")
+    try:
+        if caminho.endswith(".json"):
+            yield from json.load(arquivo)
+            return
+        for numero, linha in enumerate(arquivo, start=1):
+            if linha.strip():
+                try:
+                    yield json.loads(linha)
+                except json.JSONDecodeError as erro:
+                    raise ValueError(f"{caminho}, linha {numero}: JSON inválido ({erro})") from None
+    finally:
+        if arquivo is not sys.stdin:
+            arquivo.close()
+
+# Função do modo em lote: resolve todas as instâncias, escreve um resultado por linha e um resumo no final
+# (o resumo vai para a saída de erros, para não se misturar aos resultados)
+def executar_lote(argumentos):
+    solver.configurar_solver(mensagens=False, limite_tempo=argumentos.limite_solver)
+    saida = sys.stdout if argumentos.saida == "-" else open(argumentos.saida, "w", encoding="utf-8")
+    resumo = lote.ResumoLote()
+    try:
+        registros = lote.resolver_lote(argumentos.problema, ler_instancias(argumentos.entrada), processos=argumentos.processos,
+                                       timeout=argumentos.timeout, ordem=argumentos.ordem, usar_cache=not argumentos.sem_cache)
+        for registro_instancia in registros:
+            resumo.registrar(registro_instancia)
+            registro_instancia["resultado"] = lote.para_json(registro_instancia["resultado"])
+            saida.write(json.dumps(registro_instancia, ensure_ascii=False) + "\n")
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    dados = resumo.como_dict()
+    print(f"Instâncias: {dados['instancias']} | resolvidas: {dados['ok']} | erros: {dados['erro']} | timeouts: {dados['timeout']}", file=sys.stderr)
+    print(f"Tempo total: {dados['tempo_total']:.2f} s | vazão: {dados['vazao']:.1f} instâncias/s | "
+          f"tempo médio por instância: {dados['tempo_medio'] * 1000:.1f} ms", file=sys.stderr)
+    for identificador, erro in resumo.falhas[:10]:
+        print(f"  Falha na instância {identificador}: {erro}", file=sys.stderr)
+    if len(resumo.falhas) > 10:
+        print(f"  ... e mais {len(resumo.falhas) - 10} falhas", file=sys.stderr)
+    return 1 if resumo.falhas else 0  # Código de saída diferente de zero quando alguma instância falhou
+
+# Função que monta os argumentos da linha de comando do modo em lote
+def criar_parser():
+    parser = argparse.ArgumentParser(description="Sem argumentos abre o menu interativo; com 'lote' resolve muitas instâncias em paralelo.")
+    subcomandos = parser.add_subparsers(dest="comando")
+    parser_lote = subcomandos.add_parser("lote", help="resolve em paralelo as instâncias de um arquivo JSON Lines")
+    parser_lote.add_argument("problema", help="número do problema (1 a 13)")
+    parser_lote.add_argument("entrada", help='arquivo .jsonl (uma instância por linha: {"id", "args", "kwargs"}, lista ou dicionário), .json com uma lista, ou "-" para a entrada padrão')
+    parser_lote.add_argument("-o", "--saida", default="-", help="arquivo JSON Lines dos resultados (padrão: saída padrão)")
+    parser_lote.add_argument("-p", "--processos", type=int, default=None, help="número de processos (padrão: um por núcleo)")
+    parser_lote.add_argument("-t", "--timeout", type=float, default=None, help="tempo limite de cada instância, em segundos")
+    parser_lote.add_argument("--limite-solver", type=float, default=None, help="limite de tempo do solver em cada instância (devolve a melhor solução encontrada)")
+    parser_lote.add_argument("--ordem", choices=lote.ORDENS_LOTE, default="entrada", help="ordem dos resultados: a das instâncias ou a de conclusão")
+    parser_lote.add_argument("--sem-cache", action="store_true", help="não usa o cache de soluções")
+    subcomandos.add_parser("listar", help="lista os problemas disponíveis")
+    return parser
+
 if __name__ == "__main__":
-    main()
+    parser = criar_parser()
+    argumentos = parser.parse_args()
+    if argumentos.comando == "lote":
+        if argumentos.problema not in registro.PROBLEMAS:
+            parser.error(f"problema desconhecido: {argumentos.problema} (use 'listar' para ver os problemas)")
+        if argumentos.entrada != "-" and not os.path.isfile(argumentos.entrada):
+            parser.error(f"arquivo de entrada não encontrado: {argumentos.entrada}")
+        sys.exit(executar_lote(argumentos))
+    elif argumentos.comando == "listar":
+        for chave, titulo in registro.listar_problemas():
+            print(f"{chave}. {titulo}")
+    else:
+        main()
 
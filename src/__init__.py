@@ -0,0 +1 @@
+# Pacote com as soluções dos problemas da lista (cada módulo pode ser importado sem executar nada)
@@ -0,0 +1,203 @@
+# Importa bibliotecas necessárias
+import os  # Para o número de núcleos e o grupo de processos de cada trabalhador
+import time  # Para medir o tempo de cada resolução
+import atexit  # Para encerrar os trabalhadores quando o programa termina
+import asyncio  # API assíncrona (corrotinas) para serviços baseados em asyncio
+import weakref  # Um semáforo por laço de eventos, descartado junto com o laço
+import threading  # Os trabalhadores livres podem ser disputados por laços em threads diferentes
+import multiprocessing  # Cada resolução roda num processo trabalhador, fora do laço de eventos
+from . import registro  # Para localizar o resolvedor de cada problema
+from . import solver  # A configuração do solver de quem chamou vale dentro do trabalhador
+from . import graficos  # Os trabalhadores nunca desenham gráficos
+from .lote import _encerrar_trabalhador  # Encerra o trabalhador e o CBC que ele iniciou (grupo de processos)
+
+# Marcador de "não alterar" (None é um valor válido: sem tempo limite)
+_MANTER = object()
+
+# Função executada em cada processo trabalhador: recebe (função, argumentos, configuração do solver), resolve e
+# devolve (sucesso, resultado ou exceção, tempo) pela conexão, uma tarefa por vez
+def _trabalhador(conexao, usar_cache):
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()  # Grupo próprio: no cancelamento o trabalhador e o CBC que ele iniciou são encerrados juntos
+    graficos.desligar_graficos()  # Sem esperar as figuras pendentes, que são do processo pai
+    while True:
+        tarefa = conexao.recv()
+        if tarefa is None:
+            break
+        funcao, args, kwargs, configuracao_solver = tarefa
+        solver.configurar_solver(**configuracao_solver)
+        if not usar_cache:
+            funcao = getattr(funcao, "sem_cache", funcao)
+        inicio = time.perf_counter()
+        try:
+            resultado = funcao(*args, **kwargs)
+            conexao.send((True, resultado, time.perf_counter() - inicio))
+        except Exception as erro:
+            try:
+                conexao.send((False, erro, time.perf_counter() - inicio))
+            except Exception:  # Exceção que não pode ser serializada: vai como texto
+                conexao.send((False, RuntimeError(f"{type(erro).__name__}: {erro}"), time.perf_counter() - inicio))
+
+# Função auxiliar que espera (sem bloquear o laço de eventos) até a conexão ter uma resposta e a lê
+async def _receber(conexao):
+    laco = asyncio.get_running_loop()
+    pronta = laco.create_future()
+    try:
+        laco.add_reader(conexao.fileno(), lambda: pronta.done() or pronta.set_result(None))
+    except NotImplementedError:  # Laço sem add_reader (ProactorEventLoop do Windows): espera numa thread
+        await asyncio.to_thread(conexao.poll, None)
+    else:
+        try:
+            await pronta
+        finally:
+            laco.remove_reader(conexao.fileno())
+    return conexao.recv()
+
+# Classe que resolve problemas em processos trabalhadores a partir de corrotinas: no máximo "processos" resoluções
+# ao mesmo tempo (as demais esperam num semáforo) e, se a corrotina for cancelada ou passar do timeout (segundos,
+# contados depois de conseguir um trabalhador), o trabalhador é encerrado junto com o CBC e substituído na próxima
+# chamada. Os trabalhadores ficam abertos entre as chamadas; usar_cache=False ignora o cache de soluções neles
+class ResolvedorAssincrono:
+    def __init__(self, processos=None, timeout=None, usar_cache=True):
+        self.processos = processos or os.cpu_count() or 1
+        self.timeout = timeout
+        self.usar_cache = usar_cache
+        self._semaforos = weakref.WeakKeyDictionary()  # Laço de eventos -> semáforo
+        self._livres = []  # (processo, conexão) esperando uma tarefa
+        self._trava = threading.Lock()
+        self._encerrado = False
+        self.cancelados = 0  # Resoluções interrompidas (cancelamento ou timeout), com o trabalhador encerrado
+
+    # Semáforo do laço de eventos atual (um asyncio.Semaphore só pode ser usado no laço em que foi criado)
+    def _semaforo(self):
+        laco = asyncio.get_running_loop()
+        with self._trava:
+            if laco not in self._semaforos:
+                self._semaforos[laco] = asyncio.Semaphore(self.processos)
+            return self._semaforos[laco]
+
+    # Pega um trabalhador livre (descarta os que morreram) ou inicia um novo
+    def _obter(self):
+        with self._trava:
+            if self._encerrado:
+                raise RuntimeError("ResolvedorAssincrono já foi encerrado")
+            while self._livres:
+                processo, conexao = self._livres.pop()
+                if processo.is_alive():
+                    return processo, conexao
+                conexao.close()
+        conexao_principal, conexao_trabalhador = multiprocessing.Pipe()
+        processo = multiprocessing.Process(target=_trabalhador, args=(conexao_trabalhador, self.usar_cache), daemon=True)
+        processo.start()
+        conexao_trabalhador.close()
+        return processo, conexao_principal
+
+    # Devolve um trabalhador que terminou a tarefa (ou o encerra, se o resolvedor já foi encerrado)
+    def _devolver(self, processo, conexao):
+        with self._trava:
+            if not self._encerrado:
+                self._livres.append((processo, conexao))
+                return
+        _encerrar_trabalhador(processo, conexao)
+
+    # Corrotina que executa funcao(*args, **kwargs) num trabalhador e devolve o resultado (ou levanta a exceção
+    # da função). A função precisa ser importável pelo nome (ex.: resolver_* de um módulo de src/)
+    async def executar(self, funcao, *args, **kwargs):
+        async with self._semaforo():
+            processo, conexao = self._obter()
+            try:
+                conexao.send((funcao, args, kwargs, solver.obter_configuracao()))
+            except BaseException:
+                self._devolver(processo, conexao)  # Nada foi enviado (ex.: argumento que não pode ser serializado)
+                raise
+            try:
+                resposta = _receber(conexao)
+                sucesso, valor, _ = await (asyncio.wait_for(resposta, self.timeout) if self.timeout is not None else resposta)
+            except EOFError:
+                _encerrar_trabalhador(processo, conexao)
+                raise RuntimeError(f"Processo trabalhador encerrado (código {processo.exitcode})") from None
+            except BaseException:
+                # Cancelamento ou timeout: o trabalhador (e o CBC) são encerrados, sem deixar a resolução rodando
+                _encerrar_trabalhador(processo, conexao)
+                self.cancelados += 1
+                raise
+        self._devolver(processo, conexao)
+        if not sucesso:
+            raise valor
+        return valor
+
+    # Corrotina que resolve uma instância do problema id_problema (mesmos argumentos da função resolver_* dele)
+    async def resolver(self, id_problema, *args, **kwargs):
+        return await self.executar(registro.obter_resolvedor(id_problema), *args, **kwargs)
+
+    # Encerra os trabalhadores livres; os que estão resolvendo são encerrados ao terminar
+    def encerrar(self):
+        with self._trava:
+            self._encerrado = True
+            livres, self._livres = self._livres, []
+        for processo, conexao in livres:
+            try:
+                conexao.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            processo.join(timeout=1)
+            if processo.is_alive():
+                _encerrar_trabalhador(processo, conexao)
+            else:
+                conexao.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, tipo_erro, erro, rastro):
+        self.encerrar()
+
+# Resolvedor compartilhado pelas funções resolver e executar deste módulo (criado no primeiro uso)
+_padrao = None
+_configuracao = {"processos": None, "timeout": None, "usar_cache": True}
+_trava = threading.Lock()
+
+# Função que ajusta o resolvedor compartilhado (só os parâmetros informados mudam; os trabalhadores livres da
+# configuração anterior são encerrados). processos=None usa um por núcleo; timeout em segundos ou None (sem limite)
+def configurar_assincrono(processos=_MANTER, timeout=_MANTER, usar_cache=_MANTER):
+    global _padrao
+    if processos not in (_MANTER, None) and int(processos) < 1:
+        raise ValueError("processos precisa ser pelo menos 1")
+    if timeout not in (_MANTER, None) and timeout <= 0:
+        raise ValueError("timeout precisa ser positivo")
+    with _trava:
+        for chave, valor in (("processos", processos), ("timeout", timeout), ("usar_cache", usar_cache)):
+            if valor is not _MANTER:
+                _configuracao[chave] = valor
+        anterior, _padrao = _padrao, None
+        configuracao = dict(_configuracao)
+    if anterior is not None:
+        anterior.encerrar()
+    return configuracao
+
+# Função que devolve o resolvedor compartilhado
+def obter_resolvedor_assincrono():
+    global _padrao
+    with _trava:
+        if _padrao is None:
+            _padrao = ResolvedorAssincrono(**_configuracao)
+        return _padrao
+
+# Corrotina que resolve uma instância do problema id_problema com o resolvedor compartilhado
+# Ex.: await asyncio.gather(resolver(9, valores, pesos, 50), resolver(5, ...))
+async def resolver(id_problema, *args, **kwargs):
+    return await obter_resolvedor_assincrono().resolver(id_problema, *args, **kwargs)
+
+# Corrotina que executa qualquer função resolver_* (ex.: resolver_mistura) com o resolvedor compartilhado
+async def executar(funcao, *args, **kwargs):
+    return await obter_resolvedor_assincrono().executar(funcao, *args, **kwargs)
+
+# Função que encerra os trabalhadores do resolvedor compartilhado (a próxima chamada inicia outros)
+def encerrar_assincrono():
+    global _padrao
+    with _trava:
+        anterior, _padrao = _padrao, None
+    if anterior is not None:
+        anterior.encerrar()
+
+atexit.register(encerrar_assincrono)
@@ -0,0 +1,385 @@
+# Importa bibliotecas necessárias
+import os  # Para o número de núcleos nos metadados
+import sys  # Para a versão do Python e o código de saída
+import json  # Para gravar e ler os resultados
+import time  # Para medir as fases de cada resolução
+import signal  # Para encerrar o caso que passa do limite de tempo (com o solver)
+import platform  # Para os metadados da máquina
+import argparse  # Para a linha de comando
+import statistics  # Para a mediana das repetições
+import subprocess  # Para descobrir o commit atual
+import multiprocessing  # Cada caso roda num processo novo (memória de pico isolada)
+from datetime import datetime, timezone  # Para a data da execução
+import numpy as np  # Para os geradores de instâncias com semente
+import pulp  # Para a versão nos metadados
+from . import registro  # Para os títulos e os módulos dos problemas
+from . import solver  # Para repassar a configuração do solver
+from . import instrumentacao  # Para separar montagem, solver e extração
+from . import graficos  # O benchmark nunca desenha gráficos
+from .cache import configurar_cache  # O cache é desligado: toda repetição resolve de verdade
+
+try:
+    import resource  # Memória de pico (só em sistemas Unix)
+except ImportError:
+    resource = None
+
+# Tamanhos das instâncias, do menor (exemplo da apostila) ao maior (~1e6 variáveis)
+TAMANHOS_BENCHMARK = ('minimo', 'pequeno', 'medio', 'grande', 'enorme')
+
+# Tamanhos executados quando nenhum é informado ('grande' e 'enorme' podem levar minutos por caso)
+TAMANHOS_PADRAO = ('minimo', 'pequeno', 'medio')
+
+# Número padrão de repetições de cada caso (as fases usam a mediana)
+REPETICOES_PADRAO = 3
+
+# Tempo máximo (segundos) de cada caso, somando geração e todas as repetições
+LIMITE_TEMPO_CASO = 600
+
+# Aumento relativo do tempo total (ou da memória) a partir do qual a comparação acusa uma regressão
+TOLERANCIA_REGRESSAO = 0.2
+
+# Diferenças abaixo de 10 ms (ou de 5 MB) são ruído de medição e não contam como regressão
+TEMPO_MINIMO_REGRESSAO = 0.01
+MEMORIA_MINIMA_REGRESSAO = 5.0
+
+# Geradores de instâncias: recebem os parâmetros do tamanho e um gerador NumPy com semente e devolvem
+# (nome da função no módulo do problema, args, kwargs, número de variáveis da formulação)
+
+# Problema 1: o modelo tem sempre 2 variáveis; a partir de 'pequeno' mede a varredura vetorizada de uma grade
+# de preços lado x lado (cada cenário equivale a um modelo de 2 variáveis)
+def _gerar_racao(lado, gerador):
+    parametros = {"custo_cereal": 1, "custo_carne": 4, "consumo_amgs_cereal": 5, "consumo_amgs_carne": 1,
+                  "consumo_re_cereal": 2, "consumo_re_carne": 4, "disponibilidade_cereal": 30000, "disponibilidade_carne": 10000}
+    if lado is None:
+        return "resolver_problema_racao", [], {"preco_amgs": 20, "preco_re": 30, **parametros}, 2
+    precos_amgs = np.sort(gerador.uniform(10, 40, lado))
+    precos_re = np.sort(gerador.uniform(15, 45, lado))
+    return "superficie_lucro_racao", [precos_amgs, precos_re], parametros, 2 * lado * lado
+
+def _gerar_dieta(tamanho, gerador):
+    ingredientes, vitaminas = tamanho
+    matriz = gerador.integers(0, 4, (vitaminas, ingredientes)).tolist()
+    precos = gerador.integers(1, 20, ingredientes).tolist()
+    minimos = gerador.integers(10, 50, vitaminas).tolist()
+    return "resolver_problema_dieta", [matriz, precos, minimos], {}, ingredientes
+
+# Problema 3: o modelo tem 3 variáveis (uma por cultura); o tamanho é o número de fazendas (2 restrições cada)
+def _gerar_plantio(fazendas, gerador):
+    areas = gerador.integers(200, 700, fazendas).tolist()
+    agua = gerador.integers(800, 2500, fazendas).tolist()
+    total = sum(areas)
+    area_maxima = [int(total * fracao) for fracao in (0.5, 0.6, 0.3)]
+    return "resolver_problema_plantio", [areas, agua, area_maxima, [5.5, 4, 3.5], [5000, 4000, 1800]], {}, 3
+
+# Problema 4: 'minimo' é o enunciado (4 produtos x 2 tintas); os demais usam o modelo geral de mistura
+# (produtos, tintas, atributos de qualidade)
+def _gerar_tintas(tamanho, gerador):
+    if tamanho is None:
+        custos = dict(zip(['SolA', 'SolB', 'SEC', 'COR'], gerador.uniform(1, 8, 4).round(2).tolist()))
+        composicao_sec = {'SolA': 0.3, 'SolB': 0.6, 'SEC': 1.0, 'COR': 0.0}
+        composicao_cor = {'SolA': 0.7, 'SolB': 0.4, 'SEC': 0.0, 'COR': 1.0}
+        return "resolver_problema_tintas", [custos, composicao_sec, composicao_cor, 1000, 250], {}, 8
+    produtos, tintas, atributos = tamanho
+    custos = gerador.uniform(1, 8, produtos).round(2)
+    composicao = gerador.dirichlet(np.ones(atributos), produtos)  # Frações de cada atributo em cada produto
+    minimos = gerador.uniform(0, 0.5 / atributos, (tintas, atributos))  # Teores mínimos viáveis pela média dos produtos
+    demandas = gerador.integers(100, 1000, tintas)
+    return "resolver_mistura", [custos, composicao, minimos, demandas], {}, produtos * tintas
+
+def _gerar_transporte(tamanho, gerador):
+    m, n = tamanho
+    custos = gerador.integers(1, 100, (m, n))
+    demandas = gerador.integers(10, 100, n)
+    ofertas = np.full(m, -(-int(demandas.sum() * 1.1) // m))  # Oferta total ~10% maior que a demanda
+    fabricas = [f"F{i}" for i in range(m)]
+    depositos = [f"D{j}" for j in range(n)]
+    custos = {f: dict(zip(depositos, linha)) for f, linha in zip(fabricas, custos.tolist())}
+    return ("resolver_problema_transporte", [custos, dict(zip(fabricas, ofertas.tolist())), dict(zip(depositos, demandas.tolist()))],
+            {}, m * n)
+
+def _gerar_fluxo(tamanho, gerador):
+    nos, arcos = tamanho
+    capacidades = {}
+    # Um caminho 0 -> 1 -> ... -> nos-1 garante que o destino é alcançável; os demais arcos são sorteados
+    origens = np.concatenate([np.arange(nos - 1), gerador.integers(0, nos, arcos - (nos - 1))])
+    destinos = np.concatenate([np.arange(1, nos), gerador.integers(0, nos, arcos - (nos - 1))])
+    valores = gerador.integers(1, 100, arcos)
+    for u, v, c in zip(origens.tolist(), destinos.tolist(), valores.tolist()):
+        if u != v:
+            capacidades.setdefault(u, {})[v] = c
+    return "resolver_problema_fluxo_maximo", [capacidades, 0, nos - 1], {}, arcos
+
+def _gerar_escalonamento(dias, gerador):
+    return "resolver_problema_escalonamento", [gerador.integers(5, 20, dias).tolist()], {}, dias
+
+# Problema 8: cada subconjunto cobre um trecho contínuo de elementos (ex.: postos ao longo de uma estrada), o que
+# mantém o modelo inteiro tratável nos tamanhos menores; a partir de 'grande' usa o método heurístico
+def _gerar_cobertura(tamanho, gerador):
+    elementos, subconjuntos, metodo = tamanho
+    inicios = gerador.integers(0, elementos, subconjuntos)
+    comprimentos = gerador.integers(2, 12, subconjuntos)
+    conjuntos = {f"S{s}": set(range(a, min(elementos, a + k))) for s, (a, k) in enumerate(zip(inicios.tolist(), comprimentos.tolist()))}
+    for e in range(elementos):
+        conjuntos[f"S{e % subconjuntos}"].add(e)  # Todo elemento fica coberto por algum subconjunto
+    return "resolver_problema_cobertura", [set(range(elementos)), conjuntos], {"metodo": metodo}, subconjuntos
+
+# Problema 9: a capacidade fica dentro do limite da programação dinâmica (LIMITE_CELULAS_PD), o método
+# escolhido pelo modo automático em todos os tamanhos
+def _gerar_mochila(itens, gerador):
+    pesos = gerador.integers(1, 100, itens)
+    valores = pesos + gerador.integers(0, 50, itens)  # Valores correlacionados com os pesos
+    capacidade = min(int(pesos.sum() // 4), registro.carregar_modulo(9).LIMITE_CELULAS_PD // itens - 1)
+    return "resolver_problema_mochila", [valores.tolist(), pesos.tolist(), capacidade], {}, itens
+
+def _gerar_padroes(produtos, gerador):
+    nomes = [f"P{i}" for i in range(produtos)]
+    consumos = dict(zip(nomes, gerador.integers(2, 50, produtos).tolist()))
+    lucros = dict(zip(nomes, gerador.integers(1, 40, produtos).tolist()))
+    return "resolver_problema_padroes", [consumos, lucros, 10 * produtos], {}, produtos
+
+# Problema 11: a partir de 'grande' usa o método heurístico
+def _gerar_facilidades(tamanho, gerador):
+    locais, clientes, metodo = tamanho
+    nomes_locais = [f"L{i}" for i in range(locais)]
+    nomes_clientes = [f"C{j}" for j in range(clientes)]
+    fixos = dict(zip(nomes_locais, gerador.integers(100, 1000, locais).tolist()))
+    atendimento = {l: dict(zip(nomes_clientes, linha)) for l, linha in zip(nomes_locais, gerador.integers(1, 100, (locais, clientes)).tolist())}
+    return "resolver_problema_facilidades", [fixos, atendimento], {"metodo": metodo}, locais * (clientes + 1)
+
+# Problema 12: grafo com coloração plantada (vértice v na classe v % classes, arestas só entre classes diferentes)
+# e uma clique com um vértice de cada classe, de modo que o número cromático é conhecido (= classes)
+def _gerar_frequencia(tamanho, gerador):
+    vertices, grau_medio, classes, cores = tamanho
+    pares = gerador.integers(0, vertices, (int(vertices * grau_medio / 2), 2))
+    arestas = {(min(a, b), max(a, b)) for a, b in pares.tolist() if a % classes != b % classes}
+    arestas.update((a, b) for a in range(classes) for b in range(a + 1, classes))
+    return "resolver_problema_frequencia", [list(range(vertices)), sorted(arestas), [f"F{c}" for c in range(cores)]], {}, vertices * cores
+
+def _gerar_clique(tamanho, gerador):
+    vertices, densidade = tamanho
+    arestas = int(vertices * (vertices - 1) / 2 * densidade)
+    pares = gerador.integers(0, vertices, (arestas, 2))
+    arestas = sorted({(min(a, b), max(a, b)) for a, b in pares.tolist() if a != b})
+    return "resolver_problema_clique", [list(range(vertices)), arestas], {}, vertices
+
+# Casos do benchmark: problema -> gerador e parâmetros de cada tamanho (tamanhos ausentes não se aplicam ao problema)
+CASOS_BENCHMARK = {
+    "1": {"gerar": _gerar_racao, "tamanhos": {"minimo": None, "pequeno": 10, "medio": 100, "grande": 300, "enorme": 1000}},
+    "2": {"gerar": _gerar_dieta, "tamanhos": {"minimo": (6, 2), "pequeno": (100, 5), "medio": (1000, 10), "grande": (100000, 5), "enorme": (1000000, 2)}},
+    "3": {"gerar": _gerar_plantio, "tamanhos": {"minimo": 3, "pequeno": 100, "medio": 1000, "grande": 10000, "enorme": 100000}},
+    "4": {"gerar": _gerar_tintas, "tamanhos": {"minimo": None, "pequeno": (60, 25, 30), "medio": (300, 100, 50), "grande": (500, 200, 50)}},
+    "5": {"gerar": _gerar_transporte, "tamanhos": {"minimo": (3, 4), "pequeno": (30, 30), "medio": (100, 100), "grande": (300, 300), "enorme": (1000, 1000)}},
+    "6": {"gerar": _gerar_fluxo, "tamanhos": {"minimo": (4, 5), "pequeno": (100, 500), "medio": (1000, 5000), "grande": (20000, 100000), "enorme": (200000, 1000000)}},
+    "7": {"gerar": _gerar_escalonamento, "tamanhos": {"minimo": 7, "pequeno": 70, "medio": 700, "grande": 7000, "enorme": 70000}},
+    "8": {"gerar": _gerar_cobertura, "tamanhos": {"minimo": (5, 4, 'mip'), "pequeno": (100, 200, 'mip'), "medio": (1000, 2000, 'mip'),
+                                                  "grande": (10000, 100000, 'heuristico'), "enorme": (100000, 1000000, 'heuristico')}},
+    "9": {"gerar": _gerar_mochila, "tamanhos": {"minimo": 5, "pequeno": 100, "medio": 1000, "grande": 100000, "enorme": 1000000}},
+    "10": {"gerar": _gerar_padroes, "tamanhos": {"minimo": 3, "pequeno": 100, "medio": 1000, "grande": 100000, "enorme": 1000000}},
+    "11": {"gerar": _gerar_facilidades, "tamanhos": {"minimo": (3, 5, 'mip'), "pequeno": (10, 50, 'mip'), "medio": (30, 300, 'mip'),
+                                                     "grande": (100, 2000, 'heuristico'), "enorme": (200, 5000, 'heuristico')}},
+    "12": {"gerar": _gerar_frequencia, "tamanhos": {"minimo": (5, 2, 3, 4), "pequeno": (100, 6, 4, 10), "medio": (1000, 8, 5, 20),
+                                                    "grande": (10000, 8, 6, 20), "enorme": (50000, 20, 8, 20)}},
+    "13": {"gerar": _gerar_clique, "tamanhos": {"minimo": (5, 0.6), "pequeno": (100, 0.3), "medio": (300, 0.3), "grande": (1000, 0.1), "enorme": (3000, 0.05)}},
+}
+
+# Função auxiliar que devolve a memória de pico (MB) do processo atual e dos processos filhos já encerrados (o CBC)
+def _memoria_pico():
+    if resource is None:
+        return None, None
+    fator = 1024 * 1024 if sys.platform == "darwin" else 1024  # ru_maxrss vem em bytes no macOS e em KB no Linux
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / fator,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / fator)
+
+# Função que executa um caso (um problema num tamanho), no processo atual, e devolve o registro das medições
+def executar_caso(id_problema, tamanho, repeticoes=REPETICOES_PADRAO, semente=0):
+    caso = CASOS_BENCHMARK[str(id_problema)]
+    parametros = caso["tamanhos"][tamanho]
+    memoria_base, _ = _memoria_pico()
+
+    inicio = time.perf_counter()
+    nome_funcao, args, kwargs, variaveis = caso["gerar"](parametros, np.random.default_rng(semente))
+    tempo_geracao = time.perf_counter() - inicio
+    funcao = getattr(registro.carregar_modulo(id_problema), nome_funcao)
+    funcao = getattr(funcao, "sem_cache", funcao)  # Toda repetição resolve de verdade
+
+    medicoes = []
+    for _ in range(repeticoes):
+        with instrumentacao.medindo(nome_funcao) as medicao:
+            resultado = funcao(*args, **kwargs)
+        medicoes.append(medicao.fases())
+    evento = medicao.evento(resultado)  # Contagens da última repetição
+    memoria_pico, memoria_solver = _memoria_pico()
+
+    return {
+        "problema": str(id_problema),
+        "titulo": registro.obter_problema(id_problema)["titulo"],
+        "tamanho": tamanho,
+        "parametros": parametros,
+        "funcao": nome_funcao,
+        "variaveis": variaveis,  # Variáveis da formulação (para o problema 1 acima de 'minimo': 2 por cenário)
+        "semente": semente,
+        "repeticoes": repeticoes,
+        "status": resultado.get("status") if isinstance(resultado, dict) else "Optimal",  # A varredura do problema 1 devolve uma matriz
+        "tempo_geracao": tempo_geracao,
+        "tempos": {fase: statistics.median(m[fase] for m in medicoes) for fase in medicoes[0]},  # Mediana de cada fase
+        "tempo_total_minimo": min(m["total"] for m in medicoes),
+        "tempos_repeticoes": [m["total"] for m in medicoes],
+        "chamadas_solver": evento["chamadas_solver"],
+        "variaveis_modelo": evento["variaveis"],  # Tamanho do maior modelo enviado ao solver
+        "restricoes_modelo": evento["restricoes"],
+        "iteracoes": evento["iteracoes"],  # Iterações do solver ou do algoritmo próprio (quando informadas)
+        "nos": evento["nos"],  # Nós de branch-and-bound (quando informados)
+        "memoria_base_mb": memoria_base,  # Interpretador e bibliotecas, antes de gerar a instância
+        "memoria_pico_mb": memoria_pico,
+        "memoria_pico_solver_mb": memoria_solver,  # Maior processo do solver (CBC) iniciado pelo caso
+        "erro": None
+    }
+
+# Função executada no processo de cada caso: aplica a configuração e devolve o registro (ou o erro) pela conexão
+def _processo_caso(conexao, id_problema, tamanho, repeticoes, semente, configuracao_solver):
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()  # Grupo próprio: no limite de tempo o caso e o CBC que ele iniciou são encerrados juntos
+    solver.configurar_solver(**configuracao_solver)
+    graficos.configurar_graficos(modo="desligado")
+    configurar_cache(ativo=False)
+    try:
+        conexao.send(executar_caso(id_problema, tamanho, repeticoes, semente))
+    except Exception as erro:
+        conexao.send(f"{type(erro).__name__}: {erro}")
+    conexao.close()
+
+# Função auxiliar que executa um caso num processo novo, encerrando-o se passar do limite de tempo
+def _executar_isolado(id_problema, tamanho, repeticoes, semente, limite_tempo):
+    contexto = multiprocessing.get_context("spawn")  # Processo limpo: a memória de pico é só do caso
+    conexao_principal, conexao_caso = contexto.Pipe(duplex=False)
+    configuracao_solver = {**solver.obter_configuracao(), "mensagens": False}
+    processo = contexto.Process(target=_processo_caso, args=(conexao_caso, id_problema, tamanho, repeticoes, semente, configuracao_solver))
+    processo.start()
+    conexao_caso.close()
+    try:
+        if conexao_principal.poll(limite_tempo):
+            return conexao_principal.recv()
+        return f"Tempo limite de {limite_tempo} s excedido"
+    except EOFError:
+        return f"Processo encerrado (código {processo.exitcode})"
+    finally:
+        try:
+            os.killpg(processo.pid, signal.SIGKILL)  # Encerra também o CBC, se ainda estiver rodando
+        except (AttributeError, ProcessLookupError, PermissionError):
+            if processo.is_alive():
+                processo.kill()
+        processo.join()
+        conexao_principal.close()
+
+# Função auxiliar com os metadados da execução (para comparar resultados de commits e máquinas diferentes)
+def _metadados(repeticoes, semente):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "nucleos": os.cpu_count(),
+        "pulp": pulp.__version__,
+        "numpy": np.__version__,
+        "solver": {chave: valor for chave, valor in solver.obter_configuracao().items() if chave != "mensagens"},
+        "repeticoes": repeticoes,
+        "semente": semente
+    }
+
+# Função que executa o benchmark e devolve {"metadados", "resultados"} (um registro por problema e tamanho)
+# problemas=None executa os 13 problemas; cada caso roda num processo novo, com o cache de soluções desligado.
+# Casos com erro ou que passam de limite_tempo ficam nos resultados com "erro" preenchido.
+# ao_concluir (opcional) é chamada com cada registro assim que ele fica pronto
+def executar_benchmark(problemas=None, tamanhos=TAMANHOS_PADRAO, repeticoes=REPETICOES_PADRAO, semente=0,
+                       limite_tempo=LIMITE_TEMPO_CASO, ao_concluir=None):
+    problemas = [str(p) for p in (problemas or sorted(CASOS_BENCHMARK, key=int))]
+    for tamanho in tamanhos:
+        if tamanho not in TAMANHOS_BENCHMARK:
+            raise ValueError(f"Tamanho desconhecido: {tamanho} (use um de {TAMANHOS_BENCHMARK})")
+    for id_problema in problemas:
+        registro.obter_problema(id_problema)  # Valida antes de começar
+
+    relatorio = {"metadados": _metadados(repeticoes, semente), "resultados": []}
+    for id_problema in problemas:
+        for tamanho in tamanhos:
+            if tamanho not in CASOS_BENCHMARK[id_problema]["tamanhos"]:
+                continue  # Formulação de tamanho fixo
+            registro_caso = _executar_isolado(id_problema, tamanho, repeticoes, semente, limite_tempo)
+            if isinstance(registro_caso, str):
+                registro_caso = {"problema": id_problema, "titulo": registro.obter_problema(id_problema)["titulo"],
+                                 "tamanho": tamanho, "erro": registro_caso}
+            relatorio["resultados"].append(registro_caso)
+            if ao_concluir is not None:
+                ao_concluir(registro_caso)
+    return relatorio
+
+# Função que compara dois relatórios e devolve as regressões: casos cujo tempo total (mediana) ou memória de pico
+# cresceram mais que a tolerância, e casos que passaram a falhar
+def comparar_benchmarks(anterior, atual, tolerancia=TOLERANCIA_REGRESSAO):
+    base = {(r["problema"], r["tamanho"]): r for r in anterior["resultados"]}
+    regressoes = []
+    for caso in atual["resultados"]:
+        antes = base.get((caso["problema"], caso["tamanho"]))
+        if antes is None or antes.get("erro"):
+            continue
+        identificacao = {"problema": caso["problema"], "tamanho": caso["tamanho"]}
+        if caso.get("erro"):
+            regressoes.append({**identificacao, "medida": "erro", "antes": None, "depois": caso["erro"]})
+            continue
+        tempo_antes, tempo_depois = antes["tempos"]["total"], caso["tempos"]["total"]
+        if tempo_depois > tempo_antes * (1 + tolerancia) and tempo_depois - tempo_antes > TEMPO_MINIMO_REGRESSAO:
+            regressoes.append({**identificacao, "medida": "tempo_total", "antes": tempo_antes, "depois": tempo_depois})
+        if antes.get("memoria_pico_mb") is not None and caso.get("memoria_pico_mb") is not None:
+            memoria_antes = antes["memoria_pico_mb"] - antes["memoria_base_mb"]
+            memoria_depois = caso["memoria_pico_mb"] - caso["memoria_base_mb"]
+            if memoria_depois > memoria_antes * (1 + tolerancia) and memoria_depois - memoria_antes > MEMORIA_MINIMA_REGRESSAO:
+                regressoes.append({**identificacao, "medida": "memoria_mb", "antes": memoria_antes, "depois": memoria_depois})
+    return regressoes
+
+# Função auxiliar que mostra um registro como uma linha da tabela
+def _mostrar_caso(caso):
+    if caso.get("erro"):
+        print(f"{caso['problema']:>3} {caso['tamanho']:<8} ERRO: {caso['erro']}")
+        return
+    tempos = caso["tempos"]
+    print(f"{caso['problema']:>3} {caso['tamanho']:<8} {caso['variaveis']:>10} {tempos['construcao']:>10.4f} {tempos['resolucao']:>10.4f} "
+          f"{tempos['extracao']:>10.4f} {tempos['total']:>10.4f} {caso['memoria_pico_mb'] or 0:>9.1f} {caso['status']}")
+
+# Linha de comando: python -m src.benchmark [-p 5 9] [-t minimo pequeno] [-r 3] [-o resultados.json] [--comparar base.json]
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos resolvedores (tempos por fase e memória de pico), com saída em JSON.")
+    parser.add_argument("-p", "--problemas", nargs="+", default=None, help="números dos problemas (padrão: todos)")
+    parser.add_argument("-t", "--tamanhos", nargs="+", choices=TAMANHOS_BENCHMARK, default=list(TAMANHOS_PADRAO), help="tamanhos das instâncias")
+    parser.add_argument("-r", "--repeticoes", type=int, default=REPETICOES_PADRAO, help="repetições de cada caso")
+    parser.add_argument("-s", "--semente", type=int, default=0, help="semente dos geradores de instâncias")
+    parser.add_argument("-o", "--saida", default="benchmark.json", help="arquivo JSON dos resultados")
+    parser.add_argument("--limite-tempo", type=float, default=LIMITE_TEMPO_CASO, help="tempo máximo de cada caso, em segundos")
+    parser.add_argument("--comparar", default=None, help="relatório JSON anterior: acusa regressões e termina com código 1 se houver")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_REGRESSAO, help="aumento relativo tolerado na comparação")
+    argumentos = parser.parse_args(argumentos)
+
+    print(f"{'Pb':>3} {'Tamanho':<8} {'Variáveis':>10} {'Montagem':>10} {'Solver':>10} {'Extração':>10} {'Total (s)':>10} {'Pico (MB)':>9} Status")
+    relatorio = executar_benchmark(argumentos.problemas, argumentos.tamanhos, argumentos.repeticoes, argumentos.semente,
+                                   argumentos.limite_tempo, ao_concluir=_mostrar_caso)
+    with open(argumentos.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    print(f"\nResultados gravados em {argumentos.saida}")
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as arquivo:
+            regressoes = comparar_benchmarks(json.load(arquivo), relatorio, argumentos.tolerancia)
+        for r in regressoes:
+            print(f"REGRESSÃO problema {r['problema']} ({r['tamanho']}), {r['medida']}: {r['antes']} -> {r['depois']}")
+        if regressoes:
+            return 1
+        print("Nenhuma regressão em relação a", argumentos.comparar)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
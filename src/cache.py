@@ -0,0 +1,264 @@
+# Importa bibliotecas necessárias
+import hashlib  # Para o hash canônico (SHA-256) das entradas
+import pickle  # Para guardar cópias independentes dos resultados (em memória e em disco)
+import os  # Para o armazenamento em disco
+import threading  # Para proteger o cache quando usado por várias threads
+import functools  # Para preservar nome e documentação das funções decoradas
+import inspect  # Para normalizar argumentos posicionais e nomeados
+from collections import OrderedDict  # Para a ordem de uso do LRU
+from collections.abc import Mapping  # Para reconhecer dicionários e visões do tipo dicionário
+import numpy as np  # Para o hash rápido de vetores e matrizes
+from . import instrumentacao  # Acertos e falhas do cache aparecem nas medições dos resolvedores
+
+# Limite padrão de memória do cache (soma dos tamanhos dos resultados serializados)
+MAX_BYTES_PADRAO = 64 * 1024 * 1024
+
+# Marcador de "não encontrado" (um resultado pode ser None)
+_AUSENTE = object()
+
+# Maior inteiro que o float64 representa sem perda (acima dele os vetores são lidos valor a valor)
+MAIOR_INTEIRO_EXATO = 2 ** 53
+
+# Funções que devolvem informações extras para a chave das funções decoradas (ex.: a configuração do solver)
+_contextos = []
+
+# Função que registra uma informação extra para a chave do cache (chamada pelos módulos que a definem)
+def registrar_contexto(funcao):
+    _contextos.append(funcao)
+
+# Função auxiliar que alimenta o hash com uma representação canônica de um valor
+# Dicionários e conjuntos não dependem da ordem; 1 e 1.0 são iguais; listas de números viram vetores NumPy,
+# de modo que [1, 2] e np.array([1.0, 2.0]) geram a mesma chave
+def _atualizar_hash(h, valor):
+    if valor is None:
+        h.update(b'N')
+    elif isinstance(valor, (bool, np.bool_)):
+        h.update(b'T' if valor else b'F')
+    elif isinstance(valor, (int, np.integer)):
+        h.update(b'n%d;' % int(valor))
+    elif isinstance(valor, (float, np.floating)):
+        valor = float(valor)
+        if valor.is_integer():
+            h.update(b'n%d;' % int(valor))  # Mesmo código do inteiro equivalente
+        else:
+            h.update(b'n' + repr(valor).encode() + b';')
+    elif isinstance(valor, str):
+        dados = valor.encode()
+        h.update(b's%d:' % len(dados) + dados)
+    elif isinstance(valor, bytes):
+        h.update(b'b%d:' % len(valor) + valor)
+    elif isinstance(valor, np.ndarray) and valor.dtype.kind in 'biuf':
+        if valor.size and ((valor > MAIOR_INTEIRO_EXATO).any() or (valor < -MAIOR_INTEIRO_EXATO).any()):
+            # Valores grandes perderiam precisão no float64: cada um entra com o código exato dos números
+            h.update(b'A' + repr(valor.shape).encode())
+            for item in valor.ravel().tolist():
+                _atualizar_hash(h, item)
+            return
+        matriz = np.ascontiguousarray(valor, dtype=np.float64)
+        h.update(b'a' + repr(matriz.shape).encode())
+        h.update(matriz.tobytes())
+    elif isinstance(valor, (list, tuple, np.ndarray)):
+        matriz = _como_matriz_numerica(valor)
+        if matriz is not None:
+            _atualizar_hash(h, matriz)
+            return
+        h.update(b'l%d:' % len(valor))
+        for item in valor:
+            _atualizar_hash(h, item)
+    elif isinstance(valor, Mapping):
+        # Cada par (chave, valor) tem seu próprio hash; os hashes são ordenados para ignorar a ordem do dicionário
+        pares = sorted(_hash_de(k, v) for k, v in valor.items())
+        h.update(b'd%d:' % len(pares) + b''.join(pares))
+    elif isinstance(valor, (set, frozenset)):
+        itens = sorted(_hash_de(item) for item in valor)
+        h.update(b'c%d:' % len(itens) + b''.join(itens))
+    elif isinstance(valor, range):
+        h.update(b'r%d,%d,%d;' % (valor.start, valor.stop, valor.step))
+    else:
+        raise TypeError(f"Tipo não suportado na chave do cache: {type(valor).__name__}")
+
+# Função auxiliar que converte uma lista (ou tupla) retangular de números em vetor NumPy; devolve None se não for
+def _como_matriz_numerica(valor):
+    if len(valor) == 0 or not isinstance(valor[0], (int, float, np.number, list, tuple, np.ndarray)) or isinstance(valor[0], bool):
+        return None
+    try:
+        matriz = np.asarray(valor)
+    except ValueError:
+        return None  # Listas irregulares (ex.: [[1], [1, 2]])
+    return matriz if matriz.dtype.kind in 'iuf' else None
+
+# Função auxiliar que devolve o hash (bytes) de uma sequência de valores
+def _hash_de(*valores):
+    h = hashlib.sha256()
+    for valor in valores:
+        _atualizar_hash(h, valor)
+    return h.digest()
+
+# Função que calcula a chave canônica (hexadecimal) de um conjunto de valores
+def chave_canonica(*valores):
+    h = hashlib.sha256()
+    _atualizar_hash(h, valores)
+    return h.hexdigest()
+
+# Cache de soluções: LRU em memória limitado pelo tamanho (bytes serializados) e, opcionalmente, uma pasta em disco
+# Os resultados são guardados serializados (pickle): cada consulta devolve uma cópia nova, então alterar o
+# resultado devolvido não altera o cache
+class CacheSolucoes:
+    def __init__(self, max_bytes=MAX_BYTES_PADRAO, diretorio=None, ativo=True):
+        self.max_bytes = max_bytes  # Limite de memória; os itens menos usados saem primeiro
+        self.diretorio = diretorio  # Pasta do armazenamento em disco (None = só memória)
+        self.ativo = ativo  # Com o cache desativado as funções decoradas sempre resolvem o problema
+        self._itens = OrderedDict()  # Chave -> resultado serializado (do menos para o mais usado)
+        self._bytes = 0
+        self._trava = threading.Lock()
+        self._contadores = {"acertos_memoria": 0, "acertos_disco": 0, "falhas": 0, "remocoes": 0, "nao_armazenaveis": 0,
+                            "nao_comprovados": 0}
+        if diretorio is not None:
+            os.makedirs(diretorio, exist_ok=True)
+
+    # Caminho do arquivo de uma chave no armazenamento em disco
+    def _caminho(self, chave):
+        return os.path.join(self.diretorio, f"{chave}.pkl")
+
+    # Guarda um resultado já serializado na memória, removendo os menos usados até caber no limite
+    def _guardar_memoria(self, chave, dados):
+        if len(dados) > self.max_bytes:
+            return  # Maior que o cache inteiro: fica só no disco (se houver)
+        with self._trava:
+            if chave in self._itens:
+                self._bytes -= len(self._itens.pop(chave))
+            self._itens[chave] = dados
+            self._bytes += len(dados)
+            while self._bytes > self.max_bytes:
+                _, removido = self._itens.popitem(last=False)
+                self._bytes -= len(removido)
+                self._contadores["remocoes"] += 1
+
+    # Função que busca um resultado; devolve "padrao" quando a chave não está no cache
+    def obter(self, chave, padrao=None):
+        with self._trava:
+            dados = self._itens.get(chave)
+            if dados is not None:
+                self._itens.move_to_end(chave)
+                self._contadores["acertos_memoria"] += 1
+        if dados is not None:
+            return pickle.loads(dados)
+        if self.diretorio is not None:
+            try:
+                with open(self._caminho(chave), "rb") as arquivo:
+                    dados = arquivo.read()
+            except FileNotFoundError:
+                dados = None
+            if dados is not None:
+                self._guardar_memoria(chave, dados)  # Sobe para a memória para as próximas consultas
+                with self._trava:
+                    self._contadores["acertos_disco"] += 1
+                return pickle.loads(dados)
+        with self._trava:
+            self._contadores["falhas"] += 1
+        return padrao
+
+    # Função que guarda um resultado (na memória e, se configurado, no disco); devolve False se não for serializável
+    # ou se não for definitivo (ver _definitivo)
+    def guardar(self, chave, resultado):
+        if not _definitivo(resultado):
+            with self._trava:
+                self._contadores["nao_comprovados"] += 1
+            return False
+        try:
+            dados = pickle.dumps(resultado, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            with self._trava:
+                self._contadores["nao_armazenaveis"] += 1
+            return False
+        self._guardar_memoria(chave, dados)
+        if self.diretorio is not None:
+            # Grava num arquivo temporário e renomeia: quem lê nunca vê um arquivo pela metade
+            temporario = f"{self._caminho(chave)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporario, "wb") as arquivo:
+                arquivo.write(dados)
+            os.replace(temporario, self._caminho(chave))
+        return True
+
+    # Função que esvazia a memória (e, com disco=True, também os arquivos do armazenamento em disco)
+    def limpar(self, disco=False):
+        with self._trava:
+            self._itens.clear()
+            self._bytes = 0
+        if disco and self.diretorio is not None:
+            for nome in os.listdir(self.diretorio):
+                if nome.endswith(".pkl"):
+                    os.remove(os.path.join(self.diretorio, nome))
+
+    # Função que devolve as estatísticas de uso (acertos, falhas, remoções, itens e bytes em memória)
+    def estatisticas(self):
+        with self._trava:
+            estatisticas = dict(self._contadores)
+            estatisticas["itens"] = len(self._itens)
+            estatisticas["bytes"] = self._bytes
+        consultas = estatisticas["acertos_memoria"] + estatisticas["acertos_disco"] + estatisticas["falhas"]
+        estatisticas["taxa_acerto"] = (consultas - estatisticas["falhas"]) / consultas if consultas else 0.0
+        return estatisticas
+
+# Função auxiliar que decide se um resultado é definitivo: "status" "Optimal" com "otimo_comprovado" ou
+# "Infeasible" (em cada posição, quando são vetores por cenário); listas valem quando todos os itens valem
+# Resultados sem prova (limite de tempo, gap, heurísticas) ou sem "status" não são guardados: outra chamada pode
+# chegar a uma solução melhor
+def _definitivo(resultado):
+    if isinstance(resultado, (list, tuple)):
+        return all(_definitivo(item) for item in resultado)
+    if not isinstance(resultado, Mapping):
+        return False
+    status = np.asarray(resultado.get("status"), dtype=object)
+    comprovado = np.asarray(resultado.get("otimo_comprovado", False), dtype=object).astype(bool)
+    return bool(np.all((status == "Infeasible") | ((status == "Optimal") & comprovado)))
+
+# Cache compartilhado por todas as funções resolver_* decoradas com @em_cache
+CACHE_PADRAO = CacheSolucoes()
+
+# Função que ajusta o cache compartilhado (limite de memória, pasta em disco e ativação)
+def configurar_cache(max_bytes=None, diretorio=None, ativo=None):
+    if max_bytes is not None:
+        CACHE_PADRAO.max_bytes = max_bytes
+    if diretorio is not None:
+        os.makedirs(diretorio, exist_ok=True)
+        CACHE_PADRAO.diretorio = diretorio
+    if ativo is not None:
+        CACHE_PADRAO.ativo = ativo
+    return CACHE_PADRAO
+
+# Decorador que guarda os resultados de uma função resolver_* no cache
+# A chave combina o nome da função e os argumentos normalizados (posicionais ou nomeados, com os valores padrão),
+# então resolver(a, b) e resolver(a, b=b) compartilham o mesmo resultado, e os contextos registrados (ex.: a
+# configuração do solver). Argumentos de tipos que não têm representação canônica fazem a chamada ir direto ao resolvedor
+def em_cache(funcao=None, *, cache=None):
+    if funcao is None:
+        return lambda f: em_cache(f, cache=cache)
+    assinatura = inspect.signature(funcao)
+    nome = f"{funcao.__module__}.{funcao.__qualname__}"
+
+    # Chave do cache para uma chamada (None quando algum argumento não tem representação canônica)
+    def chave_cache(*args, **kwargs):
+        argumentos = assinatura.bind(*args, **kwargs)
+        argumentos.apply_defaults()
+        try:
+            return chave_canonica(nome, argumentos.arguments, [contexto() for contexto in _contextos])
+        except TypeError:
+            return None
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        alvo = CACHE_PADRAO if cache is None else cache
+        chave = chave_cache(*args, **kwargs) if alvo.ativo else None
+        if chave is None:
+            return funcao(*args, **kwargs)
+        resultado = alvo.obter(chave, _AUSENTE)
+        instrumentacao.anotar(cache="falha" if resultado is _AUSENTE else "acerto")
+        if resultado is _AUSENTE:
+            resultado = funcao(*args, **kwargs)
+            alvo.guardar(chave, resultado)
+        return resultado
+
+    envoltorio.chave_cache = chave_cache  # Permite consultar ou preencher o cache por fora (ex.: resolução em lote)
+    envoltorio.sem_cache = funcao  # Acesso direto à função original
+    return envoltorio
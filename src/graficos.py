@@ -0,0 +1,145 @@
+# Importa bibliotecas necessárias
+import os  # Para a pasta onde as figuras são salvas
+import re  # Para gerar nomes de arquivo a partir dos títulos
+import pickle  # Para enviar figuras aos processos de renderização
+import threading  # Para numerar as figuras sem repetição
+import unicodedata  # Para remover acentos dos nomes de arquivo
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait  # Para renderizar em segundo plano
+import matplotlib  # Para trocar o backend quando não há janela
+import matplotlib.pyplot as plt  # Para obter e fechar as figuras criadas pelas funções plotar_*
+
+# Modos de exibição: 'janela' abre a janela (plt.show, como antes), 'arquivo' salva em segundo plano,
+# 'desligado' não desenha nada (as funções plotar_* retornam logo no início)
+MODOS_GRAFICOS = ('janela', 'arquivo', 'desligado')
+
+# Formatos aceitos no modo 'arquivo'
+FORMATOS_GRAFICOS = ('png', 'svg', 'pdf')
+
+# Configuração atual (alterada por configurar_graficos)
+# (por padrão, um trabalhador por núcleo além do que executa os resolvedores)
+_configuracao = {"modo": "janela", "diretorio": "graficos", "formato": "png", "trabalhadores": max(1, (os.cpu_count() or 2) - 1),
+                 "processos": False, "dpi": 100}
+
+_executor = None  # Executor que salva as figuras (criado no primeiro uso)
+_executor_threads = None  # Threads para as figuras que não podem ser enviadas a outro processo
+_pendentes = []  # Figuras enviadas desde a última chamada de aguardar_graficos
+_trava = threading.Lock()
+_contador = 0  # Número sequencial das figuras (evita nomes repetidos)
+
+# Função que configura a exibição dos gráficos
+# modo: 'janela', 'arquivo' ou 'desligado'; diretorio e formato valem para o modo 'arquivo';
+# trabalhadores: quantas figuras são salvas ao mesmo tempo; processos=True usa processos em vez de threads
+def configurar_graficos(modo=None, diretorio=None, formato=None, trabalhadores=None, processos=None, dpi=None):
+    global _executor, _executor_threads
+    if modo is not None and modo not in MODOS_GRAFICOS:
+        raise ValueError(f"Modo desconhecido: {modo} (use um de {MODOS_GRAFICOS})")
+    if formato is not None and formato not in FORMATOS_GRAFICOS:
+        raise ValueError(f"Formato desconhecido: {formato} (use um de {FORMATOS_GRAFICOS})")
+    aguardar_graficos()  # As figuras já enviadas terminam com a configuração antiga
+    with _trava:
+        if trabalhadores is not None or processos is not None:
+            for executor in {_executor, _executor_threads} - {None}:
+                executor.shutdown(wait=True)
+            _executor = _executor_threads = None  # Recriados no próximo uso com os novos parâmetros
+        novos = {"modo": modo, "diretorio": diretorio, "formato": formato, "trabalhadores": trabalhadores, "processos": processos, "dpi": dpi}
+        _configuracao.update({chave: valor for chave, valor in novos.items() if valor is not None})
+    if _configuracao["modo"] == "arquivo":
+        plt.switch_backend("Agg")  # Sem janelas: as figuras só são desenhadas nos arquivos
+    return dict(_configuracao)
+
+# Função que indica se os gráficos estão desligados: as funções plotar_* consultam antes de montar a figura, porque
+# montar os artistas do matplotlib (e o layout dos grafos do networkx) custa mais que resolver os exemplos pequenos
+def graficos_desligados():
+    return _configuracao["modo"] == "desligado"
+
+# Função auxiliar que transforma um título em nome de arquivo (sem acentos, espaços ou símbolos)
+def _nome_arquivo(titulo):
+    texto = unicodedata.normalize("NFKD", str(titulo)).encode("ascii", "ignore").decode()
+    return re.sub(r"[^A-Za-z0-9]+", "_", texto).strip("_").lower() or "grafico"
+
+# Funções auxiliares executadas em segundo plano
+def _salvar_figura(figura, caminho, dpi):
+    figura.savefig(caminho, dpi=dpi)
+    return caminho
+
+def _salvar_figura_serializada(dados, caminho, dpi):
+    return _salvar_figura(pickle.loads(dados), caminho, dpi)
+
+def _iniciar_processo():
+    matplotlib.use("Agg")  # Os processos de renderização nunca abrem janelas
+
+# Funções auxiliares que devolvem (criando no primeiro uso) os executores das figuras
+def _obter_executor():
+    global _executor
+    if _executor is None:
+        if _configuracao["processos"]:
+            _executor = ProcessPoolExecutor(max_workers=_configuracao["trabalhadores"], initializer=_iniciar_processo)
+        else:
+            _executor = _obter_executor_threads()
+    return _executor
+
+def _obter_executor_threads():
+    global _executor_threads
+    if _executor_threads is None:
+        _executor_threads = ThreadPoolExecutor(max_workers=_configuracao["trabalhadores"], thread_name_prefix="graficos")
+    return _executor_threads
+
+# Função chamada pelas funções plotar_* no lugar de plt.show(), para que o modo de exibição seja escolhido num só lugar
+# No modo 'janela' mostra a figura; no modo 'arquivo' fecha a figura no pyplot e a salva em segundo plano,
+# devolvendo um Future com o caminho do arquivo (o cálculo continua enquanto a figura é desenhada); no modo
+# 'desligado' só fecha a figura
+def exibir_figura(titulo=None, figura=None):
+    global _contador
+    modo = _configuracao["modo"]
+    figura = plt.gcf() if figura is None else figura
+    if modo == "janela":
+        plt.show()
+        return None
+    plt.close(figura)  # Tira a figura do pyplot: a thread principal já pode criar a próxima
+    if modo == "desligado":
+        return None
+    with _trava:
+        _contador += 1
+        numero = _contador
+    os.makedirs(_configuracao["diretorio"], exist_ok=True)
+    caminho = os.path.join(_configuracao["diretorio"], f"{numero:05d}_{_nome_arquivo(titulo)}.{_configuracao['formato']}")
+    dados = None
+    if _configuracao["processos"]:
+        try:
+            dados = pickle.dumps(figura)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            dados = None  # Alguns artistas (ex.: rótulos curvos do networkx) não são serializáveis: a figura vai para uma thread
+    if dados is not None:
+        futuro = _obter_executor().submit(_salvar_figura_serializada, dados, caminho, _configuracao["dpi"])
+    else:
+        futuro = _obter_executor_threads().submit(_salvar_figura, figura, caminho, _configuracao["dpi"])
+    with _trava:
+        _pendentes.append(futuro)
+    return futuro
+
+# Função que espera as figuras pendentes serem salvas e devolve os caminhos dos arquivos
+# Erros de renderização aparecem aqui (a exceção do primeiro Future com erro é relançada)
+def aguardar_graficos(timeout=None):
+    with _trava:
+        pendentes = list(_pendentes)
+        _pendentes.clear()
+    concluidos, nao_concluidos = wait(pendentes, timeout=timeout)
+    with _trava:
+        _pendentes.extend(f for f in pendentes if f in nao_concluidos)  # Continuam pendentes para a próxima espera
+    return [futuro.result() for futuro in pendentes if futuro in concluidos]
+
+# Função que desliga os gráficos deste processo sem esperar figuras pendentes (usada nos processos trabalhadores,
+# que não desenham nada; configurar_graficos esperaria as figuras antes de trocar o modo)
+def desligar_graficos():
+    _configuracao["modo"] = "desligado"
+
+# Função auxiliar chamada no processo filho após um fork (ex.: trabalhadores de src/lote.py): as figuras pendentes e
+# os executores são do processo pai (as threads deles não existem no filho, e esperar por eles travaria para sempre)
+def _apos_fork():
+    global _executor, _executor_threads, _pendentes, _trava
+    _executor = _executor_threads = None
+    _pendentes = []
+    _trava = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_apos_fork)
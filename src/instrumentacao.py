@@ -0,0 +1,185 @@
+# Importa bibliotecas necessárias
+import json  # Para as mensagens estruturadas do observador de log
+import time  # Para medir as fases
+import logging  # Para o observador que escreve no log
+import threading  # Medições em andamento separadas por thread; trava do coletor de métricas
+import functools  # Para preservar nome e documentação das funções decoradas
+from contextlib import contextmanager  # Para os blocos "with" de medição e de observador temporário
+
+# Observadores registrados: funções (ou objetos chamáveis) que recebem o evento de cada resolução
+# Sem observadores a instrumentação fica desligada e as funções decoradas chamam o resolvedor direto
+_observadores = []
+
+# Pilha das medições em andamento na thread atual (resolvedores chamados por outros resolvedores ficam empilhados)
+_atual = threading.local()
+
+# Função que registra um observador (ex.: uma função, ObservadorLog() ou ColetorMetricas())
+def registrar_observador(observador):
+    _observadores.append(observador)
+    return observador
+
+# Função que remove um observador registrado
+def remover_observador(observador):
+    if observador in _observadores:
+        _observadores.remove(observador)
+
+# Observador temporário (removido ao sair do bloco "with")
+@contextmanager
+def observando(observador):
+    registrar_observador(observador)
+    try:
+        yield observador
+    finally:
+        remover_observador(observador)
+
+# Função que indica se há alguma medição em andamento na thread atual (o solver só coleta detalhes nesse caso)
+def medindo_agora():
+    return bool(getattr(_atual, "pilha", None))
+
+# Medição de uma chamada de resolvedor: fases, chamadas ao solver e métricas anotadas pelo próprio algoritmo
+class Medicao:
+    def __init__(self, nome=None):
+        self.nome = nome
+        self.inicio = time.perf_counter()
+        self.fim = None
+        self.chamadas = []  # Uma entrada por chamada ao solver: inicio, fim, variaveis, restricoes, iteracoes, nos
+        self.metricas = {}  # Anotadas com anotar() e contar() (ex.: iterações do simplex de transporte, nós do branch-and-bound)
+
+    # Função que separa o tempo em montagem do modelo, solver e extração dos resultados
+    # Resolvedores que não chamam o solver (algoritmos próprios) contam todo o tempo como resolução
+    def fases(self):
+        fim = self.fim if self.fim is not None else time.perf_counter()
+        total = fim - self.inicio
+        if not self.chamadas:
+            return {"construcao": 0.0, "resolucao": total, "extracao": 0.0, "total": total}
+        resolucao = sum(c["fim"] - c["inicio"] for c in self.chamadas)
+        extracao = fim - self.chamadas[-1]["fim"]
+        return {"construcao": total - resolucao - extracao, "resolucao": resolucao, "extracao": extracao, "total": total}
+
+    # Função que monta o evento enviado aos observadores
+    def evento(self, resultado=None, erro=None):
+        # Contagens do solver somadas às anotadas pelo resolvedor (None quando ninguém informou)
+        def somar(chave):
+            valores = [c[chave] for c in self.chamadas if c.get(chave) is not None]
+            if chave in self.metricas:
+                valores.append(self.metricas[chave])
+            return sum(valores) if valores else None
+
+        return {
+            "resolvedor": self.nome,
+            "fases": self.fases(),
+            "chamadas_solver": len(self.chamadas),
+            "variaveis": max((c["variaveis"] for c in self.chamadas), default=None),  # Maior modelo enviado ao solver
+            "restricoes": max((c["restricoes"] for c in self.chamadas), default=None),
+            "iteracoes": somar("iteracoes"),
+            "nos": somar("nos"),
+            "status": resultado.get("status") if isinstance(resultado, dict) else None,
+            "erro": None if erro is None else f"{type(erro).__name__}: {erro}",
+            **{chave: valor for chave, valor in self.metricas.items() if chave not in ("iteracoes", "nos")}
+        }
+
+# Bloco "with" que mede tudo o que roda dentro dele na thread atual (sem avisar os observadores)
+# Ex.: "with medindo() as medicao: resolver(...)" e depois medicao.fases()
+@contextmanager
+def medindo(nome=None):
+    medicao = Medicao(nome)
+    pilha = _atual.__dict__.setdefault("pilha", [])
+    pilha.append(medicao)
+    try:
+        yield medicao
+    finally:
+        medicao.fim = time.perf_counter()
+        pilha.remove(medicao)
+
+# Função chamada pelo solver a cada modelo resolvido: registra a chamada em todas as medições em andamento
+def registrar_chamada_solver(inicio, fim, variaveis, restricoes, iteracoes=None, nos=None):
+    chamada = {"inicio": inicio, "fim": fim, "variaveis": variaveis, "restricoes": restricoes, "iteracoes": iteracoes, "nos": nos}
+    for medicao in getattr(_atual, "pilha", ()):
+        medicao.chamadas.append(chamada)
+
+# Função que anota métricas da resolução atual (ex.: anotar(metodo='pd')); não faz nada sem medição em andamento
+def anotar(**metricas):
+    pilha = getattr(_atual, "pilha", None)
+    if pilha:
+        pilha[-1].metricas.update(metricas)
+
+# Função que soma contagens na resolução atual (ex.: contar(iteracoes=pivos, nos=nos_da_busca))
+def contar(**contagens):
+    pilha = getattr(_atual, "pilha", None)
+    if pilha:
+        metricas = pilha[-1].metricas
+        for chave, valor in contagens.items():
+            metricas[chave] = metricas.get(chave, 0) + valor
+
+# Decorador das funções resolver_problema_*: com algum observador registrado, mede a chamada e envia o evento
+# a cada observador; sem observadores chama a função direto (o custo é só verificar uma lista)
+def instrumentado(funcao):
+    nome = f"{funcao.__module__}.{funcao.__qualname__}"
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        if not _observadores:
+            return funcao(*args, **kwargs)
+        with medindo(nome) as medicao:
+            try:
+                resultado = funcao(*args, **kwargs)
+            except Exception as erro:
+                medicao.fim = time.perf_counter()
+                _notificar(medicao.evento(erro=erro))
+                raise
+        _notificar(medicao.evento(resultado))
+        return resultado
+
+    # Os atributos do cache (chave_cache, sem_cache) continuam acessíveis pela função decorada
+    return envoltorio
+
+# Função auxiliar que entrega um evento aos observadores (o erro de um observador não interrompe a resolução)
+def _notificar(evento):
+    for observador in list(_observadores):
+        try:
+            observador(evento)
+        except Exception:
+            logging.getLogger(__name__).exception("Erro no observador de instrumentação %r", observador)
+
+# Observador que escreve cada evento no log (mensagem em JSON; o evento também vai no atributo "instrumentacao")
+class ObservadorLog:
+    def __init__(self, logger=None, nivel=logging.INFO):
+        self.logger = logger or logging.getLogger(__name__)
+        self.nivel = nivel
+
+    def __call__(self, evento):
+        if self.logger.isEnabledFor(self.nivel):
+            self.logger.log(self.nivel, json.dumps(evento, ensure_ascii=False, default=str), extra={"instrumentacao": evento})
+
+# Observador que acumula métricas por resolvedor (chamadas, erros, tempo de cada fase, iterações e nós)
+class ColetorMetricas:
+    def __init__(self):
+        self._trava = threading.Lock()
+        self._metricas = {}
+
+    def __call__(self, evento):
+        with self._trava:
+            metricas = self._metricas.setdefault(evento["resolvedor"], {
+                "chamadas": 0, "erros": 0, "chamadas_solver": 0, "iteracoes": 0, "nos": 0, "tempo_maximo": 0.0,
+                "tempos": {"construcao": 0.0, "resolucao": 0.0, "extracao": 0.0, "total": 0.0}})
+            metricas["chamadas"] += 1
+            metricas["erros"] += evento["erro"] is not None
+            metricas["chamadas_solver"] += evento["chamadas_solver"]
+            metricas["iteracoes"] += evento["iteracoes"] or 0
+            metricas["nos"] += evento["nos"] or 0
+            metricas["tempo_maximo"] = max(metricas["tempo_maximo"], evento["fases"]["total"])
+            for fase, tempo in evento["fases"].items():
+                metricas["tempos"][fase] += tempo
+
+    # Função que devolve uma cópia das métricas acumuladas, com o tempo médio por chamada
+    def resumo(self):
+        with self._trava:
+            copia = {nome: {**m, "tempos": dict(m["tempos"])} for nome, m in self._metricas.items()}
+        for metricas in copia.values():
+            metricas["tempo_medio"] = metricas["tempos"]["total"] / metricas["chamadas"]
+        return copia
+
+    # Função que zera as métricas
+    def limpar(self):
+        with self._trava:
+            self._metricas.clear()
@@ -0,0 +1,197 @@
+# Importa bibliotecas necessárias
+import os  # Para o número de núcleos e para encerrar processos presos
+import signal  # Para encerrar o grupo de processos de um trabalhador (inclui o CBC)
+import time  # Para medir o tempo de cada instância e aplicar o timeout
+import multiprocessing  # Para os processos trabalhadores
+from collections.abc import Mapping  # Para converter visões do tipo dicionário em JSON
+from multiprocessing.connection import wait  # Para esperar respostas de vários trabalhadores ao mesmo tempo
+from . import registro  # Para localizar o resolvedor de cada problema
+from . import solver  # Para repassar a configuração do solver aos trabalhadores
+from . import graficos  # Os trabalhadores nunca desenham gráficos
+
+# Ordens de saída: 'entrada' devolve os resultados na ordem das instâncias; 'conclusao' assim que cada uma termina
+ORDENS_LOTE = ('entrada', 'conclusao')
+
+# Função auxiliar que separa uma instância em (identificador, argumentos posicionais, argumentos nomeados)
+# Aceita {"id": ..., "args": [...], "kwargs": {...}}, uma lista (só posicionais) ou um dicionário (só nomeados);
+# no dicionário só de nomeados, "id" (se houver) é o identificador da instância, não um argumento do resolvedor
+def _normalizar_instancia(instancia, indice):
+    if isinstance(instancia, dict) and ("args" in instancia or "kwargs" in instancia):
+        return instancia.get("id", indice), list(instancia.get("args", [])), dict(instancia.get("kwargs", {}))
+    if isinstance(instancia, dict):
+        argumentos = dict(instancia)
+        return argumentos.pop("id", indice), [], argumentos
+    return indice, list(instancia), {}
+
+# Função executada em cada processo trabalhador: resolve as instâncias recebidas pela conexão, uma por vez
+def _trabalhador(conexao, id_problema, configuracao_solver, usar_cache):
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()  # Grupo próprio: no timeout o trabalhador e o CBC que ele iniciou são encerrados juntos
+    solver.configurar_solver(**configuracao_solver)
+    graficos.desligar_graficos()  # Sem esperar as figuras pendentes, que são do processo pai
+    registro.carregar_modulo(id_problema)
+    resolvedor = registro.obter_resolvedor(id_problema)
+    if not usar_cache:
+        resolvedor = getattr(resolvedor, "sem_cache", resolvedor)
+    while True:
+        tarefa = conexao.recv()
+        if tarefa is None:
+            break
+        indice, args, kwargs = tarefa
+        inicio = time.perf_counter()
+        try:
+            resultado = resolvedor(*args, **kwargs)
+            conexao.send((indice, True, resultado, time.perf_counter() - inicio))
+        except Exception as erro:  # O erro de uma instância não derruba o lote
+            conexao.send((indice, False, f"{type(erro).__name__}: {erro}", time.perf_counter() - inicio))
+
+# Função auxiliar que inicia um trabalhador e devolve (processo, conexão do lado principal)
+def _iniciar_trabalhador(contexto, id_problema, configuracao_solver, usar_cache):
+    conexao_principal, conexao_trabalhador = contexto.Pipe()
+    processo = contexto.Process(target=_trabalhador, args=(conexao_trabalhador, id_problema, configuracao_solver, usar_cache), daemon=True)
+    processo.start()
+    conexao_trabalhador.close()
+    return processo, conexao_principal
+
+# Função auxiliar que encerra um trabalhador (e os processos filhos, como o CBC) imediatamente
+def _encerrar_trabalhador(processo, conexao):
+    try:
+        os.killpg(processo.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        processo.kill()  # Sem grupo próprio (Windows, ou o trabalhador ainda não chamou setpgrp)
+    processo.join()
+    conexao.close()
+
+# Função que resolve muitas instâncias de um problema em paralelo e devolve (gerador) um registro por instância:
+# {"indice", "id", "situacao" ('ok', 'erro' ou 'timeout'), "resultado", "erro", "tempo"}
+# processos=None usa todos os núcleos; timeout (segundos) vale para cada instância: o trabalhador que passa do
+# limite é encerrado e substituído. usar_cache=False resolve sempre (ignora o cache de soluções nos trabalhadores)
+def resolver_lote(id_problema, instancias, processos=None, timeout=None, ordem='entrada', usar_cache=True):
+    if ordem not in ORDENS_LOTE:
+        raise ValueError(f"Ordem desconhecida: {ordem} (use uma de {ORDENS_LOTE})")
+    registro.obter_problema(id_problema)  # Valida o problema antes de iniciar os processos
+    processos = processos or os.cpu_count() or 1
+    contexto = multiprocessing.get_context()
+    configuracao_solver = solver.obter_configuracao()
+
+    fila = ((indice, *_normalizar_instancia(instancia, indice)) for indice, instancia in enumerate(instancias))
+    ids = {}  # Índice -> identificador das instâncias em andamento
+    trabalhadores = {}  # Conexão -> [processo, índice da tarefa atual, prazo]
+    prontos = {}  # Resultados que aguardam sua vez (ordem de entrada)
+    proximo = 0  # Próximo índice a ser devolvido na ordem de entrada
+    esgotada = False
+
+    # Envia a próxima instância a um trabalhador livre; devolve False quando não há mais instâncias
+    def despachar(conexao):
+        nonlocal esgotada
+        try:
+            indice, identificador, args, kwargs = next(fila)
+        except StopIteration:
+            esgotada = True
+            return False
+        ids[indice] = identificador
+        conexao.send((indice, args, kwargs))
+        trabalhadores[conexao][1:] = [indice, time.monotonic() + timeout if timeout else None]
+        return True
+
+    # Registra um resultado e devolve os que já podem sair (respeitando a ordem escolhida)
+    def concluir(indice, situacao, resultado, erro, tempo):
+        nonlocal proximo
+        registro_instancia = {"indice": indice, "id": ids.pop(indice), "situacao": situacao, "resultado": resultado, "erro": erro, "tempo": tempo}
+        if ordem == 'conclusao':
+            return [registro_instancia]
+        prontos[indice] = registro_instancia
+        saida = []
+        while proximo in prontos:
+            saida.append(prontos.pop(proximo))
+            proximo += 1
+        return saida
+
+    for _ in range(processos):
+        processo, conexao = _iniciar_trabalhador(contexto, id_problema, configuracao_solver, usar_cache)
+        trabalhadores[conexao] = [processo, None, None]
+        if not despachar(conexao):
+            break
+    try:
+        while any(estado[1] is not None for estado in trabalhadores.values()):
+            prazos = [estado[2] for estado in trabalhadores.values() if estado[1] is not None and estado[2] is not None]
+            espera = max(0.0, min(prazos) - time.monotonic()) if prazos else None
+            for conexao in wait([c for c, estado in trabalhadores.items() if estado[1] is not None], timeout=espera):
+                try:
+                    indice, sucesso, valor, tempo = conexao.recv()
+                except EOFError:
+                    # O trabalhador morreu (ex.: falta de memória): registra a falha e coloca outro no lugar
+                    processo, indice, _ = trabalhadores.pop(conexao)
+                    _encerrar_trabalhador(processo, conexao)
+                    yield from concluir(indice, 'erro', None, f"Processo encerrado (código {processo.exitcode})", None)
+                    processo, conexao = _iniciar_trabalhador(contexto, id_problema, configuracao_solver, usar_cache)
+                    trabalhadores[conexao] = [processo, None, None]
+                else:
+                    trabalhadores[conexao][1:] = [None, None]
+                    yield from concluir(indice, 'ok' if sucesso else 'erro', valor if sucesso else None, None if sucesso else valor, tempo)
+                if not esgotada:
+                    despachar(conexao)
+
+            # Instâncias que passaram do prazo: encerra o trabalhador e inicia outro no lugar
+            agora = time.monotonic()
+            for conexao, (processo, indice, prazo) in list(trabalhadores.items()):
+                if indice is not None and prazo is not None and agora >= prazo:
+                    del trabalhadores[conexao]
+                    _encerrar_trabalhador(processo, conexao)
+                    yield from concluir(indice, 'timeout', None, f"Tempo limite de {timeout} s excedido", timeout)
+                    processo, conexao = _iniciar_trabalhador(contexto, id_problema, configuracao_solver, usar_cache)
+                    trabalhadores[conexao] = [processo, None, None]
+                    if not esgotada:
+                        despachar(conexao)
+    finally:
+        # Encerra os trabalhadores (também quando quem consome o gerador para no meio)
+        for conexao, (processo, indice, _) in trabalhadores.items():
+            if indice is None:
+                try:
+                    conexao.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                processo.join(timeout=1)
+            if processo.is_alive():
+                _encerrar_trabalhador(processo, conexao)
+            else:
+                conexao.close()
+
+# Função que converte um resultado em valores aceitos pelo JSON (vetores NumPy viram listas, visões viram
+# dicionários e chaves que não são texto, como as tuplas (origem, destino), viram "origem|destino")
+def para_json(valor):
+    if isinstance(valor, Mapping):
+        return {(chave if isinstance(chave, str) else "|".join(map(str, chave)) if isinstance(chave, tuple) else str(chave)): para_json(item)
+                for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple, set, frozenset)):
+        return [para_json(item) for item in valor]
+    if hasattr(valor, "tolist"):
+        return valor.tolist()  # Vetores e escalares NumPy
+    return valor
+
+# Resumo de um lote: contagem por situação, tempo total e vazão (instâncias por segundo)
+class ResumoLote:
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.contagem = {"ok": 0, "erro": 0, "timeout": 0}
+        self.tempo_resolucao = 0.0  # Soma dos tempos de resolução informados pelos trabalhadores
+        self.falhas = []  # (id, erro) das instâncias que não foram resolvidas
+
+    # Função que contabiliza o registro de uma instância
+    def registrar(self, registro_instancia):
+        self.contagem[registro_instancia["situacao"]] += 1
+        self.tempo_resolucao += registro_instancia["tempo"] or 0.0
+        if registro_instancia["situacao"] != "ok":
+            self.falhas.append((registro_instancia["id"], registro_instancia["erro"]))
+
+    # Função que devolve o resumo como dicionário
+    def como_dict(self):
+        tempo_total = time.perf_counter() - self.inicio
+        total = sum(self.contagem.values())
+        return {
+            "instancias": total,
+            **self.contagem,
+            "tempo_total": tempo_total,  # Tempo de relógio do lote inteiro
+            "vazao": total / tempo_total if tempo_total > 0 else 0.0,  # Instâncias por segundo
+            "tempo_medio": self.tempo_resolucao / self.contagem["ok"] if self.contagem["ok"] else 0.0  # Por instância resolvida
+        }
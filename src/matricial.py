@@ -0,0 +1,525 @@
+# Importa bibliotecas necessárias
+import os  # Para os caminhos do modelo e da solução no diretório temporário
+import time  # Para medir o tempo do HiGHS em memória
+import shutil  # Para juntar a seção BOUNDS (gravada à parte) ao final do MPS
+import tempfile  # Diretório temporário do arquivo MPS e da solução do CBC
+import numpy as np  # Matrizes e vetores do modelo e dos resultados
+from . import solver  # Configuração compartilhada do solver e chamada ao executável do CBC
+from . import processos_cbc  # Diretório de trabalho do pool de processos do CBC
+from . import instrumentacao  # Registro da chamada ao HiGHS nas medições em andamento
+
+# Interface em memória do HiGHS (opcional): usada quando o solver configurado é 'highs'
+try:
+    import highspy
+except ImportError:
+    highspy = None
+
+# Sentidos aceitos para as restrições e o tipo de linha correspondente no MPS
+SENTIDOS = {'<=': 'L', '>=': 'G', '=': 'E', '==': 'E', 'L': 'L', 'G': 'G', 'E': 'E'}
+
+# Quantidade de coeficientes formatados de cada vez ao gravar o MPS (limita a memória dos textos)
+COEFICIENTES_POR_BLOCO = 100_000
+
+# Tamanho aproximado (bytes) de cada bloco lido do arquivo de solução do CBC (a solução nunca é lida inteira)
+BYTES_POR_BLOCO_SOLUCAO = 2 * 1024 * 1024
+
+# Função auxiliar que converte a matriz A em colunas comprimidas (CSC): (inicios, linhas, valores)
+# Aceita matriz densa (lista ou NumPy), matriz esparsa do SciPy (qualquer objeto com tocsc()) ou a tupla
+# (linhas, colunas, valores) no formato de coordenadas; coeficientes repetidos são somados e os zeros descartados
+def _colunas(A, num_restricoes, num_variaveis):
+    if hasattr(A, "tocsc"):
+        esparsa = A.tocsc()
+        if esparsa.shape != (num_restricoes, num_variaveis):
+            raise ValueError(f"A tem dimensão {esparsa.shape}, esperado {(num_restricoes, num_variaveis)}")
+        esparsa.sum_duplicates()
+        linhas, colunas = esparsa.indices, np.repeat(np.arange(num_variaveis), np.diff(esparsa.indptr))
+        valores = esparsa.data
+    elif isinstance(A, tuple) and len(A) == 3:
+        linhas, colunas, valores = (np.asarray(parte).ravel() for parte in A)
+        if linhas.size and (linhas.min() < 0 or linhas.max() >= num_restricoes or colunas.min() < 0 or colunas.max() >= num_variaveis):
+            raise ValueError("Índice fora da matriz A nas coordenadas (linhas, colunas, valores)")
+        chaves = colunas.astype(np.int64) * num_restricoes + linhas.astype(np.int64)
+        ordem = np.argsort(chaves, kind="stable")
+        chaves, valores = chaves[ordem], np.asarray(valores, dtype=float)[ordem]
+        unicas, inicios = np.unique(chaves, return_index=True)
+        valores = np.add.reduceat(valores, inicios) if valores.size else valores  # Soma os repetidos
+        colunas, linhas = np.divmod(unicas, num_restricoes) if num_restricoes else (unicas, unicas)
+    else:
+        densa = np.asarray(A, dtype=float).reshape(num_restricoes, num_variaveis) if num_restricoes else np.zeros((0, num_variaveis))
+        colunas, linhas = np.nonzero(densa.T)  # Percorre coluna por coluna
+        valores = densa.T[colunas, linhas]
+    valores = np.asarray(valores, dtype=float)
+    diferentes = valores != 0
+    linhas, colunas, valores = np.asarray(linhas)[diferentes], np.asarray(colunas)[diferentes], valores[diferentes]
+    inicios = np.concatenate(([0], np.cumsum(np.bincount(colunas, minlength=num_variaveis))))
+    return inicios, linhas.astype(np.int64), valores
+
+# Função auxiliar que normaliza os dados do modelo em vetores NumPy (valida as dimensões)
+def _modelo(c, A, b, sentidos, limites_inferiores, limites_superiores, inteiras):
+    custos = np.asarray(c, dtype=float).ravel()
+    num_variaveis = custos.size
+    lados = np.zeros(0) if b is None else np.asarray(b, dtype=float).ravel()
+    num_restricoes = lados.size
+    if A is None and num_restricoes:
+        raise ValueError("b foi informado sem a matriz A")
+    if not (np.isfinite(custos).all() and np.isfinite(lados).all()):
+        raise ValueError("c e b precisam ter valores finitos (sem infinito nem NaN)")
+    inicios, linhas, valores = _colunas(A if A is not None else np.zeros((0, num_variaveis)), num_restricoes, num_variaveis)
+
+    if sentidos is None:
+        tipos = np.full(num_restricoes, 'L')
+    else:
+        sentidos = [sentidos] * num_restricoes if isinstance(sentidos, str) else list(sentidos)
+        if len(sentidos) != num_restricoes:
+            raise ValueError(f"{len(sentidos)} sentidos para {num_restricoes} restrições")
+        try:
+            tipos = np.array([SENTIDOS[sentido] for sentido in sentidos], dtype='<U1')
+        except KeyError as erro:
+            raise ValueError(f"Sentido desconhecido: {erro.args[0]} (use um de {tuple(SENTIDOS)})") from None
+
+    # Limites: escalar ou vetor; None é -infinito (inferior) ou +infinito (superior)
+    inferiores = np.broadcast_to(np.asarray(-np.inf if limites_inferiores is None else limites_inferiores, dtype=float), (num_variaveis,))
+    superiores = np.broadcast_to(np.asarray(np.inf if limites_superiores is None else limites_superiores, dtype=float), (num_variaveis,))
+
+    # Integralidade: vetor de booleanos (uma posição por variável) ou lista de índices das variáveis inteiras
+    mascara = np.zeros(num_variaveis, dtype=bool)
+    if inteiras is not None:
+        inteiras = np.asarray(inteiras)
+        if inteiras.dtype == bool:
+            mascara[:] = inteiras
+        else:
+            mascara[inteiras.astype(np.int64)] = True
+    return {"c": custos, "inicios": inicios, "linhas": linhas, "valores": valores, "b": lados, "tipos": tipos,
+            "inferiores": inferiores, "superiores": superiores, "inteiras": mascara}
+
+# Modelo gravado em MPS à medida que as colunas são geradas: só o bloco atual de colunas fica em memória
+# linhas: sequência de (sentido, quantidade), ex.: [('<=', 3), ('>=', 5)] cria R0..R2 (<=) e R3..R7 (>=)
+# lados: lado direito de cada restrição, vetor denso ou (índices, valores) só dos que não são zero
+# Uso: "with EscritorMPS(caminho, linhas, lados) as escritor: escritor.adicionar_colunas(...)"; o arquivo é
+# completado (RHS, BOUNDS e ENDATA) ao sair do bloco ou em fechar()
+class EscritorMPS:
+    def __init__(self, caminho, linhas, lados=None):
+        self.caminho = caminho
+        self.lados = lados
+        self.num_variaveis = 0
+        self.num_restricoes = 0
+        self.trechos_inteiros = []  # (primeira, última + 1) de cada bloco de colunas inteiras
+        self._arquivo = open(caminho, "w")
+        self._limites = tempfile.TemporaryFile("w+")  # BOUNDS vem depois de COLUMNS e RHS: fica à parte até o fim
+        self._arquivo.write("NAME          MODELO  FREE\nROWS\n N  OBJ\n")  # FREE: nomes de qualquer tamanho, fora das colunas fixas
+        for sentido, quantidade in linhas:
+            if sentido not in SENTIDOS:
+                raise ValueError(f"Sentido desconhecido: {sentido} (use um de {tuple(SENTIDOS)})")
+            tipo, primeira = SENTIDOS[sentido], self.num_restricoes
+            for inicio in range(primeira, primeira + quantidade, COEFICIENTES_POR_BLOCO):
+                self._arquivo.write("".join([f" {tipo}  R{i}\n" for i in range(inicio, min(inicio + COEFICIENTES_POR_BLOCO, primeira + quantidade))]))
+            self.num_restricoes += quantidade
+        self._arquivo.write("COLUMNS\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastro):
+        if tipo_erro is None:
+            self.fechar()
+        else:
+            self._arquivo.close()  # Arquivo incompleto: quem chamou trata o erro
+            self._limites.close()
+
+    # Função que grava um bloco de colunas em formato CSC: a coluna k tem os coeficientes valores[inicios[k]:inicios[k+1]]
+    # nas restrições linhas[inicios[k]:inicios[k+1]]; limites: escalar ou vetor (None = sem limite);
+    # inteiras: True se todas as colunas do bloco são inteiras
+    def adicionar_colunas(self, custos, inicios, linhas, valores, inferiores=0.0, superiores=None, inteiras=False):
+        custos = np.asarray(custos, dtype=float).ravel()
+        inicios, linhas = np.asarray(inicios, dtype=np.int64), np.asarray(linhas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        quantidade, primeira = custos.size, self.num_variaveis
+        if inicios.size != quantidade + 1:
+            raise ValueError(f"inicios precisa ter {quantidade + 1} posições (uma a mais que as colunas)")
+        if linhas.size and (linhas.min() < 0 or linhas.max() >= self.num_restricoes):
+            raise ValueError(f"Restrição fora do modelo (há {self.num_restricoes} restrições)")
+        if inteiras:
+            self._arquivo.write(f"    MARCA{len(self.trechos_inteiros)}  'MARKER'  'INTORG'\n")
+            self.trechos_inteiros.append((primeira, primeira + quantidade))
+
+        # Grava em trechos de colunas com até COEFICIENTES_POR_BLOCO coeficientes (limita a memória dos textos)
+        inicio = 0
+        while inicio < quantidade:
+            fim = int(np.searchsorted(inicios, inicios[inicio] + COEFICIENTES_POR_BLOCO, side="right")) - 1
+            fim = min(max(fim, inicio + 1), quantidade, inicio + COEFICIENTES_POR_BLOCO)
+            self._gravar_colunas(primeira + inicio, custos[inicio:fim], inicios[inicio:fim + 1], linhas, valores)
+            inicio = fim
+        if inteiras:
+            self._arquivo.write(f"    MARCA{len(self.trechos_inteiros) - 1}  'MARKER'  'INTEND'\n")
+        self._gravar_limites(primeira, quantidade, inferiores, superiores, inteiras)
+        self.num_variaveis += quantidade
+
+    # Função auxiliar que grava as linhas de um trecho de colunas em COLUMNS
+    # Cada coluna começa pelo coeficiente do objetivo (mesmo zero, para que toda variável apareça no MPS)
+    def _gravar_colunas(self, primeira, custos, inicios, linhas, valores):
+        quantidade = custos.size
+        contagens = np.diff(inicios)
+        total = int(contagens.sum()) + quantidade
+        posicoes_objetivo = inicios[:-1] - inicios[0] + np.arange(quantidade)
+        colunas = np.repeat(np.arange(primeira, primeira + quantidade), contagens + 1)
+        todas_linhas, todos_valores = np.empty(total, dtype=np.int64), np.empty(total)
+        de_a = np.ones(total, dtype=bool)
+        de_a[posicoes_objetivo] = False
+        todas_linhas[posicoes_objetivo], todos_valores[posicoes_objetivo] = -1, custos
+        todas_linhas[de_a], todos_valores[de_a] = linhas[inicios[0]:inicios[-1]], valores[inicios[0]:inicios[-1]]
+        self._arquivo.write("".join([f"    C{j}  R{i}  {v!r}\n" if i >= 0 else f"    C{j}  OBJ  {v!r}\n"
+                                     for j, i, v in zip(colunas.tolist(), todas_linhas.tolist(), todos_valores.tolist())]))
+
+    # Função auxiliar que grava os limites das colunas do bloco fora do padrão [0, +infinito)
+    # (inteiras sem limite superior usam PL: alguns leitores assumem variável binária)
+    def _gravar_limites(self, primeira, quantidade, inferiores, superiores, inteiras):
+        inferiores = np.broadcast_to(np.asarray(-np.inf if inferiores is None else inferiores, dtype=float), (quantidade,))
+        superiores = np.broadcast_to(np.asarray(np.inf if superiores is None else superiores, dtype=float), (quantidade,))
+        fora_do_padrao = np.flatnonzero((inferiores != 0) | (superiores != np.inf) | bool(inteiras))
+        for inicio in range(0, fora_do_padrao.size, COEFICIENTES_POR_BLOCO):
+            trecho = fora_do_padrao[inicio:inicio + COEFICIENTES_POR_BLOCO]
+            limites = []
+            for j, inferior, superior in zip((trecho + primeira).tolist(), inferiores[trecho].tolist(), superiores[trecho].tolist()):
+                if inferior == -np.inf and superior == np.inf:
+                    limites.append(f" FR BND  C{j}\n")
+                    continue
+                if inferior == superior:
+                    limites.append(f" FX BND  C{j}  {inferior!r}\n")
+                    continue
+                if inferior == -np.inf:
+                    limites.append(f" MI BND  C{j}\n")
+                elif inferior != 0:
+                    limites.append(f" LO BND  C{j}  {inferior!r}\n")
+                if superior != np.inf:
+                    limites.append(f" UP BND  C{j}  {superior!r}\n")
+                elif inteiras:
+                    limites.append(f" PL BND  C{j}\n")
+            self._limites.write("".join(limites))
+
+    # Função que completa o arquivo (RHS, BOUNDS e ENDATA); devolve (número de variáveis, número de restrições)
+    def fechar(self):
+        if self._arquivo.closed:
+            return self.num_variaveis, self.num_restricoes
+        self._arquivo.write("RHS\n")
+        if isinstance(self.lados, tuple):
+            indices, valores = (np.asarray(parte).ravel() for parte in self.lados)
+        else:
+            lados = np.zeros(0) if self.lados is None else np.asarray(self.lados, dtype=float).ravel()
+            if lados.size != self.num_restricoes:
+                raise ValueError(f"{lados.size} lados direitos para {self.num_restricoes} restrições")
+            indices = np.flatnonzero(lados)
+            valores = lados[indices]
+        for inicio in range(0, indices.size, COEFICIENTES_POR_BLOCO):
+            trecho = slice(inicio, inicio + COEFICIENTES_POR_BLOCO)
+            self._arquivo.write("".join([f"    RHS  R{i}  {v!r}\n" for i, v in zip(indices[trecho].tolist(), np.asarray(valores[trecho], dtype=float).tolist())]))
+        if self._limites.tell():
+            self._arquivo.write("BOUNDS\n")
+            self._limites.seek(0)
+            shutil.copyfileobj(self._limites, self._arquivo)
+        self._arquivo.write("ENDATA\n")
+        self._arquivo.close()
+        self._limites.close()
+        return self.num_variaveis, self.num_restricoes
+
+# Função auxiliar que grava o modelo normalizado no formato MPS (variáveis C0, C1, ...; restrições R0, R1, ...)
+def _gravar_mps(caminho, modelo):
+    tipos, inteiras, inicios = modelo["tipos"], modelo["inteiras"], modelo["inicios"]
+    cortes_linhas = [0, *(np.flatnonzero(tipos[1:] != tipos[:-1]) + 1).tolist(), tipos.size] if tipos.size else [0]
+    linhas = [(str(tipos[a]), b - a) for a, b in zip(cortes_linhas[:-1], cortes_linhas[1:])]
+    with EscritorMPS(caminho, linhas, modelo["b"]) as escritor:
+        # Trechos de colunas com a mesma integralidade (os inteiros ficam entre marcadores)
+        cortes = [0, *(np.flatnonzero(np.diff(inteiras)) + 1).tolist(), inteiras.size] if inteiras.size else [0]
+        for primeira, ultima in zip(cortes[:-1], cortes[1:]):
+            trecho = slice(inicios[primeira], inicios[ultima])
+            escritor.adicionar_colunas(modelo["c"][primeira:ultima], inicios[primeira:ultima + 1] - inicios[primeira],
+                                       modelo["linhas"][trecho], modelo["valores"][trecho], modelo["inferiores"][primeira:ultima],
+                                       modelo["superiores"][primeira:ultima], bool(inteiras[primeira]))
+    return escritor
+
+# Função que grava um modelo em matrizes no formato MPS, sem montar expressões do PuLP
+# (mesmos parâmetros de resolver_matricial; devolve (número de variáveis, número de restrições))
+def escrever_mps(caminho, c, A=None, b=None, sentidos=None, limites_inferiores=0.0, limites_superiores=None, inteiras=None):
+    escritor = _gravar_mps(caminho, _modelo(c, A, b, sentidos, limites_inferiores, limites_superiores, inteiras))
+    return escritor.num_variaveis, escritor.num_restricoes
+
+# Função auxiliar que lê o arquivo de solução do CBC ("-printingOptions all": primeiro as linhas, depois as colunas)
+# em blocos de BYTES_POR_BLOCO_SOLUCAO, convertidos de uma vez com NumPy
+# Devolve (primeira linha, x, custos reduzidos, atividades das restrições, duais); com duais=False só x é guardado
+def _ler_solucao_cbc(caminho, num_variaveis, num_restricoes, duais=True):
+    x = np.zeros(num_variaveis)
+    custos_reduzidos, atividades, valores_duais = (np.zeros(num_variaveis), np.zeros(num_restricoes), np.zeros(num_restricoes)) if duais else (None, None, None)
+    with open(caminho) as arquivo:
+        cabecalho = arquivo.readline()
+        while True:
+            bloco = arquivo.readlines(BYTES_POR_BLOCO_SOLUCAO)
+            if not bloco:
+                break
+            # Cada linha: índice, nome, valor e dual ("**" na frente marca valores inviáveis e é descartado)
+            partes = np.array("".join(bloco).replace("**", " ").split()).reshape(-1, 4)
+            nomes = partes[:, 1]
+            indices = np.char.lstrip(nomes, "CR").astype(np.int64)
+            colunas = np.char.startswith(nomes, "C")
+            x[indices[colunas]] = partes[colunas, 2].astype(float)
+            if duais:
+                linhas = ~colunas
+                custos_reduzidos[indices[colunas]] = partes[colunas, 3].astype(float)
+                atividades[indices[linhas]] = partes[linhas, 2].astype(float)
+                valores_duais[indices[linhas]] = partes[linhas, 3].astype(float)
+    return cabecalho, x, custos_reduzidos, atividades, valores_duais
+
+# Função auxiliar que resolve com o CBC: gravar(caminho) grava o MPS e devolve o EscritorMPS já fechado
+def _resolver_cbc(gravar, maximizar, duais=True):
+    # Com o pool de processos do CBC, os arquivos ficam no diretório de trabalho dele (em memória)
+    with tempfile.TemporaryDirectory(prefix="matricial-", dir=processos_cbc.diretorio_trabalho()) as diretorio:
+        caminho_mps, caminho_solucao = os.path.join(diretorio, "modelo.mps"), os.path.join(diretorio, "solucao.txt")
+        escritor = gravar(caminho_mps)
+        solver.resolver_mps(caminho_mps, caminho_solucao, maximizar=maximizar, mip=bool(escritor.trechos_inteiros),
+                            variaveis=escritor.num_variaveis, restricoes=escritor.num_restricoes)
+        cabecalho, x, custos_reduzidos, atividades, valores_duais = _ler_solucao_cbc(caminho_solucao, escritor.num_variaveis,
+                                                                                     escritor.num_restricoes, duais)
+
+    # Mesma leitura de status do PuLP: "Stopped ... objective" é uma solução inteira sem prova de otimalidade
+    palavras = cabecalho.split()
+    primeira = palavras[0] if palavras else ""
+    otima = primeira == "Optimal"
+    if otima:
+        status = "Optimal"
+    elif primeira in ("Infeasible", "Integer"):
+        status = "Infeasible"
+    elif primeira == "Unbounded":
+        status = "Unbounded"
+    else:
+        status = "Not Solved"
+    sem_solucao = status == "Not Solved" and not (len(palavras) > 4 and palavras[4] == "objective")
+    fracionaria = status == "Not Solved" and any(np.any(np.abs(x[a:b] - np.round(x[a:b])) > 1e-6) for a, b in escritor.trechos_inteiros)
+    if sem_solucao or fracionaria:
+        return status, False, None
+    return status, otima, (x, atividades, valores_duais, custos_reduzidos)
+
+# Função auxiliar que resolve com o HiGHS (highspy): carregar(highs) passa o modelo ao solver e devolve
+# (número de variáveis, número de restrições, se há variáveis inteiras)
+def _resolver_highs(carregar, maximizar, duais=True):
+    if highspy is None:
+        raise ValueError("O modelo matricial com o solver 'highs' exige o pacote highspy")
+    configuracao = solver.obter_configuracao()
+    highs = highspy.Highs()
+    highs.setOptionValue("output_flag", bool(configuracao["mensagens"]))
+    if configuracao["limite_tempo"] is not None:
+        highs.setOptionValue("time_limit", configuracao["limite_tempo"])
+    if configuracao["gap_relativo"] is not None:
+        highs.setOptionValue("mip_rel_gap", configuracao["gap_relativo"])
+    if configuracao["threads"] is not None:
+        highs.setOptionValue("threads", configuracao["threads"])
+    if configuracao["presolve"] is not None:
+        highs.setOptionValue("presolve", "on" if configuracao["presolve"] else "off")
+    num_variaveis, num_restricoes, mip = carregar(highs)
+    highs.changeObjectiveSense(highspy.ObjSense.kMaximize if maximizar else highspy.ObjSense.kMinimize)
+    inicio = time.perf_counter()
+    highs.run()
+    fim = time.perf_counter()
+    informacoes = highs.getInfo()
+    instrumentacao.registrar_chamada_solver(inicio, fim, num_variaveis, num_restricoes, informacoes.simplex_iteration_count,
+                                            informacoes.mip_node_count if mip else None)
+
+    situacao = highs.getModelStatus()
+    estados = {highspy.HighsModelStatus.kOptimal: "Optimal", highspy.HighsModelStatus.kInfeasible: "Infeasible",
+               highspy.HighsModelStatus.kUnbounded: "Unbounded", highspy.HighsModelStatus.kUnboundedOrInfeasible: "Unbounded"}
+    status = estados.get(situacao, "Not Solved")
+    if informacoes.primal_solution_status != 2:  # 2 = solução viável disponível
+        return status, False, None
+    solucao = highs.getSolution()
+    x = np.array(solucao.col_value)
+    if not duais:
+        return status, status == "Optimal", (x, None, None, None)
+    return status, status == "Optimal", (x, np.array(solucao.row_value), np.array(solucao.row_dual), np.array(solucao.col_dual))
+
+# Função auxiliar que passa as matrizes ao HiGHS em memória (sem arquivo)
+def _carregar_highs(modelo):
+    def carregar(highs):
+        num_variaveis, num_restricoes = modelo["c"].size, modelo["b"].size
+        lp = highspy.HighsLp()
+        lp.num_col_, lp.num_row_ = num_variaveis, num_restricoes
+        lp.col_cost_, lp.col_lower_, lp.col_upper_ = modelo["c"], np.asarray(modelo["inferiores"]), np.asarray(modelo["superiores"])
+        tipos, lados = modelo["tipos"], modelo["b"]
+        lp.row_lower_ = np.where(tipos == 'L', -np.inf, lados)
+        lp.row_upper_ = np.where(tipos == 'G', np.inf, lados)
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.start_, lp.a_matrix_.index_, lp.a_matrix_.value_ = modelo["inicios"], modelo["linhas"], modelo["valores"]
+        mip = bool(modelo["inteiras"].any())
+        if mip:
+            lp.integrality_ = [highspy.HighsVarType.kInteger if inteira else highspy.HighsVarType.kContinuous
+                               for inteira in modelo["inteiras"].tolist()]
+        highs.passModel(lp)
+        return num_variaveis, num_restricoes, mip
+    return carregar
+
+# Função auxiliar que resolve um modelo pequeno no próprio processo (simplex denso de src/simplex.py), sem gravar
+# o MPS; devolve (status, ótimo provado, solução) ou None se o branch-and-bound desistir
+def _resolver_denso(modelo, maximizar):
+    num_variaveis, num_restricoes = modelo["c"].size, modelo["b"].size
+    A = np.zeros((num_restricoes, num_variaveis))
+    A[modelo["linhas"], np.repeat(np.arange(num_variaveis), np.diff(modelo["inicios"]))] = modelo["valores"]
+    resolvido = solver.resolver_denso(modelo["c"], A, modelo["b"], modelo["tipos"], np.asarray(modelo["inferiores"]),
+                                      np.asarray(modelo["superiores"]), modelo["inteiras"], maximizar)
+    return resolvido[:3] if resolvido is not None else None
+
+# Função auxiliar que resolve um modelo sem restrições direto dos limites e do sinal dos custos, sem chamar o
+# solver (o CBC não trata modelos sem linhas): cada variável vai para o limite que melhora o objetivo (custo zero:
+# o valor mais perto de zero); devolve (status, ótimo provado, solução) como _resolver_cbc
+def _resolver_sem_restricoes(custos, inferiores, superiores, inteiras, maximizar, duais=True):
+    inferiores = np.where(inteiras, np.ceil(inferiores - 1e-9), inferiores)
+    superiores = np.where(inteiras, np.floor(superiores + 1e-9), superiores)
+    if np.any(inferiores > superiores):
+        return "Infeasible", False, None
+    sentido = -custos if maximizar else custos
+    x = np.where(sentido > 0, inferiores, np.where(sentido < 0, superiores, np.clip(0.0, inferiores, superiores)))
+    if not np.isfinite(x).all():
+        return "Unbounded", False, None
+    return "Optimal", True, (x, np.zeros(0), np.zeros(0), custos.copy()) if duais else (x, None, None, None)
+
+# Função auxiliar que organiza o resultado de resolver_matricial e resolver_por_colunas
+def _resultado(status, otima, solucao, custos):
+    x, atividades, duais, custos_reduzidos = solucao if solucao is not None else (None, None, None, None)
+    return {
+        "status": status,  # Status no formato do PuLP ("Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": bool(otima and not solver.obter_configuracao()["gap_relativo"]),  # Ótimo provado, sem tolerância de gap
+        "objetivo": float(custos(x)) if x is not None else None,  # Valor da função objetivo
+        "x": x,  # Valor de cada variável
+        "atividades": atividades,  # Lado esquerdo de cada restrição (A x)
+        "duais": duais,  # Preço sombra de cada restrição
+        "custos_reduzidos": custos_reduzidos  # Custo reduzido de cada variável
+    }
+
+# Função que resolve um modelo dado em matrizes: otimiza c·x sujeito a A x (<=, >= ou =) b, limites e integralidade
+# A: matriz densa (lista ou NumPy), esparsa do SciPy ou tupla (linhas, colunas, valores); sentidos: um texto para
+# todas as restrições ou um por restrição ('<=', '>=', '='; padrão '<='); limites: escalar ou vetor (None = sem
+# limite); inteiras: vetor de booleanos ou índices das variáveis inteiras.
+# Devolve vetores NumPy: "x", "atividades" (A x), "duais" e "custos_reduzidos" (None quando não há solução),
+# além de "status", "otimo_comprovado" e "objetivo", como os resolvedores que usam o PuLP
+# Modelos pequenos (solver.modelo_pequeno) são resolvidos no próprio processo, sem MPS nem CBC, e modelos sem
+# restrições direto dos limites das variáveis
+def resolver_matricial(c, A=None, b=None, sentidos=None, limites_inferiores=0.0, limites_superiores=None, inteiras=None, maximizar=False):
+    modelo = _modelo(c, A, b, sentidos, limites_inferiores, limites_superiores, inteiras)
+    if not modelo["b"].size:
+        resolvido = _resolver_sem_restricoes(modelo["c"], modelo["inferiores"], modelo["superiores"], modelo["inteiras"], maximizar)
+        return _resultado(*resolvido, lambda x: modelo["c"] @ x)
+    if solver.modelo_pequeno(modelo["c"].size, modelo["b"].size):
+        resolvido = _resolver_denso(modelo, maximizar)
+        if resolvido is not None:
+            return _resultado(*resolvido, lambda x: modelo["c"] @ x)
+    if solver.obter_configuracao()["solver"] == 'highs':
+        status, otima, solucao = _resolver_highs(_carregar_highs(modelo), maximizar)
+    else:
+        status, otima, solucao = _resolver_cbc(lambda caminho: _gravar_mps(caminho, modelo), maximizar)
+    return _resultado(status, otima, solucao, lambda x: modelo["c"] @ x)
+
+# Função que resolve um modelo gerado coluna a coluna, sem nunca ter o modelo inteiro em memória: os blocos de
+# colunas são gravados no MPS à medida que são gerados e a solução é lida do arquivo em blocos
+# linhas e lados como em EscritorMPS; colunas: iterável (ex.: gerador) de dicionários com os parâmetros de
+# EscritorMPS.adicionar_colunas (custos, inicios, linhas, valores e, opcionais, inferiores, superiores, inteiras)
+# duais=False não guarda atividades, duais e custos reduzidos (só x), para economizar memória
+def resolver_por_colunas(linhas, lados, colunas, maximizar=False, duais=True):
+    linhas = list(linhas)
+    if not sum(quantidade for _, quantidade in linhas):
+        # Sem restrições: as colunas só têm custos e limites, juntados para resolver direto dos limites
+        partes = [np.zeros((4, 0))]
+        for bloco in colunas:
+            custos = np.asarray(bloco["custos"], dtype=float).ravel()
+            inferiores, superiores = bloco.get("inferiores", 0.0), bloco.get("superiores")
+            partes.append(np.stack([custos,
+                                    np.broadcast_to(np.asarray(-np.inf if inferiores is None else inferiores, dtype=float), custos.shape),
+                                    np.broadcast_to(np.asarray(np.inf if superiores is None else superiores, dtype=float), custos.shape),
+                                    np.full(custos.size, float(bool(bloco.get("inteiras", False))))]))
+        custos, inferiores, superiores, inteiras = np.concatenate(partes, axis=1)
+        resolvido = _resolver_sem_restricoes(custos, inferiores, superiores, inteiras.astype(bool), maximizar, duais)
+        return _resultado(*resolvido, lambda x: custos @ x)
+    objetivo = []  # Custos de cada bloco, para calcular o valor do objetivo sem gravar o vetor inteiro de novo
+
+    def gravar(caminho):
+        with EscritorMPS(caminho, linhas, lados) as escritor:
+            for bloco in colunas:
+                escritor.adicionar_colunas(**bloco)
+                objetivo.append((escritor.num_variaveis, np.asarray(bloco["custos"], dtype=float).ravel()))
+        return escritor
+
+    if solver.obter_configuracao()["solver"] == 'highs':
+        # O HiGHS lê o mesmo MPS gravado em fluxo (sem montar o modelo em memória no Python)
+        def carregar(highs):
+            with tempfile.TemporaryDirectory(prefix="matricial-") as diretorio:
+                escritor = gravar(os.path.join(diretorio, "modelo.mps"))
+                highs.readModel(escritor.caminho)
+            return escritor.num_variaveis, escritor.num_restricoes, bool(escritor.trechos_inteiros)
+        status, otima, solucao = _resolver_highs(carregar, maximizar, duais)
+    else:
+        status, otima, solucao = _resolver_cbc(gravar, maximizar, duais)
+    return _resultado(status, otima, solucao, lambda x: sum(custos @ x[fim - custos.size:fim] for fim, custos in objetivo))
+
+# Função que calcula a análise de sensibilidade de um LP de minimização com x >= 0 (sem limites superiores) já
+# resolvido, a partir da base ótima: cada intervalo vale para a mudança de um único dado, com os outros fixos
+# x e duais vêm da solução (ex.: resolver_matricial); a base escolhida é compatível com esses duais.
+# Devolve "x", "duais" e "custos_reduzidos" recalculados na base (o arquivo de solução do CBC tem só 8 algarismos),
+# "intervalos_lados" (m x 2): faixa de cada b[i] em que os duais continuam valendo (o objetivo muda
+# duais[i] por unidade); "intervalos_custos" (n x 2): faixa de cada c[j] em que x continua ótimo; e
+# "direcoes_lados" (n x m): quanto cada x[j] muda por unidade de b[i] dentro da faixa
+def sensibilidade(c, A, b, sentidos, x, duais, tolerancia=1e-9):
+    modelo = _modelo(c, A, b, sentidos, 0.0, None, None)
+    custos, lados, tipos = modelo["c"], modelo["b"], modelo["tipos"]
+    num_variaveis, num_restricoes = custos.size, lados.size
+    x, duais = np.asarray(x, dtype=float), np.asarray(duais, dtype=float)
+
+    # Forma com folgas: A x + S s = b, s >= 0 (S = +1 nas restrições <=, -1 nas >=; as de igualdade não têm folga)
+    densa = np.zeros((num_restricoes, num_variaveis))
+    densa[modelo["linhas"], np.repeat(np.arange(num_variaveis), np.diff(modelo["inicios"]))] = modelo["valores"]
+    sinais = np.select([tipos == 'L', tipos == 'G'], [1.0, -1.0], 0.0)
+    completa = np.hstack([densa, np.diag(sinais)])
+    folgas = np.divide(lados - densa @ x, sinais, out=np.zeros(num_restricoes), where=sinais != 0)
+    valores = np.concatenate([x, folgas])
+    custos_completos = np.concatenate([custos, np.zeros(num_restricoes)])
+    reduzidos = custos_completos - duais @ completa
+    igualdade = np.concatenate([np.zeros(num_variaveis, dtype=bool), sinais == 0])
+
+    # Base: primeiro as colunas com valor positivo, depois as de custo reduzido zero (degeneradas) e, em último caso,
+    # as demais; cada coluna só entra se for independente das já escolhidas (Gram-Schmidt)
+    prioridade = np.where(valores > tolerancia, 0, np.where(np.abs(reduzidos) <= 1e-6 * max(1.0, np.abs(custos).max(initial=0.0)), 1, 2)) + 3 * igualdade
+    ortonormal = np.zeros((num_restricoes, num_restricoes))
+    base = []
+    for k in np.lexsort((-valores, prioridade)).tolist():
+        if len(base) == num_restricoes:
+            break
+        coluna = completa[:, k]
+        resto = coluna - ortonormal[:, :len(base)] @ (ortonormal[:, :len(base)].T @ coluna)
+        norma = np.linalg.norm(resto)
+        if norma > 1e-9 * max(1.0, np.linalg.norm(coluna)):
+            ortonormal[:, len(base)] = resto / norma
+            base.append(k)
+    base = np.array(base, dtype=np.int64)
+    inversa = np.linalg.inv(completa[:, base])
+    valores_base = np.maximum(inversa @ lados, 0.0)
+    duais = custos_completos[base] @ inversa
+    reduzidos = custos_completos - duais @ completa
+
+    # Faixa de b[i]: x_B + delta * inversa[:, i] continua >= 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        aumento = np.where(inversa < -tolerancia, valores_base[:, None] / -inversa, np.inf).min(axis=0, initial=np.inf)
+        reducao = np.where(inversa > tolerancia, valores_base[:, None] / inversa, np.inf).min(axis=0, initial=np.inf)
+    intervalos_lados = np.column_stack([lados - reducao, lados + aumento])
+
+    # Faixa de c[j]: fora da base, c[j] pode cair até o custo reduzido; na base, os custos reduzidos das colunas fora
+    # da base (d_k - delta * alfa_k) continuam >= 0 (as folgas de igualdade nunca entram na base)
+    intervalos_custos = np.column_stack([custos - np.maximum(reduzidos[:num_variaveis], 0.0), np.full(num_variaveis, np.inf)])
+    fora = np.setdiff1d(np.flatnonzero(~igualdade), base)
+    estruturais = np.flatnonzero(base < num_variaveis)
+    if estruturais.size:
+        alfa = inversa[estruturais] @ completa[:, fora]
+        d = np.maximum(reduzidos[fora], 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            subida = np.where(alfa > tolerancia, d / alfa, np.inf).min(axis=1, initial=np.inf)
+            descida = np.where(alfa < -tolerancia, d / alfa, -np.inf).max(axis=1, initial=-np.inf)
+        j = base[estruturais]
+        intervalos_custos[j] = np.column_stack([custos[j] + descida, custos[j] + subida])
+
+    direcoes = np.zeros((num_variaveis, num_restricoes))
+    direcoes[base[estruturais]] = inversa[estruturais]
+    x = np.zeros(num_variaveis)
+    x[base[estruturais]] = valores_base[estruturais]
+    return {"x": x, "duais": duais, "custos_reduzidos": reduzidos[:num_variaveis], "intervalos_lados": intervalos_lados, "intervalos_custos": intervalos_custos, "direcoes_lados": direcoes}
@@ -1,8 +1,15 @@
 # Importa bibliotecas necessárias
 import pulp  # Para resolver problemas de otimização
 import matplotlib.pyplot as plt  # Para criar gráficos
+import numpy as np  # Para varrer muitos cenários de uma vez com vetores
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráficos das rações (src/graficos.py)
+from .solver import resolver_modelo  # Configuração compartilhada do solver (CBC/HiGHS, threads, limites)
+from .instrumentacao import instrumentado  # Medição das fases para os observadores registrados (src/instrumentacao.py)
 
 # Função que calcula a melhor quantidade de rações a produzir
+@instrumentado
+@em_cache
 def resolver_problema_racao(custo_cereal, custo_carne, preco_amgs, preco_re, 
                              consumo_amgs_cereal, consumo_amgs_carne, 
                              consumo_re_cereal, consumo_re_carne,
@@ -30,11 +37,12 @@ def resolver_problema_racao(custo_cereal, custo_carne, preco_amgs, preco_re,
     problema += consumo_amgs_carne * amgs + consumo_re_carne * re <= disponibilidade_carne, "Restricao_Carne"
 
     # Resolve o problema
-    problema.solve()
+    situacao = resolver_modelo(problema)  # Usa o solver configurado em src/solver.py (solver, threads, limites)
 
     # Salva os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
+        "status": situacao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": situacao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
         "quantidade_amgs": amgs.varValue,          # Quantidade de AMGS a  # Quantidade ideal de AMGS
         "quantidade_re": re.varValue,              # Quantidade ideal de RE
         "lucro_total": pulp.value(problema.objective)  # Lucro total
@@ -42,8 +50,176 @@ def resolver_problema_racao(custo_cereal, custo_carne, preco_amgs, preco_re,
 
     return resultado  # Retorna os resultados
 
+# Tolerância usada ao arredondar para baixo (evita perder uma unidade por erro de ponto flutuante)
+TOLERANCIA_VARREDURA = 1e-9
+# Inteiros avaliados de cada lado dos vértices da relaxação para achar o limite inferior da varredura
+VIZINHANCA_VARREDURA = 16
+
+# Função auxiliar: maior quantidade de uma ração que cabe no estoque (infinito se ela não consome nada)
+def _limite_producao(consumo_cereal, consumo_carne, disponibilidade_cereal, disponibilidade_carne):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        limite_cereal = np.where(consumo_cereal > 0, np.floor(disponibilidade_cereal / consumo_cereal + TOLERANCIA_VARREDURA), np.inf)
+        limite_carne = np.where(consumo_carne > 0, np.floor(disponibilidade_carne / consumo_carne + TOLERANCIA_VARREDURA), np.inf)
+    return np.minimum(limite_cereal, limite_carne)
+
+# Função que resolve de uma só vez muitos cenários do problema da ração (varredura de preços, custos e estoques)
+# Todos os parâmetros aceitam números ou arrays NumPy; os arrays são combinados por broadcasting,
+# então cada resultado tem o formato do broadcasting das entradas (ex.: uma grade 100x100 de preços)
+# O modelo tem só duas variáveis inteiras: para cada quantidade fixa de uma ração, a melhor quantidade
+# da outra é o maior inteiro que ainda cabe no estoque. Enumerar a ração de menor faixa, vetorizando
+# sobre todos os cenários, dá a solução ótima exata sem chamar o CBC; a enumeração fica numa janela em volta do
+# vértice da relaxação linear, cuja largura não depende do tamanho dos estoques. Só quando o lucro é (quase) paralelo
+# a uma restrição e nenhum inteiro perto dos vértices alcança o lucro da relaxação a janela pode chegar à faixa
+# toda, e o tempo volta a crescer com disponibilidade / consumo
+def varrer_problema_racao(custo_cereal, custo_carne, preco_amgs, preco_re,
+                          consumo_amgs_cereal, consumo_amgs_carne,
+                          consumo_re_cereal, consumo_re_carne,
+                          disponibilidade_cereal, disponibilidade_carne):
+    # Converte as entradas em arrays de mesmo formato
+    (custo_cereal, custo_carne, preco_amgs, preco_re,
+     consumo_amgs_cereal, consumo_amgs_carne, consumo_re_cereal, consumo_re_carne,
+     disponibilidade_cereal, disponibilidade_carne) = np.broadcast_arrays(*[
+        np.asarray(v, dtype=float) for v in (custo_cereal, custo_carne, preco_amgs, preco_re,
+                                             consumo_amgs_cereal, consumo_amgs_carne, consumo_re_cereal, consumo_re_carne,
+                                             disponibilidade_cereal, disponibilidade_carne)])
+    forma = custo_cereal.shape  # Formato dos resultados
+
+    if min(np.min(c, initial=0) for c in (consumo_amgs_cereal, consumo_amgs_carne, consumo_re_cereal, consumo_re_carne)) < 0:
+        raise ValueError("Os consumos de ingredientes devem ser não negativos")
+
+    # Lucro por unidade de cada ração (preço de venda - custo), como em resolver_problema_racao
+    lucro_amgs = preco_amgs - (consumo_amgs_cereal * custo_cereal + consumo_amgs_carne * custo_carne)
+    lucro_re = preco_re - (consumo_re_cereal * custo_cereal + consumo_re_carne * custo_carne)
+
+    # Cenários especiais: estoque negativo (inviável) e ração lucrativa que não consome nada (ilimitado)
+    inviavel = (disponibilidade_cereal < 0) | (disponibilidade_carne < 0)
+    limite_amgs = _limite_producao(consumo_amgs_cereal, consumo_amgs_carne, disponibilidade_cereal, disponibilidade_carne)
+    limite_re = _limite_producao(consumo_re_cereal, consumo_re_carne, disponibilidade_cereal, disponibilidade_carne)
+    ilimitado = ~inviavel & (((limite_amgs == np.inf) & (lucro_amgs > 0)) | ((limite_re == np.inf) & (lucro_re > 0)))
+    valido = ~inviavel & ~ilimitado
+
+    # Uma ração sem lucro positivo nunca entra na solução ótima (só ocuparia estoque)
+    limite_amgs = np.where(valido & (lucro_amgs > 0), limite_amgs, 0)
+    limite_re = np.where(valido & (lucro_re > 0), limite_re, 0)
+
+    # Em cada cenário enumera a ração com a menor faixa de valores possíveis; a outra é calculada em fórmula fechada
+    # (os vetores ficam planos durante a enumeração e voltam ao formato dos resultados no fim)
+    enumera_amgs = limite_amgs <= limite_re
+
+    # Valor de cada cenário para a ração enumerada (ou, com enumerada=False, para a outra), em vetor plano
+    def escolher(de_amgs, de_re, enumerada=True):
+        return (np.where(enumera_amgs, de_amgs, de_re) if enumerada else np.where(enumera_amgs, de_re, de_amgs)).ravel()
+    lucro_enum, limite_enum = escolher(lucro_amgs, lucro_re), escolher(limite_amgs, limite_re)
+    consumo_enum_cereal, consumo_enum_carne = escolher(consumo_amgs_cereal, consumo_re_cereal), escolher(consumo_amgs_carne, consumo_re_carne)
+    lucro_outra, limite_outra = escolher(lucro_amgs, lucro_re, False), escolher(limite_amgs, limite_re, False)
+    consumo_outra_cereal, consumo_outra_carne = escolher(consumo_amgs_cereal, consumo_re_cereal, False), escolher(consumo_amgs_carne, consumo_re_carne, False)
+    estoque_cereal, estoque_carne = disponibilidade_cereal.ravel(), disponibilidade_carne.ravel()
+
+    # Relaxação contínua: com k unidades da ração enumerada, a outra vai até o menor entre o seu limite e o que as
+    # sobras de cereal e de carne permitem, sem arredondar. O lucro contínuo h(k) é côncavo e nunca fica abaixo do
+    # lucro inteiro g(k) (que arredonda a outra ração para baixo)
+    def sobras(k, indices):
+        return estoque_cereal[indices] - consumo_enum_cereal[indices] * k, estoque_carne[indices] - consumo_enum_carne[indices] * k
+
+    def lucro_continuo(k, indices):
+        sobra_cereal, sobra_carne = sobras(k, indices)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            outra = np.minimum(limite_outra[indices], np.minimum(
+                np.where(consumo_outra_cereal[indices] > 0, sobra_cereal / consumo_outra_cereal[indices], np.inf),
+                np.where(consumo_outra_carne[indices] > 0, sobra_carne / consumo_outra_carne[indices], np.inf)))
+        return lucro_enum[indices] * k + lucro_outra[indices] * outra
+
+    def lucro_inteiro(k, indices):
+        sobra_cereal, sobra_carne = sobras(k, indices)
+        outra = np.minimum(_limite_producao(consumo_outra_cereal[indices], consumo_outra_carne[indices], sobra_cereal, sobra_carne),
+                           limite_outra[indices])
+        return lucro_enum[indices] * k + lucro_outra[indices] * outra, outra
+
+    # Vértices da relaxação: o máximo de h está num extremo da faixa ou onde duas das três retas (limite da outra ração,
+    # sobra de cereal, sobra de carne) se cruzam
+    ativos = np.flatnonzero(valido.ravel())
+    limite = limite_enum[ativos]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        retas = [(estoque_cereal[ativos], consumo_enum_cereal[ativos], consumo_outra_cereal[ativos]),
+                 (estoque_carne[ativos], consumo_enum_carne[ativos], consumo_outra_carne[ativos])]
+        (s1, c1, d1), (s2, c2, d2) = retas
+        candidatos = [np.zeros_like(limite), limite, (s1 * d2 - s2 * d1) / (c1 * d2 - c2 * d1)]
+        candidatos += [(s - limite_outra[ativos] * d) / c for s, c, d in retas]
+    candidatos = np.clip(np.nan_to_num(np.array(candidatos), nan=0.0, posinf=0.0, neginf=0.0), 0, limite)
+    maximo_continuo = np.array([lucro_continuo(k, ativos) for k in candidatos]).max(axis=0)
+
+    # Limite inferior: o melhor lucro inteiro nos inteiros próximos desses pontos (perto das pontas de cada aresta
+    # costuma haver um ponto inteiro sobre ela). Só os k com h(k) >= esse lucro podem ser ótimos, e como h é côncavo
+    # eles formam um intervalo: as pontas vêm de duas buscas binárias (vetorizadas sobre os cenários) a partir do
+    # melhor inteiro. A enumeração cobre só esse intervalo, não a faixa toda de cada cenário
+    passos = np.arange(-VIZINHANCA_VARREDURA, VIZINHANCA_VARREDURA + 1)
+    vizinhos = np.clip(np.floor(candidatos)[:, None, :] + passos[None, :, None], 0, limite).reshape(-1, ativos.size)
+    lucros_vizinhos = np.array([lucro_inteiro(k, ativos)[0] for k in vizinhos])
+    centro = vizinhos[np.argmax(lucros_vizinhos, axis=0), np.arange(ativos.size)]
+    minimo = lucros_vizinhos.max(axis=0)
+    # Se um vizinho já alcança o máximo da relaxação ele é ótimo e a janela se reduz a ele: evita percorrer uma aresta
+    # inteira quando o lucro é paralelo a ela (ou quase, pelos arredondamentos de preço - custo)
+    resolvido = minimo >= maximo_continuo - 1e-9 * (np.abs(minimo) + 1)
+    minimo = minimo - 1e-9 * (np.abs(lucro_outra[ativos]) + np.abs(minimo) + 1)  # Folga para os arredondamentos
+    esquerda, direita = np.zeros_like(centro), centro.copy()
+    while np.any(esquerda < direita):  # Menor k em [0, centro] com h(k) >= mínimo
+        meio = np.floor((esquerda + direita) / 2)
+        dentro = lucro_continuo(meio, ativos) >= minimo
+        esquerda, direita = np.where(dentro, esquerda, meio + 1), np.where(dentro, meio, direita)
+    inicio_janela = esquerda
+    esquerda, direita = centro.copy(), limite.copy()
+    while np.any(esquerda < direita):  # Maior k em [centro, limite] com h(k) >= mínimo
+        meio = np.ceil((esquerda + direita) / 2)
+        dentro = lucro_continuo(meio, ativos) >= minimo
+        esquerda, direita = np.where(dentro, meio, esquerda), np.where(dentro, direita, meio - 1)
+    inicio_janela = np.where(resolvido, centro, inicio_janela)
+    larguras = np.where(resolvido, 0, esquerda - inicio_janela)
+
+    melhor_lucro = np.full(lucro_enum.size, -np.inf)
+    melhor_enum = np.zeros(lucro_enum.size)
+    melhor_outra = np.zeros(lucro_enum.size)
+    # Cada cenário só é percorrido na sua janela: com os cenários em ordem decrescente de largura, os que ainda
+    # participam do passo t são sempre os primeiros (um cenário de janela grande não alonga os outros)
+    ordem = np.argsort(-larguras, kind='stable')
+    ativos, inicio_janela, larguras_ordenadas = ativos[ordem], inicio_janela[ordem], -larguras[ordem]  # Crescente, para o searchsorted
+    for t in range(int(-larguras_ordenadas[0]) + 1 if ativos.size else 0):
+        quantos = np.searchsorted(larguras_ordenadas, -t, side='right')  # Cenários com largura >= t
+        atuais, k = ativos[:quantos], inicio_janela[:quantos] + t
+        lucro, outra = lucro_inteiro(k, atuais)
+        melhora = lucro > melhor_lucro[atuais]  # Em caso de empate mantém o menor k
+        melhorados = atuais[melhora]
+        melhor_lucro[melhorados] = lucro[melhora]
+        melhor_enum[melhorados] = k[melhora]
+        melhor_outra[melhorados] = outra[melhora]
+
+    # Cenários inviáveis ou ilimitados não têm solução: ficam com NaN
+    melhor_lucro = np.where(valido, melhor_lucro.reshape(forma), np.nan)
+    melhor_enum = np.where(valido, melhor_enum.reshape(forma), np.nan)
+    melhor_outra = np.where(valido, melhor_outra.reshape(forma), np.nan)
+    quantidade_amgs = np.where(enumera_amgs, melhor_enum, melhor_outra)
+    quantidade_re = np.where(enumera_amgs, melhor_outra, melhor_enum)
+
+    # Organiza os resultados em um dicionário com a mesma estrutura de resolver_problema_racao, mas com arrays
+    resultado = {
+        "status": np.where(inviavel, "Infeasible", np.where(ilimitado, "Unbounded", "Optimal")),  # Status de cada cenário
+        "quantidade_amgs": quantidade_amgs,  # Quantidade ótima de AMGS em cada cenário
+        "quantidade_re": quantidade_re,      # Quantidade ótima de RE em cada cenário
+        "lucro_total": melhor_lucro          # Lucro ótimo de cada cenário
+    }
+
+    return resultado  # Retorna os resultados
+
+# Função que calcula a superfície de lucro ótimo para uma grade de preços de AMGS x RE
+# Os demais parâmetros (custos, consumos e estoques) são repassados para varrer_problema_racao
+def superficie_lucro_racao(precos_amgs, precos_re, **parametros):
+    grade_amgs, grade_re = np.meshgrid(np.asarray(precos_amgs, dtype=float), np.asarray(precos_re, dtype=float), indexing='ij')
+    dados = varrer_problema_racao(preco_amgs=grade_amgs, preco_re=grade_re, **parametros)
+    return dados["lucro_total"]  # Linha i = precos_amgs[i], coluna j = precos_re[j]
+
 # Função para criar um gráfico com os resultados
 def plotar_resultado(dados, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta as barras
     labels = ['AMGS', 'RE']  # Nomes das rações
     valores = [dados['quantidade_amgs'], dados['quantidade_re']]  # Quantidades produzidas
 
@@ -51,58 +227,96 @@ def plotar_resultado(dados, titulo):
     ax.bar(labels, valores)   # Cria barras com as quantidades
     ax.set_ylabel('Quantidade Produzida')  # Nome do eixo Y
     ax.set_title(titulo)      # Título do gráfico
-    plt.show()                # Mostra o gráfico
-
-# Exemplo 1: Configuração inicial
-dados_exemplo1 = resolver_problema_racao(
-    custo_cereal=1, custo_carne=4,  # Custos dos ingredientes
-    preco_amgs=20, preco_re=30,     # Preços de venda
-    consumo_amgs_cereal=5, consumo_amgs_carne=1,  # Ingredientes por AMGS
-    consumo_re_cereal=2, consumo_re_carne=4,      # Ingredientes por RE
-    disponibilidade_cereal=30000, disponibilidade_carne=10000  # Estoque de ingredientes
-)
-
-# Mostra os resultados do Exemplo 1
-print("Exemplo 1:")
-print("Status:", dados_exemplo1["status"])  # Status da solução
-print("Quantidade de AMGS a produzir:", dados_exemplo1["quantidade_amgs"])  # Unidades de AMGS
-print("Quantidade de RE a produzir:", dados_exemplo1["quantidade_re"])      # Unidades de RE
-print("Lucro Total: R$", dados_exemplo1["lucro_total"])  # Lucro obtido
-plotar_resultado(dados_exemplo1, "Produção - Exemplo 1")  # Mostra o gráfico
-print("\n" + "="*50 + "\n")  # Separador
-
-# Exemplo 2: Mesmo cenário, mas com preço do AMGS maior
-dados_exemplo2 = resolver_problema_racao(
-    custo_cereal=1, custo_carne=4,
-    preco_amgs=25, preco_re=30,  # AMGS mais caro
-    consumo_amgs_cereal=5, consumo_amgs_carne=1,
-    consumo_re_cereal=2, consumo_re_carne=4,
-    disponibilidade_cereal=30000, disponibilidade_carne=10000
-)
-
-# Mostra os resultados do Exemplo 2
-print("\nExemplo 2:")
-print("Status:", dados_exemplo2["status"])
-print("Quantidade de AMGS a produzir:", dados_exemplo2["quantidade_amgs"])
-print("Quantidade de RE a produzir:", dados_exemplo2["quantidade_re"])
-print("Lucro Total: R$", dados_exemplo2["lucro_total"])
-plotar_resultado(dados_exemplo2, "Produção - Exemplo 2")
-print("\n" + "="*50 + "\n")
-
-# Exemplo 3: Mesmo cenário do Exemplo 1, mas com menos carne disponível
-dados_exemplo3 = resolver_problema_racao(
-    custo_cereal=1, custo_carne=4,
-    preco_amgs=20, preco_re=30,
-    consumo_amgs_cereal=5, consumo_amgs_carne=1,
-    consumo_re_cereal=2, consumo_re_carne=4,
-    disponibilidade_cereal=30000, disponibilidade_carne=7000  # Menos carne
-)
-
-# Mostra os resultados do Exemplo 3
-print("\nExemplo 3:")
-print("Status:", dados_exemplo3["status"])
-print("Quantidade de AMGS a produzir:", dados_exemplo3["quantidade_amgs"])
-print("Quantidade de RE a produzir:", dados_exemplo3["quantidade_re"])
-print("Lucro Total: R$", dados_exemplo3["lucro_total"])
-plotar_resultado(dados_exemplo3, "Produção - Exemplo 3")
-print("\n" + "="*50 + "\n")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe as barras das quantidades de AMGS e RE
+
+# Função para criar um mapa de calor com a superfície de lucro de uma varredura de preços
+def plotar_superficie_lucro(precos_amgs, precos_re, lucros, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta o mapa de calor da varredura
+    fig, ax = plt.subplots()  # Cria uma figura
+    # Cada célula mostra o lucro ótimo para um par de preços (AMGS no eixo Y, RE no eixo X)
+    imagem = ax.pcolormesh(precos_re, precos_amgs, lucros, shading='auto')
+    fig.colorbar(imagem, ax=ax, label='Lucro Total (R$)')  # Barra de cores
+    ax.set_xlabel('Preço da RE')  # Nome do eixo X
+    ax.set_ylabel('Preço da AMGS')  # Nome do eixo Y
+    ax.set_title(titulo)  # Título do gráfico
+    exibir_figura(titulo)  # Exibe o mapa de calor do lucro por par de preços
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    dados_exemplo1 = resolver_problema_racao(
+        custo_cereal=1, custo_carne=4,  # Custos dos ingredientes
+        preco_amgs=20, preco_re=30,     # Preços de venda
+        consumo_amgs_cereal=5, consumo_amgs_carne=1,  # Ingredientes por AMGS
+        consumo_re_cereal=2, consumo_re_carne=4,      # Ingredientes por RE
+        disponibilidade_cereal=30000, disponibilidade_carne=10000  # Estoque de ingredientes
+    )
+
+    # Mostra os resultados do Exemplo 1
+    print("Exemplo 1:")
+    print("Status:", dados_exemplo1["status"])  # Status da solução
+    print("Quantidade de AMGS a produzir:", dados_exemplo1["quantidade_amgs"])  # Unidades de AMGS
+    print("Quantidade de RE a produzir:", dados_exemplo1["quantidade_re"])      # Unidades de RE
+    print("Lucro Total: R$", dados_exemplo1["lucro_total"])  # Lucro obtido
+    plotar_resultado(dados_exemplo1, "Produção - Exemplo 1")  # Mostra o gráfico
+    print("\n" + "="*50 + "\n")  # Separador
+
+    # Exemplo 2: Mesmo cenário, mas com preço do AMGS maior
+    dados_exemplo2 = resolver_problema_racao(
+        custo_cereal=1, custo_carne=4,
+        preco_amgs=25, preco_re=30,  # AMGS mais caro
+        consumo_amgs_cereal=5, consumo_amgs_carne=1,
+        consumo_re_cereal=2, consumo_re_carne=4,
+        disponibilidade_cereal=30000, disponibilidade_carne=10000
+    )
+
+    # Mostra os resultados do Exemplo 2
+    print("\nExemplo 2:")
+    print("Status:", dados_exemplo2["status"])
+    print("Quantidade de AMGS a produzir:", dados_exemplo2["quantidade_amgs"])
+    print("Quantidade de RE a produzir:", dados_exemplo2["quantidade_re"])
+    print("Lucro Total: R$", dados_exemplo2["lucro_total"])
+    plotar_resultado(dados_exemplo2, "Produção - Exemplo 2")
+    print("\n" + "="*50 + "\n")
+
+    # Exemplo 3: Mesmo cenário do Exemplo 1, mas com menos carne disponível
+    dados_exemplo3 = resolver_problema_racao(
+        custo_cereal=1, custo_carne=4,
+        preco_amgs=20, preco_re=30,
+        consumo_amgs_cereal=5, consumo_amgs_carne=1,
+        consumo_re_cereal=2, consumo_re_carne=4,
+        disponibilidade_cereal=30000, disponibilidade_carne=7000  # Menos carne
+    )
+
+    # Mostra os resultados do Exemplo 3
+    print("\nExemplo 3:")
+    print("Status:", dados_exemplo3["status"])
+    print("Quantidade de AMGS a produzir:", dados_exemplo3["quantidade_amgs"])
+    print("Quantidade de RE a produzir:", dados_exemplo3["quantidade_re"])
+    print("Lucro Total: R$", dados_exemplo3["lucro_total"])
+    plotar_resultado(dados_exemplo3, "Produção - Exemplo 3")
+    print("\n" + "="*50 + "\n")
+
+    # Exemplo 4: Varredura de preços (grade 100x100) com os dados do Exemplo 1, sem chamar o CBC
+    precos_amgs4 = np.linspace(10, 40, 100)  # Preços de venda da AMGS testados
+    precos_re4 = np.linspace(15, 45, 100)    # Preços de venda da RE testados
+    lucros4 = superficie_lucro_racao(
+        precos_amgs4, precos_re4,
+        custo_cereal=1, custo_carne=4,
+        consumo_amgs_cereal=5, consumo_amgs_carne=1,
+        consumo_re_cereal=2, consumo_re_carne=4,
+        disponibilidade_cereal=30000, disponibilidade_carne=10000
+    )
+
+    # Mostra os resultados do Exemplo 4
+    print("\nExemplo 4:")
+    print("Cenários avaliados:", lucros4.size)  # Número de combinações de preços
+    print("Lucro mínimo: R$", lucros4.min())  # Pior cenário da grade
+    print("Lucro máximo: R$", lucros4.max())  # Melhor cenário da grade
+    plotar_superficie_lucro(precos_amgs4, precos_re4, lucros4, "Superfície de Lucro - Exemplo 4")
+    print("\n" + "="*50 + "\n")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
@@ -1,40 +1,87 @@
 # Importa bibliotecas necessárias
-import pulp  # Para resolver problemas de otimização linear
+import numpy as np  # Para as quantidades nas consultas "e se"
 import matplotlib.pyplot as plt  # Para criar gráficos
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráfico de barras dos ingredientes (src/graficos.py)
+from .matricial import resolver_matricial, sensibilidade  # Modelo em matrizes e análise de sensibilidade (src/matricial.py)
+from .instrumentacao import instrumentado  # Medição das fases para os observadores registrados (src/instrumentacao.py)
 
 # Função que calcula a combinação de ingredientes mais barata para atender às necessidades de vitaminas
+@instrumentado
+@em_cache
 def resolver_problema_dieta(matriz_vitaminas, precos, quantidades_minimas):
-    # Conta o número de ingredientes e vitaminas
-    num_ingredientes = len(precos)  # Quantos ingredientes existem
-    num_vitaminas = len(quantidades_minimas)  # Quantas vitaminas precisam ser atendidas
+    # Os dados já são uma matriz (vitaminas x ingredientes): o modelo vai direto ao solver, sem expressões do PuLP
+    # Minimiza o custo total (preço * quantidade) com cada vitamina atingindo pelo menos a quantidade mínima
+    # e quantidades não negativas (limite inferior padrão)
+    solucao = resolver_matricial(precos, matriz_vitaminas, quantidades_minimas, sentidos='>=')
 
-    # Cria um problema para minimizar o custo
-    problema = pulp.LpProblem("Problema_Dieta", pulp.LpMinimize)
-
-    # Define as variáveis: quantidade de cada ingrediente (não negativa)
-    ingredientes = [pulp.LpVariable(f"x{i+1}", lowBound=0) for i in range(num_ingredientes)]
-
-    # Define o objetivo: minimizar o custo total (preço de cada ingrediente * quantidade)
-    problema += pulp.lpSum(precos[i] * ingredientes[i] for i in range(num_ingredientes)), "Custo_Total"
-
-    # Adiciona restrições: cada vitamina deve atingir pelo menos a quantidade mínima
-    for v in range(num_vitaminas):
-        problema += pulp.lpSum(matriz_vitaminas[v][i] * ingredientes[i] for i in range(num_ingredientes)) >= quantidades_minimas[v], f"Vitamina_{v+1}"
-
-    # Resolve o problema
-    problema.solve()
+    # Análise de sensibilidade (só com a solução ótima): preços sombra, custos reduzidos e faixas de validade
+    analise = None
+    if solucao["status"] == "Optimal":
+        analise = sensibilidade(precos, matriz_vitaminas, quantidades_minimas, '>=', solucao["x"], solucao["duais"])
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "quantidades": [ingredientes[i].varValue for i in range(num_ingredientes)],  # Quantidade de cada ingrediente
-        "custo_total": pulp.value(problema.objective)  # Custo total da dieta
+        "status": solucao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": solucao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "quantidades": solucao["x"].tolist() if solucao["x"] is not None else [None] * len(precos),  # Quantidade de cada ingrediente
+        "custo_total": solucao["objetivo"],  # Custo total da dieta
+        "precos_sombra": analise["duais"].tolist() if analise else None,  # Aumento do custo por unidade a mais de cada vitamina
+        "custos_reduzidos": analise["custos_reduzidos"].tolist() if analise else None,  # Quanto o preço de cada ingrediente fora da dieta precisa cair
+        # Faixas (mínimo, máximo) de cada quantidade mínima e de cada preço em que a análise continua valendo
+        "intervalos_minimos": [tuple(faixa) for faixa in analise["intervalos_lados"].tolist()] if analise else None,
+        "intervalos_precos": [tuple(faixa) for faixa in analise["intervalos_custos"].tolist()] if analise else None,
+        # Quanto cada quantidade (linha) muda por unidade de cada quantidade mínima (coluna), dentro da faixa
+        "direcoes_minimos": analise["direcoes_lados"].tolist() if analise else None
     }
 
     return resultado  # Retorna os resultados
 
+# Consultas "e se" sobre uma dieta resolvida: o custo com outra quantidade mínima de uma vitamina ou outro preço de
+# um ingrediente sai dos preços sombra e das faixas da análise de sensibilidade, sem resolver de novo; só quando o
+# novo valor sai da faixa o problema é resolvido outra vez (cada consulta muda um único dado da dieta original)
+class ConsultasDieta:
+    def __init__(self, matriz_vitaminas, precos, quantidades_minimas):
+        self.matriz_vitaminas = matriz_vitaminas
+        self.precos = list(precos)
+        self.quantidades_minimas = list(quantidades_minimas)
+        self.dados = resolver_problema_dieta(matriz_vitaminas, precos, quantidades_minimas)  # Já traz a análise de sensibilidade
+        self.otima = self.dados["status"] == "Optimal"
+        self.recalculos = 0  # Consultas que precisaram resolver o problema de novo
+
+    # Função que informa a dieta quando a quantidade mínima da vitamina (índice em quantidades_minimas) passa a ser nova_quantidade
+    def com_minimo(self, vitamina, nova_quantidade):
+        inferior, superior = self.dados["intervalos_minimos"][vitamina] if self.otima else (None, None)
+        if not self.otima or not inferior <= nova_quantidade <= superior:
+            minimos = list(self.quantidades_minimas)
+            minimos[vitamina] = nova_quantidade
+            return self._recalcular(self.precos, minimos)
+        variacao = nova_quantidade - self.quantidades_minimas[vitamina]
+        quantidades = np.asarray(self.dados["quantidades"]) + np.asarray(self.dados["direcoes_minimos"])[:, vitamina] * variacao
+        return {"status": self.dados["status"], "custo_total": self.dados["custo_total"] + self.dados["precos_sombra"][vitamina] * variacao,
+                "quantidades": np.maximum(quantidades, 0.0).tolist(), "recalculado": False}
+
+    # Função que informa a dieta quando o preço do ingrediente (índice em precos) passa a ser novo_preco
+    def com_preco(self, ingrediente, novo_preco):
+        inferior, superior = self.dados["intervalos_precos"][ingrediente] if self.otima else (None, None)
+        if not self.otima or not inferior <= novo_preco <= superior:
+            precos = list(self.precos)
+            precos[ingrediente] = novo_preco
+            return self._recalcular(precos, self.quantidades_minimas)
+        variacao = novo_preco - self.precos[ingrediente]
+        return {"status": self.dados["status"], "custo_total": self.dados["custo_total"] + self.dados["quantidades"][ingrediente] * variacao,
+                "quantidades": list(self.dados["quantidades"]), "recalculado": False}
+
+    # Função auxiliar que resolve a dieta com os dados alterados (fora da faixa da análise de sensibilidade)
+    def _recalcular(self, precos, quantidades_minimas):
+        self.recalculos += 1
+        dados = resolver_problema_dieta(self.matriz_vitaminas, precos, quantidades_minimas)
+        return {"status": dados["status"], "custo_total": dados["custo_total"], "quantidades": dados["quantidades"], "recalculado": True}
+
 # Função para criar um gráfico de barras com as quantidades dos ingredientes
 def plotar_dieta(dados, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta as barras
     labels = [f'Ingrediente {i+1}' for i in range(len(dados['quantidades']))]  # Nomes dos ingredientes
     valores = dados['quantidades']  # Quantidades de cada ingrediente
 
@@ -43,51 +90,71 @@ def plotar_dieta(dados, titulo):
     ax.set_ylabel('Quantidade utilizada')  # Nome do eixo Y
     ax.set_title(titulo)  # Título do gráfico
     plt.xticks(rotation=45)  # Rotaciona os rótulos do eixo X para melhor leitura
-    plt.show()  # Exibe o gráfico
-
-# Dados do problema
-matriz_vitaminas = [
-    [1, 0, 2, 2, 1, 2],  # Quantidade de vitamina 1 por ingrediente
-    [0, 1, 3, 1, 3, 2]   # Quantidade de vitamina 2 por ingrediente
-]
-precos = [35, 30, 60, 50, 27, 22]  # Preços dos ingredientes
-quantidades_minimas = [9, 19]  # Quantidades mínimas de vitaminas 1 e 2
-
-# Exemplo 1: Configuração inicial
-dados_dieta1 = resolver_problema_dieta(matriz_vitaminas, precos, quantidades_minimas)
-
-# Mostra os resultados do Exemplo 1
-print("Problema da Dieta - Exemplo 1:")
-print("Status:", dados_dieta1["status"])  # Status da solução
-for idx, qtd in enumerate(dados_dieta1["quantidades"]):
-    print(f"Quantidade do Ingrediente {idx+1}: {qtd:.2f}")  # Quantidade de cada ingrediente
-print("Custo Total: R$", dados_dieta1["custo_total"])  # Custo total
-plotar_dieta(dados_dieta1, "Composição da Dieta - Exemplo 1")  # Mostra o gráfico
-print("\n" + "="*50 + "\n")  # Separador
-
-# Exemplo 2: Aumentando as necessidades de vitaminas
-quantidades_minimas2 = [15, 30]  # Maiores quantidades mínimas de vitaminas
-dados_dieta2 = resolver_problema_dieta(matriz_vitaminas, precos, quantidades_minimas2)
-
-# Mostra os resultados do Exemplo 2
-print("\nProblema da Dieta - Exemplo 2:")
-print("Status:", dados_dieta2["status"])
-for idx, qtd in enumerate(dados_dieta2["quantidades"]):
-    print(f"Quantidade do Ingrediente {idx+1}: {qtd:.2f}")
-print("Custo Total: R$", dados_dieta2["custo_total"])
-plotar_dieta(dados_dieta2, "Composição da Dieta - Exemplo 2")
-print("\n" + "="*50 + "\n")
-
-# Exemplo 3: Alterando preços e exigências de vitaminas
-precos3 = [45, 25, 65, 55, 25, 18]  # Novos preços dos ingredientes
-quantidades_minimas3 = [10, 22]  # Novas quantidades mínimas de vitaminas
-dados_dieta3 = resolver_problema_dieta(matriz_vitaminas, precos3, quantidades_minimas3)
-
-# Mostra os resultados do Exemplo 3
-print("\nProblema da Dieta - Exemplo 3:")
-print("Status:", dados_dieta3["status"])
-for idx, qtd in enumerate(dados_dieta3["quantidades"]):
-    print(f"Quantidade do Ingrediente {idx+1}: {qtd:.2f}")
-print("Custo Total: R$", dados_dieta3["custo_total"])
-plotar_dieta(dados_dieta3, "Composição da Dieta - Exemplo 3")
-print("\n" + "="*50 + "\n")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe as barras dos ingredientes
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Dados do problema
+    matriz_vitaminas = [
+        [1, 0, 2, 2, 1, 2],  # Quantidade de vitamina 1 por ingrediente
+        [0, 1, 3, 1, 3, 2]   # Quantidade de vitamina 2 por ingrediente
+    ]
+    precos = [35, 30, 60, 50, 27, 22]  # Preços dos ingredientes
+    quantidades_minimas = [9, 19]  # Quantidades mínimas de vitaminas 1 e 2
+
+    # Exemplo 1: Configuração inicial
+    dados_dieta1 = resolver_problema_dieta(matriz_vitaminas, precos, quantidades_minimas)
+
+    # Mostra os resultados do Exemplo 1
+    print("Problema da Dieta - Exemplo 1:")
+    print("Status:", dados_dieta1["status"])  # Status da solução
+    for idx, qtd in enumerate(dados_dieta1["quantidades"]):
+        print(f"Quantidade do Ingrediente {idx+1}: {qtd:.2f}")  # Quantidade de cada ingrediente
+    print("Custo Total: R$", dados_dieta1["custo_total"])  # Custo total
+    plotar_dieta(dados_dieta1, "Composição da Dieta - Exemplo 1")  # Mostra o gráfico
+    print("\n" + "="*50 + "\n")  # Separador
+
+    # Exemplo 2: Aumentando as necessidades de vitaminas
+    quantidades_minimas2 = [15, 30]  # Maiores quantidades mínimas de vitaminas
+    dados_dieta2 = resolver_problema_dieta(matriz_vitaminas, precos, quantidades_minimas2)
+
+    # Mostra os resultados do Exemplo 2
+    print("\nProblema da Dieta - Exemplo 2:")
+    print("Status:", dados_dieta2["status"])
+    for idx, qtd in enumerate(dados_dieta2["quantidades"]):
+        print(f"Quantidade do Ingrediente {idx+1}: {qtd:.2f}")
+    print("Custo Total: R$", dados_dieta2["custo_total"])
+    plotar_dieta(dados_dieta2, "Composição da Dieta - Exemplo 2")
+    print("\n" + "="*50 + "\n")
+
+    # Exemplo 3: Alterando preços e exigências de vitaminas
+    precos3 = [45, 25, 65, 55, 25, 18]  # Novos preços dos ingredientes
+    quantidades_minimas3 = [10, 22]  # Novas quantidades mínimas de vitaminas
+    dados_dieta3 = resolver_problema_dieta(matriz_vitaminas, precos3, quantidades_minimas3)
+
+    # Mostra os resultados do Exemplo 3
+    print("\nProblema da Dieta - Exemplo 3:")
+    print("Status:", dados_dieta3["status"])
+    for idx, qtd in enumerate(dados_dieta3["quantidades"]):
+        print(f"Quantidade do Ingrediente {idx+1}: {qtd:.2f}")
+    print("Custo Total: R$", dados_dieta3["custo_total"])
+    plotar_dieta(dados_dieta3, "Composição da Dieta - Exemplo 3")
+    print("\n" + "="*50 + "\n")
+
+    # Exemplo 4: Consultas "e se" sobre a dieta do Exemplo 1, respondidas pela análise de sensibilidade
+    consultas = ConsultasDieta(matriz_vitaminas, precos, quantidades_minimas)
+    print("\nProblema da Dieta - Exemplo 4 (consultas \"e se\"):")
+    for idx, (preco_sombra, (minimo, maximo)) in enumerate(zip(consultas.dados["precos_sombra"], consultas.dados["intervalos_minimos"])):
+        print(f"Vitamina {idx+1}: preço sombra R$ {preco_sombra:.2f} por unidade, válido para mínimos entre {minimo:.2f} e {maximo:.2f}")
+    for vitamina, novo_minimo in [(1, 22), (1, 30)]:
+        consulta = consultas.com_minimo(vitamina, novo_minimo)
+        origem = "resolvido de novo" if consulta["recalculado"] else "pela análise de sensibilidade"
+        print(f"Mínimo da vitamina {vitamina+1} = {novo_minimo}: custo R$ {consulta['custo_total']:.2f} ({origem})")
+    consulta = consultas.com_preco(4, 20)
+    origem = "resolvido de novo" if consulta["recalculado"] else "pela análise de sensibilidade"
+    print(f"Preço do ingrediente 5 = 20: custo R$ {consulta['custo_total']:.2f} ({origem})")
+    print("\n" + "="*50 + "\n")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
@@ -1,106 +1,191 @@
 # Importa bibliotecas necessárias
-import pulp  # Para resolver problemas de otimização linear
+import numpy as np  # Para montar o modelo com vetores de fazendas e culturas
 import matplotlib.pyplot as plt  # Para criar gráficos
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráfico das proporções plantadas (src/graficos.py)
+from .matricial import resolver_matricial  # Modelo em matrizes, sem montar expressões do PuLP (src/matricial.py)
+from .lote import resolver_lote  # Cenários de água resolvidos em paralelo (src/lote.py)
+from .instrumentacao import instrumentado  # Medição das fases para os observadores registrados (src/instrumentacao.py)
+
+# Culturas do enunciado (a ordem é a dos vetores de área máxima, água e lucro por área)
+CULTURAS_PLANTIO = ('milho', 'arroz', 'feijao')
+
+# Modelos disponíveis: 'proporcoes' (uma proporção por cultura, igual em todas as fazendas, como no enunciado)
+# ou 'por_fazenda' (a área de cada cultura em cada fazenda é uma variável de decisão)
+MODELOS_PLANTIO = ('proporcoes', 'por_fazenda')
+
+# Função que calcula a melhor distribuição de culturas para maximizar o lucro
+# Fazendas e culturas são vetores de qualquer tamanho (culturas: nomes na ordem dos vetores por cultura); o modelo
+# é montado com NumPy e resolvido em forma matricial (src/matricial.py)
+# modelo='proporcoes' devolve a proporção de cada cultura (uma chave por cultura, ex.: "milho", e a lista "proporcoes");
+# modelo='por_fazenda' devolve a matriz "areas" (fazendas x culturas) e a área total de cada cultura
+@instrumentado
+@em_cache
+def resolver_problema_plantio(area_fazendas, agua_fazendas, area_maxima_cultura, agua_por_area, lucro_por_area,
+                              culturas=CULTURAS_PLANTIO, modelo='proporcoes'):
+    if modelo not in MODELOS_PLANTIO:
+        raise ValueError(f"Modelo desconhecido: {modelo} (use um de {MODELOS_PLANTIO})")
+    areas = np.asarray(area_fazendas, dtype=float)  # Área disponível em cada fazenda
+    aguas = np.asarray(agua_fazendas, dtype=float)  # Água disponível em cada fazenda
+    maximos = np.asarray(area_maxima_cultura, dtype=float)  # Área máxima de cada cultura
+    consumos = np.asarray(agua_por_area, dtype=float)  # Consumo de água por unidade de área de cada cultura
+    lucros = np.asarray(lucro_por_area, dtype=float)  # Lucro por unidade de área de cada cultura
+    culturas = list(culturas)
+    num_fazendas, num_culturas = areas.size, len(culturas)
+    if aguas.size != num_fazendas:
+        raise ValueError(f"{aguas.size} valores de água para {num_fazendas} fazendas")
+    if not maximos.size == consumos.size == lucros.size == num_culturas:
+        raise ValueError(f"Os vetores por cultura precisam ter {num_culturas} valores (um para cada uma de {culturas})")
+
+    if modelo == 'por_fazenda':
+        return _plantio_por_fazenda(areas, aguas, maximos, consumos, lucros, culturas)
+
+    # Variáveis: proporção da área para cada cultura (não negativa), a mesma em todas as fazendas
+    total = areas.sum()
+    fatores = areas / total  # Proporção da área de cada fazenda
+
+    # Objetivo: lucro de cada cultura ponderado pela área de cada fazenda (a soma dos fatores sai da soma sobre as fazendas)
+    custos = lucros * fatores.sum()
+
+    # Restrições por fazenda: área plantada até a área disponível e consumo de água até a água disponível;
+    # e, para cada cultura, a área total até a área máxima
+    A = np.vstack([np.outer(fatores, np.ones(num_culturas)), np.outer(fatores, consumos), np.eye(num_culturas) * total])
+    b = np.concatenate([areas, aguas, maximos])
+
+    # Resolve o problema (maximiza o lucro) com o solver configurado em src/solver.py
+    solucao = resolver_matricial(custos, A, b, maximizar=True)
+    proporcoes = solucao["x"].tolist() if solucao["x"] is not None else [None] * num_culturas
 
-# Função que calcula a melhor distribuição de culturas (milho, arroz, feijão) para maximizar o lucro
-def resolver_problema_plantio(area_fazendas, agua_fazendas, area_maxima_cultura, agua_por_area, lucro_por_area):
-    # Cria um problema para maximizar o lucro
-    problema = pulp.LpProblem("Problema_Plantio", pulp.LpMaximize)
-
-    # Define as variáveis: proporção da área para cada cultura (não negativa)
-    milho = pulp.LpVariable('Milho', lowBound=0)  # Proporção para milho
-    arroz = pulp.LpVariable('Arroz', lowBound=0)  # Proporção para arroz
-    feijao = pulp.LpVariable('Feijao', lowBound=0)  # Proporção para feijão
-
-    culturas = [milho, arroz, feijao]  # Lista das culturas
+    # Organiza os resultados em um dicionário
+    resultado = {
+        "status": solucao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": solucao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        **dict(zip(culturas, proporcoes)),  # Proporção da área para cada cultura (ex.: "milho")
+        "proporcoes": proporcoes,  # As mesmas proporções, na ordem das culturas
+        "lucro_total": solucao["objetivo"]  # Lucro total
+    }
 
-    # Calcula o lucro total, ponderado pela área de cada fazenda
-    lucro_total = sum(
-        sum(lucro_por_area[i] * culturas[i] * (area / sum(area_fazendas)) for i in range(3))
-        for area in area_fazendas
-    )
-    problema += lucro_total, "Lucro_Total"  # Define o objetivo: maximizar o lucro
+    return resultado  # Retorna os resultados
 
-    # Adiciona restrições para cada fazenda
-    for idx, (area, agua) in enumerate(zip(area_fazendas, agua_fazendas)):
-        fator = area / sum(area_fazendas)  # Proporção da área da fazenda
-        # Restrição de área: soma das áreas plantadas não pode exceder a área disponível
-        problema += pulp.lpSum(culturas[i] * fator for i in range(3)) <= area, f"Area_Fazenda_{idx+1}"
-        # Restrição de água: consumo de água pelas culturas não pode exceder a água disponível
-        problema += pulp.lpSum(culturas[i] * agua_por_area[i] * fator for i in range(3)) <= agua, f"Agua_Fazenda_{idx+1}"
+# Função auxiliar do modelo 'por_fazenda': a área de cada cultura em cada fazenda é uma variável (fazendas x culturas,
+# posição f * culturas + c); a matriz de restrições é montada em coordenadas com NumPy
+def _plantio_por_fazenda(areas, aguas, maximos, consumos, lucros, culturas):
+    num_fazendas, num_culturas = areas.size, len(culturas)
+    variaveis = np.arange(num_fazendas * num_culturas)
+    fazenda_de = np.repeat(np.arange(num_fazendas), num_culturas)  # Fazenda de cada variável
+    cultura_de = np.tile(np.arange(num_culturas), num_fazendas)  # Cultura de cada variável
 
-    # Restrições de área máxima para cada cultura
-    for i in range(3):
-        problema += culturas[i] * sum(area_fazendas) <= area_maxima_cultura[i], f"Area_Maxima_Cultura_{i+1}"
+    # Restrições: área (linhas 0 até F-1) e água (F até 2F-1) de cada fazenda; área máxima de cada cultura (2F em diante)
+    linhas = np.concatenate([fazenda_de, num_fazendas + fazenda_de, 2 * num_fazendas + cultura_de])
+    colunas = np.tile(variaveis, 3)
+    valores = np.concatenate([np.ones(variaveis.size), consumos[cultura_de], np.ones(variaveis.size)])
+    b = np.concatenate([areas, aguas, maximos])
 
-    # Resolve o problema
-    problema.solve()
+    # Resolve o problema (maximiza o lucro de todas as áreas plantadas)
+    solucao = resolver_matricial(lucros[cultura_de], (linhas, colunas, valores), b, maximizar=True)
+    plantadas = solucao["x"].reshape(num_fazendas, num_culturas) if solucao["x"] is not None else None
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "milho": milho.varValue,  # Proporção da área para milho
-        "arroz": arroz.varValue,  # Proporção da área para arroz
-        "feijao": feijao.varValue,  # Proporção da área para feijão
-        "lucro_total": pulp.value(problema.objective)  # Lucro total
+        "status": solucao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": solucao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "areas": plantadas,  # Área de cada cultura (colunas) em cada fazenda (linhas)
+        "area_por_cultura": dict(zip(culturas, plantadas.sum(axis=0).tolist())) if plantadas is not None else None,  # Área total de cada cultura
+        "lucro_total": solucao["objetivo"]  # Lucro total
     }
 
     return resultado  # Retorna os resultados
 
+# Função que resolve vários cenários de disponibilidade de água ao mesmo tempo, em processos trabalhadores
+# (src/lote.py); cenarios_agua: uma lista de água por fazenda para cada cenário. Os demais dados e o modelo valem
+# para todos os cenários; devolve os resultados na ordem dos cenários
+def resolver_cenarios_plantio(area_fazendas, cenarios_agua, area_maxima_cultura, agua_por_area, lucro_por_area,
+                              culturas=CULTURAS_PLANTIO, modelo='proporcoes', processos=None):
+    instancias = ({"args": [area_fazendas, agua, area_maxima_cultura, agua_por_area, lucro_por_area],
+                   "kwargs": {"culturas": list(culturas), "modelo": modelo}} for agua in cenarios_agua)
+    resultados = []
+    for item in resolver_lote("3", instancias, processos=processos):
+        if item["situacao"] != "ok":
+            raise RuntimeError(f"Cenário {item['indice']} não foi resolvido: {item['erro']}")
+        resultados.append(item["resultado"])
+    return resultados
+
 # Função para criar um gráfico de barras com a distribuição das culturas
-def plotar_plantio(dados, titulo):
-    labels = ['Milho', 'Arroz', 'Feijao']  # Nomes das culturas
-    valores = [dados['milho'], dados['arroz'], dados['feijao']]  # Proporções de área
+# culturas: os mesmos nomes passados a resolver_problema_plantio (modelo='proporcoes')
+def plotar_plantio(dados, titulo, culturas=CULTURAS_PLANTIO):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta as barras das culturas
+    labels = [cultura.capitalize() for cultura in culturas]  # Nomes das culturas
+    valores = [dados[cultura] for cultura in culturas]  # Proporções de área
 
     fig, ax = plt.subplots()  # Cria uma figura
     ax.bar(labels, valores)  # Cria o gráfico de barras
     ax.set_ylabel('Proporção da área plantada')  # Nome do eixo Y
     ax.set_title(titulo)  # Título do gráfico
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial
-area_fazendas = [400, 650, 350]  # Áreas disponíveis em cada fazenda
-agua_fazendas = [1800, 2200, 950]  # Água disponível em cada fazenda
-area_maxima_cultura = [660, 880, 400]  # Área máxima para milho, arroz e feijão
-agua_por_area = [5.5, 4, 3.5]  # Consumo de água por unidade de área para cada cultura
-lucro_por_area = [5000, 4000, 1800]  # Lucro por unidade de área para cada cultura
-
-dados_plantio1 = resolver_problema_plantio(area_fazendas, agua_fazendas, area_maxima_cultura, agua_por_area, lucro_por_area)
-
-# Mostra os resultados do Exemplo 1
-print("Problema do Plantio - Exemplo 1:")
-print("Status:", dados_plantio1["status"])  # Status da solução
-print(f"Proporção da área para Milho: {dados_plantio1['milho']:.4f}")  # Área para milho
-print(f"Proporção da área para Arroz: {dados_plantio1['arroz']:.4f}")  # Área para arroz
-print(f"Proporção da área para Feijão: {dados_plantio1['feijao']:.4f}")  # Área para feijão
-print("Lucro Total: R$", dados_plantio1["lucro_total"])  # Lucro total
-plotar_plantio(dados_plantio1, "Distribuição de Plantio - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Mudança nas áreas e água das fazendas
-data2_area_fazendas = [500, 400, 300]  # Novas áreas das fazendas
-data2_agua_fazendas = [1500, 1400, 1000]  # Nova disponibilidade de água
-area_maxima_cultura2 = [800, 700, 500]  # Novas áreas máximas para as culturas
-dados_plantio2 = resolver_problema_plantio(data2_area_fazendas, data2_agua_fazendas, area_maxima_cultura2, agua_por_area, lucro_por_area)
-
-# Mostra os resultados do Exemplo 2
-print("\nProblema do Plantio - Exemplo 2:")
-print("Status:", dados_plantio2["status"])
-print(f"Proporção da área para Milho: {dados_plantio2['milho']:.4f}")
-print(f"Proporção da área para Arroz: {dados_plantio2['arroz']:.4f}")
-print(f"Proporção da área para Feijão: {dados_plantio2['feijao']:.4f}")
-print("Lucro Total: R$", dados_plantio2["lucro_total"])
-plotar_plantio(dados_plantio2, "Distribuição de Plantio - Exemplo 2")
-
-# Exemplo 3: Mudança na água e nos lucros das culturas
-data3_agua_fazendas = [1300, 1800, 900]  # Nova disponibilidade de água
-lucro_por_area3 = [4000, 5500, 2500]  # Novos lucros por cultura
-dados_plantio3 = resolver_problema_plantio(area_fazendas, data3_agua_fazendas, area_maxima_cultura, agua_por_area, lucro_por_area3)
-
-# Mostra os resultados do Exemplo 3
-print("\nProblema do Plantio - Exemplo 3:")
-print("Status:", dados_plantio3["status"])
-print(f"Proporção da área para Milho: {dados_plantio3['milho']:.4f}")
-print(f"Proporção da área para Arroz: {dados_plantio3['arroz']:.4f}")
-print(f"Proporção da área para Feijão: {dados_plantio3['feijao']:.4f}")
-print("Lucro Total: R$", dados_plantio3["lucro_total"])
-plotar_plantio(dados_plantio3, "Distribuição de Plantio - Exemplo 3")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe a proporção da área de cada cultura
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    area_fazendas = [400, 650, 350]  # Áreas disponíveis em cada fazenda
+    agua_fazendas = [1800, 2200, 950]  # Água disponível em cada fazenda
+    area_maxima_cultura = [660, 880, 400]  # Área máxima para milho, arroz e feijão
+    agua_por_area = [5.5, 4, 3.5]  # Consumo de água por unidade de área para cada cultura
+    lucro_por_area = [5000, 4000, 1800]  # Lucro por unidade de área para cada cultura
+
+    dados_plantio1 = resolver_problema_plantio(area_fazendas, agua_fazendas, area_maxima_cultura, agua_por_area, lucro_por_area)
+
+    # Mostra os resultados do Exemplo 1
+    print("Problema do Plantio - Exemplo 1:")
+    print("Status:", dados_plantio1["status"])  # Status da solução
+    print(f"Proporção da área para Milho: {dados_plantio1['milho']:.4f}")  # Área para milho
+    print(f"Proporção da área para Arroz: {dados_plantio1['arroz']:.4f}")  # Área para arroz
+    print(f"Proporção da área para Feijão: {dados_plantio1['feijao']:.4f}")  # Área para feijão
+    print("Lucro Total: R$", dados_plantio1["lucro_total"])  # Lucro total
+    plotar_plantio(dados_plantio1, "Distribuição de Plantio - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Mudança nas áreas e água das fazendas
+    data2_area_fazendas = [500, 400, 300]  # Novas áreas das fazendas
+    data2_agua_fazendas = [1500, 1400, 1000]  # Nova disponibilidade de água
+    area_maxima_cultura2 = [800, 700, 500]  # Novas áreas máximas para as culturas
+    dados_plantio2 = resolver_problema_plantio(data2_area_fazendas, data2_agua_fazendas, area_maxima_cultura2, agua_por_area, lucro_por_area)
+
+    # Mostra os resultados do Exemplo 2
+    print("\nProblema do Plantio - Exemplo 2:")
+    print("Status:", dados_plantio2["status"])
+    print(f"Proporção da área para Milho: {dados_plantio2['milho']:.4f}")
+    print(f"Proporção da área para Arroz: {dados_plantio2['arroz']:.4f}")
+    print(f"Proporção da área para Feijão: {dados_plantio2['feijao']:.4f}")
+    print("Lucro Total: R$", dados_plantio2["lucro_total"])
+    plotar_plantio(dados_plantio2, "Distribuição de Plantio - Exemplo 2")
+
+    # Exemplo 3: Mudança na água e nos lucros das culturas
+    data3_agua_fazendas = [1300, 1800, 900]  # Nova disponibilidade de água
+    lucro_por_area3 = [4000, 5500, 2500]  # Novos lucros por cultura
+    dados_plantio3 = resolver_problema_plantio(area_fazendas, data3_agua_fazendas, area_maxima_cultura, agua_por_area, lucro_por_area3)
+
+    # Mostra os resultados do Exemplo 3
+    print("\nProblema do Plantio - Exemplo 3:")
+    print("Status:", dados_plantio3["status"])
+    print(f"Proporção da área para Milho: {dados_plantio3['milho']:.4f}")
+    print(f"Proporção da área para Arroz: {dados_plantio3['arroz']:.4f}")
+    print(f"Proporção da área para Feijão: {dados_plantio3['feijao']:.4f}")
+    print("Lucro Total: R$", dados_plantio3["lucro_total"])
+    plotar_plantio(dados_plantio3, "Distribuição de Plantio - Exemplo 3")
+
+    # Exemplo 4: Área de cada cultura decidida fazenda a fazenda, e vários cenários de água resolvidos em paralelo
+    dados_plantio4 = resolver_problema_plantio(area_fazendas, agua_fazendas, area_maxima_cultura, agua_por_area,
+                                               lucro_por_area, modelo='por_fazenda')
+    print("\nProblema do Plantio - Exemplo 4 (área por fazenda):")
+    print("Status:", dados_plantio4["status"])
+    for fazenda, areas in enumerate(dados_plantio4["areas"], start=1):
+        print(f"Fazenda {fazenda}: " + ", ".join(f"{cultura} {area:.2f}" for cultura, area in zip(CULTURAS_PLANTIO, areas)))
+    print("Lucro Total: R$", dados_plantio4["lucro_total"])
+    cenarios_agua = [[1800, 2200, 950], [1300, 1800, 900], [900, 1100, 500]]  # Água normal, seca moderada e seca forte
+    for agua, dados in zip(cenarios_agua, resolver_cenarios_plantio(area_fazendas, cenarios_agua, area_maxima_cultura,
+                                                                    agua_por_area, lucro_por_area, modelo='por_fazenda')):
+        print(f"Cenário de água {agua}: lucro total R$ {dados['lucro_total']:.2f}")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
@@ -1,54 +1,167 @@
 # Importa bibliotecas necessárias
-import pulp  # Para resolver problemas de otimização linear
+import numpy as np  # Para montar o modelo geral de mistura com vetores e matrizes
 import matplotlib.pyplot as plt  # Para criar gráficos
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráfico das quantidades de produtos (src/graficos.py)
+from .matricial import resolver_matricial  # Modelo em matrizes, sem montar expressões do PuLP (src/matricial.py)
+from .instrumentacao import instrumentado  # Medição das fases para os observadores registrados (src/instrumentacao.py)
 
-# Função que calcula a combinação mais barata de produtos para produzir tintas SR e SN
-def resolver_problema_tintas(custos, composicao_sec, composicao_cor, demanda_sr, demanda_sn, exigencias=None):
-    # Cria um problema para minimizar o custo
-    problema = pulp.LpProblem("Problema_Tintas", pulp.LpMinimize)
+# Componentes e tintas do enunciado (a ordem é a das linhas e colunas de "quantidades" no modelo geral)
+PRODUTOS_TINTAS = ('SolA', 'SolB', 'SEC', 'COR')
+TINTAS = ('SR', 'SN')
 
-    # Dicionário para armazenar variáveis de decisão
-    variaveis = {}
-    produtos = ['SolA', 'SolB', 'SEC', 'COR']  # Componentes (solventes e aditivos)
-    tintas = ['SR', 'SN']  # Tipos de tinta (SR e SN)
+# Exigências mínimas padrão (fração de SEC, fração de COR) de cada tinta
+EXIGENCIAS_PADRAO = {'SR': (0.25, 0.50), 'SN': (0.20, 0.50)}
 
-    # Cria variáveis: quantidade de cada produto para cada tinta (não negativa)
-    for produto in produtos:
-        for tinta in tintas:
-            variaveis[(produto, tinta)] = pulp.LpVariable(f"{produto}_{tinta}", lowBound=0)
+# Função auxiliar que monta e resolve o modelo geral de mistura com NumPy
+# Variável (p, t): quantidade do produto p na tinta t, na posição p * tintas + t
+# Restrições: demanda de cada tinta (igualdade) e, para cada tinta e atributo, o teor mínimo (e o máximo, se finito)
+# como fração da demanda
+def _resolver_mistura(custos, composicao, minimos, demandas, maximos=None):
+    num_produtos, num_atributos = composicao.shape
+    num_tintas = demandas.size
+    variaveis = np.arange(num_produtos * num_tintas).reshape(num_produtos, num_tintas)
+    tinta_de = np.broadcast_to(np.arange(num_tintas), variaveis.shape)
 
-    # Define o objetivo: minimizar o custo total (custo de cada produto * quantidade)
-    problema += pulp.lpSum(custos[produto] * variaveis[(produto, tinta)] for produto in produtos for tinta in tintas), "Custo_Total"
+    # Demanda: uma linha por tinta (linhas 0 até T-1)
+    linhas = [tinta_de.ravel()]
+    colunas = [variaveis.ravel()]
+    valores = [np.ones(variaveis.size)]
+    lados = [demandas]
+    sentidos = ['='] * num_tintas
 
-    # Restrições: atender exatamente a demanda de cada tinta
-    problema += pulp.lpSum(variaveis[(produto, 'SR')] for produto in produtos) == demanda_sr, "Demanda_SR"
-    problema += pulp.lpSum(variaveis[(produto, 'SN')] for produto in produtos) == demanda_sn, "Demanda_SN"
+    # Teores mínimos (e máximos): linha de cada (tinta, atributo) com a composição de cada produto; lado = teor * demanda
+    for limites, sentido in ((minimos, '>='), (maximos, '<=')):
+        if limites is None:
+            continue
+        ativas = np.flatnonzero(np.isfinite(limites).ravel())  # Limite infinito: restrição omitida
+        posicao = np.full(limites.size, -1)
+        posicao[ativas] = len(sentidos) + np.arange(ativas.size)  # Índice da linha de cada (tinta, atributo) ativo
+        indices = posicao.reshape(num_tintas, num_atributos)[tinta_de[:, :, None], np.arange(num_atributos)]  # (P, T, Q)
+        coeficientes = np.broadcast_to(composicao[:, None, :], indices.shape)
+        usadas = indices >= 0
+        linhas.append(indices[usadas])
+        colunas.append(np.broadcast_to(variaveis[:, :, None], indices.shape)[usadas])
+        valores.append(coeficientes[usadas])
+        lados.append(limites.ravel()[ativas] * np.repeat(demandas, num_atributos)[ativas])
+        sentidos += [sentido] * ativas.size
 
-    # Define exigências mínimas de SEC e COR (se não fornecidas, usa valores padrão)
-    exigencias = exigencias or {'SR': (0.25, 0.50), 'SN': (0.20, 0.50)}
+    # Objetivo: custo de cada produto, igual em todas as tintas
+    c = np.repeat(custos, num_tintas)
+    A = (np.concatenate(linhas), np.concatenate(colunas), np.concatenate(valores))
+    solucao = resolver_matricial(c, A, np.concatenate(lados), sentidos=sentidos)
+    quantidades = solucao["x"].reshape(num_produtos, num_tintas) if solucao["x"] is not None else None
+    return solucao, quantidades
+
+# Função auxiliar que converte e valida os dados do modelo geral (vetores e matrizes NumPy)
+def _dados_mistura(custos, composicao, minimos, maximos):
+    custos = np.asarray(custos, dtype=float)
+    composicao = np.asarray(composicao, dtype=float).reshape(custos.size, -1)  # Produtos x atributos
+    minimos = np.asarray(minimos, dtype=float).reshape(-1, composicao.shape[1])  # Tintas x atributos
+    if maximos is not None:
+        maximos = np.asarray(maximos, dtype=float).reshape(minimos.shape)
+    return custos, composicao, minimos, maximos
+
+# Função que calcula a mistura mais barata de muitos produtos para muitas tintas (modelo geral)
+# custos: custo de cada produto; composicao: fração de cada atributo de qualidade em cada produto (produtos x atributos);
+# minimos: teor mínimo de cada atributo em cada tinta (tintas x atributos, -inf = sem mínimo); demandas: de cada tinta;
+# maximos (opcional): teor máximo de cada atributo em cada tinta (inf = sem máximo)
+# "quantidades" é a matriz produtos x tintas
+@instrumentado
+@em_cache
+def resolver_mistura(custos, composicao, minimos, demandas, maximos=None):
+    custos, composicao, minimos, maximos = _dados_mistura(custos, composicao, minimos, maximos)
+    solucao, quantidades = _resolver_mistura(custos, composicao, minimos, np.asarray(demandas, dtype=float), maximos)
+
+    # Organiza os resultados em um dicionário
+    resultado = {
+        "status": solucao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": solucao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "quantidades": quantidades,  # Quantidade de cada produto (linhas) em cada tinta (colunas)
+        "custo_total": solucao["objetivo"]  # Custo total
+    }
+
+    return resultado  # Retorna os resultados
+
+# Função que resolve muitos cenários de demanda do modelo geral de uma vez (cenarios_demanda: cenários x tintas)
+# As restrições são proporcionais à demanda de cada tinta, então a mistura ótima de uma unidade de cada tinta
+# (a receita) vale para qualquer demanda: o modelo é resolvido uma vez com demanda 1 e cada cenário é a receita
+# multiplicada pela sua demanda. Se alguma tinta não tiver mistura viável, só os cenários que pedem essa tinta são
+# inviáveis. Devolve um resultado (como o de resolver_mistura) por cenário, na ordem dos cenários
+@instrumentado
+@em_cache
+def resolver_cenarios_mistura(custos, composicao, minimos, cenarios_demanda, maximos=None):
+    custos, composicao, minimos, maximos = _dados_mistura(custos, composicao, minimos, maximos)
+    cenarios = np.asarray(cenarios_demanda, dtype=float).reshape(-1, minimos.shape[0])
+    if not np.all(np.isfinite(cenarios)) or np.any(cenarios < 0):
+        raise ValueError("As demandas dos cenários precisam ser finitas e não negativas")
+    num_tintas = minimos.shape[0]
 
-    # Restrições: garantir composição mínima de SEC e COR para tinta SR
-    problema += pulp.lpSum(composicao_sec[produto] * variaveis[(produto, 'SR')] for produto in produtos) >= exigencias['SR'][0] * demanda_sr, "SEC_minima_SR"
-    problema += pulp.lpSum(composicao_cor[produto] * variaveis[(produto, 'SR')] for produto in produtos) >= exigencias['SR'][1] * demanda_sr, "COR_minima_SR"
+    # Receitas: mistura ótima de uma unidade de cada tinta
+    solucao, receitas = _resolver_mistura(custos, composicao, minimos, np.ones(num_tintas), maximos)
+    viaveis = np.ones(num_tintas, dtype=bool)
+    if solucao["status"] == "Infeasible":
+        # Descobre quais tintas não têm mistura viável (cada tinta é um modelo independente)
+        receitas = np.zeros((custos.size, num_tintas))
+        comprovado = True
+        for tinta in range(num_tintas):
+            parcial, receita = _resolver_mistura(custos, composicao, minimos[tinta:tinta + 1], np.ones(1),
+                                                 maximos[tinta:tinta + 1] if maximos is not None else None)
+            if parcial["status"] == "Infeasible" or receita is None:
+                viaveis[tinta] = False
+            else:
+                receitas[:, tinta] = receita[:, 0]
+                comprovado = comprovado and parcial["otimo_comprovado"]
+        solucao = {"status": "Optimal", "otimo_comprovado": comprovado}  # Vale para os cenários das tintas viáveis
+    elif receitas is None:
+        viaveis[:] = False  # Sem receita (ex.: limite de tempo sem solução): nenhum cenário tem valores
+
+    # Cada cenário: receitas multiplicadas pela demanda de cada tinta (tinta inviável tem receita zero, o que só
+    # importa para os cenários sem demanda dela, que continuam viáveis mesmo sem nenhuma tinta viável)
+    quantidades = receitas[None, :, :] * cenarios[:, None, :] if receitas is not None else None
+    custos_totais = cenarios @ (custos @ receitas) if receitas is not None else None
+    resultados = []
+    for indice, demandas in enumerate(cenarios):
+        atendido = bool(np.all(viaveis[demandas > 0])) and quantidades is not None
+        resultados.append({
+            "status": solucao["status"] if atendido or receitas is None else "Infeasible",
+            "otimo_comprovado": solucao["otimo_comprovado"] and atendido,
+            "quantidades": quantidades[indice] if atendido else None,
+            "custo_total": float(custos_totais[indice]) if atendido else None
+        })
+    return resultados
+
+# Função que calcula a combinação mais barata de produtos para produzir tintas SR e SN
+# (o enunciado: os quatro produtos, duas tintas e os atributos SEC e COR, resolvido com o modelo geral de mistura)
+@instrumentado
+@em_cache
+def resolver_problema_tintas(custos, composicao_sec, composicao_cor, demanda_sr, demanda_sn, exigencias=None):
+    # Define exigências mínimas de SEC e COR (se não fornecidas, usa valores padrão)
+    exigencias = exigencias or EXIGENCIAS_PADRAO
 
-    # Restrições: garantir composição mínima de SEC e COR para tinta SN
-    problema += pulp.lpSum(composicao_sec[produto] * variaveis[(produto, 'SN')] for produto in produtos) >= exigencias['SN'][0] * demanda_sn, "SEC_minima_SN"
-    problema += pulp.lpSum(composicao_cor[produto] * variaveis[(produto, 'SN')] for produto in produtos) >= exigencias['SN'][1] * demanda_sn, "COR_minima_SN"
+    # Converte os dicionários do enunciado para o modelo geral: produtos x (SEC, COR) e tintas x (SEC, COR)
+    vetor_custos = np.array([custos[produto] for produto in PRODUTOS_TINTAS], dtype=float)
+    composicao = np.array([[composicao_sec[produto], composicao_cor[produto]] for produto in PRODUTOS_TINTAS], dtype=float)
+    minimos = np.array([exigencias[tinta] for tinta in TINTAS], dtype=float)
 
     # Resolve o problema
-    problema.solve()
+    solucao, quantidades = _resolver_mistura(vetor_custos, composicao, minimos, np.array([demanda_sr, demanda_sn], dtype=float))
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "quantidades": {(produto, tinta): variaveis[(produto, tinta)].varValue for produto in produtos for tinta in tintas},  # Quantidade de cada produto por tinta
-        "custo_total": pulp.value(problema.objective)  # Custo total
+        "status": solucao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": solucao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "quantidades": {(produto, tinta): (quantidades[p, t].item() if quantidades is not None else None)
+                        for p, produto in enumerate(PRODUTOS_TINTAS) for t, tinta in enumerate(TINTAS)},  # Quantidade de cada produto por tinta
+        "custo_total": solucao["objetivo"]  # Custo total
     }
 
     return resultado  # Retorna os resultados
 
 # Função para criar um gráfico de barras com as quantidades de produtos usadas
 def plotar_tintas(dados, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta as barras
     produtos_tinta = ['SolA_SR', 'SolB_SR', 'SEC_SR', 'COR_SR', 'SolA_SN', 'SolB_SN', 'SEC_SN', 'COR_SN']  # Combinações de produto e tinta
     valores = [dados['quantidades'][tuple(p.split('_'))] for p in produtos_tinta]  # Quantidades correspondentes
 
@@ -57,78 +170,95 @@ def plotar_tintas(dados, titulo):
     ax.set_ylabel('Litros utilizados')  # Nome do eixo Y
     ax.set_title(titulo)  # Título do gráfico
     plt.xticks(rotation=45)  # Rotaciona os rótulos do eixo X
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial
-custos1 = {'SolA': 1.5, 'SolB': 1.0, 'SEC': 4.0, 'COR': 6.0}  # Custos dos produtos
-composicao_sec1 = {'SolA': 0.3, 'SolB': 0.6, 'SEC': 1.0, 'COR': 0.0}  # Proporção de SEC por produto
-composicao_cor1 = {'SolA': 0.7, 'SolB': 0.4, 'SEC': 0.0, 'COR': 1.0}  # Proporção de COR por produto
-demanda_sr1 = 1000  # Demanda de tinta SR (litros)
-demanda_sn1 = 250   # Demanda de tinta SN (litros)
-
-# Resolve Exemplo 1
-dados_tintas1 = resolver_problema_tintas(custos1, composicao_sec1, composicao_cor1, demanda_sr1, demanda_sn1)
-
-# Mostra os resultados do Exemplo 1
-print("Problema das Tintas - Exemplo 1:")
-print("Status:", dados_tintas1["status"])  # Status da solução
-for chave, valor in dados_tintas1["quantidades"].items():
-    print(f"Quantidade de {chave[0]} para {chave[1]}: {valor:.2f} litros")  # Quantidade por produto e tinta
-print("Custo Total: R$", dados_tintas1["custo_total"])  # Custo total
-plotar_tintas(dados_tintas1, "Composição das Tintas - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Custos e composições modificados
-custos2 = {'SolA': 2.5, 'SolB': 1.8, 'SEC': 6.0, 'COR': 7.5}  # Novos custos
-composicao_sec2 = {'SolA': 0.25, 'SolB': 0.55, 'SEC': 1.0, 'COR': 0.0}  # Nova composição de SEC
-composicao_cor2 = {'SolA': 0.75, 'SolB': 0.45, 'SEC': 0.0, 'COR': 1.0}  # Nova composição de COR
-demanda_sr2 = 900  # Nova demanda de SR
-demanda_sn2 = 300  # Nova demanda de SN
-
-# Resolve Exemplo 2
-dados_tintas2 = resolver_problema_tintas(custos2, composicao_sec2, composicao_cor2, demanda_sr2, demanda_sn2)
-
-# Mostra os resultados do Exemplo 2
-print("\nProblema das Tintas - Exemplo 2:")
-print("Status:", dados_tintas2["status"])
-for chave, valor in dados_tintas2["quantidades"].items():
-    print(f"Quantidade de {chave[0]} para {chave[1]}: {valor:.2f} litros")
-print("Custo Total: R$", dados_tintas2["custo_total"])
-plotar_tintas(dados_tintas2, "Composição das Tintas - Exemplo 2")
-
-# Exemplo 3: Exigências mais rigorosas
-custos3 = {'SolA': 1.5, 'SolB': 1.0, 'SEC': 4.0, 'COR': 6.0}  # Mesmos custos do Exemplo 1
-composicao_sec3 = {'SolA': 0.4, 'SolB': 0.5, 'SEC': 1.0, 'COR': 0.0}  # Nova composição de SEC
-composicao_cor3 = {'SolA': 0.6, 'SolB': 0.5, 'SEC': 0.0, 'COR': 1.0}  # Nova composição de COR
-demanda_sr3 = 1000  # Mesma demanda de SR
-demanda_sn3 = 250   # Mesma demanda de SN
-exigencias3 = {'SR': (0.30, 0.60), 'SN': (0.25, 0.55)}  # Exigências mais rigorosas de SEC e COR
-
-# Resolve Exemplo 3
-dados_tintas3 = resolver_problema_tintas(custos3, composicao_sec3, composicao_cor3, demanda_sr3, demanda_sn3, exigencias3)
-
-# Mostra os resultados do Exemplo 3
-print("\nProblema das Tintas - Exemplo 3:")
-print("Status:", dados_tintas3["status"])
-for chave, valor in dados_tintas3["quantidades"].items():
-    print(f"Quantidade de {chave[0]} para {chave[1]}: {valor:.2f} litros")
-print("Custo Total: R$", dados_tintas3["custo_total"])
-plotar_tintas(dados_tintas3, "Composição das Tintas - Exemplo 3")
-
-# Exemplo 4: Custos e exigências ajustados
-custos4 = {'SolA': 2.0, 'SolB': 2.5, 'SEC': 3.5, 'COR': 4.0}  # Novos custos
-composicao_sec4 = {'SolA': 0.2, 'SolB': 0.3, 'SEC': 1.0, 'COR': 0.0}  # Nova composição de SEC
-composicao_cor4 = {'SolA': 0.8, 'SolB': 0.7, 'SEC': 0.0, 'COR': 1.0}  # Nova composição de COR
-demanda_sr4 = 1000  # Mesma demanda de SR
-demanda_sn4 = 250   # Mesma demanda de SN
-exigencias4 = {'SR': (0.35, 0.65), 'SN': (0.30, 0.55)}  # Exigências mais rigorosas
-
-# Resolve Exemplo 4
-dados_tintas4 = resolver_problema_tintas(custos4, composicao_sec4, composicao_cor4, demanda_sr4, demanda_sn4, exigencias4)
-
-# Mostra os resultados do Exemplo 4
-print("\nProblema das Tintas - Exemplo 4:")
-print("Status:", dados_tintas4["status"])
-for chave, valor in dados_tintas4["quantidades"].items():
-    print(f"Quantidade de {chave[0]} para {chave[1]}: {valor:.2f} litros")
-print("Custo Total: R$", dados_tintas4["custo_total"])
-plotar_tintas(dados_tintas4, "Composição das Tintas - Exemplo 4")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe as barras de produtos usados
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    custos1 = {'SolA': 1.5, 'SolB': 1.0, 'SEC': 4.0, 'COR': 6.0}  # Custos dos produtos
+    composicao_sec1 = {'SolA': 0.3, 'SolB': 0.6, 'SEC': 1.0, 'COR': 0.0}  # Proporção de SEC por produto
+    composicao_cor1 = {'SolA': 0.7, 'SolB': 0.4, 'SEC': 0.0, 'COR': 1.0}  # Proporção de COR por produto
+    demanda_sr1 = 1000  # Demanda de tinta SR (litros)
+    demanda_sn1 = 250   # Demanda de tinta SN (litros)
+
+    # Resolve Exemplo 1
+    dados_tintas1 = resolver_problema_tintas(custos1, composicao_sec1, composicao_cor1, demanda_sr1, demanda_sn1)
+
+    # Mostra os resultados do Exemplo 1
+    print("Problema das Tintas - Exemplo 1:")
+    print("Status:", dados_tintas1["status"])  # Status da solução
+    for chave, valor in dados_tintas1["quantidades"].items():
+        print(f"Quantidade de {chave[0]} para {chave[1]}: {valor:.2f} litros")  # Quantidade por produto e tinta
+    print("Custo Total: R$", dados_tintas1["custo_total"])  # Custo total
+    plotar_tintas(dados_tintas1, "Composição das Tintas - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Custos e composições modificados
+    custos2 = {'SolA': 2.5, 'SolB': 1.8, 'SEC': 6.0, 'COR': 7.5}  # Novos custos
+    composicao_sec2 = {'SolA': 0.25, 'SolB': 0.55, 'SEC': 1.0, 'COR': 0.0}  # Nova composição de SEC
+    composicao_cor2 = {'SolA': 0.75, 'SolB': 0.45, 'SEC': 0.0, 'COR': 1.0}  # Nova composição de COR
+    demanda_sr2 = 900  # Nova demanda de SR
+    demanda_sn2 = 300  # Nova demanda de SN
+
+    # Resolve Exemplo 2
+    dados_tintas2 = resolver_problema_tintas(custos2, composicao_sec2, composicao_cor2, demanda_sr2, demanda_sn2)
+
+    # Mostra os resultados do Exemplo 2
+    print("\nProblema das Tintas - Exemplo 2:")
+    print("Status:", dados_tintas2["status"])
+    for chave, valor in dados_tintas2["quantidades"].items():
+        print(f"Quantidade de {chave[0]} para {chave[1]}: {valor:.2f} litros")
+    print("Custo Total: R$", dados_tintas2["custo_total"])
+    plotar_tintas(dados_tintas2, "Composição das Tintas - Exemplo 2")
+
+    # Exemplo 3: Exigências mais rigorosas
+    custos3 = {'SolA': 1.5, 'SolB': 1.0, 'SEC': 4.0, 'COR': 6.0}  # Mesmos custos do Exemplo 1
+    composicao_sec3 = {'SolA': 0.4, 'SolB': 0.5, 'SEC': 1.0, 'COR': 0.0}  # Nova composição de SEC
+    composicao_cor3 = {'SolA': 0.6, 'SolB': 0.5, 'SEC': 0.0, 'COR': 1.0}  # Nova composição de COR
+    demanda_sr3 = 1000  # Mesma demanda de SR
+    demanda_sn3 = 250   # Mesma demanda de SN
+    exigencias3 = {'SR': (0.30, 0.60), 'SN': (0.25, 0.55)}  # Exigências mais rigorosas de SEC e COR
+
+    # Resolve Exemplo 3
+    dados_tintas3 = resolver_problema_tintas(custos3, composicao_sec3, composicao_cor3, demanda_sr3, demanda_sn3, exigencias3)
+
+    # Mostra os resultados do Exemplo 3
+    print("\nProblema das Tintas - Exemplo 3:")
+    print("Status:", dados_tintas3["status"])
+    for chave, valor in dados_tintas3["quantidades"].items():
+        print(f"Quantidade de {chave[0]} para {chave[1]}: {valor:.2f} litros")
+    print("Custo Total: R$", dados_tintas3["custo_total"])
+    plotar_tintas(dados_tintas3, "Composição das Tintas - Exemplo 3")
+
+    # Exemplo 4: Custos e exigências ajustados
+    custos4 = {'SolA': 2.0, 'SolB': 2.5, 'SEC': 3.5, 'COR': 4.0}  # Novos custos
+    composicao_sec4 = {'SolA': 0.2, 'SolB': 0.3, 'SEC': 1.0, 'COR': 0.0}  # Nova composição de SEC
+    composicao_cor4 = {'SolA': 0.8, 'SolB': 0.7, 'SEC': 0.0, 'COR': 1.0}  # Nova composição de COR
+    demanda_sr4 = 1000  # Mesma demanda de SR
+    demanda_sn4 = 250   # Mesma demanda de SN
+    exigencias4 = {'SR': (0.35, 0.65), 'SN': (0.30, 0.55)}  # Exigências mais rigorosas
+
+    # Resolve Exemplo 4
+    dados_tintas4 = resolver_problema_tintas(custos4, composicao_sec4, composicao_cor4, demanda_sr4, demanda_sn4, exigencias4)
+
+    # Mostra os resultados do Exemplo 4
+    print("\nProblema das Tintas - Exemplo 4:")
+    print("Status:", dados_tintas4["status"])
+    for chave, valor in dados_tintas4["quantidades"].items():
+        print(f"Quantidade de {chave[0]} para {chave[1]}: {valor:.2f} litros")
+    print("Custo Total: R$", dados_tintas4["custo_total"])
+    plotar_tintas(dados_tintas4, "Composição das Tintas - Exemplo 4")
+
+    # Exemplo 5: Modelo geral com os dados do Exemplo 1 e vários cenários de demanda resolvidos de uma vez
+    composicao5 = [[composicao_sec1[produto], composicao_cor1[produto]] for produto in PRODUTOS_TINTAS]  # Produtos x (SEC, COR)
+    minimos5 = [EXIGENCIAS_PADRAO[tinta] for tinta in TINTAS]  # Tintas x (SEC, COR)
+    cenarios5 = [[1000, 250], [800, 400], [1200, 0]]  # Demandas de SR e SN em cada cenário
+    resultados5 = resolver_cenarios_mistura([custos1[produto] for produto in PRODUTOS_TINTAS], composicao5, minimos5, cenarios5)
+
+    # Mostra os resultados do Exemplo 5
+    print("\nProblema das Tintas - Exemplo 5 (cenários de demanda):")
+    for demandas, dados in zip(cenarios5, resultados5):
+        print(f"Demanda SR {demandas[0]}, SN {demandas[1]}: {dados['status']}, Custo Total: R$ {dados['custo_total']:.2f}")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
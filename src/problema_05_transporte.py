@@ -1,48 +1,446 @@
 # Importa bibliotecas necessárias
-import pulp  # Para resolver problemas de otimização linear
 import matplotlib.pyplot as plt  # Para criar gráficos
 import networkx as nx  # Para criar e visualizar redes de transporte
+import numpy as np  # Para a matriz de custos e os vetores de oferta e demanda
+from collections.abc import Mapping  # Base da visão em dicionário das quantidades
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráfico da rede de transporte (src/graficos.py)
+from .matricial import resolver_por_colunas  # Modelo gravado em MPS em fluxo, sem montar o modelo no PuLP (src/matricial.py)
+from .instrumentacao import instrumentado, contar, anotar  # Medição das fases para os observadores registrados (src/instrumentacao.py)
 
-# Função que calcula a quantidade de produtos a transportar de fábricas para depósitos com menor custo
-def resolver_problema_transporte(custos, ofertas, demandas):
-    # Cria um problema para minimizar o custo total de transporte
-    problema = pulp.LpProblem("Problema_Transporte", pulp.LpMinimize)
+# Métodos disponíveis: simplex de transporte (padrão) ou modelo linear no CBC
+METODOS_TRANSPORTE = ('simplex', 'lp')
+
+# Métodos para a solução básica inicial do simplex de transporte
+METODOS_SOLUCAO_INICIAL = ('vogel', 'custo_minimo')
+
+# Quantos elementos da matriz de custos reduzidos são avaliados por vez na escolha da variável que entra na base
+# (arredondado para linhas inteiras, pelo menos uma). Blocos pequenos dão mais pivôs, mas cada um bem mais barato:
+# em 1000 x 1000, 200000 elementos levavam 3,3 s e 2000 elementos (2 linhas), 0,9 s
+TAMANHO_BLOCO_PRECOS = 2000
 
-    # Dicionário para armazenar variáveis de decisão
-    variaveis = {}
+# Função que calcula a quantidade de produtos a transportar de fábricas para depósitos com menor custo
+# Recebe dicionários (custos[fabrica][deposito], ofertas[fabrica], demandas[deposito]) e devolve as quantidades
+# como uma visão em dicionário {(fabrica, deposito): quantidade} sobre a matriz calculada pelo simplex de transporte
+# metodo='lp' resolve o modelo linear no CBC. Cada depósito recebe pelo menos a demanda; com algum custo negativo
+# pode valer a pena mandar mais que a demanda, o que o simplex de transporte não faz: esses casos vão para o modelo linear
+@instrumentado
+@em_cache
+def resolver_problema_transporte(custos, ofertas, demandas, metodo='simplex'):
+    if metodo not in METODOS_TRANSPORTE:
+        raise ValueError(f"Método desconhecido: {metodo} (use um de {METODOS_TRANSPORTE})")
     fabricas = list(custos.keys())  # Lista de fábricas
     depositos = list(next(iter(custos.values())).keys())  # Lista de depósitos
+    matriz = np.array([[custos[f][d] for d in depositos] for f in fabricas], dtype=float)
+    if metodo == 'lp' or np.any(matriz < 0):
+        anotar(metodo='lp')  # Método usado (para a instrumentação)
+        return resolver_transporte_lp(custos, ofertas, demandas)
+    anotar(metodo='simplex')
+    dados = resolver_transporte_simplex(matriz, [ofertas[f] for f in fabricas], [demandas[d] for d in depositos])
+
+    resultado = {
+        "status": dados["status"],  # Status da solução (ex.: "Optimal")
+        "otimo_comprovado": dados["otimo_comprovado"],  # O simplex terminou sem custo reduzido negativo
+        "quantidades": QuantidadesTransporte(dados["quantidades"], fabricas, depositos),  # Quantidade transportada
+        "custo_total": dados["custo_total"]  # Custo total
+    }
+
+    return resultado  # Retorna os resultados
+
+# Visão somente leitura de uma matriz de quantidades como dicionário {(fabrica, deposito): quantidade}
+# Não copia a matriz: cada consulta lê direto do array NumPy
+class QuantidadesTransporte(Mapping):
+    def __init__(self, matriz, fabricas, depositos):
+        self.matriz = matriz
+        self.fabricas = list(fabricas)
+        self.depositos = list(depositos)
+        self._linha = {f: i for i, f in enumerate(self.fabricas)}
+        self._coluna = {d: j for j, d in enumerate(self.depositos)}
+
+    def __getitem__(self, chave):
+        f, d = chave
+        return float(self.matriz[self._linha[f], self._coluna[d]])
+
+    def __iter__(self):
+        return ((f, d) for f in self.fabricas for d in self.depositos)
+
+    def __len__(self):
+        return len(self.fabricas) * len(self.depositos)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+# Função que resolve o problema de transporte com o simplex de transporte (método MODI / u-v)
+# custos: matriz NumPy (fábricas x depósitos); ofertas e demandas: vetores
+# As fábricas podem enviar até a oferta e cada depósito recebe exatamente a demanda (com custos não negativos,
+# equivale a "pelo menos a demanda"; custos negativos são recusados); a sobra de oferta vai para um depósito
+# fictício de custo zero
+# A base é uma árvore geradora sobre linhas e colunas: os potenciais u e v são atualizados só na subárvore que muda
+# a cada pivô, e o custo reduzido é avaliado em blocos de linhas com NumPy
+# Em instâncias aleatórias densas (um núcleo): 1000 x 1000 em cerca de 1 s e 2000 x 2000 em 3 a 4 s, dos quais
+# cerca de 1,3 s são da solução inicial de Vogel (ordenação da matriz de custos)
+# formato='denso' devolve a matriz de quantidades; formato='esparso' devolve só as células básicas (linhas, colunas, valores)
+def resolver_transporte_simplex(custos, ofertas, demandas, inicial='vogel', formato='denso', max_iteracoes=None):
+    custos = np.asarray(custos, dtype=float)
+    ofertas = np.asarray(ofertas, dtype=float)
+    demandas = np.asarray(demandas, dtype=float)
+    m, n = custos.shape
+    if inicial not in METODOS_SOLUCAO_INICIAL:
+        raise ValueError(f"Solução inicial desconhecida: {inicial} (use um de {METODOS_SOLUCAO_INICIAL})")
+    if np.any(custos < 0):
+        raise ValueError("O simplex de transporte exige custos não negativos (use resolver_transporte_lp)")
+
+    tolerancia = 1e-9 * max(1.0, float(np.abs(custos).max(initial=0)))  # Para os custos reduzidos
+    tolerancia_quantidade = 1e-9 * max(1.0, float(ofertas.sum()), float(demandas.sum()))  # Para oferta e demanda
+    if ofertas.sum() < demandas.sum() - tolerancia_quantidade:
+        # Oferta total menor que a demanda total: não há como atender todos os depósitos
+        return _resultado_transporte("Infeasible", np.zeros((m, n)), None, formato, 0)
+
+    # Balanceia com um depósito fictício (custo zero) que recebe a sobra de oferta
+    sobra = ofertas.sum() - demandas.sum()
+    if sobra > tolerancia_quantidade:
+        custos_b = np.hstack([custos, np.zeros((m, 1))])
+        demandas_b = np.append(demandas, sobra)
+    else:
+        custos_b, demandas_b = custos, demandas
+    nb = custos_b.shape[1]
+
+    # Solução básica inicial: m + nb - 1 células formando uma árvore geradora
+    if inicial == 'vogel':
+        base = _solucao_inicial_vogel(custos_b, ofertas, demandas_b)
+    else:
+        base = _solucao_inicial_custo_minimo(custos_b, ofertas, demandas_b)
+
+    # Árvore da base: nós 0..m-1 são fábricas e m..m+nb-1 são depósitos
+    total_nos = m + nb
+    quantidade = {}  # (i, j) -> quantidade da célula básica (só para montar a árvore inicial)
+    vizinhos = [[] for _ in range(total_nos)]  # Usado só para montar a árvore inicial
+    for i, j, q in base:
+        quantidade[(i, j)] = q
+        vizinhos[i].append(m + j)
+        vizinhos[m + j].append(i)
+
+    # Árvore enraizada no nó 0, guardada em pré-ordem: a subárvore de um nó ocupa um trecho contínuo de "ordem"
+    # (do próprio nó até o primeiro nó seguinte com profundidade menor ou igual). Assim, mover uma subárvore
+    # e corrigir profundidades e potenciais vira operações de fatias NumPy em vez de laços nó a nó
+    # Cada célula básica é a aresta entre um nó e o seu pai, e a quantidade dela fica no nó filho (fluxo)
+    pai = [-1] * total_nos  # Lista Python: os laços de subida na árvore acessam um elemento por vez
+    profundidade = np.zeros(total_nos, dtype=np.int64)
+    potencial = np.zeros(total_nos)  # u das fábricas nos nós 0..m-1 e v dos depósitos nos nós m..
+    fluxo = np.zeros(total_nos)  # Quantidade da célula (no, pai[no]); a raiz não tem célula
+    ordem = []
+    pilha = [0]
+    while pilha:
+        a = pilha.pop()
+        ordem.append(a)
+        for b in vizinhos[a]:
+            if b != pai[a]:
+                pai[b] = a
+                profundidade[b] = profundidade[a] + 1
+                potencial[b] = custos_b[min(a, b), max(a, b) - m] - potencial[a]  # u_i + v_j = c_ij
+                fluxo[b] = quantidade[(min(a, b), max(a, b) - m)]
+                pilha.append(b)
+    ordem = np.array(ordem, dtype=np.int64)
+    posicao = np.empty(total_nos, dtype=np.int64)
+    posicao[ordem] = np.arange(total_nos)
+    sinal = np.where(np.arange(total_nos) < m, 1.0, -1.0)  # Ao somar delta a u, v precisa diminuir delta
+    del vizinhos, quantidade
 
-    # Cria variáveis: quantidade a transportar de cada fábrica para cada depósito (não negativa)
-    for f in fabricas:
-        for d in depositos:
-            variaveis[(f, d)] = pulp.LpVariable(f"x_{f}_{d}", lowBound=0)
+    tamanho_bloco = max(1, TAMANHO_BLOCO_PRECOS // nb)
+    reduzidos = np.empty((tamanho_bloco, nb))  # Reaproveitado a cada bloco (sem alocar matrizes temporárias)
+    inicio_bloco = 0
+    iteracoes = 0
+    status = "Optimal"
+    while True:
+        # Escolha da variável que entra: menor custo reduzido (c_ij - u_i - v_j) em blocos de linhas,
+        # continuando de onde o bloco anterior parou (preço parcial); ótimo quando nenhum bloco tem valor negativo
+        entrada = None
+        u, v = potencial[:m], potencial[m:]
+        for _ in range(0, m, tamanho_bloco):
+            fim_bloco = min(m, inicio_bloco + tamanho_bloco)
+            bloco = reduzidos[:fim_bloco - inicio_bloco]
+            np.subtract(custos_b[inicio_bloco:fim_bloco], u[inicio_bloco:fim_bloco, None], out=bloco)
+            bloco -= v
+            k = int(np.argmin(bloco))
+            i, j = divmod(k, nb)
+            i += inicio_bloco
+            inicio_bloco = 0 if fim_bloco >= m else fim_bloco
+            if bloco.flat[k] < -tolerancia:
+                entrada = (i, j)
+                break
+        if entrada is None:
+            break
+        if max_iteracoes is not None and iteracoes >= max_iteracoes:
+            status = "Not Solved"
+            break
+        iteracoes += 1
 
-    # Define o objetivo: minimizar o custo total (custo por unidade * quantidade transportada)
-    problema += pulp.lpSum(custos[f][d] * variaveis[(f, d)] for f in fabricas for d in depositos), "Custo_Total"
+        # Ciclo formado pela célula que entra: caminho na árvore entre a fábrica i e o depósito j
+        i, j = entrada
+        lado_fabrica, lado_deposito = [i], [m + j]
+        while lado_fabrica[-1] != lado_deposito[-1]:
+            if profundidade[lado_fabrica[-1]] >= profundidade[lado_deposito[-1]]:
+                lado_fabrica.append(pai[lado_fabrica[-1]])
+            else:
+                lado_deposito.append(pai[lado_deposito[-1]])
 
-    # Restrições: cada fábrica não pode enviar mais do que sua oferta
-    for f in fabricas:
-        problema += pulp.lpSum(variaveis[(f, d)] for d in depositos) <= ofertas[f], f"Oferta_{f}"
+        # Cada aresta do ciclo é identificada pelo seu nó filho; de i até j os sinais alternam e a primeira
+        # (saindo de i) diminui, então diminuem as arestas nas posições pares de cada lado, contadas a partir de i e de j
+        filhos_fabrica = np.array(lado_fabrica[:-1], dtype=np.int64)
+        filhos_deposito = np.array(lado_deposito[:-1], dtype=np.int64)
+        diminuem_fabrica = filhos_fabrica[0::2]
+        diminuem = np.concatenate([diminuem_fabrica, filhos_deposito[0::2][::-1]])  # Na ordem do caminho de i até j
+        k = int(np.argmin(fluxo[diminuem]))  # Sai a primeira aresta com a menor quantidade
+        q = int(diminuem[k])  # Nó filho da aresta que sai: a subárvore de q se separa da árvore
+        theta = float(fluxo[q])
+        fluxo[diminuem] -= theta
+        fluxo[filhos_fabrica[1::2]] += theta
+        fluxo[filhos_deposito[1::2]] += theta
 
-    # Restrições: cada depósito deve receber pelo menos sua demanda
-    for d in depositos:
-        problema += pulp.lpSum(variaveis[(f, d)] for f in fabricas) >= demandas[d], f"Demanda_{d}"
+        # A subárvore de q contém i ou j (x) e passa a ficar pendurada no outro extremo da célula que entra (y)
+        if k < diminuem_fabrica.size:
+            x, y = i, m + j  # A aresta que saiu estava do lado da fábrica
+        else:
+            x, y = m + j, i
+        profundidades_ordem = profundidade[ordem]
+        inicio_q = int(posicao[q])
+        fora = np.flatnonzero(profundidades_ordem[inicio_q + 1:] <= profundidades_ordem[inicio_q])
+        fim_q = inicio_q + 1 + int(fora[0]) if fora.size else total_nos  # Fim (exclusivo) do trecho de q
 
-    # Resolve o problema
-    problema.solve()
+        # Potenciais: toda a subárvore se desloca por uma constante para valer u_x + v_y = c_xy
+        delta = (custos_b[min(x, y), max(x, y) - m] - potencial[y] - potencial[x]) * sinal[x]
+        nos_soltos = ordem[inicio_q:fim_q]
+        potencial[nos_soltos] += delta * sinal[nos_soltos]
+
+        # Reenraíza a subárvore em x: seguindo o caminho x = w0, w1, ..., q, a nova pré-ordem é o trecho de w0
+        # seguido, para cada w_t, do trecho de w_t sem o de w_(t-1); cada pedaço muda de profundidade por uma constante
+        caminho = [x]
+        while caminho[-1] != q:
+            caminho.append(pai[caminho[-1]])
+        # Todo nó entre w_t e x na pré-ordem é descendente de w_t, então o trecho de w_t termina no primeiro nó
+        # depois de x com profundidade menor ou igual à de w_t: um mínimo acumulado e uma busca binária dão todos
+        inicio_x = int(posicao[x])
+        inicios = posicao[caminho].tolist()
+        minimos = np.minimum.accumulate(profundidades_ordem[inicio_x + 1:fim_q])
+        fins = (inicio_x + 1 + np.searchsorted(-minimos, -profundidades_ordem[inicios], side='left')).tolist()
+        pedacos = []
+        for t in range(len(caminho)):
+            deslocamento = profundidade[y] + 1 + t - profundidades_ordem[inicios[t]]
+            if t == 0:
+                trechos = [ordem[inicios[0]:fins[0]]]
+            else:
+                trechos = [ordem[inicios[t]:inicios[t - 1]], ordem[fins[t - 1]:fins[t]]]
+            for trecho in trechos:
+                profundidade[trecho] += deslocamento
+            pedacos.extend(trechos)
+        # Inverte os pais ao longo do caminho x -> q e pendura x em y; a quantidade de cada aresta do caminho
+        # passa para o novo filho, e a célula que entra fica em x
+        for t in range(len(caminho) - 1, 0, -1):
+            pai[caminho[t]] = caminho[t - 1]
+        pai[x] = y
+        caminho = np.array(caminho, dtype=np.int64)
+        fluxo[caminho[1:]] = fluxo[caminho[:-1]]
+        fluxo[x] = theta
+
+        # Reposiciona a subárvore na pré-ordem logo depois de y (vira o primeiro filho de y): só muda o trecho
+        # entre a subárvore e y
+        posicao_y = int(posicao[y])
+        if posicao_y > inicio_q:
+            inicio, fim = inicio_q, posicao_y + 1
+            ordem[inicio:fim] = np.concatenate([ordem[fim_q:fim]] + pedacos)
+        else:
+            inicio, fim = posicao_y + 1, fim_q
+            ordem[inicio:fim] = np.concatenate(pedacos + [ordem[inicio:inicio_q]])
+        posicao[ordem[inicio:fim]] = np.arange(inicio, fim)
+
+    # Monta a matriz de quantidades (sem o depósito fictício): a célula de cada nó com pai
+    filhos = np.flatnonzero(np.array(pai) >= 0)
+    pais = np.array(pai)[filhos]
+    fabricas, depositos = np.minimum(filhos, pais), np.maximum(filhos, pais) - m
+    matriz = np.zeros((m, n))
+    reais = depositos < n
+    matriz[fabricas[reais], depositos[reais]] = fluxo[filhos[reais]]
+    # Monta a matriz de quantidades (sem o depósito fictício)
+    custo_total = float((matriz * custos).sum())
+    contar(iteracoes=iteracoes)  # Pivôs do simplex (para a instrumentação)
+    return _resultado_transporte(status, matriz, custo_total, formato, iteracoes)
+
+# Função auxiliar que organiza o resultado do simplex de transporte no formato pedido
+def _resultado_transporte(status, matriz, custo_total, formato, iteracoes):
+    if formato == 'esparso':
+        linhas, colunas = np.nonzero(matriz)
+        quantidades = {"linhas": linhas, "colunas": colunas, "valores": matriz[linhas, colunas], "forma": matriz.shape}
+    elif formato == 'denso':
+        quantidades = matriz
+    else:
+        raise ValueError(f"Formato desconhecido: {formato} (use 'denso' ou 'esparso')")
+    return {
+        "status": status,  # Status da solução (ex.: "Optimal")
+        "otimo_comprovado": status == "Optimal",  # O simplex terminou sem custo reduzido negativo
+        "quantidades": quantidades,  # Quantidade transportada de cada fábrica para cada depósito
+        "custo_total": custo_total,  # Custo total
+        "iteracoes": iteracoes  # Pivôs do simplex de transporte
+    }
+
+# Função auxiliar que registra uma alocação da solução inicial e decide qual linha ou coluna sai
+# Só uma linha ou coluna sai por vez (exceto na última alocação), garantindo m + n - 1 células na base
+def _alocar(i, j, oferta, demanda, linhas_ativas, colunas_ativas):
+    q = min(oferta[i], demanda[j])
+    oferta[i] -= q
+    demanda[j] -= q
+    if linhas_ativas == 1:
+        return q, 'coluna'
+    if colunas_ativas == 1 or oferta[i] <= demanda[j]:
+        return q, 'linha'
+    return q, 'coluna'
+
+# Função que calcula a solução básica inicial pelo método do custo mínimo
+def _solucao_inicial_custo_minimo(custos, ofertas, demandas):
+    m, n = custos.shape
+    oferta, demanda = ofertas.astype(float).copy(), demandas.astype(float).copy()
+    linha_ativa, coluna_ativa = [True] * m, [True] * n
+    linhas_ativas, colunas_ativas = m, n
+    base = []
+    for k in np.argsort(custos, axis=None, kind='stable').tolist():
+        i, j = divmod(k, n)
+        if not (linha_ativa[i] and coluna_ativa[j]):
+            continue
+        q, sai = _alocar(i, j, oferta, demanda, linhas_ativas, colunas_ativas)
+        base.append((i, j, q))
+        if len(base) == m + n - 1:
+            break
+        if sai == 'linha':
+            linha_ativa[i] = False
+            linhas_ativas -= 1
+        else:
+            coluna_ativa[j] = False
+            colunas_ativas -= 1
+    return base
+
+# Função que calcula a solução básica inicial pelo método de Vogel (penalidades)
+# Penalidade de uma linha (ou coluna) = segundo menor custo ativo - menor custo ativo; aloca na linha/coluna de maior
+# penalidade, na célula mais barata. Cada linha e coluna guarda a ordem dos custos e ponteiros para os dois menores
+# ainda ativos, que só avançam; assim cada passo atualiza apenas as linhas/colunas afetadas
+def _solucao_inicial_vogel(custos, ofertas, demandas):
+    m, n = custos.shape
+    oferta, demanda = ofertas.astype(float).copy(), demandas.astype(float).copy()
+    ordem_linha = np.argsort(custos, axis=1, kind='stable')  # Colunas de cada linha, da mais barata para a mais cara
+    ordem_coluna = np.argsort(custos, axis=0, kind='stable').T  # Linhas de cada coluna, da mais barata para a mais cara
+    linha_ativa = np.ones(m, dtype=bool)
+    coluna_ativa = np.ones(n, dtype=bool)
+    ponteiros_linha = np.zeros((m, 2), dtype=np.int64)
+    ponteiros_coluna = np.zeros((n, 2), dtype=np.int64)
+    penalidade_linha = np.full(m, -np.inf)
+    penalidade_coluna = np.full(n, -np.inf)
+
+    # Avança os ponteiros de uma linha/coluna até os dois menores custos ativos e recalcula a penalidade
+    def atualizar(ordem, ponteiros, penalidade, ativos_outro_lado, matriz, k):
+        tamanho = ordem.shape[1]
+        p1, p2 = ponteiros[k]
+        while p1 < tamanho and not ativos_outro_lado[ordem[k, p1]]:
+            p1 += 1
+        p2 = max(p2, p1 + 1)
+        while p2 < tamanho and not ativos_outro_lado[ordem[k, p2]]:
+            p2 += 1
+        ponteiros[k] = p1, p2
+        if p1 >= tamanho:
+            penalidade[k] = -np.inf
+        elif p2 >= tamanho:
+            penalidade[k] = matriz[k, ordem[k, p1]]  # Só resta uma célula: penalidade é o próprio custo
+        else:
+            penalidade[k] = matriz[k, ordem[k, p2]] - matriz[k, ordem[k, p1]]
+
+    custos_t = custos.T
+    for i in range(m):
+        atualizar(ordem_linha, ponteiros_linha, penalidade_linha, coluna_ativa, custos, i)
+    for j in range(n):
+        atualizar(ordem_coluna, ponteiros_coluna, penalidade_coluna, linha_ativa, custos_t, j)
+
+    linhas_ativas, colunas_ativas = m, n
+    base = []
+    while len(base) < m + n - 1:
+        # Linha ou coluna de maior penalidade; a célula é a mais barata ainda ativa dela
+        i_max = int(np.argmax(penalidade_linha))
+        j_max = int(np.argmax(penalidade_coluna))
+        if penalidade_linha[i_max] >= penalidade_coluna[j_max]:
+            i = i_max
+            j = int(ordem_linha[i, ponteiros_linha[i, 0]])
+        else:
+            j = j_max
+            i = int(ordem_coluna[j, ponteiros_coluna[j, 0]])
+        q, sai = _alocar(i, j, oferta, demanda, linhas_ativas, colunas_ativas)
+        base.append((i, j, q))
+        if len(base) == m + n - 1:
+            break
+        if sai == 'linha':
+            linha_ativa[i] = False
+            linhas_ativas -= 1
+            penalidade_linha[i] = -np.inf
+            # Colunas cujos dois menores custos ativos incluíam a linha i precisam ser atualizadas
+            ativas = np.flatnonzero(coluna_ativa)
+            p = ponteiros_coluna[ativas]
+            afetadas = ativas[(ordem_coluna[ativas, np.minimum(p[:, 0], m - 1)] == i) |
+                              (ordem_coluna[ativas, np.minimum(p[:, 1], m - 1)] == i)]
+            for k in afetadas.tolist():
+                atualizar(ordem_coluna, ponteiros_coluna, penalidade_coluna, linha_ativa, custos_t, k)
+        else:
+            coluna_ativa[j] = False
+            colunas_ativas -= 1
+            penalidade_coluna[j] = -np.inf
+            ativas = np.flatnonzero(linha_ativa)
+            p = ponteiros_linha[ativas]
+            afetadas = ativas[(ordem_linha[ativas, np.minimum(p[:, 0], n - 1)] == j) |
+                              (ordem_linha[ativas, np.minimum(p[:, 1], n - 1)] == j)]
+            for k in afetadas.tolist():
+                atualizar(ordem_linha, ponteiros_linha, penalidade_linha, coluna_ativa, custos, k)
+    return base
+
+# Função que resolve o transporte como um problema de programação linear (CBC)
+# O modelo é gravado em MPS em fluxo, uma fábrica por vez, direto dos dados (sem montar o modelo no PuLP),
+# e as quantidades voltam como uma visão sobre a matriz lida da solução
+def resolver_transporte_lp(custos, ofertas, demandas):
+    fabricas = list(custos.keys())  # Lista de fábricas
+    depositos = list(next(iter(custos.values())).keys())  # Lista de depósitos
+    num_fabricas, num_depositos = len(fabricas), len(depositos)
+
+    # Restrições: cada fábrica não pode enviar mais do que sua oferta (R0 até R[fábricas-1]) e
+    # cada depósito deve receber pelo menos sua demanda (as restrições seguintes)
+    linhas = [('<=', num_fabricas), ('>=', num_depositos)]
+    lados = np.array([ofertas[f] for f in fabricas] + [demandas[d] for d in depositos], dtype=float)
+
+    # Variáveis: quantidade a transportar de cada fábrica para cada depósito (não negativa), geradas uma fábrica
+    # por vez; a coluna (f, d) tem o custo por unidade no objetivo e coeficiente 1 na oferta de f e na demanda de d
+    def colunas():
+        inicios = np.arange(0, 2 * num_depositos + 1, 2)
+        valores = np.ones(2 * num_depositos)
+        restricoes = np.empty(2 * num_depositos, dtype=np.int64)
+        restricoes[1::2] = num_fabricas + np.arange(num_depositos)
+        for i, f in enumerate(fabricas):
+            restricoes[0::2] = i
+            yield {"custos": np.fromiter((custos[f][d] for d in depositos), dtype=float, count=num_depositos),
+                   "inicios": inicios, "linhas": restricoes, "valores": valores}
+
+    # Resolve o problema (minimiza o custo total) com o solver configurado em src/solver.py
+    solucao = resolver_por_colunas(linhas, lados, colunas(), duais=False)
 
     # Organiza os resultados em um dicionário
+    if solucao["x"] is not None:
+        quantidades = QuantidadesTransporte(solucao["x"].reshape(num_fabricas, num_depositos), fabricas, depositos)
+    else:
+        quantidades = {(f, d): None for f in fabricas for d in depositos}  # Sem solução (limite de tempo)
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "quantidades": {(f, d): variaveis[(f, d)].varValue for f in fabricas for d in depositos},  # Quantidade transportada
-        "custo_total": pulp.value(problema.objective)  # Custo total
+        "status": solucao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": solucao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "quantidades": quantidades,  # Quantidade transportada
+        "custo_total": solucao["objetivo"]  # Custo total
     }
 
     return resultado  # Retorna os resultados
 
 # Função para criar um gráfico de rede mostrando o transporte
 def plotar_transporte(dados, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta o grafo da rede
     G = nx.DiGraph()  # Cria um grafo direcionado
     fabricas = sorted(set(f for f, d in dados['quantidades'].keys()))  # Lista de fábricas
     depositos = sorted(set(d for f, d in dados['quantidades'].keys()))  # Lista de depósitos
@@ -66,7 +464,7 @@ def plotar_transporte(dados, titulo):
     nx.draw_networkx_edge_labels(G, pos, edge_labels={(u, v): f"{d:.0f}" for (u, v), d in edge_labels.items()}, font_size=10)
     plt.title(titulo)  # Título do gráfico
     plt.axis('off')  # Remove os eixos
-    plt.show()  # Exibe o gráfico
+    exibir_figura(titulo)  # Exibe a rede fábricas -> depósitos
 
 # Função para executar e exibir resultados de um exemplo
 def executar_exemplo(custos, ofertas, demandas, titulo):
@@ -78,20 +476,26 @@ def executar_exemplo(custos, ofertas, demandas, titulo):
     print("Custo Total: R$", dados["custo_total"])  # Custo total
     plotar_transporte(dados, titulo)  # Mostra o gráfico
 
-# Exemplo 1: Configuração inicial
-custos1 = {1: {1: 8, 2: 5, 3: 6}, 2: {1: 15, 2: 10, 3: 12}, 3: {1: 3, 2: 9, 3: 10}}  # Custos de transporte
-ofertas1 = {1: 120, 2: 80, 3: 80}  # Oferta de cada fábrica
-demandas1 = {1: 70, 2: 60, 3: 150}  # Demanda de cada depósito
-executar_exemplo(custos1, ofertas1, demandas1, "Problema do Transporte - Exemplo 1")
-
-# Exemplo 2: Custos, ofertas e demandas modificados
-custos2 = {1: {1: 7, 2: 6, 3: 8}, 2: {1: 12, 2: 9, 3: 11}, 3: {1: 4, 2: 7, 3: 9}}  # Novos custos
-ofertas2 = {1: 50, 2: 90, 3: 190}  # Novas ofertas
-demandas2 = {1: 80, 2: 70, 3: 130}  # Novas demandas
-executar_exemplo(custos2, ofertas2, demandas2, "Problema do Transporte - Exemplo 2")
-
-# Exemplo 3: Outro conjunto de dados
-custos3 = {1: {1: 9, 2: 7, 3: 5}, 2: {1: 14, 2: 11, 3: 13}, 3: {1: 5, 2: 8, 3: 6}}  # Novos custos
-ofertas3 = {1: 70, 2: 90, 3: 50}  # Novas ofertas
-demandas3 = {1: 90, 2: 60, 3: 140}  # Novas demandas
-executar_exemplo(custos3, ofertas3, demandas3, "Problema do Transporte - Exemplo 3")
\ No newline at end of file
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    custos1 = {1: {1: 8, 2: 5, 3: 6}, 2: {1: 15, 2: 10, 3: 12}, 3: {1: 3, 2: 9, 3: 10}}  # Custos de transporte
+    ofertas1 = {1: 120, 2: 80, 3: 80}  # Oferta de cada fábrica
+    demandas1 = {1: 70, 2: 60, 3: 150}  # Demanda de cada depósito
+    executar_exemplo(custos1, ofertas1, demandas1, "Problema do Transporte - Exemplo 1")
+
+    # Exemplo 2: Custos, ofertas e demandas modificados
+    custos2 = {1: {1: 7, 2: 6, 3: 8}, 2: {1: 12, 2: 9, 3: 11}, 3: {1: 4, 2: 7, 3: 9}}  # Novos custos
+    ofertas2 = {1: 50, 2: 90, 3: 190}  # Novas ofertas
+    demandas2 = {1: 80, 2: 70, 3: 130}  # Novas demandas
+    executar_exemplo(custos2, ofertas2, demandas2, "Problema do Transporte - Exemplo 2")
+
+    # Exemplo 3: Outro conjunto de dados
+    custos3 = {1: {1: 9, 2: 7, 3: 5}, 2: {1: 14, 2: 11, 3: 13}, 3: {1: 5, 2: 8, 3: 6}}  # Novos custos
+    ofertas3 = {1: 70, 2: 90, 3: 50}  # Novas ofertas
+    demandas3 = {1: 90, 2: 60, 3: 140}  # Novas demandas
+    executar_exemplo(custos3, ofertas3, demandas3, "Problema do Transporte - Exemplo 3")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
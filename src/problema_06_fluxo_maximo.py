@@ -2,25 +2,54 @@
 import pulp  # Para resolver problemas de otimização linear
 import matplotlib.pyplot as plt  # Para criar gráficos
 import networkx as nx  # Para criar e visualizar redes de fluxo
+import numpy as np  # Para guardar a rede residual em arrays (formato CSR)
+from collections import deque  # Fila usada nas buscas em largura
+from itertools import chain  # Para percorrer nós de origem e de destino juntos
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráfico da rede de fluxo (src/graficos.py)
+from .solver import resolver_modelo  # Configuração compartilhada do solver (CBC/HiGHS, threads, limites)
+from .instrumentacao import instrumentado, contar  # Medição das fases para os observadores registrados (src/instrumentacao.py)
+
+# Métodos disponíveis para resolver o problema
+METODOS_FLUXO_MAXIMO = ('dinic', 'lp')
 
 # Função que calcula o fluxo máximo em uma rede, de uma origem a um destino
-def resolver_problema_fluxo_maximo(capacidades, origem, destino):
+# metodo='dinic' (padrão) usa o algoritmo combinatório de Dinic; metodo='lp' resolve o modelo linear
+# com o PuLP/CBC e serve como verificação cruzada. Os dois devolvem o mesmo dicionário, incluindo o corte mínimo
+@instrumentado
+@em_cache
+def resolver_problema_fluxo_maximo(capacidades, origem, destino, metodo='dinic'):
+    if metodo == 'dinic':
+        return resolver_fluxo_maximo_dinic(capacidades, origem, destino)
+    if metodo == 'lp':
+        return resolver_fluxo_maximo_lp(capacidades, origem, destino)
+    raise ValueError(f"Método desconhecido: {metodo} (use um de {METODOS_FLUXO_MAXIMO})")
+
+# Função que resolve o fluxo máximo como um problema de programação linear (PuLP/CBC)
+def resolver_fluxo_maximo_lp(capacidades, origem, destino):
     # Cria um problema para maximizar o fluxo total
     problema = pulp.LpProblem("Problema_Fluxo_Maximo", pulp.LpMaximize)
 
     # Cria variáveis: fluxo em cada arco (não negativo)
     variaveis = {(u, v): pulp.LpVariable(f"x_{u}_{v}", lowBound=0) for u in capacidades for v in capacidades[u]}
 
-    # Define o objetivo: maximizar o fluxo que sai da origem
-    problema += pulp.lpSum(variaveis[(origem, v)] for v in capacidades[origem]), "Fluxo_Total"
-
     # Identifica todos os nós (incluindo origem, destino e intermediários)
     nos = set(capacidades.keys()).union({v for dests in capacidades.values() for v in dests})
     intermediarios = nos - {origem, destino}  # Nós que não são origem nem destino
 
+    # Índice de arcos que entram em cada nó (evita percorrer todos os nós para cada nó)
+    entradas = {nodo: [] for nodo in nos}
+    for u in capacidades:
+        for v in capacidades[u]:
+            entradas[v].append(u)
+
+    # Define o objetivo: maximizar o fluxo líquido que sai da origem (o que sai menos o que volta para ela)
+    problema += (pulp.lpSum(variaveis[(origem, v)] for v in capacidades[origem]) -
+                 pulp.lpSum(variaveis[(u, origem)] for u in entradas[origem])), "Fluxo_Total"
+
     # Restrições: conservação de fluxo (o que entra em um nó intermediário deve sair)
     for nodo in intermediarios:
-        problema += (pulp.lpSum(variaveis[(u, nodo)] for u in capacidades if nodo in capacidades[u]) ==
+        problema += (pulp.lpSum(variaveis[(u, nodo)] for u in entradas[nodo]) ==
                      pulp.lpSum(variaveis[(nodo, v)] for v in capacidades.get(nodo, {}))), f"Conservacao_fluxo_{nodo}"
 
     # Restrições: fluxo em cada arco não pode exceder a capacidade
@@ -29,19 +58,189 @@ def resolver_problema_fluxo_maximo(capacidades, origem, destino):
             problema += variaveis[(u, v)] <= capacidades[u][v], f"Capacidade_{u}_{v}"
 
     # Resolve o problema
-    problema.solve()
+    situacao = resolver_modelo(problema)  # Usa o solver configurado em src/solver.py (solver, threads, limites)
 
     # Organiza os resultados em um dicionário
+    fluxos = {(u, v): variaveis[(u, v)].varValue for u in capacidades for v in capacidades[u]}  # Fluxo em cada arco
+    resultado = {
+        "status": situacao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": situacao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "fluxos": fluxos,
+        "fluxo_total": pulp.value(problema.objective),  # Fluxo total
+        "corte_minimo": calcular_corte_minimo(capacidades, fluxos, origem)  # Corte mínimo obtido a partir dos fluxos
+    }
+
+    return resultado  # Retorna os resultados
+
+# Função que calcula o corte mínimo a partir de um fluxo máximo já conhecido
+# O lado da origem são os nós alcançáveis a partir da origem na rede residual
+def calcular_corte_minimo(capacidades, fluxos, origem):
+    # Monta a rede residual: arco direto se ainda há folga, arco reverso se há fluxo
+    vizinhos = {}
+    for (u, v), fluxo in fluxos.items():
+        if fluxo < capacidades[u][v]:
+            vizinhos.setdefault(u, []).append(v)
+        if fluxo > 0:
+            vizinhos.setdefault(v, []).append(u)
+
+    # Busca em largura a partir da origem
+    alcancados = {origem}
+    fila = deque([origem])
+    while fila:
+        u = fila.popleft()
+        for v in vizinhos.get(u, []):
+            if v not in alcancados:
+                alcancados.add(v)
+                fila.append(v)
+
+    return _montar_corte(capacidades, alcancados)
+
+# Função auxiliar que organiza o corte mínimo em um dicionário a partir do lado da origem
+def _montar_corte(capacidades, lado_origem):
+    nos = list(dict.fromkeys(chain(capacidades, (v for dests in capacidades.values() for v in dests))))
+    arcos = [(u, v) for u in capacidades if u in lado_origem for v in capacidades[u] if v not in lado_origem]
+    return {
+        "lado_origem": [n for n in nos if n in lado_origem],  # Nós do lado da origem
+        "lado_destino": [n for n in nos if n not in lado_origem],  # Nós do lado do destino
+        "arcos": arcos,  # Arcos que atravessam o corte (saturados)
+        "capacidade": sum(capacidades[u][v] for u, v in arcos)  # Capacidade do corte (= fluxo máximo)
+    }
+
+# Função auxiliar que monta a rede residual em formato CSR (arrays de início, destino, folga e arco par)
+# Cada arco original i vira dois arcos residuais: 2*i (direto, com a capacidade) e 2*i+1 (reverso, vazio)
+def _construir_rede_residual(capacidades):
+    nos = list(dict.fromkeys(chain(capacidades, (v for dests in capacidades.values() for v in dests))))
+    indice = {n: i for i, n in enumerate(nos)}  # Nome do nó -> número
+    arcos = [(u, v) for u in capacidades for v in capacidades[u]]
+    m = len(arcos)
+
+    cauda = np.fromiter((indice[u] for u, v in arcos), dtype=np.int64, count=m)
+    cabeca = np.fromiter((indice[v] for u, v in arcos), dtype=np.int64, count=m)
+    capacidade = np.fromiter((capacidades[u][v] for u, v in arcos), dtype=float, count=m)
+
+    # Arcos residuais intercalados: pares (direto, reverso)
+    saida = np.empty(2 * m, dtype=np.int64)
+    chegada = np.empty(2 * m, dtype=np.int64)
+    folga = np.zeros(2 * m)
+    saida[0::2], saida[1::2] = cauda, cabeca
+    chegada[0::2], chegada[1::2] = cabeca, cauda
+    folga[0::2] = capacidade
+
+    # Ordena os arcos residuais pelo nó de saída (CSR) e guarda onde cada arco foi parar
+    ordem = np.argsort(saida, kind='stable')
+    posicao = np.empty(2 * m, dtype=np.int64)
+    posicao[ordem] = np.arange(2 * m)
+    inicio = np.zeros(len(nos) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(saida, minlength=len(nos)), out=inicio[1:])
+
+    return {
+        "nos": nos,
+        "indice": indice,
+        "arcos": arcos,
+        "inicio": inicio,  # Arcos do nó u ficam nas posições inicio[u] até inicio[u+1]-1
+        "chegada": chegada[ordem],  # Nó de chegada de cada arco residual
+        "folga": folga[ordem],  # Capacidade residual de cada arco
+        "par": posicao[ordem ^ 1],  # Posição do arco reverso de cada arco residual
+        "posicao_direto": posicao[0::2],  # Posição do arco direto de cada arco original
+        "capacidade": capacidade
+    }
+
+# Função que resolve o fluxo máximo com o algoritmo de Dinic (caminhos aumentantes em camadas)
+def resolver_fluxo_maximo_dinic(capacidades, origem, destino):
+    rede = _construir_rede_residual(capacidades)
+    n = len(rede["nos"])
+    # Os laços do algoritmo usam listas Python (acesso a elemento único é mais rápido que em arrays NumPy)
+    inicio = rede["inicio"].tolist()
+    chegada = rede["chegada"].tolist()
+    folga = rede["folga"].tolist()
+    par = rede["par"].tolist()
+
+    s = rede["indice"][origem]
+    t = rede["indice"].get(destino, -1)  # Destino sem arcos não recebe fluxo
+
+    fluxo_total = 0
+    fases = 0  # Fases do algoritmo (buscas em largura), informadas à instrumentação como iterações
+    while t >= 0 and s != t:
+        fases += 1
+        # Busca em largura: calcula o nível (distância) de cada nó na rede residual
+        nivel = [-1] * n
+        nivel[s] = 0
+        fila = deque([s])
+        while fila and nivel[t] < 0:
+            u = fila.popleft()
+            for a in range(inicio[u], inicio[u + 1]):
+                v = chegada[a]
+                if folga[a] > 0 and nivel[v] < 0:
+                    nivel[v] = nivel[u] + 1
+                    fila.append(v)
+        if nivel[t] < 0:
+            break  # Não há mais caminho aumentante: o fluxo é máximo
+
+        # Fluxo bloqueante: busca em profundidade (iterativa) só por arcos que sobem um nível
+        ponteiro = inicio[:-1]  # Próximo arco a testar em cada nó
+        caminho = []  # Arcos do caminho atual
+        u = s
+        while True:
+            if u == t:
+                # Aumenta o fluxo pelo gargalo do caminho encontrado
+                gargalo = min(folga[a] for a in caminho)
+                for a in caminho:
+                    folga[a] -= gargalo
+                    folga[par[a]] += gargalo
+                fluxo_total += gargalo
+                # Volta até o primeiro arco saturado e continua a busca a partir dali
+                k = next(k for k, a in enumerate(caminho) if folga[a] <= 0)
+                del caminho[k:]
+                u = chegada[caminho[-1]] if caminho else s
+                continue
+            avancou = False
+            while ponteiro[u] < inicio[u + 1]:
+                a = ponteiro[u]
+                v = chegada[a]
+                if folga[a] > 0 and nivel[v] == nivel[u] + 1:
+                    caminho.append(a)
+                    u = v
+                    avancou = True
+                    break
+                ponteiro[u] += 1
+            if not avancou:
+                if u == s:
+                    break  # Fluxo bloqueante concluído nesta fase
+                nivel[u] = -1  # Beco sem saída: o nó não é mais usado nesta fase
+                a = caminho.pop()
+                u = chegada[par[a]]  # Volta para o nó anterior
+                ponteiro[u] += 1
+
+    contar(iteracoes=fases)
+
+    # Nós alcançáveis a partir da origem na rede residual final formam o lado da origem do corte mínimo
+    alcancados = [False] * n
+    alcancados[s] = True
+    fila = deque([s])
+    while fila:
+        u = fila.popleft()
+        for a in range(inicio[u], inicio[u + 1]):
+            v = chegada[a]
+            if folga[a] > 0 and not alcancados[v]:
+                alcancados[v] = True
+                fila.append(v)
+
+    # Fluxo em cada arco original = capacidade - folga do arco direto
+    fluxo_arcos = rede["capacidade"] - np.asarray(folga)[rede["posicao_direto"]]
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "fluxos": {(u, v): variaveis[(u, v)].varValue for u in capacidades for v in capacidades[u]},  # Fluxo em cada arco
-        "fluxo_total": pulp.value(problema.objective)  # Fluxo total
+        "status": "Optimal",  # O algoritmo sempre termina com o fluxo máximo
+        "otimo_comprovado": True,
+        "fluxos": dict(zip(rede["arcos"], fluxo_arcos.tolist())),  # Fluxo em cada arco
+        "fluxo_total": float(fluxo_total),  # Fluxo total
+        "corte_minimo": _montar_corte(capacidades, {rede["nos"][i] for i in range(n) if alcancados[i]})
     }
 
     return resultado  # Retorna os resultados
 
 # Função para criar um gráfico de rede mostrando os fluxos
 def plotar_fluxo(dados, capacidades, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta o grafo nem calcula o layout
     G = nx.DiGraph()  # Cria um grafo direcionado
 
     # Adiciona arestas com fluxos maiores que zero, incluindo fluxo/capacidade
@@ -58,68 +257,77 @@ def plotar_fluxo(dados, capacidades, titulo):
     nx.draw_networkx_edge_labels(G, pos, edge_labels=labels)
     plt.title(titulo)  # Título do gráfico
     plt.axis('off')  # Remove os eixos
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial
-capacidades1 = {
-    's': {'a': 20, 'b': 10},  # Capacidades dos arcos saindo da origem 's'
-    'a': {'b': 5, 't': 10},   # Capacidades dos arcos saindo de 'a'
-    'b': {'t': 20}            # Capacidades dos arcos saindo de 'b'
-}
-origem1 = 's'  # Nó de origem
-destino1 = 't'  # Nó de destino
-
-dados_fluxo1 = resolver_problema_fluxo_maximo(capacidades1, origem1, destino1)
-
-# Mostra os resultados do Exemplo 1
-print("\nProblema do Fluxo Máximo - Exemplo 1:")
-print("Status:", dados_fluxo1["status"])  # Status da solução
-for (u, v), fluxo in dados_fluxo1["fluxos"].items():
-    if fluxo > 0:
-        print(f"Fluxo de {u} para {v}: {fluxo:.0f}")  # Fluxos não nulos
-print("Fluxo Total: ", dados_fluxo1["fluxo_total"])  # Fluxo total
-plotar_fluxo(dados_fluxo1, capacidades1, "Fluxo Máximo na Rede - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Novo conjunto de dados
-capacidades2 = {
-    's': {'a': 15, 'b': 10},  # Capacidades dos arcos saindo de 's'
-    'a': {'c': 10},           # Capacidades dos arcos saindo de 'a'
-    'b': {'c': 5, 't': 10},   # Capacidades dos arcos saindo de 'b'
-    'c': {'t': 10}            # Capacidades dos arcos saindo de 'c'
-}
-origem2 = 's'
-destino2 = 't'
-
-dados_fluxo2 = resolver_problema_fluxo_maximo(capacidades2, origem2, destino2)
-
-# Mostra os resultados do Exemplo 2
-print("\nProblema do Fluxo Máximo - Exemplo 2:")
-print("Status:", dados_fluxo2["status"])
-for (u, v), fluxo in dados_fluxo2["fluxos"].items():
-    if fluxo > 0:
-        print(f"Fluxo de {u} para {v}: {fluxo:.0f}")
-print("Fluxo Total: ", dados_fluxo2["fluxo_total"])
-plotar_fluxo(dados_fluxo2, capacidades2, "Fluxo Máximo na Rede - Exemplo 2")
-
-# Exemplo 3: Outro conjunto de dados
-capacidades3 = {
-    's': {'a': 25, 'b': 15},  # Capacidades dos arcos saindo de 's'
-    'a': {'c': 10, 'd': 10},  # Capacidades dos arcos saindo de 'a'
-    'b': {'d': 5, 'e': 10},   # Capacidades dos arcos saindo de 'b'
-    'c': {'t': 10},           # Capacidades dos arcos saindo de 'c'
-    'd': {'t': 15},           # Capacidades dos arcos saindo de 'd'
-    'e': {'t': 10}            # Capacidades dos arcos saindo de 'e'
-}
-origem3 = 's'
-destino3 = 't'
-
-dados_fluxo3 = resolver_problema_fluxo_maximo(capacidades3, origem3, destino3)
-
-# Mostra os resultados do Exemplo 3
-print("\nProblema do Fluxo Máximo - Exemplo 3:")
-print("Status:", dados_fluxo3["status"])
-for (u, v), fluxo in dados_fluxo3["fluxos"].items():
-    if fluxo > 0:
-        print(f"Fluxo de {u} para {v}: {fluxo:.0f}")
-print("Fluxo Total: ", dados_fluxo3["fluxo_total"])
-plotar_fluxo(dados_fluxo3, capacidades3, "Fluxo Máximo na Rede - Exemplo 3")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe a rede com os fluxos nas arestas
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    capacidades1 = {
+        's': {'a': 20, 'b': 10},  # Capacidades dos arcos saindo da origem 's'
+        'a': {'b': 5, 't': 10},   # Capacidades dos arcos saindo de 'a'
+        'b': {'t': 20}            # Capacidades dos arcos saindo de 'b'
+    }
+    origem1 = 's'  # Nó de origem
+    destino1 = 't'  # Nó de destino
+
+    dados_fluxo1 = resolver_problema_fluxo_maximo(capacidades1, origem1, destino1)
+
+    # Mostra os resultados do Exemplo 1
+    print("\nProblema do Fluxo Máximo - Exemplo 1:")
+    print("Status:", dados_fluxo1["status"])  # Status da solução
+    for (u, v), fluxo in dados_fluxo1["fluxos"].items():
+        if fluxo > 0:
+            print(f"Fluxo de {u} para {v}: {fluxo:.0f}")  # Fluxos não nulos
+    print("Fluxo Total: ", dados_fluxo1["fluxo_total"])  # Fluxo total
+    print("Arcos do corte mínimo:", dados_fluxo1["corte_minimo"]["arcos"])  # Arcos saturados que limitam o fluxo
+    plotar_fluxo(dados_fluxo1, capacidades1, "Fluxo Máximo na Rede - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Novo conjunto de dados
+    capacidades2 = {
+        's': {'a': 15, 'b': 10},  # Capacidades dos arcos saindo de 's'
+        'a': {'c': 10},           # Capacidades dos arcos saindo de 'a'
+        'b': {'c': 5, 't': 10},   # Capacidades dos arcos saindo de 'b'
+        'c': {'t': 10}            # Capacidades dos arcos saindo de 'c'
+    }
+    origem2 = 's'
+    destino2 = 't'
+
+    dados_fluxo2 = resolver_problema_fluxo_maximo(capacidades2, origem2, destino2)
+
+    # Mostra os resultados do Exemplo 2
+    print("\nProblema do Fluxo Máximo - Exemplo 2:")
+    print("Status:", dados_fluxo2["status"])
+    for (u, v), fluxo in dados_fluxo2["fluxos"].items():
+        if fluxo > 0:
+            print(f"Fluxo de {u} para {v}: {fluxo:.0f}")
+    print("Fluxo Total: ", dados_fluxo2["fluxo_total"])
+    print("Arcos do corte mínimo:", dados_fluxo2["corte_minimo"]["arcos"])  # Arcos saturados que limitam o fluxo
+    plotar_fluxo(dados_fluxo2, capacidades2, "Fluxo Máximo na Rede - Exemplo 2")
+
+    # Exemplo 3: Outro conjunto de dados
+    capacidades3 = {
+        's': {'a': 25, 'b': 15},  # Capacidades dos arcos saindo de 's'
+        'a': {'c': 10, 'd': 10},  # Capacidades dos arcos saindo de 'a'
+        'b': {'d': 5, 'e': 10},   # Capacidades dos arcos saindo de 'b'
+        'c': {'t': 10},           # Capacidades dos arcos saindo de 'c'
+        'd': {'t': 15},           # Capacidades dos arcos saindo de 'd'
+        'e': {'t': 10}            # Capacidades dos arcos saindo de 'e'
+    }
+    origem3 = 's'
+    destino3 = 't'
+
+    dados_fluxo3 = resolver_problema_fluxo_maximo(capacidades3, origem3, destino3)
+
+    # Mostra os resultados do Exemplo 3
+    print("\nProblema do Fluxo Máximo - Exemplo 3:")
+    print("Status:", dados_fluxo3["status"])
+    for (u, v), fluxo in dados_fluxo3["fluxos"].items():
+        if fluxo > 0:
+            print(f"Fluxo de {u} para {v}: {fluxo:.0f}")
+    print("Fluxo Total: ", dados_fluxo3["fluxo_total"])
+    print("Arcos do corte mínimo:", dados_fluxo3["corte_minimo"]["arcos"])  # Arcos saturados que limitam o fluxo
+    plotar_fluxo(dados_fluxo3, capacidades3, "Fluxo Máximo na Rede - Exemplo 3")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
@@ -1,39 +1,145 @@
 # Importa bibliotecas necessárias
 import pulp  # Para resolver problemas de otimização linear
 import matplotlib.pyplot as plt  # Para criar gráficos
+import numpy as np  # Para as matrizes de cobertura dos padrões de turno
+import copy  # Para entregar a cada ala sua própria cópia do resultado
+from concurrent.futures import ProcessPoolExecutor  # Para resolver várias alas em paralelo
+from .cache import em_cache, chave_canonica, CACHE_PADRAO  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráfico das enfermeiras por dia (src/graficos.py)
+from .solver import resolver_modelo, obter_configuracao, usando_solver  # Configuração compartilhada do solver (CBC/HiGHS, threads, limites)
+from .instrumentacao import instrumentado  # Medição das fases para os observadores registrados (src/instrumentacao.py)
 
-# Função que calcula o menor número de enfermeiras necessário para atender à demanda semanal
-def resolver_problema_escalonamento(demanda):
-    dias = len(demanda)  # Número de dias na semana (7)
-    # Cria um problema para minimizar o total de enfermeiras
+# Dias consecutivos de trabalho no turno padrão (uma semana cíclica com 5 dias de trabalho)
+DIAS_TRABALHO = 5
+
+# Função que monta a matriz de cobertura (dias x padrões) a partir de modelos de turno
+# Cada modelo é uma sequência 0/1 (1 = dia de trabalho) repetida até cobrir o horizonte; cada rotação distinta
+# do modelo vira um padrão (coluna), ou seja, um início possível no horizonte cíclico
+def matriz_padroes(horizonte, modelos):
+    colunas = []
+    vistos = set()
+    for modelo in modelos:
+        modelo = np.asarray(modelo, dtype=float)
+        base = np.resize(modelo, horizonte)  # Repete o modelo até completar o horizonte
+        for inicio in range(horizonte):
+            coluna = np.roll(base, inicio)
+            chave = coluna.tobytes()
+            if chave not in vistos:  # Rotações iguais (ex.: semanas repetidas) geram um único padrão
+                vistos.add(chave)
+                colunas.append(coluna)
+    return np.column_stack(colunas)
+
+# Função auxiliar com a cobertura original: o padrão i começa no dia i e cobre DIAS_TRABALHO dias consecutivos (ciclo)
+def _cobertura_padrao(dias):
+    cobertura = np.zeros((dias, dias))
+    for inicio in range(dias):
+        for i in range(DIAS_TRABALHO):
+            cobertura[(inicio + i) % dias, inicio] += 1
+    return cobertura
+
+# Função auxiliar que resolve o modelo de cobertura inteiro: min custos . x  com  cobertura @ x >= demanda, x inteiro >= 0
+# Fica no nível do módulo para poder ser enviada aos processos do lote; devolve uma tupla (fácil de guardar em cache)
+def _resolver_padroes(demanda, cobertura, custos):
+    dias, num_padroes = cobertura.shape
+    # Cria um problema para minimizar o total de enfermeiras (ou o custo dos padrões)
     problema = pulp.LpProblem("Problema_Escalonamento", pulp.LpMinimize)
 
-    # Cria variáveis: número de enfermeiras que começam a trabalhar em cada dia (inteiro, não negativo)
-    x = {i: pulp.LpVariable(f"x_{i}", lowBound=0, cat='Integer') for i in range(dias)}
+    # Cria variáveis: número de enfermeiras em cada padrão de turno (inteiro, não negativo)
+    x = {j: pulp.LpVariable(f"x_{j}", lowBound=0, cat='Integer') for j in range(num_padroes)}
 
-    # Define o objetivo: minimizar o total de enfermeiras (soma de todas que começam)
-    problema += pulp.lpSum(x[i] for i in range(dias)), "Minimizar_total_enfermeiras"
+    # Define o objetivo: minimizar o total de enfermeiras (custo 1 por padrão) ou o custo informado
+    problema += pulp.lpSum(custos[j] * x[j] for j in range(num_padroes)), "Minimizar_total_enfermeiras"
 
-    # Restrições: garantir que a demanda diária seja atendida
-    # Cada enfermeira trabalha 5 dias consecutivos, começando em um dos últimos 5 dias
+    # Restrições: garantir que a demanda de cada dia seja atendida pelos padrões que trabalham nesse dia
     for d in range(dias):
-        problema += pulp.lpSum(x[(d - i) % dias] for i in range(5)) >= demanda[d], f"Demanda_dia_{d}"
+        padroes_dia = np.flatnonzero(cobertura[d])
+        problema += pulp.lpSum(cobertura[d, j] * x[j] for j in padroes_dia.tolist()) >= demanda[d], f"Demanda_dia_{d}"
 
     # Resolve o problema
-    problema.solve()
+    situacao = resolver_modelo(problema)  # Usa o solver configurado em src/solver.py (solver, threads, limites)
+
+    quantidades = tuple(x[j].varValue for j in range(num_padroes))
+    total = sum(q for q in quantidades if q is not None)
+    return situacao["status"], quantidades, total, pulp.value(problema.objective), situacao["otimo_comprovado"]
+
+# Função auxiliar executada nos processos do lote: aplica a configuração do solver do processo principal
+def _resolver_padroes_configurado(configuracao, demanda, cobertura, custos):
+    with usando_solver(**configuracao):
+        return _resolver_padroes(demanda, cobertura, custos)
 
-    # Organiza os resultados em um dicionário
-    resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "inicio_enfermeiras": {i: x[i].varValue for i in range(dias)},  # Enfermeiras que começam em cada dia
-        "total_enfermeiras": pulp.value(problema.objective)  # Total de enfermeiras
+# Função auxiliar que normaliza a entrada (demanda, matriz de cobertura e custo de cada padrão)
+def _preparar_escalonamento(demanda, cobertura, custos):
+    demanda = tuple(float(d) for d in demanda)
+    cobertura = _cobertura_padrao(len(demanda)) if cobertura is None else np.asarray(cobertura, dtype=float)
+    if cobertura.shape[0] != len(demanda):
+        raise ValueError(f"A cobertura tem {cobertura.shape[0]} dias, mas a demanda tem {len(demanda)}")
+    custos = tuple([1.0] * cobertura.shape[1]) if custos is None else tuple(float(c) for c in custos)
+    return demanda, cobertura, custos
+
+# Função auxiliar que organiza a solução (tupla devolvida por _resolver_padroes) no dicionário de resultados
+def _resultado_escalonamento(solucao):
+    status, quantidades, total, custo, otimo = solucao
+    return {
+        "status": status,  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": otimo,  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "inicio_enfermeiras": dict(enumerate(quantidades)),  # Enfermeiras em cada padrão (no padrão original, que começam em cada dia)
+        "total_enfermeiras": total,  # Total de enfermeiras
+        "custo_total": custo  # Valor do objetivo (igual ao total quando todos os padrões custam 1)
     }
 
-    return resultado  # Retorna os resultados
+# Função que calcula o menor número de enfermeiras necessário para atender à demanda
+# Sem "cobertura", usa o turno original: DIAS_TRABALHO dias consecutivos num ciclo do tamanho da demanda.
+# Com "cobertura" (matriz dias x padrões, ex.: de matriz_padroes), aceita qualquer horizonte e vários padrões de turno;
+# "custos" opcionais dão o custo de cada padrão. Resultados de entradas já resolvidas vêm do cache de soluções
+@instrumentado
+@em_cache
+def resolver_problema_escalonamento(demanda, cobertura=None, custos=None):
+    return _resultado_escalonamento(_resolver_padroes(*_preparar_escalonamento(demanda, cobertura, custos)))  # Retorna os resultados
+
+# Função que resolve o escalonamento de várias alas de uma vez (cada ala é independente)
+# demandas: lista ou dicionário {ala: demanda}; todas as alas usam a mesma cobertura e os mesmos custos.
+# Demandas idênticas são resolvidas uma única vez (e as já vistas vêm do cache de soluções); as restantes são
+# distribuídas entre processos (processos=None usa todos os núcleos; processos=1 resolve em sequência)
+def resolver_escalonamento_lote(demandas, cobertura=None, custos=None, processos=None):
+    nomes = list(demandas.keys()) if isinstance(demandas, dict) else list(range(len(demandas)))
+    chaves = {}
+    resultados_por_chave = {}  # Resultado de cada demanda distinta do lote
+    pendentes = {}  # Demandas distintas que não estão no cache: chave -> (entrada preparada, chave no cache)
+    for nome in nomes:
+        entrada = _preparar_escalonamento(demandas[nome], cobertura, custos)
+        chave = chave_canonica(*entrada)
+        chaves[nome] = chave
+        if chave in resultados_por_chave or chave in pendentes:
+            continue  # Demanda idêntica a outra ala do lote
+        chave_cache = resolver_problema_escalonamento.chave_cache(demandas[nome], cobertura, custos) if CACHE_PADRAO.ativo else None
+        resultado = CACHE_PADRAO.obter(chave_cache) if chave_cache is not None else None
+        if resultado is None:
+            pendentes[chave] = (entrada, chave_cache)
+        else:
+            resultados_por_chave[chave] = resultado
+
+    # Resolve as demandas distintas ainda não vistas, em paralelo quando houver mais de uma
+    entradas = [entrada for entrada, _ in pendentes.values()]
+    if processos == 1 or len(entradas) <= 1:
+        solucoes = [_resolver_padroes(*entrada) for entrada in entradas]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            configuracoes = [obter_configuracao()] * len(entradas)  # Os processos usam a mesma configuração do solver
+            solucoes = list(executor.map(_resolver_padroes_configurado, configuracoes, *zip(*entradas)))
+    for (chave, (_, chave_cache)), solucao in zip(pendentes.items(), solucoes):
+        resultados_por_chave[chave] = _resultado_escalonamento(solucao)
+        if chave_cache is not None:
+            CACHE_PADRAO.guardar(chave_cache, resultados_por_chave[chave])
+
+    # Cada ala recebe sua própria cópia do resultado (alas com a mesma demanda não compartilham o dicionário)
+    resultados = {nome: copy.deepcopy(resultados_por_chave[chaves[nome]]) for nome in nomes}
+    return resultados if isinstance(demandas, dict) else [resultados[nome] for nome in nomes]
 
 # Função para criar um gráfico de barras mostrando as enfermeiras que começam em cada dia
 def plotar_escalonamento(dados, titulo):
-    dias = sorted(dados['inicio_enfermeiras'].keys())  # Lista de dias (0 a 6)
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta as barras dos dias
+    dias = sorted(dados['inicio_enfermeiras'].keys())  # Lista de dias (0 a 6) ou de padrões
     valores = [dados['inicio_enfermeiras'][d] for d in dias]  # Número de enfermeiras por dia
 
     fig, ax = plt.subplots()  # Cria uma figura
@@ -42,38 +148,62 @@ def plotar_escalonamento(dados, titulo):
     ax.set_ylabel('Enfermeiras iniciando')  # Nome do eixo Y
     ax.set_title(titulo)  # Título do gráfico
     ax.set_xticks(dias)  # Define os ticks do eixo X
-    ax.set_xticklabels(['Dom', 'Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb'])  # Rótulos dos dias
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial (demanda da apostila)
-demanda1 = [17, 13, 15, 19, 14, 16, 11]  # Demanda de enfermeiras por dia (Domingo a Sábado)
-
-print("\nProblema de Escalonamento de Horários - Exemplo 1:")
-dados_escalonamento1 = resolver_problema_escalonamento(demanda1)
-print("Status:", dados_escalonamento1["status"])  # Status da solução
-for dia, valor in dados_escalonamento1["inicio_enfermeiras"].items():
-    print(f"Dia {dia} - Enfermeiras iniciando: {valor:.0f}")  # Enfermeiras que começam em cada dia
-print("Total de enfermeiras: ", dados_escalonamento1["total_enfermeiras"])  # Total de enfermeiras
-plotar_escalonamento(dados_escalonamento1, "Escalonamento de Enfermeiras - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Demanda mais alta no meio da semana
-demanda2 = [10, 12, 20, 25, 23, 18, 14]  # Nova demanda com pico na quarta e quinta
-
-print("\nProblema de Escalonamento de Horários - Exemplo 2:")
-dados_escalonamento2 = resolver_problema_escalonamento(demanda2)
-print("Status:", dados_escalonamento2["status"])
-for dia, valor in dados_escalonamento2["inicio_enfermeiras"].items():
-    print(f"Dia {dia} - Enfermeiras iniciando: {valor:.0f}")
-print("Total de enfermeiras: ", dados_escalonamento2["total_enfermeiras"])
-plotar_escalonamento(dados_escalonamento2, "Escalonamento de Enfermeiras - Exemplo 2")
-
-# Exemplo 3: Demanda alta no fim de semana
-demanda3 = [8, 9, 11, 10, 12, 20, 22]  # Nova demanda com pico na sexta e sábado
-
-print("\nProblema de Escalonamento de Horários - Exemplo 3:")
-dados_escalonamento3 = resolver_problema_escalonamento(demanda3)
-print("Status:", dados_escalonamento3["status"])
-for dia, valor in dados_escalonamento3["inicio_enfermeiras"].items():
-    print(f"Dia {dia} - Enfermeiras iniciando: {valor:.0f}")
-print("Total de enfermeiras: ", dados_escalonamento3["total_enfermeiras"])
-plotar_escalonamento(dados_escalonamento3, "Escalonamento de Enfermeiras - Exemplo 3")
\ No newline at end of file
+    if len(dias) == 7:
+        ax.set_xticklabels(['Dom', 'Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb'])  # Rótulos dos dias
+    exibir_figura(titulo)  # Exibe as barras de início por dia
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial (demanda da apostila)
+    demanda1 = [17, 13, 15, 19, 14, 16, 11]  # Demanda de enfermeiras por dia (Domingo a Sábado)
+
+    print("\nProblema de Escalonamento de Horários - Exemplo 1:")
+    dados_escalonamento1 = resolver_problema_escalonamento(demanda1)
+    print("Status:", dados_escalonamento1["status"])  # Status da solução
+    for dia, valor in dados_escalonamento1["inicio_enfermeiras"].items():
+        print(f"Dia {dia} - Enfermeiras iniciando: {valor:.0f}")  # Enfermeiras que começam em cada dia
+    print("Total de enfermeiras: ", dados_escalonamento1["total_enfermeiras"])  # Total de enfermeiras
+    plotar_escalonamento(dados_escalonamento1, "Escalonamento de Enfermeiras - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Demanda mais alta no meio da semana
+    demanda2 = [10, 12, 20, 25, 23, 18, 14]  # Nova demanda com pico na quarta e quinta
+
+    print("\nProblema de Escalonamento de Horários - Exemplo 2:")
+    dados_escalonamento2 = resolver_problema_escalonamento(demanda2)
+    print("Status:", dados_escalonamento2["status"])
+    for dia, valor in dados_escalonamento2["inicio_enfermeiras"].items():
+        print(f"Dia {dia} - Enfermeiras iniciando: {valor:.0f}")
+    print("Total de enfermeiras: ", dados_escalonamento2["total_enfermeiras"])
+    plotar_escalonamento(dados_escalonamento2, "Escalonamento de Enfermeiras - Exemplo 2")
+
+    # Exemplo 3: Demanda alta no fim de semana
+    demanda3 = [8, 9, 11, 10, 12, 20, 22]  # Nova demanda com pico na sexta e sábado
+
+    print("\nProblema de Escalonamento de Horários - Exemplo 3:")
+    dados_escalonamento3 = resolver_problema_escalonamento(demanda3)
+    print("Status:", dados_escalonamento3["status"])
+    for dia, valor in dados_escalonamento3["inicio_enfermeiras"].items():
+        print(f"Dia {dia} - Enfermeiras iniciando: {valor:.0f}")
+    print("Total de enfermeiras: ", dados_escalonamento3["total_enfermeiras"])
+    plotar_escalonamento(dados_escalonamento3, "Escalonamento de Enfermeiras - Exemplo 3")
+
+    # Exemplo 4: 40 alas num horizonte de 8 semanas com três padrões de turno, resolvidas em lote
+    horizonte = 56
+    cobertura4 = matriz_padroes(horizonte, [
+        [1, 1, 1, 1, 1, 0, 0],  # 5 dias de trabalho e 2 de folga por semana
+        [1, 1, 1, 1, 0, 0, 0],  # 4 dias de trabalho e 3 de folga por semana
+        [1] * 7 + [0] * 7,  # Uma semana de trabalho e uma de folga
+    ])
+    perfis = [demanda1, demanda2, demanda3, [12, 12, 14, 14, 14, 10, 8]]  # Perfis semanais das alas
+    demandas4 = {f"Ala{a + 1:02d}": np.resize(perfis[a % len(perfis)], horizonte) for a in range(40)}  # Muitas alas repetem o perfil
+
+    print("\nProblema de Escalonamento de Horários - Exemplo 4 (40 alas, 8 semanas):")
+    dados_escalonamento4 = resolver_escalonamento_lote(demandas4, cobertura4)
+    print("Padrões de turno disponíveis:", cobertura4.shape[1])
+    for ala in list(dados_escalonamento4)[:len(perfis)]:
+        print(f"{ala} - Status: {dados_escalonamento4[ala]['status']} - Total de enfermeiras: {dados_escalonamento4[ala]['total_enfermeiras']:.0f}")
+    print("Total de enfermeiras (todas as alas):", sum(r["total_enfermeiras"] for r in dados_escalonamento4.values()))
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
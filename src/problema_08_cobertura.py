@@ -1,37 +1,225 @@
 # Importa bibliotecas necessárias
-import pulp  # Para resolver problemas de otimização linear
 import matplotlib.pyplot as plt  # Para criar gráficos
 import networkx as nx  # Para criar e visualizar grafos
+import numpy as np  # Para guardar a incidência elemento x subconjunto em formato esparso (CSR)
+import heapq  # Fila de prioridade usada pela heurística gulosa
+import math  # Para arredondar o limite inferior
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Grafo bipartido da cobertura (src/graficos.py)
+from .matricial import resolver_por_colunas  # Modelo gravado em MPS em fluxo, sem montar o modelo no PuLP (src/matricial.py)
+from .instrumentacao import instrumentado, contar  # Medição das fases para os observadores registrados (src/instrumentacao.py)
+
+# Métodos disponíveis: modelo inteiro no CBC (exato) ou heurística gulosa + relaxação lagrangeana (rápida)
+METODOS_COBERTURA = ('mip', 'heuristico')
+
+# Número padrão de iterações do subgradiente na relaxação lagrangeana
+ITERACOES_LAGRANGE = 300
+
+# A cada quantas iterações do subgradiente a heurística lagrangeana tenta melhorar a cobertura
+INTERVALO_HEURISTICA = 10
 
 # Função que encontra o menor número de subconjuntos para cobrir todos os elementos
-def resolver_problema_cobertura(elementos, subconjuntos):
-    # Cria um problema para minimizar o número de subconjuntos usados
-    problema = pulp.LpProblem("Problema_Cobertura", pulp.LpMinimize)
+# metodo='mip' (padrão) resolve o modelo inteiro no CBC; metodo='heuristico' não chama o CBC e devolve
+# uma cobertura gulosa melhorada pela heurística lagrangeana, com limite inferior e gap de otimalidade
+@instrumentado
+@em_cache
+def resolver_problema_cobertura(elementos, subconjuntos, metodo='mip', iteracoes=ITERACOES_LAGRANGE):
+    if metodo == 'mip':
+        return resolver_cobertura_mip(elementos, subconjuntos)
+    if metodo == 'heuristico':
+        return resolver_cobertura_heuristica(elementos, subconjuntos, iteracoes)
+    raise ValueError(f"Método desconhecido: {metodo} (use um de {METODOS_COBERTURA})")
 
-    # Cria variáveis binárias: 1 se o subconjunto é escolhido, 0 caso contrário
-    x = {s: pulp.LpVariable(f"x_{s}", cat='Binary') for s in subconjuntos}
+# Função auxiliar que monta a incidência entre subconjuntos e elementos em formato esparso
+# Guarda as duas direções em CSR: subconjunto -> elementos e o índice invertido elemento -> subconjuntos
+def indexar_cobertura(elementos, subconjuntos):
+    elementos = list(elementos)
+    nomes = list(subconjuntos.keys())
+    indice = {e: i for i, e in enumerate(elementos)}
 
-    # Define o objetivo: minimizar o total de subconjuntos escolhidos
-    problema += pulp.lpSum(x[s] for s in subconjuntos), "Minimizar_numero_subconjuntos"
+    # Pares (subconjunto, elemento) da incidência; elementos fora da lista são ignorados
+    linhas, colunas = [], []
+    for s, nome in enumerate(nomes):
+        for e in subconjuntos[nome]:
+            if e in indice:
+                linhas.append(s)
+                colunas.append(indice[e])
+    # Um elemento repetido na lista de um subconjunto conta uma vez (como "e in subconjunto" no modelo do PuLP);
+    # os pares ficam em ordem de subconjunto e, dentro dele, de elemento
+    pares = np.unique(np.asarray(linhas, dtype=np.int64) * max(len(elementos), 1) + np.asarray(colunas, dtype=np.int64))
+    linhas, colunas = np.divmod(pares, max(len(elementos), 1))
 
-    # Restrições: cada elemento deve ser coberto por pelo menos um subconjunto
-    for e in elementos:
-        problema += pulp.lpSum(x[s] for s in subconjuntos if e in subconjuntos[s]) >= 1, f"Cobertura_elemento_{e}"
+    # CSR subconjunto -> elementos
+    inicio_subconjunto = np.zeros(len(nomes) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(linhas, minlength=len(nomes)), out=inicio_subconjunto[1:])
+
+    # CSR elemento -> subconjuntos (índice invertido)
+    ordem = np.argsort(colunas, kind='stable')
+    inicio_elemento = np.zeros(len(elementos) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(colunas, minlength=len(elementos)), out=inicio_elemento[1:])
+
+    return {
+        "elementos": elementos,
+        "nomes": nomes,
+        "linhas": linhas,  # Subconjunto de cada par da incidência
+        "inicio_subconjunto": inicio_subconjunto,
+        "elementos_do_subconjunto": colunas,  # Elementos de s: posições inicio_subconjunto[s] até inicio_subconjunto[s+1]-1
+        "inicio_elemento": inicio_elemento,
+        "subconjuntos_do_elemento": linhas[ordem]  # Subconjuntos que cobrem e: posições inicio_elemento[e] até inicio_elemento[e+1]-1
+    }
+
+# Função que resolve a cobertura como um problema de programação inteira binária (CBC)
+# O modelo é gravado em MPS em fluxo direto da incidência em CSR (sem montar o modelo no PuLP)
+def resolver_cobertura_mip(elementos, subconjuntos):
+    dados = indexar_cobertura(elementos, subconjuntos)
+    nomes = dados["nomes"]
+    num_elementos = len(dados["elementos"])
 
-    # Resolve o problema
-    problema.solve()
+    # Restrições: cada elemento deve ser coberto por pelo menos um subconjunto (uma por elemento, lado direito 1)
+    linhas = [('>=', num_elementos)]
+
+    # Variáveis binárias (1 se o subconjunto é escolhido): a coluna de cada subconjunto tem custo 1 no objetivo
+    # (minimizar o total de subconjuntos escolhidos) e coeficiente 1 nas restrições dos elementos que ele contém
+    colunas = [{"custos": np.ones(len(nomes)), "inicios": dados["inicio_subconjunto"], "linhas": dados["elementos_do_subconjunto"],
+                "valores": np.ones(dados["elementos_do_subconjunto"].size), "superiores": 1.0, "inteiras": True}]
+
+    # Resolve o problema com o solver configurado em src/solver.py
+    solucao = resolver_por_colunas(linhas, np.ones(num_elementos), colunas, duais=False)
+    escolhidos = np.flatnonzero(solucao["x"] > 0.5).tolist() if solucao["x"] is not None else []
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "subconjuntos_escolhidos": [s for s in subconjuntos if x[s].varValue == 1],  # Subconjuntos selecionados
-        "total_subconjuntos": pulp.value(problema.objective)  # Número total de subconjuntos usados
+        "status": solucao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": solucao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "subconjuntos_escolhidos": [nomes[s] for s in escolhidos],  # Subconjuntos selecionados
+        "total_subconjuntos": solucao["objetivo"]  # Número total de subconjuntos usados
+    }
+
+    return resultado  # Retorna os resultados
+
+# Função auxiliar que completa uma cobertura de forma gulosa (menor custo por elemento novo coberto)
+# Usa avaliação preguiçosa: a razão de um subconjunto só é recalculada quando ele chega ao topo da fila
+def _cobertura_gulosa(dados, custos, iniciais=()):
+    inicio = dados["inicio_subconjunto"]
+    membros = dados["elementos_do_subconjunto"]
+    coberto = np.zeros(len(dados["elementos"]), dtype=bool)
+    escolhidos = list(iniciais)
+    for s in escolhidos:
+        coberto[membros[inicio[s]:inicio[s + 1]]] = True
+    restantes = int((~coberto).sum())
+
+    # Quantos elementos ainda descobertos cada subconjunto cobre
+    novos = np.bincount(dados["linhas"], weights=~coberto[membros], minlength=len(dados["nomes"]))
+    fila = [(custos[s] / novos[s], s) for s in np.flatnonzero(novos > 0).tolist()]
+    heapq.heapify(fila)
+    while restantes and fila:
+        razao, s = heapq.heappop(fila)
+        elementos_s = membros[inicio[s]:inicio[s + 1]]
+        descobertos = elementos_s[~coberto[elementos_s]]
+        if len(descobertos) == 0:
+            continue
+        nova_razao = custos[s] / len(descobertos)
+        if nova_razao > razao:
+            heapq.heappush(fila, (nova_razao, s))  # A razão piorou: volta para a fila com o valor atualizado
+            continue
+        coberto[descobertos] = True
+        restantes -= len(descobertos)
+        escolhidos.append(s)
+    return escolhidos
+
+# Função auxiliar que retira subconjuntos redundantes (todos os seus elementos cobertos por outros escolhidos)
+def _remover_redundantes(dados, custos, escolhidos):
+    inicio = dados["inicio_subconjunto"]
+    membros = dados["elementos_do_subconjunto"]
+    vezes = np.zeros(len(dados["elementos"]), dtype=np.int64)  # Quantos escolhidos cobrem cada elemento
+    for s in escolhidos:
+        vezes[membros[inicio[s]:inicio[s + 1]]] += 1
+    mantidos = []
+    # Tenta retirar primeiro os mais caros
+    for s in sorted(escolhidos, key=lambda s: custos[s], reverse=True):
+        elementos_s = membros[inicio[s]:inicio[s + 1]]
+        if np.all(vezes[elementos_s] >= 2):
+            vezes[elementos_s] -= 1
+        else:
+            mantidos.append(s)
+    return sorted(mantidos)
+
+# Função que resolve a cobertura sem o CBC: heurística gulosa + relaxação lagrangeana (subgradiente)
+# Relaxando as restrições de cobertura com multiplicadores u >= 0, L(u) = soma(u) + soma(min(0, custo - soma de u no subconjunto))
+# é um limite inferior para o ótimo; a cada iteração os subconjuntos de custo reduzido negativo sugerem uma cobertura,
+# completada de forma gulosa. O resultado informa o limite inferior e o gap entre a melhor cobertura e esse limite
+def resolver_cobertura_heuristica(elementos, subconjuntos, iteracoes=ITERACOES_LAGRANGE):
+    dados = indexar_cobertura(elementos, subconjuntos)
+    nomes = dados["nomes"]
+    m, n = len(nomes), len(dados["elementos"])
+    linhas = dados["linhas"]
+    membros = dados["elementos_do_subconjunto"]
+    grau = np.diff(dados["inicio_elemento"])  # Quantos subconjuntos cobrem cada elemento
+
+    if np.any(grau == 0):
+        # Algum elemento não aparece em nenhum subconjunto: não existe cobertura
+        return {"status": "Infeasible", "subconjuntos_escolhidos": [], "total_subconjuntos": None,
+                "limite_inferior": None, "gap": None, "otimo_comprovado": False}
+
+    custos = np.ones(m)  # Todos os subconjuntos custam 1 (minimiza a quantidade)
+
+    # Solução inicial: gulosa sem redundâncias
+    melhor = _remover_redundantes(dados, custos, _cobertura_gulosa(dados, custos))
+    limite_superior = custos[melhor].sum()
+
+    # Multiplicadores iniciais: menor custo por elemento entre os subconjuntos que cobrem cada elemento
+    tamanho = np.diff(dados["inicio_subconjunto"])
+    u = np.full(n, np.inf)
+    np.minimum.at(u, membros, (custos / np.maximum(tamanho, 1))[linhas])
+    limite_inferior = 0.0
+    passo, sem_melhora = 2.0, 0
+    for iteracao in range(iteracoes):
+        if math.ceil(limite_inferior - 1e-6) >= limite_superior:
+            break  # Limites iguais: a melhor cobertura é ótima
+        # Custo reduzido de cada subconjunto e valor da função lagrangeana
+        custo_reduzido = custos - np.bincount(linhas, weights=u[membros], minlength=m)
+        selecionados = custo_reduzido < 0
+        valor = u.sum() + custo_reduzido[selecionados].sum()
+        if valor > limite_inferior + 1e-9:
+            limite_inferior, sem_melhora = valor, 0
+        else:
+            sem_melhora += 1
+            if sem_melhora >= 20:
+                passo, sem_melhora = passo / 2, 0  # Reduz o passo quando o limite para de melhorar
+
+        # Heurística lagrangeana: completa os subconjuntos selecionados até cobrir tudo
+        if iteracao % INTERVALO_HEURISTICA == 0:
+            candidata = _cobertura_gulosa(dados, custos, np.flatnonzero(selecionados).tolist())
+            candidata = _remover_redundantes(dados, custos, candidata)
+            if custos[candidata].sum() < limite_superior:
+                melhor, limite_superior = candidata, custos[candidata].sum()
+
+        # Subgradiente: 1 - número de vezes que cada elemento é coberto pelos subconjuntos selecionados
+        subgradiente = 1 - np.bincount(membros, weights=selecionados[linhas], minlength=n)
+        norma = float(subgradiente @ subgradiente)
+        if norma == 0 or passo < 1e-4:
+            break
+        u = np.maximum(0, u + passo * (limite_superior - valor) / norma * subgradiente)
+    contar(iteracoes=iteracao + 1 if iteracoes else 0)  # Iterações do subgradiente (para a instrumentação)
+
+    # Com custos inteiros, o ótimo é inteiro: o limite inferior pode ser arredondado para cima
+    limite_inferior = min(math.ceil(limite_inferior - 1e-6), limite_superior)
+    otimo = bool(limite_inferior >= limite_superior)
+    resultado = {
+        "status": "Optimal" if otimo else "Not Solved",  # "Optimal" só quando os limites se encontram
+        "subconjuntos_escolhidos": [nomes[s] for s in melhor],  # Subconjuntos selecionados
+        "total_subconjuntos": float(limite_superior),  # Número total de subconjuntos usados
+        "limite_inferior": float(limite_inferior),  # Limite inferior da relaxação lagrangeana
+        "gap": float((limite_superior - limite_inferior) / limite_superior) if limite_superior else 0.0,  # Gap relativo
+        "otimo_comprovado": otimo
     }
 
     return resultado  # Retorna os resultados
 
 # Função para criar um grafo bipartido mostrando a cobertura
 def plotar_cobertura(elementos, subconjuntos, subconjuntos_escolhidos, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta o grafo bipartido
     G = nx.Graph()  # Cria um grafo não direcionado
 
     # Adiciona nós para subconjuntos (lado esquerdo) e elementos (lado direito)
@@ -55,52 +243,58 @@ def plotar_cobertura(elementos, subconjuntos, subconjuntos_escolhidos, titulo):
     nx.draw(G, pos, with_labels=True, node_color=["lightgreen" if n in subconjuntos_escolhidos else "lightblue" for n in G.nodes()], node_size=2000)
     plt.title(titulo)  # Título do gráfico
     plt.axis('off')  # Remove os eixos
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial (dados da apostila)
-print("\nProblema de Cobertura - Exemplo 1:")
-elementos1 = {1, 2, 3, 4, 5}  # Elementos que precisam ser cobertos
-subconjuntos1 = {
-    'A': {1, 2, 3},  # Subconjunto A cobre os elementos 1, 2, 3
-    'B': {2, 4},     # Subconjunto B cobre os elementos 2, 4
-    'C': {3, 4},     # Subconjunto C cobre os elementos 3, 4
-    'D': {4, 5}      # Subconjunto D cobre os elementos 4, 5
-}
-dados_cobertura1 = resolver_problema_cobertura(elementos1, subconjuntos1)
-print("Status:", dados_cobertura1["status"])  # Status da solução
-print("Subconjuntos escolhidos:", dados_cobertura1["subconjuntos_escolhidos"])  # Subconjuntos selecionados
-print("Total de subconjuntos usados:", dados_cobertura1["total_subconjuntos"])  # Número de subconjuntos
-plotar_cobertura(elementos1, subconjuntos1, dados_cobertura1['subconjuntos_escolhidos'], "Cobertura - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Novo conjunto de dados
-print("\nProblema de Cobertura - Exemplo 2:")
-elementos2 = {1, 2, 3, 4, 5, 6}  # Elementos que precisam ser cobertos
-subconjuntos2 = {
-    'X': {1, 4},     # Subconjunto X cobre os elementos 1, 4
-    'Y': {2, 5},     # Subconjunto Y cobre os elementos 2, 5
-    'Z': {3, 6},     # Subconjunto Z cobre os elementos 3, 6
-    'W': {1, 2, 3},  # Subconjunto W cobre os elementos 1, 2, 3
-    'V': {4, 5, 6}   # Subconjunto V cobre os elementos 4, 5, 6
-}
-dados_cobertura2 = resolver_problema_cobertura(elementos2, subconjuntos2)
-print("Status:", dados_cobertura2["status"])
-print("Subconjuntos escolhidos:", dados_cobertura2["subconjuntos_escolhidos"])
-print("Total de subconjuntos usados:", dados_cobertura2["total_subconjuntos"])
-plotar_cobertura(elementos2, subconjuntos2, dados_cobertura2['subconjuntos_escolhidos'], "Cobertura - Exemplo 2")
-
-# Exemplo 3: Outro conjunto de dados
-print("\nProblema de Cobertura - Exemplo 3:")
-elementos3 = {1, 2, 3, 4, 5, 6, 7}  # Elementos que precisam ser cobertos
-subconjuntos3 = {
-    'M': {1, 2},     # Subconjunto M cobre os elementos 1, 2
-    'N': {2, 3, 4},  # Subconjunto N cobre os elementos 2, 3, 4
-    'O': {4, 5},     # Subconjunto O cobre os elementos 4, 5
-    'P': {5, 6},     # Subconjunto P cobre os elementos 5, 6
-    'Q': {6, 7},     # Subconjunto Q cobre os elementos 6, 7
-    'R': {1, 7}      # Subconjunto R cobre os elementos 1, 7
-}
-dados_cobertura3 = resolver_problema_cobertura(elementos3, subconjuntos3)
-print("Status:", dados_cobertura3["status"])
-print("Subconjuntos escolhidos:", dados_cobertura3["subconjuntos_escolhidos"])
-print("Total de subconjuntos usados:", dados_cobertura3["total_subconjuntos"])
-plotar_cobertura(elementos3, subconjuntos3, dados_cobertura3['subconjuntos_escolhidos'], "Cobertura - Exemplo 3")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe o grafo subconjuntos -> elementos
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial (dados da apostila)
+    print("\nProblema de Cobertura - Exemplo 1:")
+    elementos1 = {1, 2, 3, 4, 5}  # Elementos que precisam ser cobertos
+    subconjuntos1 = {
+        'A': {1, 2, 3},  # Subconjunto A cobre os elementos 1, 2, 3
+        'B': {2, 4},     # Subconjunto B cobre os elementos 2, 4
+        'C': {3, 4},     # Subconjunto C cobre os elementos 3, 4
+        'D': {4, 5}      # Subconjunto D cobre os elementos 4, 5
+    }
+    dados_cobertura1 = resolver_problema_cobertura(elementos1, subconjuntos1)
+    print("Status:", dados_cobertura1["status"])  # Status da solução
+    print("Subconjuntos escolhidos:", dados_cobertura1["subconjuntos_escolhidos"])  # Subconjuntos selecionados
+    print("Total de subconjuntos usados:", dados_cobertura1["total_subconjuntos"])  # Número de subconjuntos
+    plotar_cobertura(elementos1, subconjuntos1, dados_cobertura1['subconjuntos_escolhidos'], "Cobertura - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Novo conjunto de dados
+    print("\nProblema de Cobertura - Exemplo 2:")
+    elementos2 = {1, 2, 3, 4, 5, 6}  # Elementos que precisam ser cobertos
+    subconjuntos2 = {
+        'X': {1, 4},     # Subconjunto X cobre os elementos 1, 4
+        'Y': {2, 5},     # Subconjunto Y cobre os elementos 2, 5
+        'Z': {3, 6},     # Subconjunto Z cobre os elementos 3, 6
+        'W': {1, 2, 3},  # Subconjunto W cobre os elementos 1, 2, 3
+        'V': {4, 5, 6}   # Subconjunto V cobre os elementos 4, 5, 6
+    }
+    dados_cobertura2 = resolver_problema_cobertura(elementos2, subconjuntos2)
+    print("Status:", dados_cobertura2["status"])
+    print("Subconjuntos escolhidos:", dados_cobertura2["subconjuntos_escolhidos"])
+    print("Total de subconjuntos usados:", dados_cobertura2["total_subconjuntos"])
+    plotar_cobertura(elementos2, subconjuntos2, dados_cobertura2['subconjuntos_escolhidos'], "Cobertura - Exemplo 2")
+
+    # Exemplo 3: Outro conjunto de dados
+    print("\nProblema de Cobertura - Exemplo 3:")
+    elementos3 = {1, 2, 3, 4, 5, 6, 7}  # Elementos que precisam ser cobertos
+    subconjuntos3 = {
+        'M': {1, 2},     # Subconjunto M cobre os elementos 1, 2
+        'N': {2, 3, 4},  # Subconjunto N cobre os elementos 2, 3, 4
+        'O': {4, 5},     # Subconjunto O cobre os elementos 4, 5
+        'P': {5, 6},     # Subconjunto P cobre os elementos 5, 6
+        'Q': {6, 7},     # Subconjunto Q cobre os elementos 6, 7
+        'R': {1, 7}      # Subconjunto R cobre os elementos 1, 7
+    }
+    dados_cobertura3 = resolver_problema_cobertura(elementos3, subconjuntos3)
+    print("Status:", dados_cobertura3["status"])
+    print("Subconjuntos escolhidos:", dados_cobertura3["subconjuntos_escolhidos"])
+    print("Total de subconjuntos usados:", dados_cobertura3["total_subconjuntos"])
+    plotar_cobertura(elementos3, subconjuntos3, dados_cobertura3['subconjuntos_escolhidos'], "Cobertura - Exemplo 3")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
@@ -1,9 +1,172 @@
 # Importa bibliotecas necessárias
 import pulp  # Para resolver problemas de otimização linear
 import matplotlib.pyplot as plt  # Para criar gráficos
+import numpy as np  # Para a programação dinâmica vetorizada
+from bisect import bisect_right  # Para calcular o limitante do branch-and-bound em O(log n)
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráfico dos itens da mochila (src/graficos.py)
+from .solver import resolver_modelo  # Configuração compartilhada do solver (CBC/HiGHS, threads, limites)
+from .instrumentacao import instrumentado, contar, anotar  # Medição das fases para os observadores registrados (src/instrumentacao.py)
+
+# Métodos disponíveis: programação dinâmica, branch-and-bound, modelo inteiro no CBC ou escolha automática
+METODOS_MOCHILA = ('auto', 'pd', 'bb', 'mip')
+
+# Maior tabela (itens x capacidades) aceita pela programação dinâmica no modo automático
+# Com as decisões guardadas em bits, 2e8 células ocupam cerca de 25 MB
+LIMITE_CELULAS_PD = 2 * 10**8
+
+# Tolerância usada nas comparações com o limitante do branch-and-bound (pesos e valores reais)
+TOLERANCIA_BB = 1e-9
 
 # Função que seleciona os itens mais valiosos para colocar na mochila sem exceder a capacidade
-def resolver_problema_mochila(valores, pesos, capacidade):
+# metodo='auto' usa programação dinâmica quando os pesos são inteiros e a tabela cabe em LIMITE_CELULAS_PD,
+# e branch-and-bound caso contrário; 'pd', 'bb' e 'mip' (modelo inteiro no CBC) forçam um método
+@instrumentado
+@em_cache
+def resolver_problema_mochila(valores, pesos, capacidade, metodo='auto'):
+    if metodo not in METODOS_MOCHILA:
+        raise ValueError(f"Método desconhecido: {metodo} (use um de {METODOS_MOCHILA})")
+    if metodo == 'auto':
+        if min(pesos, default=0) < 0:
+            metodo = 'mip'  # Pesos negativos só são tratados pelo modelo inteiro
+        elif _pesos_inteiros(pesos, capacidade) and len(pesos) * (int(capacidade) + 1) <= LIMITE_CELULAS_PD:
+            metodo = 'pd'
+        else:
+            metodo = 'bb'
+    anotar(metodo=metodo)  # Método usado (para a instrumentação)
+    if metodo == 'pd':
+        return resolver_mochila_pd(valores, pesos, capacidade)
+    if metodo == 'bb':
+        return resolver_mochila_bb(valores, pesos, capacidade)
+    return resolver_mochila_mip(valores, pesos, capacidade)
+
+# Função auxiliar que verifica se os pesos são inteiros (requisito da programação dinâmica)
+def _pesos_inteiros(pesos, capacidade):
+    return capacidade >= 0 and all(float(p) == int(p) for p in pesos)
+
+# Função auxiliar que organiza o resultado no mesmo formato do modelo inteiro
+def _resultado_mochila(valores, pesos, itens_escolhidos, status="Optimal"):
+    return {
+        "status": status,  # Status da solução
+        "otimo_comprovado": status == "Optimal",  # Programação dinâmica e branch-and-bound são exatos
+        "itens_escolhidos": itens_escolhidos,  # Índices dos itens escolhidos
+        "valor_total": sum(valores[i] for i in itens_escolhidos),  # Valor total dos itens
+        "peso_total": sum(pesos[i] for i in itens_escolhidos)  # Peso total dos itens
+    }
+
+# Função que resolve a mochila com programação dinâmica vetorizada (pesos inteiros)
+# tabela[c] = maior valor possível com peso até c; cada item atualiza a tabela inteira com uma operação NumPy
+# Para reconstruir a solução, guarda só 1 bit por (item, capacidade) indicando se o item melhorou aquela posição
+def resolver_mochila_pd(valores, pesos, capacidade):
+    if capacidade < 0:
+        return _resultado_mochila(valores, pesos, [], status="Infeasible")
+    if not _pesos_inteiros(pesos, capacidade):
+        raise ValueError("A programação dinâmica exige pesos inteiros não negativos (use metodo='bb')")
+
+    n = len(valores)
+    pesos_int = [int(p) for p in pesos]
+    if min(pesos_int, default=0) < 0:
+        raise ValueError("A programação dinâmica exige pesos inteiros não negativos (use metodo='mip')")
+    # Capacidade acima da soma dos pesos não muda nada: limita o tamanho da tabela
+    cap = min(int(capacidade), sum(pesos_int))
+    tipo = np.int64 if all(float(v) == int(v) for v in valores) else float
+    tabela = np.zeros(cap + 1, dtype=tipo)
+    decisoes = np.zeros((n, (cap + 8) // 8), dtype=np.uint8)  # Bits compactados: 8 capacidades por byte
+
+    linha = np.zeros(cap + 1, dtype=bool)
+    for i in range(n):
+        w, v = pesos_int[i], valores[i]
+        if w > cap or v <= 0:
+            continue  # Item que não cabe ou não tem valor nunca é escolhido
+        candidato = tabela[:cap + 1 - w] + v  # Valor ao colocar o item sobre a mochila de capacidade c - w
+        melhora = candidato > tabela[w:]
+        tabela[w:] = np.where(melhora, candidato, tabela[w:])
+        linha[:w] = False
+        linha[w:] = melhora
+        decisoes[i] = np.packbits(linha)
+
+    # Reconstrução: percorre os itens de trás para frente seguindo os bits de decisão
+    itens_escolhidos = []
+    c = cap
+    for i in range(n - 1, -1, -1):
+        if decisoes[i, c >> 3] & (0x80 >> (c & 7)):
+            itens_escolhidos.append(i)
+            c -= pesos_int[i]
+    itens_escolhidos.reverse()
+
+    return _resultado_mochila(valores, pesos, itens_escolhidos)
+
+# Função que resolve a mochila com branch-and-bound em profundidade (Horowitz-Sahni), aceitando pesos reais
+# Os itens são ordenados por valor/peso; o limitante é a relaxação linear (Dantzig), calculada com somas acumuladas
+def resolver_mochila_bb(valores, pesos, capacidade):
+    if capacidade < 0:
+        return _resultado_mochila(valores, pesos, [], status="Infeasible")
+    if min(pesos, default=0) < 0:
+        raise ValueError("O branch-and-bound exige pesos não negativos (use metodo='mip')")
+
+    # Itens de peso zero e valor positivo sempre entram; itens sem valor ou que não cabem nunca entram
+    fixos = [i for i in range(len(valores)) if pesos[i] == 0 and valores[i] > 0]
+    candidatos = [i for i in range(len(valores)) if pesos[i] > 0 and valores[i] > 0 and pesos[i] <= capacidade]
+    candidatos.sort(key=lambda i: valores[i] / pesos[i], reverse=True)
+    m = len(candidatos)
+    p = [valores[i] for i in candidatos]
+    w = [pesos[i] for i in candidatos]
+
+    # Somas acumuladas de valores e pesos na ordem de valor/peso
+    acum_p = [0] * (m + 1)
+    acum_w = [0] * (m + 1)
+    for k in range(m):
+        acum_p[k + 1] = acum_p[k] + p[k]
+        acum_w[k + 1] = acum_w[k] + w[k]
+
+    # Limitante superior do valor que ainda cabe usando os itens j, j+1, ... com a folga dada
+    def limitante(j, folga):
+        k = bisect_right(acum_w, acum_w[j] + folga, lo=j) - 1  # Últimos itens que cabem inteiros: j até k-1
+        limite = acum_p[k] - acum_p[j]
+        if k < m:
+            limite += (acum_w[j] + folga - acum_w[k]) * p[k] / w[k]  # Fração do item seguinte
+        return limite
+
+    x = [0] * m  # Decisão atual de cada item (só as posições antes de j são válidas)
+    melhor_x = [0] * m
+    melhor_valor = 0
+    valor, folga, j = 0, capacidade, 0
+    nos = 0  # Ramos explorados (informados à instrumentação)
+    while True:
+        nos += 1
+        # Avança: coloca os itens que cabem enquanto o limitante ainda supera a melhor solução
+        podado = False
+        while j < m:
+            if valor + limitante(j, folga) <= melhor_valor + TOLERANCIA_BB:
+                podado = True
+                break
+            if w[j] <= folga:
+                x[j] = 1
+                folga -= w[j]
+                valor += p[j]
+            else:
+                x[j] = 0
+            j += 1
+        if not podado and valor > melhor_valor:
+            melhor_valor = valor
+            melhor_x = x[:]
+        # Retrocede: retira o último item colocado e tenta o ramo sem ele
+        i = j - 1
+        while i >= 0 and x[i] == 0:
+            i -= 1
+        if i < 0:
+            break
+        x[i] = 0
+        valor -= p[i]
+        folga += w[i]
+        j = i + 1
+
+    contar(nos=nos)
+    itens_escolhidos = sorted(fixos + [candidatos[k] for k in range(m) if melhor_x[k]])
+    return _resultado_mochila(valores, pesos, itens_escolhidos)
+
+# Função que resolve a mochila como um problema de programação inteira binária (PuLP/CBC)
+def resolver_mochila_mip(valores, pesos, capacidade):
     # Cria um problema para maximizar o valor total dos itens escolhidos
     problema = pulp.LpProblem("Problema_Mochila", pulp.LpMaximize)
 
@@ -17,20 +180,23 @@ def resolver_problema_mochila(valores, pesos, capacidade):
     problema += pulp.lpSum(pesos[i] * x[i] for i in range(n)) <= capacidade, "Restricao_capacidade"
 
     # Resolve o problema
-    problema.solve()
+    situacao = resolver_modelo(problema)  # Usa o solver configurado em src/solver.py (solver, threads, limites)
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "itens_escolhidos": [i for i in range(n) if x[i].varValue == 1],  # Índices dos itens escolhidos
+        "status": situacao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": situacao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "itens_escolhidos": [i for i in range(n) if (x[i].varValue or 0) > 0.5],  # Índices dos itens escolhidos
         "valor_total": pulp.value(problema.objective),  # Valor total dos itens
-        "peso_total": sum(pesos[i] for i in range(n) if x[i].varValue == 1)  # Peso total dos itens
+        "peso_total": sum(pesos[i] for i in range(n) if (x[i].varValue or 0) > 0.5)  # Peso total dos itens
     }
 
     return resultado  # Retorna os resultados
 
 # Função para criar um gráfico de barras mostrando os itens selecionados
 def plotar_mochila(valores, pesos, itens_escolhidos, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta as barras dos itens
     fig, ax = plt.subplots()  # Cria uma figura
     indices = list(range(len(valores)))  # Índices dos itens
     # Destaca itens escolhidos em verde e os não escolhidos em azul
@@ -40,60 +206,66 @@ def plotar_mochila(valores, pesos, itens_escolhidos, titulo):
     ax.set_ylabel('Valor')  # Nome do eixo Y
     ax.set_title(titulo)  # Título do gráfico
     plt.xticks(indices)  # Define os ticks do eixo X
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial
-valores1 = [60, 100, 120]  # Valores dos itens
-pesos1 = [10, 20, 30]  # Pesos dos itens
-capacidade1 = 50  # Capacidade da mochila
-
-dados_mochila1 = resolver_problema_mochila(valores1, pesos1, capacidade1)
-
-print("\nProblema da Mochila - Exemplo 1:")
-print("Status:", dados_mochila1["status"])  # Status da solução
-print("Itens escolhidos:", dados_mochila1["itens_escolhidos"])  # Itens selecionados
-print("Valor total: R$", dados_mochila1["valor_total"])  # Valor total
-print("Peso total: ", dados_mochila1["peso_total"])  # Peso total
-plotar_mochila(valores1, pesos1, dados_mochila1['itens_escolhidos'], "Mochila - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Mais itens com capacidade limitada
-valores2 = [90, 20, 60, 40, 30]  # Valores dos itens
-pesos2 = [15, 5, 10, 8, 6]  # Pesos dos itens
-capacidade2 = 25  # Capacidade da mochila
-
-dados_mochila2 = resolver_problema_mochila(valores2, pesos2, capacidade2)
-
-print("\nProblema da Mochila - Exemplo 2:")
-print("Status:", dados_mochila2["status"])
-print("Itens escolhidos:", dados_mochila2["itens_escolhidos"])
-print("Valor total: R$", dados_mochila2["valor_total"])
-print("Peso total: ", dados_mochila2["peso_total"])
-plotar_mochila(valores2, pesos2, dados_mochila2['itens_escolhidos'], "Mochila - Exemplo 2")
-
-# Exemplo 3: Mochila com mais itens e pesos variados
-valores3 = [45, 60, 75, 40, 30, 20]  # Valores dos itens
-pesos3 = [3, 8, 7, 4, 2, 1]  # Pesos dos itens
-capacidade3 = 15  # Capacidade da mochila
-
-dados_mochila3 = resolver_problema_mochila(valores3, pesos3, capacidade3)
-
-print("\nProblema da Mochila - Exemplo 3:")
-print("Status:", dados_mochila3["status"])
-print("Itens escolhidos:", dados_mochila3["itens_escolhidos"])
-print("Valor total: R$", dados_mochila3["valor_total"])
-print("Peso total: ", dados_mochila3["peso_total"])
-plotar_mochila(valores3, pesos3, dados_mochila3['itens_escolhidos'], "Mochila - Exemplo 3")
-
-# Exemplo 4: Valores e pesos variados
-valores4 = [80, 50, 60, 90, 20]  # Valores dos itens
-pesos4 = [10, 5, 7, 12, 3]  # Pesos dos itens
-capacidade4 = 20  # Capacidade da mochila
-
-dados_mochila4 = resolver_problema_mochila(valores4, pesos4, capacidade4)
-
-print("\nProblema da Mochila - Exemplo 4:")
-print("Status:", dados_mochila4["status"])
-print("Itens escolhidos:", dados_mochila4["itens_escolhidos"])
-print("Valor total: R$", dados_mochila4["valor_total"])
-print("Peso total: ", dados_mochila4["peso_total"])
-plotar_mochila(valores4, pesos4, dados_mochila4['itens_escolhidos'], "Mochila - Exemplo 4")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe as barras com os itens escolhidos destacados
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    valores1 = [60, 100, 120]  # Valores dos itens
+    pesos1 = [10, 20, 30]  # Pesos dos itens
+    capacidade1 = 50  # Capacidade da mochila
+
+    dados_mochila1 = resolver_problema_mochila(valores1, pesos1, capacidade1)
+
+    print("\nProblema da Mochila - Exemplo 1:")
+    print("Status:", dados_mochila1["status"])  # Status da solução
+    print("Itens escolhidos:", dados_mochila1["itens_escolhidos"])  # Itens selecionados
+    print("Valor total: R$", dados_mochila1["valor_total"])  # Valor total
+    print("Peso total: ", dados_mochila1["peso_total"])  # Peso total
+    plotar_mochila(valores1, pesos1, dados_mochila1['itens_escolhidos'], "Mochila - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Mais itens com capacidade limitada
+    valores2 = [90, 20, 60, 40, 30]  # Valores dos itens
+    pesos2 = [15, 5, 10, 8, 6]  # Pesos dos itens
+    capacidade2 = 25  # Capacidade da mochila
+
+    dados_mochila2 = resolver_problema_mochila(valores2, pesos2, capacidade2)
+
+    print("\nProblema da Mochila - Exemplo 2:")
+    print("Status:", dados_mochila2["status"])
+    print("Itens escolhidos:", dados_mochila2["itens_escolhidos"])
+    print("Valor total: R$", dados_mochila2["valor_total"])
+    print("Peso total: ", dados_mochila2["peso_total"])
+    plotar_mochila(valores2, pesos2, dados_mochila2['itens_escolhidos'], "Mochila - Exemplo 2")
+
+    # Exemplo 3: Mochila com mais itens e pesos variados
+    valores3 = [45, 60, 75, 40, 30, 20]  # Valores dos itens
+    pesos3 = [3, 8, 7, 4, 2, 1]  # Pesos dos itens
+    capacidade3 = 15  # Capacidade da mochila
+
+    dados_mochila3 = resolver_problema_mochila(valores3, pesos3, capacidade3)
+
+    print("\nProblema da Mochila - Exemplo 3:")
+    print("Status:", dados_mochila3["status"])
+    print("Itens escolhidos:", dados_mochila3["itens_escolhidos"])
+    print("Valor total: R$", dados_mochila3["valor_total"])
+    print("Peso total: ", dados_mochila3["peso_total"])
+    plotar_mochila(valores3, pesos3, dados_mochila3['itens_escolhidos'], "Mochila - Exemplo 3")
+
+    # Exemplo 4: Valores e pesos variados
+    valores4 = [80, 50, 60, 90, 20]  # Valores dos itens
+    pesos4 = [10, 5, 7, 12, 3]  # Pesos dos itens
+    capacidade4 = 20  # Capacidade da mochila
+
+    dados_mochila4 = resolver_problema_mochila(valores4, pesos4, capacidade4)
+
+    print("\nProblema da Mochila - Exemplo 4:")
+    print("Status:", dados_mochila4["status"])
+    print("Itens escolhidos:", dados_mochila4["itens_escolhidos"])
+    print("Valor total: R$", dados_mochila4["valor_total"])
+    print("Peso total: ", dados_mochila4["peso_total"])
+    plotar_mochila(valores4, pesos4, dados_mochila4['itens_escolhidos'], "Mochila - Exemplo 4")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
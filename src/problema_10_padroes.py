@@ -1,9 +1,62 @@
 # Importa bibliotecas necessárias
 import pulp  # Para resolver problemas de otimização linear
+import math  # Para arredondar o limite inferior do corte de bobinas
+import numpy as np  # Para a programação dinâmica vetorizada
 import matplotlib.pyplot as plt  # Para criar gráficos
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Gráfico da produção por produto (src/graficos.py)
+from .solver import resolver_modelo  # Configuração compartilhada do solver (CBC/HiGHS, threads, limites)
+from .matricial import resolver_matricial  # Mestre da geração de colunas em matrizes (src/matricial.py)
+from .instrumentacao import instrumentado, contar, anotar  # Medição das fases para os observadores registrados (src/instrumentacao.py)
+
+# Métodos disponíveis: programação dinâmica (mochila ilimitada), modelo inteiro no CBC ou escolha automática
+METODOS_PADROES = ('auto', 'pd', 'mip')
+
+# Métodos para obter a solução inteira do corte de bobinas a partir da relaxação linear:
+# 'arredondamento' (arredonda para baixo e completa a demanda restante com first-fit decreasing) ou
+# 'mip' (modelo inteiro no CBC com os padrões gerados)
+METODOS_CORTE = ('arredondamento', 'mip')
+
+# Maior tabela (produtos distintos x capacidades) e maior memória (bytes) aceitas pela programação dinâmica no
+# modo automático; acima delas o modelo inteiro no CBC é mais rápido
+LIMITE_CELULAS_PD = 2 * 10**8
+LIMITE_BYTES_PD = 256 * 2**20
+
+# Bytes por posição da tabela em _mochila_ilimitada: tabela e escolha (8 + 8) e, para cada item, grade, deslocada,
+# acumulada, o resultado do np.where e a cópia do ravel (5 x 8) e a máscara melhora (1)
+BYTES_POR_POSICAO_PD = 8 + 8 + 5 * 8 + 1
+
+# Limite de rodadas da geração de colunas e tolerância do custo reduzido para aceitar um padrão novo
+LIMITE_ITERACOES_CORTE = 1000
+TOLERANCIA_CORTE = 1e-6
 
 # Função que calcula a quantidade de cada produto (latinhas) a produzir para maximizar o lucro
-def resolver_problema_padroes(consumos, lucros, material_disponivel):
+# metodo='auto' usa programação dinâmica quando os consumos são inteiros positivos e a tabela cabe em
+# LIMITE_CELULAS_PD e LIMITE_BYTES_PD, e o modelo inteiro no CBC caso contrário; 'pd' e 'mip' forçam um método
+@instrumentado
+@em_cache
+def resolver_problema_padroes(consumos, lucros, material_disponivel, metodo='auto'):
+    if metodo not in METODOS_PADROES:
+        raise ValueError(f"Método desconhecido: {metodo} (use um de {METODOS_PADROES})")
+    produtos = list(consumos.keys())  # Lista de produtos (ex.: Pequena, Media, Grande)
+    if metodo == 'auto':
+        metodo = 'mip'
+        if _consumos_inteiros([consumos[p] for p in produtos]) and material_disponivel >= 0:
+            itens = _reduzir_itens(np.array([lucros[p] for p in produtos], dtype=float),
+                                   np.array([consumos[p] for p in produtos], dtype=np.int64), int(material_disponivel))
+            if len(itens[0]) * (itens[4] + 1) <= LIMITE_CELULAS_PD and _memoria_pd(itens) <= LIMITE_BYTES_PD:
+                metodo = 'pd'
+    anotar(metodo=metodo)  # Método usado (para a instrumentação)
+    if metodo == 'pd':
+        return resolver_padroes_pd(consumos, lucros, material_disponivel)
+    return resolver_padroes_mip(consumos, lucros, material_disponivel)
+
+# Função auxiliar que verifica se os consumos são inteiros positivos (requisito da programação dinâmica)
+def _consumos_inteiros(consumos):
+    return all(float(c) == int(c) and c > 0 for c in consumos)
+
+# Função que resolve o modelo inteiro no CBC (uma restrição de material, produtos ilimitados)
+def resolver_padroes_mip(consumos, lucros, material_disponivel):
     # Cria um problema para maximizar o lucro total
     problema = pulp.LpProblem("Problema_Padroes", pulp.LpMaximize)
 
@@ -17,19 +70,192 @@ def resolver_problema_padroes(consumos, lucros, material_disponivel):
     problema += pulp.lpSum(consumos[p] * x[p] for p in produtos) <= material_disponivel, "Restricao_Material"
 
     # Resolve o problema
-    problema.solve()
+    situacao = resolver_modelo(problema)  # Usa o solver configurado em src/solver.py (solver, threads, limites)
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
+        "status": situacao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": situacao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
         "quantidade_produtos": {p: x[p].varValue for p in produtos},  # Quantidade de cada produto
         "lucro_total": pulp.value(problema.objective)  # Lucro total
     }
 
     return resultado  # Retorna os resultados
 
+# Função que resolve o caso de uma restrição de material direto por programação dinâmica (consumos inteiros
+# positivos), sem montar o modelo nem enumerar padrões; devolve o resultado no mesmo formato do modelo inteiro
+def resolver_padroes_pd(consumos, lucros, material_disponivel):
+    produtos = list(consumos.keys())
+    if material_disponivel < 0:
+        return {"status": "Infeasible", "otimo_comprovado": False,
+                "quantidade_produtos": {p: None for p in produtos}, "lucro_total": None}
+    if not _consumos_inteiros([consumos[p] for p in produtos]):
+        raise ValueError("A programação dinâmica exige consumos inteiros positivos (use metodo='mip')")
+    _, quantidades = _mochila_ilimitada(np.array([lucros[p] for p in produtos], dtype=float),
+                                        np.array([consumos[p] for p in produtos], dtype=np.int64), int(material_disponivel))
+    return {
+        "status": "Optimal",  # A programação dinâmica é exata
+        "otimo_comprovado": True,
+        "quantidade_produtos": {p: float(q) for p, q in zip(produtos, quantidades.tolist())},  # Quantidade de cada produto
+        "lucro_total": float(sum(lucros[p] * q for p, q in zip(produtos, quantidades.tolist())))  # Lucro total
+    }
+
+# Função auxiliar que prepara a mochila ilimitada: descarta itens sem valor ou que não cabem, mantém só o item
+# mais valioso de cada peso e escolhe o item de maior valor por peso (b)
+# Existe uma solução ótima com menos de peso(b) itens diferentes de b (dentre peso(b) itens, alguns somam um
+# múltiplo de peso(b) e podem ser trocados por cópias de b sem perder valor): a tabela da programação dinâmica
+# só precisa ir até (peso(b) - 1) * maior peso, qualquer que seja a capacidade
+# Devolve (índices originais, pesos, valores, posição de b, tamanho da tabela)
+def _reduzir_itens(valores, pesos, capacidade):
+    uteis = np.flatnonzero((valores > 0) & (pesos <= capacidade))
+    if uteis.size == 0:
+        return uteis, pesos[uteis], valores[uteis], None, 0
+    ordem = uteis[np.lexsort((-valores[uteis], pesos[uteis]))]  # Por peso; no mesmo peso, o mais valioso primeiro
+    primeiros = np.concatenate([[True], pesos[ordem][1:] != pesos[ordem][:-1]])
+    indices = ordem[primeiros]
+    w, v = pesos[indices], valores[indices]
+    melhor = int(np.argmax(v / w))
+    tamanho = int(min(capacidade, (int(w[melhor]) - 1) * int(w.max())))
+    return indices, w, v, melhor, tamanho
+
+# Função auxiliar que estima a memória (bytes) de _mochila_ilimitada a partir do resultado de _reduzir_itens
+# (a grade de cada item é arredondada para um múltiplo do peso: até um peso a mais que a tabela)
+def _memoria_pd(itens):
+    _, pesos, _, _, tamanho = itens
+    if pesos.size == 0:
+        return 0
+    return (tamanho + 1 + int(pesos.max())) * BYTES_POR_POSICAO_PD
+
+# Função que resolve a mochila ilimitada (cada item pode ser usado várias vezes) com programação dinâmica
+# vetorizada; pesos inteiros positivos. Devolve (valor ótimo, quantidade de cada item)
+# Para cada item, tabela[r + k * w] = max_j≤k(tabela[r + j * w] + (k - j) * v): com as posições agrupadas por
+# resto da divisão por w, é um máximo acumulado (np.maximum.accumulate) sobre uma matriz (k x w)
+def _mochila_ilimitada(valores, pesos, capacidade):
+    quantidades = np.zeros(valores.size, dtype=np.int64)
+    indices, w, v, melhor, tamanho = _reduzir_itens(valores, pesos, capacidade)
+    if indices.size == 0:
+        return 0.0, quantidades
+
+    tabela = np.zeros(tamanho + 1)  # tabela[c] = maior valor com peso até c
+    escolha = np.full(tamanho + 1, -1, dtype=np.int64)  # Último item que melhorou cada posição (para a reconstrução)
+    for i in range(indices.size):
+        peso, valor = int(w[i]), v[i]
+        if peso > tamanho:
+            continue
+        linhas = -(-(tamanho + 1) // peso)
+        grade = np.zeros(linhas * peso)  # Posições além da tabela ficam na última linha e não afetam as demais
+        grade[:tamanho + 1] = tabela
+        grade = grade.reshape(linhas, peso)
+        passos = np.arange(linhas)[:, None] * valor
+        deslocada = grade - passos
+        acumulada = np.maximum.accumulate(deslocada, axis=0)
+        melhora = acumulada > deslocada  # Comparação exata (o máximo é um dos valores deslocados)
+        tabela = np.where(melhora, acumulada + passos, grade).ravel()[:tamanho + 1]
+        escolha[melhora.ravel()[:tamanho + 1]] = i
+
+    # Capacidade restante coberta por cópias do item de maior valor por peso
+    copias = (capacidade - np.arange(tamanho + 1)) // int(w[melhor])
+    totais = tabela + copias * v[melhor]
+    c = int(np.argmax(totais))
+    quantidades[indices[melhor]] += int(copias[c])
+    while escolha[c] >= 0:  # Reconstrução: volta pelos itens que melhoraram cada posição
+        quantidades[indices[escolha[c]]] += 1
+        c -= int(w[escolha[c]])
+    return float(totais.max()), quantidades
+
+# Função que resolve o corte de bobinas (cutting stock) por geração de colunas (Gilmore-Gomory): bobinas de
+# largura largura_bobina são cortadas nas larguras pedidas, com a quantidade pedida de cada uma (demandas),
+# usando o menor número de bobinas. A relaxação linear com os padrões já gerados (mestre) é resolvida no CBC e
+# os preços duais definem a mochila ilimitada (programação dinâmica) que gera o próximo padrão; quando nenhum
+# padrão tem custo reduzido negativo, a solução inteira vem de metodo='arredondamento' ou 'mip'
+# Larguras inteiras positivas. "status" é "Optimal" só quando o número de bobinas alcança o limite inferior
+@instrumentado
+@em_cache
+def resolver_corte_bobinas(larguras, demandas, largura_bobina, metodo='arredondamento'):
+    if metodo not in METODOS_CORTE:
+        raise ValueError(f"Método desconhecido: {metodo} (use um de {METODOS_CORTE})")
+    larguras = np.asarray(larguras, dtype=np.int64)
+    demandas = np.asarray(demandas, dtype=float)
+    largura_bobina = int(largura_bobina)
+    if np.any(larguras <= 0) or np.any(larguras > largura_bobina):
+        raise ValueError("As larguras precisam ser inteiros positivos que caibam na bobina")
+
+    # Padrões iniciais: cada bobina cortada só numa largura, o máximo de vezes
+    padroes = [np.diag(largura_bobina // larguras)[i] for i in range(larguras.size)]
+    existentes = {p.tobytes() for p in padroes}
+    valor_padrao = 1.0
+    for iteracao in range(LIMITE_ITERACOES_CORTE):
+        mestre = resolver_matricial(np.ones(len(padroes)), np.column_stack(padroes), demandas, sentidos='>=')
+        if mestre["status"] != "Optimal":
+            break
+        # Preço: padrão com maior valor dual (mochila ilimitada); entra se o custo reduzido 1 - valor for negativo
+        valor_padrao, novo = _mochila_ilimitada(np.maximum(mestre["duais"], 0), larguras, largura_bobina)
+        if valor_padrao <= 1 + TOLERANCIA_CORTE or novo.tobytes() in existentes:
+            break
+        padroes.append(novo)
+        existentes.add(novo.tobytes())
+    contar(iteracoes=iteracao + 1)  # Rodadas da geração de colunas (para a instrumentação)
+    if mestre["status"] != "Optimal":
+        return {"status": mestre["status"], "otimo_comprovado": False, "padroes": None, "repeticoes": None,
+                "total_bobinas": None, "limite_inferior": None, "padroes_gerados": len(padroes)}
+
+    # Limite inferior: relaxação linear (dividida pelo maior valor de padrão, se a geração parou antes do fim)
+    limite_inferior = math.ceil(mestre["objetivo"] / max(valor_padrao, 1.0) - TOLERANCIA_CORTE)
+    matriz = np.column_stack(padroes)
+    if metodo == 'mip':
+        inteiro = resolver_matricial(np.ones(len(padroes)), matriz, demandas, sentidos='>=', inteiras=np.arange(len(padroes)))
+        if inteiro["x"] is None:
+            return {"status": inteiro["status"], "otimo_comprovado": False, "padroes": None, "repeticoes": None,
+                    "total_bobinas": None, "limite_inferior": limite_inferior, "padroes_gerados": len(padroes)}
+        usados = np.round(inteiro["x"]).astype(np.int64)
+        cortes = {tuple(matriz[:, j].tolist()): int(usados[j]) for j in np.flatnonzero(usados)}
+    else:
+        cortes = _arredondar_corte(matriz, mestre["x"], larguras, demandas, largura_bobina)
+
+    total = sum(cortes.values())
+    otimo = total <= limite_inferior
+    resultado = {
+        "status": "Optimal" if otimo else "Not Solved",  # "Optimal" só quando alcança o limite inferior
+        "otimo_comprovado": otimo,
+        "padroes": [list(padrao) for padrao in cortes],  # Peças de cada largura em cada padrão usado
+        "repeticoes": list(cortes.values()),  # Bobinas cortadas com cada padrão
+        "total_bobinas": total,  # Número total de bobinas
+        "limite_inferior": limite_inferior,  # Limite inferior da relaxação linear (arredondado para cima)
+        "padroes_gerados": len(padroes)  # Padrões gerados (colunas do mestre)
+    }
+
+    return resultado  # Retorna os resultados
+
+# Função auxiliar do corte: arredonda a relaxação para baixo e corta as peças que faltam com first-fit
+# decreasing (cada peça na primeira bobina nova em que couber, das mais largas para as mais estreitas)
+# Devolve {padrão (peças de cada largura): número de bobinas}
+def _arredondar_corte(matriz, x, larguras, demandas, largura_bobina):
+    inteiros = np.floor(x + TOLERANCIA_CORTE).astype(np.int64)
+    cortes = {}
+    for j in np.flatnonzero(inteiros):
+        padrao = tuple(matriz[:, j].tolist())
+        cortes[padrao] = cortes.get(padrao, 0) + int(inteiros[j])
+    faltam = np.maximum(np.ceil(demandas - TOLERANCIA_CORTE) - matriz @ inteiros, 0).astype(np.int64)
+
+    bobinas = []  # [sobra, peças de cada largura] de cada bobina nova
+    for i in np.argsort(-larguras, kind="stable"):
+        for _ in range(int(faltam[i])):
+            for bobina in bobinas:
+                if bobina[0] >= larguras[i]:
+                    break
+            else:
+                bobina = [largura_bobina, [0] * larguras.size]
+                bobinas.append(bobina)
+            bobina[0] -= int(larguras[i])
+            bobina[1][i] += 1
+    for _, pecas in bobinas:
+        cortes[tuple(pecas)] = cortes.get(tuple(pecas), 0) + 1
+    return cortes
+
 # Função para criar um gráfico de barras mostrando a quantidade produzida de cada produto
 def plotar_padroes(quantidade_produtos, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta as barras
     produtos = list(quantidade_produtos.keys())  # Nomes dos produtos
     quantidades = [quantidade_produtos[p] for p in produtos]  # Quantidades produzidas
 
@@ -38,43 +264,61 @@ def plotar_padroes(quantidade_produtos, titulo):
     plt.xlabel('Produtos')  # Nome do eixo X
     plt.ylabel('Quantidade Produzida')  # Nome do eixo Y
     plt.title(titulo)  # Título do gráfico
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial
-consumos1 = {'Pequena': 2, 'Media': 3, 'Grande': 5}  # Consumo de material por unidade
-lucros1 = {'Pequena': 1, 'Media': 2, 'Grande': 4}  # Lucro por unidade
-material_disponivel1 = 1000  # Material disponível
-
-dados_padroes1 = resolver_problema_padroes(consumos1, lucros1, material_disponivel1)
-
-print("\nProblema de Padroes - Exemplo 1:")
-print("Status:", dados_padroes1["status"])  # Status da solução
-print("Quantidade produzida:", dados_padroes1["quantidade_produtos"])  # Quantidade de cada produto
-print("Lucro total: R$", dados_padroes1["lucro_total"])  # Lucro total
-plotar_padroes(dados_padroes1['quantidade_produtos'], "Padroes de Produção - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Novo conjunto de dados
-consumos2 = {'Latinha A': 4, 'Latinha B': 5, 'Latinha C': 7}  # Consumo de material
-lucros2 = {'Latinha A': 3, 'Latinha B': 5, 'Latinha C': 8}  # Lucro por unidade
-material_disponivel2 = 500  # Material disponível
-
-dados_padroes2 = resolver_problema_padroes(consumos2, lucros2, material_disponivel2)
-
-print("\nProblema de Padroes - Exemplo 2:")
-print("Status:", dados_padroes2["status"])
-print("Quantidade produzida:", dados_padroes2["quantidade_produtos"])
-print("Lucro total: R$", dados_padroes2["lucro_total"])
-plotar_padroes(dados_padroes2['quantidade_produtos'], "Padroes de Produção - Exemplo 2")
-
-# Exemplo 3: Conjunto com consumos e lucros mais altos
-consumos3 = {'Tipo X': 6, 'Tipo Y': 9, 'Tipo Z': 12}  # Consumo de material
-lucros3 = {'Tipo X': 5, 'Tipo Y': 7, 'Tipo Z': 10}  # Lucro por unidade
-material_disponivel3 = 720  # Material disponível
-
-dados_padroes3 = resolver_problema_padroes(consumos3, lucros3, material_disponivel3)
-
-print("\nProblema de Padroes - Exemplo 3:")
-print("Status:", dados_padroes3["status"])
-print("Quantidade produzida:", dados_padroes3["quantidade_produtos"])
-print("Lucro total: R$", dados_padroes3["lucro_total"])
-plotar_padroes(dados_padroes3['quantidade_produtos'], "Padroes de Produção - Exemplo 3")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe as barras da produção
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    consumos1 = {'Pequena': 2, 'Media': 3, 'Grande': 5}  # Consumo de material por unidade
+    lucros1 = {'Pequena': 1, 'Media': 2, 'Grande': 4}  # Lucro por unidade
+    material_disponivel1 = 1000  # Material disponível
+
+    dados_padroes1 = resolver_problema_padroes(consumos1, lucros1, material_disponivel1)
+
+    print("\nProblema de Padroes - Exemplo 1:")
+    print("Status:", dados_padroes1["status"])  # Status da solução
+    print("Quantidade produzida:", dados_padroes1["quantidade_produtos"])  # Quantidade de cada produto
+    print("Lucro total: R$", dados_padroes1["lucro_total"])  # Lucro total
+    plotar_padroes(dados_padroes1['quantidade_produtos'], "Padroes de Produção - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Novo conjunto de dados
+    consumos2 = {'Latinha A': 4, 'Latinha B': 5, 'Latinha C': 7}  # Consumo de material
+    lucros2 = {'Latinha A': 3, 'Latinha B': 5, 'Latinha C': 8}  # Lucro por unidade
+    material_disponivel2 = 500  # Material disponível
+
+    dados_padroes2 = resolver_problema_padroes(consumos2, lucros2, material_disponivel2)
+
+    print("\nProblema de Padroes - Exemplo 2:")
+    print("Status:", dados_padroes2["status"])
+    print("Quantidade produzida:", dados_padroes2["quantidade_produtos"])
+    print("Lucro total: R$", dados_padroes2["lucro_total"])
+    plotar_padroes(dados_padroes2['quantidade_produtos'], "Padroes de Produção - Exemplo 2")
+
+    # Exemplo 3: Conjunto com consumos e lucros mais altos
+    consumos3 = {'Tipo X': 6, 'Tipo Y': 9, 'Tipo Z': 12}  # Consumo de material
+    lucros3 = {'Tipo X': 5, 'Tipo Y': 7, 'Tipo Z': 10}  # Lucro por unidade
+    material_disponivel3 = 720  # Material disponível
+
+    dados_padroes3 = resolver_problema_padroes(consumos3, lucros3, material_disponivel3)
+
+    print("\nProblema de Padroes - Exemplo 3:")
+    print("Status:", dados_padroes3["status"])
+    print("Quantidade produzida:", dados_padroes3["quantidade_produtos"])
+    print("Lucro total: R$", dados_padroes3["lucro_total"])
+    plotar_padroes(dados_padroes3['quantidade_produtos'], "Padroes de Produção - Exemplo 3")
+
+    # Exemplo 4: Corte de bobinas de 100 cm nas larguras pedidas (geração de colunas)
+    larguras4 = [45, 36, 31, 14]  # Larguras pedidas (cm)
+    demandas4 = [97, 610, 395, 211]  # Peças pedidas de cada largura
+    dados_corte4 = resolver_corte_bobinas(larguras4, demandas4, 100)
+
+    print("\nProblema de Padroes - Exemplo 4 (corte de bobinas):")
+    print("Status:", dados_corte4["status"])
+    for padrao, repeticoes in zip(dados_corte4["padroes"], dados_corte4["repeticoes"]):
+        pecas = ", ".join(f"{quantidade} x {largura} cm" for largura, quantidade in zip(larguras4, padrao) if quantidade)
+        print(f"{repeticoes} bobinas cortadas em {pecas}")
+    print(f"Total de bobinas: {dados_corte4['total_bobinas']} (limite inferior: {dados_corte4['limite_inferior']})")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
@@ -1,48 +1,252 @@
 # Importa bibliotecas necessárias
-import pulp  # Para resolver problemas de otimização linear
 import matplotlib.pyplot as plt  # Para criar gráficos
 import networkx as nx  # Para criar e visualizar grafos
+import numpy as np  # Para trabalhar com a matriz de custos de atendimento (locais x clientes)
+import math  # Para arredondar o limite inferior
+import heapq  # Fila de prioridade usada pela heurística gulosa
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Grafo da rede de atendimento (src/graficos.py)
+from .matricial import resolver_por_colunas  # Modelo gravado em MPS em fluxo, sem montar o modelo no PuLP (src/matricial.py)
+from .instrumentacao import instrumentado, contar  # Medição das fases para os observadores registrados (src/instrumentacao.py)
 
-# Função que decide quais locais abrir e como atender clientes para minimizar custos
-def resolver_problema_facilidades(custos_fixos, custos_atendimento):
-    # Cria um problema para minimizar o custo total
-    problema = pulp.LpProblem("Problema_Facilidades", pulp.LpMinimize)
+# Métodos disponíveis: modelo inteiro no CBC (exato) ou heurísticas + relaxação lagrangeana sobre matrizes NumPy (rápido)
+METODOS_FACILIDADES = ('mip', 'heuristico')
 
-    locais = list(custos_fixos.keys())  # Lista de locais (ex.: Local1, Local2)
-    clientes = list(next(iter(custos_atendimento.values())).keys())  # Lista de clientes (ex.: A, B)
+# Número padrão de iterações do subgradiente na relaxação lagrangeana
+ITERACOES_LAGRANGE = 100
 
-    # Variáveis binárias: y[l] = 1 se o local l está aberto, 0 caso contrário
-    y = {l: pulp.LpVariable(f"y_{l}", cat='Binary') for l in locais}
-    # Variáveis binárias: x[l,c] = 1 se o local l atende o cliente c, 0 caso contrário
-    x = {(l, c): pulp.LpVariable(f"x_{l}_{c}", cat='Binary') for l in locais for c in clientes}
+# A cada quantas iterações do subgradiente os locais abertos da relaxação viram ponto de partida da busca local
+INTERVALO_HEURISTICA = 10
 
-    # Define o objetivo: minimizar custos fixos (de abrir locais) + custos de atendimento
-    problema += pulp.lpSum(custos_fixos[l] * y[l] + custos_atendimento[l][c] * x[(l, c)] for l in locais for c in clientes), "Minimizar_Custo_Total"
+# Número máximo de movimentos (abrir, fechar ou trocar um local) em cada busca local
+MAX_MOVIMENTOS_BUSCA = 200
 
-    # Restrições: cada cliente deve ser atendido exatamente por um local
-    for c in clientes:
-        problema += pulp.lpSum(x[(l, c)] for l in locais) == 1, f"Atender_cliente_{c}"
+# A busca local só parte dos locais abertos na relaxação se o custo deles estiver até 3% acima da melhor solução
+TOLERANCIA_REINICIO = 0.03
 
-    # Restrições: um cliente só pode ser atendido por um local se esse local estiver aberto
-    for l in locais:
-        for c in clientes:
-            problema += x[(l, c)] <= y[l], f"Cliente_{c}_so_se_local_{l}_aberto"
+# Gap relativo abaixo do qual a solução é considerada ótima (erros de arredondamento dos custos reais)
+TOLERANCIA_GAP = 1e-6
+
+# Função que decide quais locais abrir e como atender clientes para minimizar custos
+# Custo total (o do modelo original, nos dois métodos) = custo fixo de cada local aberto multiplicado pelo número de
+# clientes + custo de atendimento de cada cliente pelo seu local. metodo='mip' (padrão) resolve o modelo inteiro no
+# CBC; metodo='heuristico' não chama o CBC e devolve a melhor solução das heurísticas com limite inferior lagrangeano
+# e gap de otimalidade
+@instrumentado
+@em_cache
+def resolver_problema_facilidades(custos_fixos, custos_atendimento, metodo='mip', iteracoes=ITERACOES_LAGRANGE):
+    if metodo == 'mip':
+        return resolver_facilidades_mip(custos_fixos, custos_atendimento)
+    if metodo == 'heuristico':
+        return resolver_facilidades_heuristica(custos_fixos, custos_atendimento, iteracoes)
+    raise ValueError(f"Método desconhecido: {metodo} (use um de {METODOS_FACILIDADES})")
 
-    # Resolve o problema
-    problema.solve()
+# Função que resolve o problema como um modelo de programação inteira binária (CBC)
+# O modelo é gravado em MPS em fluxo, um local por vez, direto da matriz de custos (sem montar o modelo no PuLP)
+def resolver_facilidades_mip(custos_fixos, custos_atendimento):
+    locais, clientes, fixos, matriz = _matrizes_facilidades(custos_fixos, custos_atendimento)
+    num_locais, num_clientes = matriz.shape
+
+    # Restrições: cada cliente deve ser atendido exatamente por um local (R0 até R[clientes-1]) e um cliente só
+    # pode ser atendido por um local se esse local estiver aberto (x[l,c] - y[l] <= 0, uma por par local x cliente)
+    linhas = [('=', num_clientes), ('<=', num_locais * num_clientes)]
+    lados = (np.arange(num_clientes), np.ones(num_clientes))  # Só os lados "= 1" não são zero
+
+    # Variáveis binárias geradas um local por vez: y[l] (1 se o local l está aberto), seguida de x[l,c]
+    # (1 se o local l atende o cliente c); o objetivo do modelo original soma custos fixos e custos de atendimento
+    # sobre os pares local x cliente, então o custo fixo de y[l] entra uma vez por cliente
+    def colunas():
+        atender = np.arange(num_clientes)
+        inicios = np.concatenate(([0], num_clientes + 2 * np.arange(num_clientes + 1)))
+        valores = np.concatenate((-np.ones(num_clientes), np.ones(2 * num_clientes)))
+        for l in range(num_locais):
+            ligacoes = num_clientes + l * num_clientes + atender  # Restrições x[l,c] - y[l] <= 0 do local l
+            restricoes = np.empty(3 * num_clientes, dtype=np.int64)
+            restricoes[:num_clientes] = ligacoes
+            restricoes[num_clientes::2], restricoes[num_clientes + 1::2] = atender, ligacoes
+            yield {"custos": np.concatenate(([fixos[l] * num_clientes], matriz[l])), "inicios": inicios, "linhas": restricoes,
+                   "valores": valores, "superiores": 1.0, "inteiras": True}
+
+    # Resolve o problema (minimiza o custo total) com o solver configurado em src/solver.py
+    solucao = resolver_por_colunas(linhas, lados, colunas(), duais=False)
+    valores = solucao["x"].reshape(num_locais, num_clientes + 1) if solucao["x"] is not None else np.zeros((num_locais, num_clientes + 1))
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "locais_abertos": [l for l in locais if y[l].varValue == 1],  # Locais abertos
-        "atendimentos": {(l, c): x[(l, c)].varValue for l in locais for c in clientes if x[(l, c)].varValue == 1},  # Atendimentos realizados
-        "custo_total": pulp.value(problema.objective)  # Custo total
+        "status": solucao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": solucao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "locais_abertos": [locais[l] for l in np.flatnonzero(valores[:, 0] > 0.5).tolist()],  # Locais abertos
+        "atendimentos": {(locais[l], clientes[c]): float(valores[l, c + 1])
+                         for l, c in zip(*(indices.tolist() for indices in np.nonzero(valores[:, 1:] > 0.5)))},  # Atendimentos realizados
+        "custo_total": solucao["objetivo"]  # Custo total
+    }
+
+    return resultado  # Retorna os resultados
+
+# Função auxiliar que converte os custos em vetores/matrizes NumPy
+# Aceita dicionários (como nos exemplos) ou diretamente um vetor de custos fixos e uma matriz locais x clientes;
+# nesse caso os locais e clientes são identificados pelos seus índices
+def _matrizes_facilidades(custos_fixos, custos_atendimento):
+    if isinstance(custos_fixos, dict):
+        locais = list(custos_fixos.keys())
+        clientes = list(next(iter(custos_atendimento.values())).keys())
+        fixos = np.array([custos_fixos[l] for l in locais], dtype=float)
+        matriz = np.array([[custos_atendimento[l][c] for c in clientes] for l in locais], dtype=float)
+    else:
+        fixos = np.asarray(custos_fixos, dtype=float)
+        matriz = np.asarray(custos_atendimento, dtype=float)
+        locais, clientes = list(range(matriz.shape[0])), list(range(matriz.shape[1]))
+    return locais, clientes, fixos, matriz
+
+# Função auxiliar que avalia um conjunto de locais abertos: cada cliente vai para o local aberto mais barato
+# Devolve o custo total, o local de cada cliente, o menor e o segundo menor custo de atendimento de cada cliente
+def _avaliar_abertos(fixos, matriz, abertos):
+    submatriz = matriz[abertos]
+    posicao = np.argmin(submatriz, axis=0)
+    colunas = np.arange(matriz.shape[1])
+    melhor = submatriz[posicao, colunas]
+    if len(abertos) > 1:
+        segundo = np.partition(submatriz, 1, axis=0)[1]
+    else:
+        segundo = np.full(matriz.shape[1], np.inf)  # Com um só local aberto não há alternativa
+    custo = float(fixos[abertos].sum() + melhor.sum())
+    return custo, abertos[posicao], melhor, segundo
+
+# Função auxiliar que constrói uma solução gulosa (ADD): começa pelo melhor local isolado e abre, um por vez,
+# o local que mais reduz o custo total enquanto houver redução
+# Usa avaliação preguiçosa: a economia de um local só diminui quando outros abrem, então só o topo da fila é recalculado
+def _facilidades_gulosa(fixos, matriz):
+    primeiro = int(np.argmin(fixos + matriz.sum(axis=1)))
+    abertos = [primeiro]
+    melhor = matriz[primeiro].copy()
+    # Fila com a variação de custo (negativa = economia) de abrir cada local
+    variacao = fixos - np.maximum(0, melhor[None, :] - matriz).sum(axis=1)
+    fila = [(float(variacao[l]), l) for l in range(len(fixos)) if l != primeiro]
+    heapq.heapify(fila)
+    tolerancia = 1e-9 * max(1.0, abs(float(melhor.sum())))
+    while fila and fila[0][0] < -tolerancia:
+        valor, l = heapq.heappop(fila)
+        atual = float(fixos[l] - np.maximum(0, melhor - matriz[l]).sum())
+        if atual > valor + tolerancia:
+            heapq.heappush(fila, (atual, l))  # A economia diminuiu: volta para a fila com o valor atualizado
+            continue
+        if atual >= -tolerancia:
+            break
+        abertos.append(l)
+        np.minimum(melhor, matriz[l], out=melhor)
+    return np.array(abertos)
+
+# Função auxiliar de busca local com os movimentos abrir (ADD), fechar (DROP) e trocar (interchange) um local
+# A cada passo avalia toda a vizinhança de forma vetorizada e aplica o melhor movimento que reduz o custo
+def _busca_local_facilidades(fixos, matriz, abertos):
+    num_locais = len(fixos)
+    custo, atribuicao, melhor, segundo = _avaliar_abertos(fixos, matriz, abertos)
+    for _ in range(MAX_MOVIMENTOS_BUSCA):
+        tolerancia = 1e-9 * max(1.0, abs(custo))
+        fechado = np.ones(num_locais, dtype=bool)
+        fechado[abertos] = False
+        # Abrir o local l: economia nos clientes que ficam mais baratos com ele
+        economia = np.maximum(0, melhor[None, :] - matriz).sum(axis=1)
+        abrir = np.where(fechado, fixos - economia, np.inf)
+        melhor_variacao, movimento = float(abrir.min()), (int(np.argmin(abrir)), None)
+        for sai in abertos.tolist():
+            clientes = np.flatnonzero(atribuicao == sai)
+            # Fechar "sai": seus clientes vão para o segundo melhor local aberto
+            fechar = float((segundo[clientes] - melhor[clientes]).sum()) - fixos[sai]
+            if fechar < melhor_variacao:
+                melhor_variacao, movimento = fechar, (None, sai)
+            # Trocar "sai" por um local fechado l: os clientes de "sai" vão para min(segundo, c_l), os demais para min(melhor, c_l)
+            custos_l = matriz[:, clientes]
+            ajuste = (np.minimum(segundo[clientes], custos_l) - np.minimum(melhor[clientes], custos_l)).sum(axis=1)
+            trocar = np.where(fechado, fixos - fixos[sai] - economia + ajuste, np.inf)
+            entra = int(np.argmin(trocar))
+            if trocar[entra] < melhor_variacao:
+                melhor_variacao, movimento = float(trocar[entra]), (entra, sai)
+        if melhor_variacao >= -tolerancia:
+            break  # Nenhum movimento melhora: ótimo local
+        entra, sai = movimento
+        if sai is not None:
+            abertos = abertos[abertos != sai]
+        if entra is not None:
+            abertos = np.append(abertos, entra)
+        custo, atribuicao, melhor, segundo = _avaliar_abertos(fixos, matriz, abertos)
+    return custo, np.sort(abertos), atribuicao
+
+# Função que resolve o problema sem o CBC: heurística gulosa + busca local + relaxação lagrangeana (subgradiente)
+# Relaxando "cada cliente atendido uma vez" com multiplicadores lam, L(lam) = soma(lam) + soma sobre os locais de
+# min(0, f_l + soma(min(0, c_lc - lam_c))) (ao menos um local aberto) é um limite inferior para o ótimo.
+# Os locais abertos na relaxação alimentam a busca local; o resultado informa o limite inferior e o gap
+def resolver_facilidades_heuristica(custos_fixos, custos_atendimento, iteracoes=ITERACOES_LAGRANGE):
+    locais, clientes, fixos, matriz = _matrizes_facilidades(custos_fixos, custos_atendimento)
+    num_clientes = matriz.shape[1]
+    fixos = fixos * num_clientes  # Custo fixo uma vez por cliente, como no objetivo de resolver_facilidades_mip
+
+    # Solução inicial: gulosa (ADD) melhorada pela busca local (ADD/DROP/troca)
+    limite_superior, abertos, atribuicao = _busca_local_facilidades(fixos, matriz, _facilidades_gulosa(fixos, matriz))
+    visitados = {tuple(abertos.tolist())}
+
+    # Multiplicadores iniciais: menor custo de atendimento de cada cliente
+    lam = matriz.min(axis=0)
+    limite_inferior = float(lam.sum())
+    passo, sem_melhora = 2.0, 0
+    for iteracao in range(iteracoes):
+        if limite_inferior >= limite_superior - TOLERANCIA_GAP * max(1.0, abs(limite_superior)):
+            break  # Limites iguais: a melhor solução é ótima
+        # Custo reduzido de cada local e valor da função lagrangeana
+        atende = matriz < lam[None, :]
+        reduzido = fixos + np.where(atende, matriz - lam[None, :], 0).sum(axis=1)
+        selecionados = reduzido < 0
+        if not selecionados.any():
+            selecionados[np.argmin(reduzido)] = True  # Toda solução abre pelo menos um local
+        valor = float(lam.sum() + reduzido[selecionados].sum())
+        if valor > limite_inferior + 1e-9 * max(1.0, abs(valor)):
+            limite_inferior, sem_melhora = valor, 0
+        else:
+            sem_melhora += 1
+            if sem_melhora >= 20:
+                passo, sem_melhora = passo / 2, 0  # Reduz o passo quando o limite para de melhorar
+
+        # Heurística lagrangeana: busca local a partir dos locais abertos na relaxação (se ainda não visitados
+        # e se o custo deles já estiver perto da melhor solução)
+        if iteracao % INTERVALO_HEURISTICA == 0:
+            candidatos = np.flatnonzero(selecionados)
+            if tuple(candidatos.tolist()) not in visitados:
+                visitados.add(tuple(candidatos.tolist()))
+                custo, atribuicao_c = _avaliar_abertos(fixos, matriz, candidatos)[:2]
+                if custo <= limite_superior * (1 + TOLERANCIA_REINICIO):
+                    custo, candidatos, atribuicao_c = _busca_local_facilidades(fixos, matriz, candidatos)
+                if custo < limite_superior:
+                    limite_superior, abertos, atribuicao = custo, candidatos, atribuicao_c
+
+        # Subgradiente: 1 - número de locais selecionados que atendem cada cliente
+        subgradiente = 1 - atende[selecionados].sum(axis=0)
+        norma = float(subgradiente @ subgradiente)
+        if norma == 0 or passo < 1e-4:
+            break
+        lam = lam + passo * (limite_superior - valor) / norma * subgradiente
+    contar(iteracoes=iteracao + 1 if iteracoes else 0)  # Iterações do subgradiente (para a instrumentação)
+
+    # Com custos inteiros, o ótimo é inteiro: o limite inferior pode ser arredondado para cima
+    if np.all(fixos == np.round(fixos)) and np.all(matriz == np.round(matriz)):
+        limite_inferior = math.ceil(limite_inferior - 1e-6)
+    limite_inferior = min(limite_inferior, limite_superior)
+    otimo = bool(limite_inferior >= limite_superior - TOLERANCIA_GAP * max(1.0, abs(limite_superior)))
+    resultado = {
+        "status": "Optimal" if otimo else "Not Solved",  # "Optimal" só quando os limites se encontram
+        "locais_abertos": [locais[l] for l in abertos.tolist()],  # Locais abertos
+        "atendimentos": {(locais[l], clientes[c]): 1.0 for c, l in zip(range(num_clientes), atribuicao.tolist())},  # Atendimentos realizados
+        "custo_total": float(limite_superior),  # Custo total
+        "limite_inferior": float(limite_inferior),  # Limite inferior da relaxação lagrangeana
+        "gap": float((limite_superior - limite_inferior) / limite_superior) if limite_superior else 0.0,  # Gap relativo
+        "otimo_comprovado": otimo
     }
 
     return resultado  # Retorna os resultados
 
 # Função para criar um grafo direcionado mostrando a rede de atendimento
 def plotar_facilidades(locais_abertos, atendimentos, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta o grafo locais -> clientes
     G = nx.DiGraph()  # Cria um grafo direcionado
 
     # Identifica locais e clientes a partir dos atendimentos
@@ -69,57 +273,79 @@ def plotar_facilidades(locais_abertos, atendimentos, titulo):
     nx.draw(G, pos, with_labels=True, node_color=['lightgreen' if n in locais_abertos else 'lightblue' for n in G.nodes()], node_size=2500)
     plt.title(titulo)  # Título do gráfico
     plt.axis('off')  # Remove os eixos
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial (dados da apostila)
-custos_fixos1 = {'Local1': 100, 'Local2': 120, 'Local3': 90}  # Custos fixos para abrir cada local
-custos_atendimento1 = {
-    'Local1': {'A': 20, 'B': 24, 'C': 18},  # Custos de atendimento do Local1 para cada cliente
-    'Local2': {'A': 28, 'B': 20, 'C': 26},  # Custos de atendimento do Local2
-    'Local3': {'A': 22, 'B': 23, 'C': 20}   # Custos de atendimento do Local3
-}
-
-dados_facilidades1 = resolver_problema_facilidades(custos_fixos1, custos_atendimento1)
-
-print("\nProblema das Facilidades - Exemplo 1:")
-print("Status:", dados_facilidades1["status"])  # Status da solução
-print("Locais abertos:", dados_facilidades1["locais_abertos"])  # Locais abertos
-print("Atendimentos:", dados_facilidades1["atendimentos"])  # Atendimentos realizados
-print("Custo total: R$", dados_facilidades1["custo_total"])  # Custo total
-plotar_facilidades(dados_facilidades1['locais_abertos'], dados_facilidades1['atendimentos'], "Rede de Atendimento - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Conjunto com mais locais
-custos_fixos2 = {'LocalA': 80, 'LocalB': 110, 'LocalC': 95, 'LocalD': 70}  # Custos fixos
-custos_atendimento2 = {
-    'LocalA': {'D': 15, 'E': 25, 'F': 22},  # Custos de atendimento do LocalA
-    'LocalB': {'D': 20, 'E': 18, 'F': 21},  # Custos de atendimento do LocalB
-    'LocalC': {'D': 22, 'E': 20, 'F': 24},  # Custos de atendimento do LocalC
-    'LocalD': {'D': 17, 'E': 19, 'F': 20}   # Custos de atendimento do LocalD
-}
-
-dados_facilidades2 = resolver_problema_facilidades(custos_fixos2, custos_atendimento2)
-
-print("\nProblema das Facilidades - Exemplo 2:")
-print("Status:", dados_facilidades2["status"])
-print("Locais abertos:", dados_facilidades2["locais_abertos"])
-print("Atendimentos:", dados_facilidades2["atendimentos"])
-print("Custo total: R$", dados_facilidades2["custo_total"])
-plotar_facilidades(dados_facilidades2['locais_abertos'], dados_facilidades2['atendimentos'], "Rede de Atendimento - Exemplo 2")
-
-# Exemplo 3: Conjunto maior com mais clientes
-custos_fixos3 = {'Centro1': 130, 'Centro2': 90, 'Centro3': 120, 'Centro4': 85}  # Custos fixos
-custos_atendimento3 = {
-    'Centro1': {'G': 30, 'H': 35, 'I': 28, 'J': 32},  # Custos de atendimento do Centro1
-    'Centro2': {'G': 25, 'H': 30, 'I': 20, 'J': 24},  # Custos de atendimento do Centro2
-    'Centro3': {'G': 32, 'H': 29, 'I': 27, 'J': 30},  # Custos de atendimento do Centro3
-    'Centro4': {'G': 26, 'H': 27, 'I': 25, 'J': 28}   # Custos de atendimento do Centro4
-}
-
-dados_facilidades3 = resolver_problema_facilidades(custos_fixos3, custos_atendimento3)
-
-print("\nProblema das Facilidades - Exemplo 3:")
-print("Status:", dados_facilidades3["status"])
-print("Locais abertos:", dados_facilidades3["locais_abertos"])
-print("Atendimentos:", dados_facilidades3["atendimentos"])
-print("Custo total: R$", dados_facilidades3["custo_total"])
-plotar_facilidades(dados_facilidades3['locais_abertos'], dados_facilidades3['atendimentos'], "Rede de Atendimento - Exemplo 3")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe a rede com os locais abertos em verde
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial (dados da apostila)
+    custos_fixos1 = {'Local1': 100, 'Local2': 120, 'Local3': 90}  # Custos fixos para abrir cada local
+    custos_atendimento1 = {
+        'Local1': {'A': 20, 'B': 24, 'C': 18},  # Custos de atendimento do Local1 para cada cliente
+        'Local2': {'A': 28, 'B': 20, 'C': 26},  # Custos de atendimento do Local2
+        'Local3': {'A': 22, 'B': 23, 'C': 20}   # Custos de atendimento do Local3
+    }
+
+    dados_facilidades1 = resolver_problema_facilidades(custos_fixos1, custos_atendimento1)
+
+    print("\nProblema das Facilidades - Exemplo 1:")
+    print("Status:", dados_facilidades1["status"])  # Status da solução
+    print("Locais abertos:", dados_facilidades1["locais_abertos"])  # Locais abertos
+    print("Atendimentos:", dados_facilidades1["atendimentos"])  # Atendimentos realizados
+    print("Custo total: R$", dados_facilidades1["custo_total"])  # Custo total
+    plotar_facilidades(dados_facilidades1['locais_abertos'], dados_facilidades1['atendimentos'], "Rede de Atendimento - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Conjunto com mais locais
+    custos_fixos2 = {'LocalA': 80, 'LocalB': 110, 'LocalC': 95, 'LocalD': 70}  # Custos fixos
+    custos_atendimento2 = {
+        'LocalA': {'D': 15, 'E': 25, 'F': 22},  # Custos de atendimento do LocalA
+        'LocalB': {'D': 20, 'E': 18, 'F': 21},  # Custos de atendimento do LocalB
+        'LocalC': {'D': 22, 'E': 20, 'F': 24},  # Custos de atendimento do LocalC
+        'LocalD': {'D': 17, 'E': 19, 'F': 20}   # Custos de atendimento do LocalD
+    }
+
+    dados_facilidades2 = resolver_problema_facilidades(custos_fixos2, custos_atendimento2)
+
+    print("\nProblema das Facilidades - Exemplo 2:")
+    print("Status:", dados_facilidades2["status"])
+    print("Locais abertos:", dados_facilidades2["locais_abertos"])
+    print("Atendimentos:", dados_facilidades2["atendimentos"])
+    print("Custo total: R$", dados_facilidades2["custo_total"])
+    plotar_facilidades(dados_facilidades2['locais_abertos'], dados_facilidades2['atendimentos'], "Rede de Atendimento - Exemplo 2")
+
+    # Exemplo 3: Conjunto maior com mais clientes
+    custos_fixos3 = {'Centro1': 130, 'Centro2': 90, 'Centro3': 120, 'Centro4': 85}  # Custos fixos
+    custos_atendimento3 = {
+        'Centro1': {'G': 30, 'H': 35, 'I': 28, 'J': 32},  # Custos de atendimento do Centro1
+        'Centro2': {'G': 25, 'H': 30, 'I': 20, 'J': 24},  # Custos de atendimento do Centro2
+        'Centro3': {'G': 32, 'H': 29, 'I': 27, 'J': 30},  # Custos de atendimento do Centro3
+        'Centro4': {'G': 26, 'H': 27, 'I': 25, 'J': 28}   # Custos de atendimento do Centro4
+    }
+
+    dados_facilidades3 = resolver_problema_facilidades(custos_fixos3, custos_atendimento3)
+
+    print("\nProblema das Facilidades - Exemplo 3:")
+    print("Status:", dados_facilidades3["status"])
+    print("Locais abertos:", dados_facilidades3["locais_abertos"])
+    print("Atendimentos:", dados_facilidades3["atendimentos"])
+    print("Custo total: R$", dados_facilidades3["custo_total"])
+    plotar_facilidades(dados_facilidades3['locais_abertos'], dados_facilidades3['atendimentos'], "Rede de Atendimento - Exemplo 3")
+
+    # Exemplo 4: Instância grande gerada aleatoriamente (100 locais e 5000 clientes), resolvida pelo modo heurístico
+    gerador = np.random.default_rng(0)
+    posicoes_locais = gerador.random((100, 2))
+    posicoes_clientes = gerador.random((5000, 2))
+    custos_fixos4 = gerador.uniform(2000, 6000, 100)  # Vetor de custos fixos
+    custos_atendimento4 = 1000 * np.linalg.norm(posicoes_locais[:, None, :] - posicoes_clientes[None, :, :], axis=2)  # Matriz locais x clientes
+
+    dados_facilidades4 = resolver_problema_facilidades(custos_fixos4, custos_atendimento4, metodo='heuristico')
+
+    print("\nProblema das Facilidades - Exemplo 4 (modo heurístico):")
+    print("Status:", dados_facilidades4["status"])
+    print("Locais abertos:", len(dados_facilidades4["locais_abertos"]))
+    print("Custo total: R$", round(dados_facilidades4["custo_total"], 2))
+    print("Limite inferior: R$", round(dados_facilidades4["limite_inferior"], 2))
+    print(f"Gap: {100 * dados_facilidades4['gap']:.4f}%")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
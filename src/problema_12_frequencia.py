@@ -2,9 +2,93 @@
 import pulp  # Para resolver problemas de otimização linear
 import matplotlib.pyplot as plt  # Para criar gráficos
 import networkx as nx  # Para criar e visualizar grafos
+import heapq  # Fila de prioridade usada pelo DSATUR
+import random  # Sorteios da busca tabu
+from .problema_13_clique_maxima import resolver_clique_bitset  # Clique exata (com limite de tempo) para o limite inferior
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Grafo colorido das frequências (src/graficos.py)
+from .solver import resolver_modelo  # Configuração compartilhada do solver (CBC/HiGHS, threads, limites)
+from .instrumentacao import instrumentado  # Medição das fases para os observadores registrados (src/instrumentacao.py)
+
+# Número padrão de iterações da busca tabu para cada tentativa de usar uma cor a menos
+ITERACOES_TABU = 2000
+
+# Tempo padrão (segundos) da busca exata de clique usada para melhorar o limite inferior
+TEMPO_CLIQUE = 1.0
 
 # Função que resolve o problema de coloração de grafos (atribuição de frequências)
-def resolver_problema_frequencia(vertices, arestas, cores):
+# Com pre_processar=True, heurísticas calculam antes limites para o número de cores:
+#   - superior: DSATUR seguido de busca tabu (TabuCol) tentando remover cores
+#   - inferior: tamanho de uma clique (cada vértice da clique precisa de uma cor), encontrada de forma gulosa e
+#     melhorada pelo branch-and-bound de clique máxima do problema 13 durante até tempo_clique segundos
+# Se os limites coincidem, a coloração heurística já é ótima e o CBC nem é chamado. Caso contrário, o modelo
+# inteiro usa só as primeiras "limite superior" cores da paleta, com as cores da clique fixadas
+@instrumentado
+@em_cache
+def resolver_problema_frequencia(vertices, arestas, cores, pre_processar=True, iteracoes_tabu=ITERACOES_TABU,
+                                 tempo_clique=TEMPO_CLIQUE, semente=0):
+    vertices = list(vertices)
+    cores = list(cores)
+    indice = {v: i for i, v in enumerate(vertices)}
+    vizinhos = _lista_adjacencia(vertices, arestas, indice)
+
+    if not pre_processar:
+        return _resolver_frequencia_mip(vertices, vizinhos, cores)
+
+    # Limite superior: DSATUR e, em seguida, busca tabu para tentar usar cada vez menos cores
+    coloracao = _dsatur(vizinhos)
+    limite_superior = max(coloracao, default=-1) + 1
+    clique = _clique_gulosa(vizinhos)
+    if tempo_clique and len(clique) < limite_superior:
+        arestas_indices = [(a, b) for a in range(len(vizinhos)) for b in vizinhos[a] if a < b]
+        exata = resolver_clique_bitset(range(len(vizinhos)), arestas_indices, limite_tempo=tempo_clique)
+        if exata["tamanho_clique"] > len(clique):
+            clique = exata["vertices_clique"]
+    limite_inferior = len(clique)
+    gerador = random.Random(semente)
+    while limite_superior > limite_inferior:
+        melhor = _tabucol(vizinhos, coloracao, limite_superior - 1, iteracoes_tabu, gerador)
+        if melhor is None:
+            break
+        coloracao, limite_superior = melhor, limite_superior - 1
+
+    if limite_inferior > len(cores):
+        # Paleta menor que uma clique do grafo: não existe atribuição válida
+        resultado = {"status": "Infeasible", "otimo_comprovado": False, "cores_usadas": {}, "total_cores": None,
+                     "limite_inferior": limite_inferior, "limite_superior": limite_superior}
+        return resultado
+
+    if limite_superior == limite_inferior and limite_superior <= len(cores):
+        # Limites iguais: a coloração heurística é ótima
+        resultado = {
+            "status": "Optimal",  # Ótimo comprovado pelos limites
+            "otimo_comprovado": True,
+            "cores_usadas": {v: cores[coloracao[indice[v]]] for v in vertices},  # Atribuição de cores
+            "total_cores": limite_superior,  # Número total de cores usadas
+            "limite_inferior": limite_inferior,  # Tamanho da clique encontrada
+            "limite_superior": limite_superior  # Cores da melhor coloração heurística
+        }
+        return resultado
+
+    # Paleta reduzida: nunca são necessárias mais cores que o limite superior
+    paleta = cores[:limite_superior]
+    resultado = _resolver_frequencia_mip(vertices, vizinhos, paleta, clique=[vertices[i] for i in clique])
+    resultado["limite_inferior"] = limite_inferior
+    resultado["limite_superior"] = limite_superior
+    return resultado
+
+# Função auxiliar que monta a lista de adjacência (sem laços nem arestas repetidas)
+def _lista_adjacencia(vertices, arestas, indice):
+    vizinhos = [set() for _ in vertices]
+    for v1, v2 in arestas:
+        if v1 != v2:
+            vizinhos[indice[v1]].add(indice[v2])
+            vizinhos[indice[v2]].add(indice[v1])
+    return [sorted(viz) for viz in vizinhos]
+
+# Função que resolve a coloração como um problema de programação inteira binária (PuLP/CBC)
+# clique: vértices que formam uma clique; recebem as primeiras cores da paleta (quebra de simetria)
+def _resolver_frequencia_mip(vertices, vizinhos, cores, clique=()):
     # Cria um problema para minimizar o número de cores usadas
     problema = pulp.LpProblem("Problema_Frequencia", pulp.LpMinimize)
 
@@ -20,30 +104,144 @@ def resolver_problema_frequencia(vertices, arestas, cores):
     for v in vertices:
         problema += pulp.lpSum(x[(v, c)] for c in cores) == 1, f"Uma_frequencia_para_{v}"
 
-    # Restrições: vértices adjacentes não podem ter a mesma cor
-    for (v1, v2) in arestas:
-        for c in cores:
-            problema += x[(v1, c)] + x[(v2, c)] <= 1, f"Aresta_{v1}_{v2}_cor_{c}"
+    # Restrições: vértices adjacentes não podem ter a mesma cor, e a cor só pode ser usada se estiver ativa
+    # (x[v1,c] + x[v2,c] <= y[c] já liga x e y para vértices com vizinhos; só os isolados precisam de x[v,c] <= y[c])
+    for a, v1 in enumerate(vertices):
+        for b in vizinhos[a]:
+            if a < b:
+                v2 = vertices[b]
+                for c in cores:
+                    problema += x[(v1, c)] + x[(v2, c)] <= y[c], f"Aresta_{v1}_{v2}_cor_{c}"
+        if not vizinhos[a]:
+            for c in cores:
+                problema += x[(v1, c)] <= y[c], f"Ativar_cor_{c}_se_usada_por_{v1}"
 
-    # Restrições: uma cor só é considerada usada se pelo menos um vértice a utiliza
-    for v in vertices:
-        for c in cores:
-            problema += x[(v, c)] <= y[c], f"Ativar_cor_{c}_se_usada_por_{v}"
+    # Quebra de simetria: a cor c+1 só é usada se a cor c for usada
+    for c_atual, c_seguinte in zip(cores, cores[1:]):
+        problema += y[c_atual] >= y[c_seguinte], f"Ordem_cores_{c_atual}_{c_seguinte}"
+
+    # Fixa as cores da clique (todas diferentes entre si em qualquer solução)
+    for v, c in zip(clique, cores):
+        problema += x[(v, c)] == 1, f"Fixar_cor_{c}_para_{v}"
 
     # Resolve o problema
-    problema.solve()
+    situacao = resolver_modelo(problema)  # Usa o solver configurado em src/solver.py (solver, threads, limites)
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "cores_usadas": {v: c for v in vertices for c in cores if x[(v, c)].varValue == 1},  # Atribuição de cores
+        "status": situacao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "otimo_comprovado": situacao["otimo_comprovado"],  # O solver provou a otimalidade (sem limite de tempo ou gap)
+        "cores_usadas": {v: c for v in vertices for c in cores if (x[(v, c)].varValue or 0) > 0.5},  # Atribuição de cores
         "total_cores": pulp.value(problema.objective)  # Número total de cores usadas
     }
 
     return resultado  # Retorna os resultados
 
+# Função que colore o grafo com a heurística DSATUR (Brélaz)
+# Sempre colore o vértice com mais cores diferentes na vizinhança (desempate pelo grau), usando a menor cor livre
+def _dsatur(vizinhos):
+    n = len(vizinhos)
+    cor = [-1] * n
+    cores_vizinhas = [set() for _ in range(n)]  # Cores já usadas na vizinhança de cada vértice
+    fila = [(0, -len(vizinhos[v]), v) for v in range(n)]  # (-saturação, -grau, vértice)
+    heapq.heapify(fila)
+    while fila:
+        saturacao, _, v = heapq.heappop(fila)
+        if cor[v] >= 0 or -saturacao != len(cores_vizinhas[v]):
+            continue  # Entrada desatualizada da fila
+        c = 0
+        while c in cores_vizinhas[v]:
+            c += 1
+        cor[v] = c
+        for u in vizinhos[v]:
+            if cor[u] < 0 and c not in cores_vizinhas[u]:
+                cores_vizinhas[u].add(c)
+                heapq.heappush(fila, (-len(cores_vizinhas[u]), -len(vizinhos[u]), u))
+    return cor
+
+# Função que tenta colorir o grafo com k cores usando busca tabu (TabuCol, Hertz e de Werra)
+# Parte da coloração recebida, recolorindo os vértices com cor >= k; devolve a coloração sem conflitos ou None
+def _tabucol(vizinhos, coloracao, k, iteracoes, gerador):
+    n = len(vizinhos)
+    if k <= 0:
+        return None
+    cor = [c if c < k else 0 for c in coloracao]
+    # conflitos[v][c] = número de vizinhos de v com a cor c
+    conflitos = [[0] * k for _ in range(n)]
+    for v in range(n):
+        for u in vizinhos[v]:
+            conflitos[v][cor[u]] += 1
+    # Vértices que perderam a cor vão para a cor com menos conflitos
+    for v in range(n):
+        if coloracao[v] >= k:
+            nova = min(range(k), key=lambda c: conflitos[v][c])
+            for u in vizinhos[v]:
+                conflitos[u][cor[v]] -= 1
+                conflitos[u][nova] += 1
+            cor[v] = nova
+
+    conflitantes = {v for v in range(n) if conflitos[v][cor[v]] > 0}
+    total = sum(conflitos[v][cor[v]] for v in conflitantes) // 2
+    tabu = {}  # (vértice, cor) -> iteração até a qual o movimento é proibido
+    for iteracao in range(iteracoes):
+        if total == 0:
+            return cor
+        # Melhor movimento não tabu (ou tabu que leva a uma solução melhor que a atual: critério de aspiração)
+        melhor_delta, movimentos = None, []
+        for v in conflitantes:
+            atual = conflitos[v][cor[v]]
+            for c in range(k):
+                if c == cor[v]:
+                    continue
+                delta = conflitos[v][c] - atual
+                if tabu.get((v, c), -1) >= iteracao and total + delta > 0:
+                    continue
+                if melhor_delta is None or delta < melhor_delta:
+                    melhor_delta, movimentos = delta, [(v, c)]
+                elif delta == melhor_delta:
+                    movimentos.append((v, c))
+        if not movimentos:
+            continue
+        v, nova = gerador.choice(movimentos)
+        antiga = cor[v]
+        cor[v] = nova
+        total += melhor_delta
+        tabu[(v, antiga)] = iteracao + gerador.randint(0, 9) + int(0.6 * len(conflitantes))
+        for u in vizinhos[v]:
+            conflitos[u][antiga] -= 1
+            conflitos[u][nova] += 1
+            if conflitos[u][cor[u]] > 0:
+                conflitantes.add(u)
+            else:
+                conflitantes.discard(u)
+        if conflitos[v][nova] > 0:
+            conflitantes.add(v)
+        else:
+            conflitantes.discard(v)
+    return cor if total == 0 else None
+
+# Função que encontra uma clique de forma gulosa (limite inferior para o número de cores)
+# Tenta começar por alguns vértices de maior grau e sempre adiciona o candidato de maior grau
+def _clique_gulosa(vizinhos, tentativas=10):
+    n = len(vizinhos)
+    conjuntos = [set(viz) for viz in vizinhos]
+    por_grau = sorted(range(n), key=lambda v: len(vizinhos[v]), reverse=True)
+    melhor = []
+    for inicio in por_grau[:tentativas]:
+        clique = [inicio]
+        candidatos = set(conjuntos[inicio])
+        while candidatos:
+            v = max(candidatos, key=lambda u: len(vizinhos[u]))
+            clique.append(v)
+            candidatos &= conjuntos[v]
+        if len(clique) > len(melhor):
+            melhor = clique
+    return melhor
+
 # Função para criar um grafo colorido mostrando a atribuição de cores
 def plotar_frequencia(vertices, arestas, cores_usadas, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta o grafo colorido
     G = nx.Graph()  # Cria um grafo não direcionado
     G.add_nodes_from(vertices)  # Adiciona os vértices
     G.add_edges_from(arestas)  # Adiciona as arestas
@@ -57,43 +255,49 @@ def plotar_frequencia(vertices, arestas, cores_usadas, titulo):
     plt.figure(figsize=(8, 6))  # Define tamanho da figura
     nx.draw(G, with_labels=True, node_color=color_map, node_size=2000)  # Desenha o grafo
     plt.title(titulo)  # Título do gráfico
-    plt.show()  # Exibe o gráfico
-
-# Exemplo 1: Configuração inicial
-vertices1 = ['A', 'B', 'C', 'D']  # Vértices do grafo
-arestas1 = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')]  # Arestas do grafo
-cores1 = [0, 1, 2, 3]  # Cores disponíveis (representadas por índices)
-
-dados_frequencia1 = resolver_problema_frequencia(vertices1, arestas1, cores1)
-
-print("\nProblema de Frequencias - Exemplo 1:")
-print("Status:", dados_frequencia1["status"])  # Status da solução
-print("Atribuição de cores:", dados_frequencia1["cores_usadas"])  # Cores atribuídas a cada vértice
-print("Total de cores usadas:", dados_frequencia1["total_cores"])  # Número de cores usadas
-plotar_frequencia(vertices1, arestas1, dados_frequencia1['cores_usadas'], "Coloração de Grafos - Exemplo 1")  # Mostra o gráfico
-
-# Exemplo 2: Grafo com mais vértices e conexões complexas
-vertices2 = ['A', 'B', 'C', 'D', 'E', 'F']  # Vértices do grafo
-arestas2 = [('A', 'B'), ('A', 'C'), ('B', 'C'), ('B', 'D'), ('C', 'E'), ('D', 'E'), ('E', 'F')]  # Arestas do grafo
-cores2 = [0, 1, 2, 3, 4]  # Cores disponíveis
-
-dados_frequencia2 = resolver_problema_frequencia(vertices2, arestas2, cores2)
-
-print("\nProblema de Frequencias - Exemplo 2:")
-print("Status:", dados_frequencia2["status"])
-print("Atribuição de cores:", dados_frequencia2["cores_usadas"])
-print("Total de cores usadas:", dados_frequencia2["total_cores"])
-plotar_frequencia(vertices2, arestas2, dados_frequencia2['cores_usadas'], "Coloração de Grafos - Exemplo 2")
-
-# Exemplo 3: Grafo em forma de ciclo
-vertices3 = ['P', 'Q', 'R', 'S', 'T']  # Vértices do grafo
-arestas3 = [('P', 'Q'), ('Q', 'R'), ('R', 'S'), ('S', 'T'), ('T', 'P')]  # Arestas formando um ciclo
-cores3 = [0, 1, 2, 3]  # Cores disponíveis
-
-dados_frequencia3 = resolver_problema_frequencia(vertices3, arestas3, cores3)
-
-print("\nProblema de Frequencias - Exemplo 3:")
-print("Status:", dados_frequencia3["status"])
-print("Atribuição de cores:", dados_frequencia3["cores_usadas"])
-print("Total de cores usadas:", dados_frequencia3["total_cores"])
-plotar_frequencia(vertices3, arestas3, dados_frequencia3['cores_usadas'], "Coloração de Grafos - Exemplo 3")
\ No newline at end of file
+    exibir_figura(titulo)  # Exibe o grafo com uma cor por frequência
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    vertices1 = ['A', 'B', 'C', 'D']  # Vértices do grafo
+    arestas1 = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')]  # Arestas do grafo
+    cores1 = [0, 1, 2, 3]  # Cores disponíveis (representadas por índices)
+
+    dados_frequencia1 = resolver_problema_frequencia(vertices1, arestas1, cores1)
+
+    print("\nProblema de Frequencias - Exemplo 1:")
+    print("Status:", dados_frequencia1["status"])  # Status da solução
+    print("Atribuição de cores:", dados_frequencia1["cores_usadas"])  # Cores atribuídas a cada vértice
+    print("Total de cores usadas:", dados_frequencia1["total_cores"])  # Número de cores usadas
+    plotar_frequencia(vertices1, arestas1, dados_frequencia1['cores_usadas'], "Coloração de Grafos - Exemplo 1")  # Mostra o gráfico
+
+    # Exemplo 2: Grafo com mais vértices e conexões complexas
+    vertices2 = ['A', 'B', 'C', 'D', 'E', 'F']  # Vértices do grafo
+    arestas2 = [('A', 'B'), ('A', 'C'), ('B', 'C'), ('B', 'D'), ('C', 'E'), ('D', 'E'), ('E', 'F')]  # Arestas do grafo
+    cores2 = [0, 1, 2, 3, 4]  # Cores disponíveis
+
+    dados_frequencia2 = resolver_problema_frequencia(vertices2, arestas2, cores2)
+
+    print("\nProblema de Frequencias - Exemplo 2:")
+    print("Status:", dados_frequencia2["status"])
+    print("Atribuição de cores:", dados_frequencia2["cores_usadas"])
+    print("Total de cores usadas:", dados_frequencia2["total_cores"])
+    plotar_frequencia(vertices2, arestas2, dados_frequencia2['cores_usadas'], "Coloração de Grafos - Exemplo 2")
+
+    # Exemplo 3: Grafo em forma de ciclo
+    vertices3 = ['P', 'Q', 'R', 'S', 'T']  # Vértices do grafo
+    arestas3 = [('P', 'Q'), ('Q', 'R'), ('R', 'S'), ('S', 'T'), ('T', 'P')]  # Arestas formando um ciclo
+    cores3 = [0, 1, 2, 3]  # Cores disponíveis
+
+    dados_frequencia3 = resolver_problema_frequencia(vertices3, arestas3, cores3)
+
+    print("\nProblema de Frequencias - Exemplo 3:")
+    print("Status:", dados_frequencia3["status"])
+    print("Atribuição de cores:", dados_frequencia3["cores_usadas"])
+    print("Total de cores usadas:", dados_frequencia3["total_cores"])
+    plotar_frequencia(vertices3, arestas3, dados_frequencia3['cores_usadas'], "Coloração de Grafos - Exemplo 3")
+
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
@@ -2,9 +2,33 @@
 import pulp  # Para resolver problemas de otimização linear
 import matplotlib.pyplot as plt  # Para criar gráficos
 import networkx as nx  # Para criar e visualizar grafos
+import time  # Para controlar o limite de tempo da busca
+from .cache import em_cache  # Cache de soluções compartilhado pelos resolvedores
+from .graficos import exibir_figura, graficos_desligados  # Grafo com a clique destacada (src/graficos.py)
+from .solver import resolver_modelo  # Configuração compartilhada do solver (CBC/HiGHS, threads, limites)
+from .instrumentacao import instrumentado, contar  # Medição das fases para os observadores registrados (src/instrumentacao.py)
+
+# Métodos disponíveis: branch-and-bound com bitsets (padrão) ou modelo inteiro no CBC
+METODOS_CLIQUE = ('bitset', 'mip')
+
+# A cada quantos nós da busca o relógio é consultado (consultar sempre custaria caro)
+INTERVALO_VERIFICACAO_TEMPO = 1000
 
 # Função que encontra a maior clique em um grafo
-def resolver_problema_clique(vertices, arestas):
+# metodo='bitset' (padrão) usa branch-and-bound com limitantes de coloração gulosa; metodo='mip' usa o CBC
+# limite_tempo (segundos, só no método bitset) interrompe a busca e devolve a maior clique encontrada até ali;
+# nesse caso "status" é "Not Solved" e "otimo_comprovado" é False
+@instrumentado
+@em_cache
+def resolver_problema_clique(vertices, arestas, metodo='bitset', limite_tempo=None):
+    if metodo == 'bitset':
+        return resolver_clique_bitset(vertices, arestas, limite_tempo)
+    if metodo == 'mip':
+        return resolver_clique_mip(vertices, arestas)
+    raise ValueError(f"Método desconhecido: {metodo} (use um de {METODOS_CLIQUE})")
+
+# Função que resolve a clique máxima como um problema de programação inteira binária (PuLP/CBC)
+def resolver_clique_mip(vertices, arestas):
     # Cria um problema para maximizar o tamanho da clique
     problema = pulp.LpProblem("Problema_Clique_Maxima", pulp.LpMaximize)
 
@@ -14,26 +38,126 @@ def resolver_problema_clique(vertices, arestas):
     # Define o objetivo: maximizar o número de vértices na clique
     problema += pulp.lpSum(x[v] for v in vertices), "Maximizar_Clique"
 
+    # Conjunto de arestas nos dois sentidos (consulta em O(1) em vez de percorrer a lista)
+    # Cada aresta vira tupla: arestas lidas de JSON (ex.: src/lote.py) chegam como listas
+    adjacentes = {tuple(aresta) for aresta in arestas} | {(v2, v1) for (v1, v2) in arestas}
+
     # Restrições: vértices não conectados por uma aresta não podem estar na mesma clique
-    for v1 in vertices:
-        for v2 in vertices:
-            if v1 != v2 and (v1, v2) not in arestas and (v2, v1) not in arestas:
+    # Cada par não adjacente entra uma única vez (v1 antes de v2 na lista de vértices)
+    for a, v1 in enumerate(vertices):
+        for v2 in vertices[a + 1:]:
+            if (v1, v2) not in adjacentes:
                 problema += x[v1] + x[v2] <= 1, f"Restricao_{v1}_{v2}"
 
     # Resolve o problema
-    problema.solve()
+    situacao = resolver_modelo(problema)  # Usa o solver configurado em src/solver.py (solver, threads, limites)
 
     # Organiza os resultados em um dicionário
     resultado = {
-        "status": pulp.LpStatus[problema.status],  # Status da solução (ex.: "Optimal")
-        "vertices_clique": [v for v in vertices if x[v].varValue == 1],  # Vértices na clique
-        "tamanho_clique": pulp.value(problema.objective)  # Tamanho da clique
+        "status": situacao["status"],  # Status da solução (ex.: "Optimal"; "Not Solved" se o limite de tempo parar a busca)
+        "vertices_clique": [v for v in vertices if (x[v].varValue or 0) > 0.5],  # Vértices na clique
+        "tamanho_clique": pulp.value(problema.objective),  # Tamanho da clique
+        "otimo_comprovado": situacao["otimo_comprovado"]  # O solver provou a otimalidade
+    }
+
+    return resultado  # Retorna os resultados
+
+# Função que encontra a maior clique com branch-and-bound sobre bitsets (estilo MCQ/BBMC de Tomita e San Segundo)
+# Cada vértice vira um bit; a vizinhança de um vértice é um inteiro Python com os bits dos vizinhos.
+# Em cada nó, os candidatos são coloridos de forma gulosa: uma clique não pode ter dois vértices da mesma cor,
+# então "tamanho atual + maior cor" é um limitante superior e corta ramos que não superam a melhor clique
+def resolver_clique_bitset(vertices, arestas, limite_tempo=None):
+    vertices = list(vertices)
+    n = len(vertices)
+    indice_original = {v: i for i, v in enumerate(vertices)}
+
+    # Graus para a ordenação inicial (vértices de maior grau recebem os primeiros bits)
+    vizinhos = [set() for _ in range(n)]
+    for v1, v2 in arestas:
+        if v1 != v2 and v1 in indice_original and v2 in indice_original:
+            vizinhos[indice_original[v1]].add(indice_original[v2])
+            vizinhos[indice_original[v2]].add(indice_original[v1])
+    ordem = sorted(range(n), key=lambda i: len(vizinhos[i]), reverse=True)
+    bit = {original: b for b, original in enumerate(ordem)}  # Vértice original -> posição do bit
+
+    # Matriz de adjacência em bitsets
+    adjacencia = [0] * n
+    for b, original in enumerate(ordem):
+        mascara = 0
+        for w in vizinhos[original]:
+            mascara |= 1 << bit[w]
+        adjacencia[b] = mascara
+
+    # Clique inicial gulosa: percorre os vértices por grau e adiciona quem é vizinho de todos os já escolhidos
+    melhor = []
+    candidatos = (1 << n) - 1
+    while candidatos:
+        menor = candidatos & -candidatos
+        b = menor.bit_length() - 1
+        melhor.append(b)
+        candidatos &= adjacencia[b]
+
+    prazo = None if limite_tempo is None else time.perf_counter() + limite_tempo
+    estado = {"nos": 0, "interrompido": False}
+
+    # Coloração gulosa dos candidatos: devolve os vértices em ordem de cor crescente e a cor de cada um
+    def colorir(candidatos):
+        ordem_cor, cores = [], []
+        restantes = candidatos
+        cor = 0
+        while restantes:
+            cor += 1
+            livres = restantes  # Vértices que ainda podem receber a cor atual
+            while livres:
+                menor = livres & -livres
+                b = menor.bit_length() - 1
+                restantes &= ~menor
+                livres &= ~(adjacencia[b] | menor)  # Vizinhos de b não podem ter a mesma cor
+                ordem_cor.append(b)
+                cores.append(cor)
+        return ordem_cor, cores
+
+    def expandir(clique, candidatos):
+        nonlocal melhor
+        estado["nos"] += 1
+        if prazo is not None and estado["nos"] % INTERVALO_VERIFICACAO_TEMPO == 0 and time.perf_counter() > prazo:
+            estado["interrompido"] = True
+        if estado["interrompido"]:
+            return
+        ordem_cor, cores = colorir(candidatos)
+        # Percorre da maior cor para a menor, cortando quando o limitante não supera a melhor clique
+        for k in range(len(ordem_cor) - 1, -1, -1):
+            if len(clique) + cores[k] <= len(melhor) or estado["interrompido"]:
+                return
+            b = ordem_cor[k]
+            clique.append(b)
+            novos = candidatos & adjacencia[b]
+            if novos:
+                expandir(clique, novos)
+            elif len(clique) > len(melhor):
+                melhor = clique[:]  # Nova melhor clique
+            clique.pop()
+            candidatos &= ~(1 << b)
+
+    if n:
+        expandir([], (1 << n) - 1)
+    contar(nos=estado["nos"])  # Nós do branch-and-bound (para a instrumentação)
+
+    # Converte os bits de volta para os vértices originais, na ordem da lista recebida
+    na_clique = {ordem[b] for b in melhor}
+    resultado = {
+        "status": "Not Solved" if estado["interrompido"] else "Optimal",  # Status da solução
+        "vertices_clique": [vertices[i] for i in range(n) if i in na_clique],  # Vértices na clique
+        "tamanho_clique": len(melhor),  # Tamanho da clique
+        "otimo_comprovado": not estado["interrompido"]  # False quando o limite de tempo interrompeu a busca
     }
 
     return resultado  # Retorna os resultados
 
 # Função para criar um grafo destacando os vértices da clique
 def plotar_clique(vertices, arestas, vertices_clique, titulo):
+    if graficos_desligados():
+        return  # Nada a desenhar: nem monta o grafo
     G = nx.Graph()  # Cria um grafo não direcionado
     G.add_nodes_from(vertices)  # Adiciona os vértices
     G.add_edges_from(arestas)  # Adiciona as arestas
@@ -44,40 +168,46 @@ def plotar_clique(vertices, arestas, vertices_clique, titulo):
     plt.figure(figsize=(8, 6))  # Define tamanho da figura
     nx.draw(G, with_labels=True, node_color=color_map, node_size=2000)  # Desenha o grafo
     plt.title(titulo)  # Título do gráfico
-    plt.show()  # Exibe o gráfico
+    exibir_figura(titulo)  # Exibe o grafo com a clique destacada
+
+# Função que executa os exemplos do problema, exibindo resultados e gráficos
+def executar_exemplos():
+    # Exemplo 1: Configuração inicial
+    vertices1 = ['A', 'B', 'C', 'D']  # Vértices do grafo
+    arestas1 = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('A', 'C')]  # Arestas do grafo
 
-# Exemplo 1: Configuração inicial
-vertices1 = ['A', 'B', 'C', 'D']  # Vértices do grafo
-arestas1 = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('A', 'C')]  # Arestas do grafo
+    dados_clique1 = resolver_problema_clique(vertices1, arestas1)
 
-dados_clique1 = resolver_problema_clique(vertices1, arestas1)
+    print("\nProblema da Clique Máxima - Exemplo 1:")
+    print("Status:", dados_clique1["status"])  # Status da solução
+    print("Vertices na clique:", dados_clique1["vertices_clique"])  # Vértices selecionados
+    print("Tamanho da clique:", dados_clique1["tamanho_clique"])  # Tamanho da clique
+    plotar_clique(vertices1, arestas1, dados_clique1['vertices_clique'], "Clique Máxima - Exemplo 1")  # Mostra o gráfico
 
-print("\nProblema da Clique Máxima - Exemplo 1:")
-print("Status:", dados_clique1["status"])  # Status da solução
-print("Vertices na clique:", dados_clique1["vertices_clique"])  # Vértices selecionados
-print("Tamanho da clique:", dados_clique1["tamanho_clique"])  # Tamanho da clique
-plotar_clique(vertices1, arestas1, dados_clique1['vertices_clique'], "Clique Máxima - Exemplo 1")  # Mostra o gráfico
+    # Exemplo 2: Grafo maior e mais conectado
+    vertices2 = ['P', 'Q', 'R', 'S', 'T', 'U']  # Vértices do grafo
+    arestas2 = [('P', 'Q'), ('P', 'R'), ('Q', 'R'), ('Q', 'S'), ('R', 'S'), ('S', 'T'), ('T', 'U')]  # Arestas do grafo
 
-# Exemplo 2: Grafo maior e mais conectado
-vertices2 = ['P', 'Q', 'R', 'S', 'T', 'U']  # Vértices do grafo
-arestas2 = [('P', 'Q'), ('P', 'R'), ('Q', 'R'), ('Q', 'S'), ('R', 'S'), ('S', 'T'), ('T', 'U')]  # Arestas do grafo
+    dados_clique2 = resolver_problema_clique(vertices2, arestas2)
 
-dados_clique2 = resolver_problema_clique(vertices2, arestas2)
+    print("\nProblema da Clique Máxima - Exemplo 2:")
+    print("Status:", dados_clique2["status"])
+    print("Vertices na clique:", dados_clique2["vertices_clique"])
+    print("Tamanho da clique:", dados_clique2["tamanho_clique"])
+    plotar_clique(vertices2, arestas2, dados_clique2['vertices_clique'], "Clique Máxima - Exemplo 2")
 
-print("\nProblema da Clique Máxima - Exemplo 2:")
-print("Status:", dados_clique2["status"])
-print("Vertices na clique:", dados_clique2["vertices_clique"])
-print("Tamanho da clique:", dados_clique2["tamanho_clique"])
-plotar_clique(vertices2, arestas2, dados_clique2['vertices_clique'], "Clique Máxima - Exemplo 2")
+    # Exemplo 3: Grafo com estrutura de quase-clique
+    vertices3 = ['X', 'Y', 'Z', 'W', 'V']  # Vértices do grafo
+    arestas3 = [('X', 'Y'), ('X', 'Z'), ('X', 'W'), ('Y', 'Z'), ('Y', 'W'), ('Z', 'W'), ('W', 'V')]  # Arestas do grafo
 
-# Exemplo 3: Grafo com estrutura de quase-clique
-vertices3 = ['X', 'Y', 'Z', 'W', 'V']  # Vértices do grafo
-arestas3 = [('X', 'Y'), ('X', 'Z'), ('X', 'W'), ('Y', 'Z'), ('Y', 'W'), ('Z', 'W'), ('W', 'V')]  # Arestas do grafo
+    dados_clique3 = resolver_problema_clique(vertices3, arestas3)
 
-dados_clique3 = resolver_problema_clique(vertices3, arestas3)
+    print("\nProblema da Clique Máxima - Exemplo 3:")
+    print("Status:", dados_clique3["status"])
+    print("Vertices na clique:", dados_clique3["vertices_clique"])
+    print("Tamanho da clique:", dados_clique3["tamanho_clique"])
+    plotar_clique(vertices3, arestas3, dados_clique3['vertices_clique'], "Clique Máxima - Exemplo 3")
 
-print("\nProblema da Clique Máxima - Exemplo 3:")
-print("Status:", dados_clique3["status"])
-print("Vertices na clique:", dados_clique3["vertices_clique"])
-print("Tamanho da clique:", dados_clique3["tamanho_clique"])
-plotar_clique(vertices3, arestas3, dados_clique3['vertices_clique'], "Clique Máxima - Exemplo 3")
\ No newline at end of file
+# Executa os exemplos apenas quando o arquivo é rodado diretamente
+if __name__ == "__main__":
+    executar_exemplos()
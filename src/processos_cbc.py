@@ -0,0 +1,237 @@
+# Importa bibliotecas necessárias
+import os  # Para o diretório em memória (/dev/shm) e para reconhecer processos criados por fork
+import re  # Para conferir se o CBC leu o modelo sem erros
+import atexit  # Para encerrar os processos do CBC quando o programa termina
+import shutil  # Para apagar o diretório de trabalho no fim
+import tempfile  # Diretório de trabalho quando não há /dev/shm
+import threading  # Vários resolvedores podem pedir processos ao mesmo tempo
+import subprocess  # Processos do CBC no modo interativo
+import pulp  # Caminho do executável do CBC e erro padrão do solver
+
+# Prompt que o CBC escreve no modo interativo ("cbc -") antes de ler cada comando
+PROMPT_CBC = b"Coin:"
+
+# Função auxiliar que escolhe onde ficam os arquivos MPS e de solução: /dev/shm (memória) quando existe, para que
+# os arquivos de cada modelo não passem pelo disco
+def _diretorio_base():
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+# Classe que mantém um processo do CBC já iniciado no modo interativo, esperando um modelo
+# Cada processo resolve um único modelo: o CBC guarda estado entre modelos importados no mesmo processo e, ao
+# reaproveitá-lo, devolve soluções erradas e às vezes termina com falha de segmentação
+class ProcessoCBC:
+    # Inicia o CBC lendo comandos da entrada padrão e espera o primeiro prompt
+    def __init__(self, caminho_cbc=None):
+        caminho_cbc = caminho_cbc or pulp.PULP_CBC_CMD(msg=False).path
+        self._processo = subprocess.Popen([caminho_cbc, "-"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                          stderr=subprocess.STDOUT, bufsize=0)
+        self._ler(1)
+
+    # Lê a saída até o CBC pedir o próximo comando quantidade vezes e devolve o texto
+    def _ler(self, quantidade):
+        saida = bytearray()
+        while saida.count(PROMPT_CBC) < quantidade or not saida.endswith(PROMPT_CBC):
+            bloco = os.read(self._processo.stdout.fileno(), 65536)
+            if not bloco:
+                raise pulp.PulpSolverError(f"O processo do CBC terminou inesperadamente (código {self._processo.poll()})")
+            saida += bloco
+        return saida.replace(PROMPT_CBC, b"").decode("utf-8", errors="replace")
+
+    # Executa uma sequência de comandos do CBC e devolve o log produzido por eles
+    def executar(self, comandos):
+        self._processo.stdin.write(("\n".join(comandos) + "\n").encode())
+        return self._ler(len(comandos))
+
+    # Resolve o modelo gravado em caminho_mps e grava a solução em caminho_solucao ("-printingOptions all"),
+    # como uma chamada "cbc modelo.mps [-max] -opção valor ... -solve -solution arquivo"; opcoes: pares (opção, valor)
+    # Devolve o log do CBC
+    def resolver(self, caminho_mps, caminho_solucao, maximizar=False, mip=True, opcoes=()):
+        texto = self.executar([f"import {caminho_mps}"])
+        if not re.search(r"^Problem .* has \d+ rows", texto, re.MULTILINE) or "errors on input" in texto:
+            raise pulp.PulpSolverError(f"O CBC não conseguiu ler o modelo {caminho_mps}:\n{texto}")
+        comandos = (["maximize"] if maximizar else []) + [f"{opcao} {valor}" for opcao, valor in opcoes]
+        comandos += ["solve" if mip else "initialSolve", "printingOptions all", f"solution {caminho_solucao}"]
+        return texto + self.executar(comandos)
+
+    # Encerra o processo (pede "quit" e, se não sair logo, mata)
+    def encerrar(self):
+        try:
+            self._processo.stdin.write(b"quit\n")
+            self._processo.stdin.close()
+            self._processo.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self._processo.kill()
+            self._processo.wait()
+        self._processo.stdout.close()
+
+    # Fecha as conexões herdadas por um processo filho (fork) sem encerrar o CBC, que pertence ao processo pai
+    def abandonar(self):
+        for arquivo in (self._processo.stdin, self._processo.stdout):
+            try:
+                arquivo.close()
+            except OSError:
+                pass
+
+# Classe que mantém até "processos" processos do CBC já iniciados e entrega um a cada modelo
+# O processo usado é encerrado e um substituto é iniciado numa thread em segundo plano, enquanto o resolvedor lê a
+# solução: a inicialização do CBC (carregar o executável e as bibliotecas) sai do caminho de cada resolução
+class PoolCBC:
+    def __init__(self, processos=None):
+        self.processos = processos or os.cpu_count() or 1
+        self._prontos = []  # Processos iniciados esperando um modelo
+        self._abertos = 0  # Processos prontos, em uso ou sendo iniciados
+        self._encerrado = False
+        self._condicao = threading.Condition()
+        self.iniciados = 0  # Processos do CBC iniciados desde a criação do pool
+        self.modelos = 0  # Modelos resolvidos
+
+    # Entrega um processo pronto; se não houver e ainda couber no limite, inicia um agora; senão espera
+    def _obter(self):
+        with self._condicao:
+            while not self._prontos and self._abertos >= self.processos:
+                self._condicao.wait()
+            if self._prontos:
+                return self._prontos.pop()
+            self._abertos += 1
+        try:
+            processo = ProcessoCBC()
+        except BaseException:
+            self._descontar()
+            raise
+        with self._condicao:
+            self.iniciados += 1
+        return processo
+
+    # Desconta um processo que não será substituído e acorda quem espera
+    def _descontar(self):
+        with self._condicao:
+            self._abertos -= 1
+            self._condicao.notify()
+
+    # Executado em segundo plano: encerra o processo usado e inicia o substituto
+    def _repor(self, usado):
+        usado.encerrar()
+        try:
+            novo = ProcessoCBC()
+        except (OSError, pulp.PulpSolverError):
+            self._descontar()  # O próximo modelo tenta iniciar o CBC de novo (e recebe o erro, se persistir)
+            return
+        with self._condicao:
+            self.iniciados += 1
+            if not self._encerrado:
+                self._prontos.append(novo)
+                self._condicao.notify()
+                return
+            self._abertos -= 1
+        novo.encerrar()
+
+    # Resolve um modelo MPS num processo pronto (mesmos argumentos de ProcessoCBC.resolver) e devolve o log
+    def resolver(self, caminho_mps, caminho_solucao, maximizar=False, mip=True, opcoes=()):
+        processo = self._obter()
+        try:
+            return processo.resolver(caminho_mps, caminho_solucao, maximizar, mip, opcoes)
+        finally:
+            with self._condicao:
+                self.modelos += 1
+                repor = not self._encerrado
+            if repor:
+                threading.Thread(target=self._repor, args=(processo,), daemon=True).start()
+            else:
+                processo.encerrar()
+                self._descontar()
+
+    # Devolve os contadores do pool
+    def estatisticas(self):
+        with self._condicao:
+            return {"processos": self.processos, "abertos": self._abertos, "prontos": len(self._prontos),
+                    "iniciados": self.iniciados, "modelos": self.modelos}
+
+    # Encerra os processos prontos; os que estão em uso são encerrados ao terminar o modelo
+    def encerrar(self):
+        with self._condicao:
+            prontos, self._prontos = self._prontos, []
+            self._abertos -= len(prontos)
+            self._encerrado = True
+        for processo in prontos:
+            processo.encerrar()
+
+    # No processo filho de um fork: esquece os processos do pai (continuam dele) e passa a iniciar os próprios
+    def _apos_fork(self):
+        for processo in self._prontos:
+            processo.abandonar()
+        self._prontos, self._abertos, self._condicao = [], 0, threading.Condition()
+
+# Configuração: ativo=False volta a iniciar o CBC na hora de cada modelo (com arquivos temporários comuns)
+_configuracao = {"ativo": True, "processos": None}
+_pool = None
+_trava = threading.Lock()
+
+# Diretório de trabalho dos arquivos MPS e de solução (criado no primeiro uso) e o processo que o criou
+_diretorio = None
+_pid_diretorio = None
+
+# Função que ajusta o pool de processos do CBC (só os parâmetros informados mudam)
+# processos: máximo de processos iniciados de antemão, que é também o máximo de modelos resolvidos ao mesmo tempo
+# (None = um por núcleo); ativo: liga/desliga o pool. Os processos prontos da configuração anterior são encerrados
+def configurar_processos(processos=None, ativo=None):
+    global _pool
+    if processos is not None and int(processos) < 1:
+        raise ValueError("processos precisa ser pelo menos 1")
+    with _trava:
+        if processos is not None:
+            _configuracao["processos"] = int(processos)
+        if ativo is not None:
+            _configuracao["ativo"] = bool(ativo)
+        anterior, _pool = _pool, None
+        configuracao = dict(_configuracao)
+    if anterior is not None:
+        anterior.encerrar()
+    return configuracao
+
+# Função que devolve o pool compartilhado (criado no primeiro uso), ou None se ele está desligado
+def obter_pool():
+    global _pool
+    with _trava:
+        if not _configuracao["ativo"]:
+            return None
+        if _pool is None:
+            _pool = PoolCBC(_configuracao["processos"])
+        return _pool
+
+# Função que devolve o diretório de trabalho dos modelos resolvidos pelo pool (em memória quando há /dev/shm)
+# Cada modelo usa um subdiretório temporário dentro dele; None quando o pool está desligado
+def diretorio_trabalho():
+    global _diretorio, _pid_diretorio
+    with _trava:
+        if not _configuracao["ativo"]:
+            return None
+        if _diretorio is None or not os.path.isdir(_diretorio):
+            _diretorio, _pid_diretorio = tempfile.mkdtemp(prefix="processos-cbc-", dir=_diretorio_base()), os.getpid()
+        return _diretorio
+
+# Função que encerra os processos prontos (o próximo modelo cria o pool de novo)
+def encerrar_processos():
+    global _pool
+    with _trava:
+        anterior, _pool = _pool, None
+    if anterior is not None:
+        anterior.encerrar()
+
+# Função auxiliar chamada ao fim do programa: encerra os processos e apaga o diretório de trabalho
+def _finalizar():
+    encerrar_processos()
+    if _diretorio is not None and _pid_diretorio == os.getpid():
+        shutil.rmtree(_diretorio, ignore_errors=True)
+
+# Função auxiliar chamada no processo filho após um fork (ex.: trabalhadores de src/lote.py)
+def _apos_fork():
+    global _trava
+    _trava = threading.Lock()
+    if _pool is not None:
+        _pool._apos_fork()
+
+atexit.register(_finalizar)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_apos_fork)
@@ -0,0 +1,55 @@
+# Importa bibliotecas necessárias
+import importlib  # Para importar os módulos dos problemas somente quando forem usados
+
+# Registro dos problemas disponíveis: número do problema -> título, módulo e funções
+# Os módulos não são importados aqui; cada um é carregado apenas na primeira vez que é usado
+PROBLEMAS = {
+    "1": {"titulo": "Problema da Ração", "modulo": "problema_01_racao", "resolver": "resolver_problema_racao", "plotar": "plotar_resultado"},
+    "2": {"titulo": "Problema da Dieta", "modulo": "problema_02_dieta", "resolver": "resolver_problema_dieta", "plotar": "plotar_dieta"},
+    "3": {"titulo": "Problema do Plantio", "modulo": "problema_03_plantio", "resolver": "resolver_problema_plantio", "plotar": "plotar_plantio"},
+    "4": {"titulo": "Problema das Tintas", "modulo": "problema_04_tintas", "resolver": "resolver_problema_tintas", "plotar": "plotar_tintas"},
+    "5": {"titulo": "Problema do Transporte", "modulo": "problema_05_transporte", "resolver": "resolver_problema_transporte", "plotar": "plotar_transporte"},
+    "6": {"titulo": "Problema do Fluxo Máximo", "modulo": "problema_06_fluxo_maximo", "resolver": "resolver_problema_fluxo_maximo", "plotar": "plotar_fluxo"},
+    "7": {"titulo": "Problema de Escalonamento de Horários", "modulo": "problema_07_escalonamento", "resolver": "resolver_problema_escalonamento", "plotar": "plotar_escalonamento"},
+    "8": {"titulo": "Problema de Cobertura", "modulo": "problema_08_cobertura", "resolver": "resolver_problema_cobertura", "plotar": "plotar_cobertura"},
+    "9": {"titulo": "Problema da Mochila", "modulo": "problema_09_mochila", "resolver": "resolver_problema_mochila", "plotar": "plotar_mochila"},
+    "10": {"titulo": "Problema dos Padrões", "modulo": "problema_10_padroes", "resolver": "resolver_problema_padroes", "plotar": "plotar_padroes"},
+    "11": {"titulo": "Problema de Localização de Facilidades", "modulo": "problema_11_facilidades", "resolver": "resolver_problema_facilidades", "plotar": "plotar_facilidades"},
+    "12": {"titulo": "Problema de Atribuição de Frequências", "modulo": "problema_12_frequencia", "resolver": "resolver_problema_frequencia", "plotar": "plotar_frequencia"},
+    "13": {"titulo": "Problema da Clique Máxima", "modulo": "problema_13_clique_maxima", "resolver": "resolver_problema_clique", "plotar": "plotar_clique"},
+}
+
+# Função que devolve a entrada do registro de um problema, aceitando número inteiro ou texto
+def obter_problema(id_problema):
+    chave = str(id_problema).strip()  # Normaliza o identificador (ex.: 1 ou "1")
+    if chave not in PROBLEMAS:
+        raise KeyError(f"Problema desconhecido: {id_problema}")
+    return PROBLEMAS[chave]
+
+# Função que carrega (sob demanda) o módulo de um problema
+def carregar_modulo(id_problema):
+    problema = obter_problema(id_problema)
+    # O import é feito relativo a este pacote; o Python guarda o módulo em cache após a primeira carga
+    return importlib.import_module(f".{problema['modulo']}", __package__)
+
+# Função que devolve a função resolver_* de um problema
+def obter_resolvedor(id_problema):
+    problema = obter_problema(id_problema)
+    return getattr(carregar_modulo(id_problema), problema["resolver"])
+
+# Função que devolve a função plotar_* de um problema
+def obter_plotador(id_problema):
+    problema = obter_problema(id_problema)
+    return getattr(carregar_modulo(id_problema), problema["plotar"])
+
+# Função que resolve um problema repassando os argumentos para a função resolver_* correspondente
+def resolver(id_problema, *args, **kwargs):
+    return obter_resolvedor(id_problema)(*args, **kwargs)
+
+# Função que executa os exemplos de um problema (pode ser chamada quantas vezes for preciso)
+def executar_exemplos(id_problema):
+    carregar_modulo(id_problema).executar_exemplos()
+
+# Função que lista os problemas registrados como pares (número, título), em ordem numérica
+def listar_problemas():
+    return [(chave, PROBLEMAS[chave]["titulo"]) for chave in sorted(PROBLEMAS, key=int)]
@@ -0,0 +1,222 @@
+# Importa bibliotecas necessárias
+import time  # Para o limite de tempo do branch-and-bound
+import numpy as np  # Tableau denso do simplex
+
+# Tolerâncias: pivôs e custos reduzidos do simplex, viabilidade da fase 1 e integralidade no branch-and-bound
+TOLERANCIA_SIMPLEX = 1e-9
+TOLERANCIA_VIABILIDADE = 1e-7
+TOLERANCIA_INTEIRA = 1e-6
+
+# Limites de pivôs por LP, de variáveis inteiras, de nós e de tempo (segundos) do branch-and-bound; acima deles
+# resolver_denso desiste (devolve None) e quem chamou resolve o modelo com o solver externo. O branch-and-bound
+# refaz o tableau em cada nó, sem cortes nem heurísticas: só compensa em MIPs que o CBC também resolve em poucos nós
+LIMITE_PIVOS = 10_000
+LIMITE_INTEIRAS = 12
+LIMITE_NOS = 64
+LIMITE_TEMPO_NOS = 0.05
+
+# Função auxiliar que converte o modelo para a forma padrão min c·z, A z = b (b >= 0), z >= 0
+# Cada variável vira z deslocada pelo limite inferior (x = l + z), espelhada pelo superior (x = u - z) ou, se
+# livre, a diferença de duas (x = z1 - z2); limites superiores finitos viram linhas z <= u - l
+# Devolve (tableau, base inicial das artificiais, transformação x = D z + deslocamento, sinais das linhas, colunas)
+# ou None se algum limite inferior for maior que o superior
+def _forma_padrao(custos, A, b, tipos, inferiores, superiores):
+    num_restricoes, num_variaveis = A.shape
+    if np.any(inferiores > superiores + TOLERANCIA_SIMPLEX):
+        return None
+    colunas_d, deslocamento, linhas_limite = [], np.zeros(num_variaveis), []
+    for j in range(num_variaveis):
+        if np.isfinite(inferiores[j]):
+            deslocamento[j] = inferiores[j]
+            colunas_d.append((j, 1.0))
+            if np.isfinite(superiores[j]):
+                linhas_limite.append((len(colunas_d) - 1, superiores[j] - inferiores[j]))
+        elif np.isfinite(superiores[j]):
+            deslocamento[j] = superiores[j]
+            colunas_d.append((j, -1.0))
+        else:
+            colunas_d.extend([(j, 1.0), (j, -1.0)])
+    D = np.zeros((num_variaveis, len(colunas_d)))
+    for coluna, (j, sinal) in enumerate(colunas_d):
+        D[j, coluna] = sinal
+
+    # Linhas: restrições originais (lado direito sem o deslocamento) e limites superiores
+    num_z = D.shape[1]
+    limites = np.zeros((len(linhas_limite), num_z))
+    for linha, (coluna, _) in enumerate(linhas_limite):
+        limites[linha, coluna] = 1.0
+    matriz = np.vstack([A @ D, limites])
+    lados = np.concatenate([b - A @ deslocamento, [valor for _, valor in linhas_limite]])
+    todos_tipos = np.concatenate([tipos, np.full(len(linhas_limite), 'L')])
+
+    # Folgas (+1 em <=, -1 em >=), linhas com lado negativo multiplicadas por -1 e uma artificial por linha
+    num_linhas = lados.size
+    folgas = np.flatnonzero(todos_tipos != 'E')
+    matriz_folgas = np.zeros((num_linhas, folgas.size))
+    matriz_folgas[folgas, np.arange(folgas.size)] = np.where(todos_tipos[folgas] == 'L', 1.0, -1.0)
+    sinais = np.where(lados < 0, -1.0, 1.0)
+    padrao = np.hstack([matriz, matriz_folgas]) * sinais[:, None]
+    colunas = padrao.shape[1]
+    tableau = np.zeros((num_linhas + 1, colunas + num_linhas + 1))
+    tableau[:-1, :colunas] = padrao
+    tableau[:-1, colunas:colunas + num_linhas] = np.eye(num_linhas)
+    tableau[:-1, -1] = lados * sinais
+    objetivo = np.concatenate([custos @ D, np.zeros(folgas.size)])
+    base = colunas + np.arange(num_linhas)
+    return tableau, base, D, deslocamento, sinais[:num_restricoes], objetivo, colunas
+
+# Função auxiliar que faz o pivô do tableau na linha s e coluna e
+def _pivotear(tableau, s, e):
+    tableau[s] /= tableau[s, e]
+    coluna = tableau[:, e].copy()
+    coluna[s] = 0.0
+    tableau -= np.outer(coluna, tableau[s])
+
+# Função auxiliar que executa o simplex primal no tableau (última linha: custos reduzidos; última coluna: valores)
+# Entra a coluna de menor custo reduzido (Dantzig); depois de um pivô degenerado passa para a regra de Bland,
+# que não cicla. Devolve ('otimo' | 'ilimitado' | 'limite', pivôs)
+def _simplex(tableau, base, permitidas):
+    pivos, bland = 0, False
+    while True:
+        custos = np.where(permitidas, tableau[-1, :-1], 0.0)
+        candidatas = np.flatnonzero(custos < -TOLERANCIA_SIMPLEX)
+        if candidatas.size == 0:
+            return 'otimo', pivos
+        if pivos >= LIMITE_PIVOS:
+            return 'limite', pivos
+        e = int(candidatas[0]) if bland else int(candidatas[np.argmin(custos[candidatas])])
+        coluna = tableau[:-1, e]
+        positivas = np.flatnonzero(coluna > TOLERANCIA_SIMPLEX)
+        if positivas.size == 0:
+            return 'ilimitado', pivos
+        razoes = tableau[positivas, -1] / coluna[positivas]
+        minimo = razoes.min()
+        empates = positivas[razoes <= minimo + TOLERANCIA_SIMPLEX]
+        s = int(empates[np.argmin(base[empates])])  # Entre empates, sai a variável de menor índice
+        bland = bland or minimo <= TOLERANCIA_SIMPLEX
+        _pivotear(tableau, s, e)
+        base[s] = e
+        pivos += 1
+
+# Função auxiliar que resolve um LP (minimização) com o simplex de duas fases
+# Devolve (status, valor, (x, atividades, duais, custos reduzidos), pivôs); status None = limite de pivôs
+def _resolver_lp(custos, A, b, tipos, inferiores, superiores):
+    forma = _forma_padrao(custos, A, b, tipos, inferiores, superiores)
+    if forma is None:
+        return "Infeasible", None, None, 0
+    tableau, base, D, deslocamento, sinais, objetivo, colunas = forma
+    num_linhas = base.size
+    inicial = tableau[:-1, :-1].copy()  # Matriz da forma padrão (com as artificiais), para os duais no fim
+    originais = np.zeros(tableau.shape[1] - 1, dtype=bool)
+    originais[:colunas] = True
+
+    # Fase 1: minimiza a soma das artificiais (a linha de custos começa com -soma das linhas)
+    tableau[-1] = 0.0
+    tableau[-1, colunas:colunas + num_linhas] = 1.0
+    tableau[-1] -= tableau[:-1].sum(axis=0)
+    situacao, pivos = _simplex(tableau, base, np.ones(tableau.shape[1] - 1, dtype=bool))
+    if situacao == 'limite':
+        return None, None, None, pivos
+    viavel = -tableau[-1, -1] <= TOLERANCIA_VIABILIDADE * max(1.0, np.abs(tableau[:-1, -1]).max(initial=0.0))
+
+    # Tira da base as artificiais que ficaram com valor zero (linhas redundantes mantêm a artificial)
+    for s in np.flatnonzero(base >= colunas):
+        candidatas = np.flatnonzero(originais & (np.abs(tableau[s, :-1]) > TOLERANCIA_SIMPLEX))
+        if candidatas.size and viavel:
+            _pivotear(tableau, s, int(candidatas[0]))
+            base[s] = int(candidatas[0])
+
+    # Fase 2: custos originais, só com as colunas originais podendo entrar
+    status = "Infeasible"
+    if viavel:
+        custos_padrao = np.concatenate([objetivo, np.zeros(num_linhas)])
+        tableau[-1, :-1] = custos_padrao
+        tableau[-1, -1] = 0.0
+        tableau[-1] -= custos_padrao[base] @ tableau[:-1]
+        situacao, mais = _simplex(tableau, base, originais)
+        pivos += mais
+        if situacao == 'limite':
+            return None, None, None, pivos
+        status = "Optimal" if situacao == 'otimo' else "Unbounded"
+
+    # Solução: valores da base convertidos de volta para x; duais da base (B^T y = c_B) nas linhas originais
+    z = np.zeros(tableau.shape[1] - 1)
+    z[base] = tableau[:-1, -1]
+    x = D @ z[:D.shape[1]] + deslocamento
+    duais = np.zeros(b.size)
+    if status == "Optimal" and num_linhas:
+        custos_padrao = np.concatenate([objetivo, np.zeros(num_linhas)])
+        try:
+            y = np.linalg.solve(inicial[:, base].T, custos_padrao[base])
+        except np.linalg.LinAlgError:
+            y = np.linalg.lstsq(inicial[:, base].T, custos_padrao[base], rcond=None)[0]
+        duais = y[:b.size] * sinais
+    atividades = A @ x
+    return status, float(custos @ x), (x, atividades, duais, custos - A.T @ duais), pivos
+
+# Função que resolve um modelo pequeno (matriz densa) no próprio processo: simplex de duas fases para o LP e
+# branch-and-bound em profundidade para as variáveis inteiras (ramifica na variável mais fracionária)
+# tipos: 'L', 'G' ou 'E' por linha; inferiores/superiores com -inf/inf para sem limite; inteiras: booleanos
+# Devolve (status, ótimo provado, (x, atividades, duais, custos reduzidos) ou None, pivôs, nós), no formato dos
+# solvers de src/matricial.py, ou None se passar de LIMITE_PIVOS, LIMITE_INTEIRAS, LIMITE_NOS ou LIMITE_TEMPO_NOS
+# (o modelo deve ir para o solver externo)
+def resolver_denso(custos, A, b, tipos, inferiores, superiores, inteiras, maximizar=False, limite_tempo=None, gap_relativo=None):
+    sinal = -1.0 if maximizar else 1.0
+    custos_min = sinal * custos  # Maximização resolvida como minimização de -c
+    if not inteiras.any():
+        status, _, solucao, pivos = _resolver_lp(custos_min, A, b, tipos, inferiores, superiores)
+        if status is None:
+            return None
+        if solucao is not None:
+            x, atividades, duais, custos_reduzidos = solucao
+            solucao = (x, atividades, sinal * duais, sinal * custos_reduzidos)
+        return status, status == "Optimal", solucao, pivos, 0
+
+    if np.count_nonzero(inteiras) > LIMITE_INTEIRAS:
+        return None
+    inicio = time.perf_counter()
+    pilha = [(np.array(inferiores, dtype=float), np.array(superiores, dtype=float))]
+    melhor, melhor_valor, pivos, nos, interrompido = None, np.inf, 0, 0, False
+    raiz = None  # Solução da relaxação na raiz: devolvida quando não há solução inteira (como o CBC)
+    while pilha:
+        if nos >= LIMITE_NOS or time.perf_counter() - inicio > LIMITE_TEMPO_NOS:
+            return None
+        if limite_tempo is not None and time.perf_counter() - inicio > limite_tempo:
+            interrompido = True
+            break
+        nos += 1
+        li, ls = pilha.pop()
+        status, valor, solucao, mais = _resolver_lp(custos_min, A, b, tipos, li, ls)
+        pivos += mais
+        if status is None:
+            return None
+        raiz = solucao if nos == 1 else raiz
+        if status == "Unbounded":
+            return "Unbounded", False, solucao, pivos, nos
+        if status != "Optimal":
+            continue
+        folga = max(TOLERANCIA_INTEIRA, (gap_relativo or 0.0) * abs(melhor_valor)) if melhor is not None else 0.0
+        if valor >= melhor_valor - folga:
+            continue  # Poda: a relaxação não supera a melhor solução inteira
+        x = solucao[0]
+        fracoes = np.where(inteiras, np.abs(x - np.round(x)), 0.0)
+        j = int(np.argmax(fracoes))
+        if fracoes[j] <= TOLERANCIA_INTEIRA:
+            melhor, melhor_valor = solucao, valor
+            continue
+        # Dois ramos: x_j <= piso e x_j >= teto; o mais próximo do valor atual é explorado primeiro
+        abaixo = (li, ls.copy())
+        abaixo[1][j] = np.floor(x[j])
+        acima = (li.copy(), ls)
+        acima[0][j] = np.ceil(x[j])
+        pilha.extend([acima, abaixo] if x[j] - np.floor(x[j]) < 0.5 else [abaixo, acima])
+
+    if melhor is None:
+        if interrompido or raiz is None:
+            return ("Not Solved" if interrompido else "Infeasible"), False, None, pivos, nos
+        x, atividades, duais, custos_reduzidos = raiz
+        return "Infeasible", False, (x, atividades, sinal * duais, sinal * custos_reduzidos), pivos, nos
+    x, _, duais, custos_reduzidos = melhor
+    x = np.where(inteiras, np.round(x), x)
+    solucao = (x, A @ x, sinal * duais, sinal * custos_reduzidos)
+    return ("Not Solved" if interrompido else "Optimal"), not interrompido, solucao, pivos, nos
@@ -0,0 +1,338 @@
+# Importa bibliotecas necessárias
+import os  # Para descobrir quantos núcleos a máquina tem
+import threading  # Para proteger a configuração alterada em tempo de execução
+import re  # Para ler iterações e nós do log do CBC
+import time  # Para medir o tempo gasto dentro do solver
+import tempfile  # Arquivo temporário do log do CBC quando a instrumentação está ligada
+import subprocess  # Para chamar o executável do CBC direto com um arquivo MPS (src/matricial.py)
+from contextlib import contextmanager  # Para ajustes temporários da configuração
+from contextvars import ContextVar  # Ajustes temporários valem só na thread (ou tarefa asyncio) que os fez
+import numpy as np  # Matrizes densas dos modelos pequenos resolvidos no próprio processo
+import pulp  # Para criar os solvers (CBC e HiGHS) e ler o status da solução
+from .cache import registrar_contexto  # A configuração do solver entra na chave do cache de soluções
+from . import instrumentacao  # Cada chamada ao solver é registrada nas medições em andamento
+from . import simplex  # Simplex denso e branch-and-bound para os modelos pequenos (src/simplex.py)
+from . import processos_cbc  # Processos do CBC iniciados de antemão (src/processos_cbc.py)
+
+# Solvers suportados: CBC (vem com o PuLP) e HiGHS (quando o highspy ou o executável highs estiver instalado)
+SOLVERS = ('cbc', 'highs')
+
+# Modelos com até LIMITE_DENSO_PADRAO variáveis e até LIMITE_DENSO_PADRAO restrições são resolvidos no próprio
+# processo (src/simplex.py), sem arquivos temporários nem processo do CBC
+LIMITE_DENSO_PADRAO = 50
+
+# Configuração usada por todas as funções resolver_* que montam modelos no PuLP
+# threads=None, limite_tempo=None, gap_relativo=None e presolve=None mantêm o padrão do solver
+_configuracao = {"solver": "cbc", "threads": None, "limite_tempo": None, "gap_relativo": None, "presolve": None,
+                 "mensagens": True, "limite_denso": LIMITE_DENSO_PADRAO}
+_trava = threading.Lock()
+
+# Configuração dentro de um bloco usando_solver (None fora dele): cada thread e cada tarefa asyncio tem a sua,
+# então o ajuste temporário de uma não muda a configuração usada pelas outras
+_configuracao_local = ContextVar("configuracao_solver", default=None)
+
+# Marcador de "não alterar" (None é um valor válido: remove o limite)
+_MANTER = object()
+
+# Função que lista os solvers disponíveis nesta máquina
+def solvers_disponiveis():
+    disponiveis = []
+    if pulp.PULP_CBC_CMD(msg=False).available():
+        disponiveis.append('cbc')
+    if pulp.HiGHS(msg=False).available() or pulp.HiGHS_CMD(msg=False).available():
+        disponiveis.append('highs')
+    return disponiveis
+
+# Função auxiliar que valida e normaliza um conjunto de ajustes da configuração
+def _validar(ajustes):
+    normalizados = {}
+    for chave, valor in ajustes.items():
+        if valor is _MANTER:
+            continue
+        if chave not in _configuracao:
+            raise ValueError(f"Opção de solver desconhecida: {chave}")
+        if chave == "solver":
+            if valor not in SOLVERS:
+                raise ValueError(f"Solver desconhecido: {valor} (use um de {SOLVERS})")
+            if valor not in solvers_disponiveis():
+                raise ValueError(f"Solver não instalado: {valor} (disponíveis: {solvers_disponiveis()})")
+        elif chave == "threads" and valor is not None:
+            valor = (os.cpu_count() or 1) if valor == 'auto' else int(valor)  # 'auto' usa todos os núcleos
+            if valor < 1:
+                raise ValueError("threads precisa ser pelo menos 1")
+        elif chave in ("limite_tempo", "gap_relativo") and valor is not None:
+            valor = float(valor)
+            if valor < 0:
+                raise ValueError(f"{chave} não pode ser negativo")
+        elif chave == "limite_denso":
+            valor = int(valor or 0)
+            if valor < 0:
+                raise ValueError("limite_denso não pode ser negativo")
+        normalizados[chave] = valor
+    return normalizados
+
+# Função que altera a configuração do solver em tempo de execução (só os parâmetros informados mudam)
+# Dentro de um bloco usando_solver a alteração vale só até o fim do bloco, no contexto dele
+# solver: 'cbc' ou 'highs'; threads: número de threads ou 'auto'; limite_tempo em segundos; gap_relativo
+# (ex.: 0.01 = para quando o gap de otimalidade chega a 1%); presolve: True/False; mensagens: log do solver;
+# limite_denso: maior número de variáveis (e de restrições) resolvido no próprio processo (0 = sempre o solver)
+def configurar_solver(solver=_MANTER, threads=_MANTER, limite_tempo=_MANTER, gap_relativo=_MANTER, presolve=_MANTER, mensagens=_MANTER,
+                      limite_denso=_MANTER):
+    normalizados = _validar({"solver": solver, "threads": threads, "limite_tempo": limite_tempo,
+                             "gap_relativo": gap_relativo, "presolve": presolve, "mensagens": mensagens,
+                             "limite_denso": limite_denso})
+    local = _configuracao_local.get()
+    if local is not None:
+        _configuracao_local.set({**local, **normalizados})
+        return obter_configuracao()
+    with _trava:
+        _configuracao.update(normalizados)
+        return dict(_configuracao)
+
+# Função que devolve uma cópia da configuração atual (a do bloco usando_solver em andamento, se houver)
+def obter_configuracao():
+    local = _configuracao_local.get()
+    if local is not None:
+        return dict(local)
+    with _trava:
+        return dict(_configuracao)
+
+# Ajuste temporário da configuração (restaurada ao sair do bloco "with"), só na thread ou tarefa asyncio atual
+@contextmanager
+def usando_solver(**ajustes):
+    marcador = _configuracao_local.set({**obter_configuracao(), **_validar(ajustes)})
+    try:
+        yield obter_configuracao()
+    finally:
+        _configuracao_local.reset(marcador)
+
+# Função que cria o objeto solver do PuLP com a configuração atual
+# caminho_log (só CBC) grava o log do solver num arquivo, de onde a instrumentação lê iterações e nós
+def criar_solver(caminho_log=None):
+    configuracao = obter_configuracao()
+    if configuracao["solver"] == 'highs':
+        # Prefere a interface em memória (highspy); senão usa o executável highs
+        classe = pulp.HiGHS if pulp.HiGHS(msg=False).available() else pulp.HiGHS_CMD
+        opcoes = {"msg": configuracao["mensagens"], "timeLimit": configuracao["limite_tempo"],
+                  "gapRel": configuracao["gap_relativo"], "threads": configuracao["threads"]}
+        if configuracao["presolve"] is not None:
+            valor = 'on' if configuracao["presolve"] else 'off'
+            if classe is pulp.HiGHS:
+                opcoes["presolve"] = valor  # Opção repassada direto ao highspy
+            else:
+                opcoes["options"] = [f"presolve={valor}"]  # Linha do arquivo de opções do executável
+        return classe(**{chave: valor for chave, valor in opcoes.items() if valor is not None})
+    return pulp.PULP_CBC_CMD(msg=configuracao["mensagens"], threads=configuracao["threads"],
+                             timeLimit=configuracao["limite_tempo"], gapRel=configuracao["gap_relativo"],
+                             presolve=configuracao["presolve"], logPath=caminho_log)
+
+# Função auxiliar que lê do texto do log do CBC as iterações do simplex e os nós do branch-and-bound (None se não achar)
+def _contagens_texto_cbc(texto):
+    nos = re.search(r"Enumerated nodes:\s+(\d+)", texto)
+    iteracoes = re.search(r"Total iterations:\s+(\d+)", texto) or re.search(r"-\s+(\d+) iterations", texto)  # MIP ou só LP
+    return (int(iteracoes.group(1)) if iteracoes else None), (int(nos.group(1)) if nos else None)
+
+# Função auxiliar que lê o arquivo de log do CBC e devolve (iterações, nós, texto do log)
+def _contagens_log_cbc(caminho_log):
+    try:
+        with open(caminho_log, encoding="utf-8", errors="replace") as arquivo:
+            texto = arquivo.read()
+    except OSError:
+        return None, None, ""
+    return (*_contagens_texto_cbc(texto), texto)
+
+# Função auxiliar que verifica se as variáveis inteiras têm valores inteiros
+# Quando o CBC para no limite de tempo antes de achar uma solução inteira, o PuLP devolve a solução da relaxação
+def _solucao_inteira(problema, tolerancia=1e-6):
+    for variavel in problema.variables():
+        if variavel.cat == pulp.LpInteger and variavel.varValue is not None:
+            if abs(variavel.varValue - round(variavel.varValue)) > tolerancia:
+                return False
+    return True
+
+# Função que informa se um modelo é pequeno o bastante para o simplex denso no próprio processo
+def modelo_pequeno(num_variaveis, num_restricoes):
+    limite = obter_configuracao()["limite_denso"]
+    return 0 < num_variaveis <= limite and num_restricoes <= limite
+
+# Função que resolve no próprio processo (src/simplex.py) um modelo pequeno dado em matrizes densas, com o limite
+# de tempo e o gap da configuração; devolve (status, ótimo provado, solução, pivôs, nós) como simplex.resolver_denso,
+# ou None quando o branch-and-bound passa do limite de nós (o modelo deve ir para o CBC/HiGHS)
+def resolver_denso(custos, A, b, tipos, inferiores, superiores, inteiras, maximizar=False):
+    configuracao = obter_configuracao()
+    inicio = time.perf_counter()
+    resolvido = simplex.resolver_denso(custos, A, b, tipos, inferiores, superiores, inteiras, maximizar,
+                                       configuracao["limite_tempo"], configuracao["gap_relativo"])
+    fim = time.perf_counter()
+    if resolvido is not None and instrumentacao.medindo_agora():
+        instrumentacao.registrar_chamada_solver(inicio, fim, A.shape[1], A.shape[0], resolvido[3],
+                                                resolvido[4] if inteiras.any() else None)
+    return resolvido
+
+# Função auxiliar que resolve um modelo pequeno do PuLP com resolver_denso e grava a solução no próprio modelo
+# (valores, custos reduzidos, duais e status, como o PuLP faz ao ler a solução do CBC); False se desistiu
+def _resolver_pulp_denso(problema):
+    variaveis = problema.variables()
+    indices = {variavel.name: j for j, variavel in enumerate(variaveis)}
+    restricoes = list(problema.constraints.items())
+    custos = np.zeros(len(variaveis))
+    for variavel, coeficiente in (problema.objective.items() if problema.objective is not None else ()):
+        custos[indices[variavel.name]] += coeficiente
+    A = np.zeros((len(restricoes), len(variaveis)))
+    for i, (_, restricao) in enumerate(restricoes):
+        for variavel, coeficiente in restricao.items():
+            A[i, indices[variavel.name]] += coeficiente
+    b = np.array([-restricao.constant for _, restricao in restricoes], dtype=float)
+    tipos = np.array([{pulp.LpConstraintLE: 'L', pulp.LpConstraintGE: 'G'}.get(restricao.sense, 'E')
+                      for _, restricao in restricoes], dtype='<U1')
+    inferiores = np.array([-np.inf if v.lowBound is None else v.lowBound for v in variaveis], dtype=float)
+    superiores = np.array([np.inf if v.upBound is None else v.upBound for v in variaveis], dtype=float)
+    inteiras = np.array([v.cat == pulp.LpInteger for v in variaveis], dtype=bool)
+
+    resolvido = resolver_denso(custos, A, b, tipos, inferiores, superiores, inteiras, problema.sense == pulp.LpMaximize)
+    if resolvido is None:
+        return False
+    status, _, solucao, _, _ = resolvido
+    estados = {"Optimal": (pulp.LpStatusOptimal, pulp.LpSolutionOptimal),
+               "Infeasible": (pulp.LpStatusInfeasible, pulp.LpSolutionInfeasible),
+               "Unbounded": (pulp.LpStatusUnbounded, pulp.LpSolutionUnbounded)}
+    if status == "Not Solved":  # Limite de tempo: com solução inteira, o PuLP marca Optimal + IntegerFeasible
+        estados["Not Solved"] = (pulp.LpStatusOptimal, pulp.LpSolutionIntegerFeasible) if solucao is not None else \
+            (pulp.LpStatusNotSolved, pulp.LpSolutionNoSolutionFound)
+    problema.assignStatus(*estados[status])
+    if solucao is not None:
+        x, atividades, duais, custos_reduzidos = solucao
+        problema.assignVarsVals({v.name: valor for v, valor in zip(variaveis, x.tolist())})
+        problema.assignVarsDj({v.name: valor for v, valor in zip(variaveis, custos_reduzidos.tolist())})
+        problema.assignConsPi({nome: valor for (nome, _), valor in zip(restricoes, duais.tolist())})
+        problema.assignConsSlack({nome: valor for (nome, _), valor in zip(restricoes, (b - atividades).tolist())})
+    return True
+
+# Função que resolve um modelo do PuLP com a configuração atual e informa a situação da solução
+# "status" segue o PuLP, exceto quando o limite de tempo interrompe a busca: nesse caso o status é "Not Solved",
+# com os valores da solução incumbente ou, se nenhuma solução inteira foi encontrada, com as variáveis sem valor (None).
+# "otimo_comprovado" só é True quando o solver prova o ótimo sem tolerância de gap
+# Modelos pequenos (até limite_denso variáveis e restrições) são resolvidos no próprio processo (src/simplex.py) e,
+# com o CBC, os demais vão para os processos já iniciados de src/processos_cbc.py (quando o pool está ligado)
+def resolver_modelo(problema):
+    configuracao = obter_configuracao()
+    diretorio = processos_cbc.diretorio_trabalho() if configuracao["solver"] == 'cbc' else None
+    if modelo_pequeno(problema.numVariables(), problema.numConstraints()) and _resolver_pulp_denso(problema):
+        pass  # Resolvido no próprio processo (src/simplex.py)
+    elif diretorio is not None:
+        _resolver_pulp_pool(problema, diretorio)  # CBC já iniciado (a instrumentação é feita em resolver_mps)
+    elif not instrumentacao.medindo_agora():
+        problema.solve(criar_solver())
+    else:
+        # Com a instrumentação ligada, o log do CBC vai para um arquivo temporário para contar iterações e nós
+        caminho_log = None
+        if configuracao["solver"] == 'cbc':
+            descritor, caminho_log = tempfile.mkstemp(suffix="-cbc.log")
+            os.close(descritor)
+        inicio = time.perf_counter()
+        try:
+            problema.solve(criar_solver(caminho_log))
+            iteracoes = nos = None
+            if caminho_log is not None:
+                iteracoes, nos, texto = _contagens_log_cbc(caminho_log)
+                if configuracao["mensagens"]:
+                    print(texto, end="")  # O log foi para o arquivo: repete na tela, como sem a instrumentação
+        finally:
+            if caminho_log is not None and os.path.exists(caminho_log):
+                os.remove(caminho_log)
+        fim = time.perf_counter()  # A leitura do log conta como tempo do solver, não da extração
+        instrumentacao.registrar_chamada_solver(inicio, fim, problema.numVariables(), problema.numConstraints(), iteracoes, nos)
+    status = pulp.LpStatus[problema.status]
+    if problema.sol_status == pulp.LpSolutionIntegerFeasible:
+        status = "Not Solved"  # Interrompido (limite de tempo), sem prova de otimalidade
+    sem_solucao = problema.status == pulp.LpStatusNotSolved and problema.sol_status == pulp.LpSolutionNoSolutionFound
+    if sem_solucao or (status == "Not Solved" and not _solucao_inteira(problema)):
+        for variavel in problema.variables():
+            variavel.varValue = None  # Valores da relaxação, não de uma solução: descarta
+    otimo = problema.sol_status == pulp.LpSolutionOptimal and not configuracao["gap_relativo"]
+    return {"status": status, "otimo_comprovado": bool(otimo)}
+
+# Função auxiliar que lista as opções do CBC da configuração atual como pares (opção, valor)
+# (as mesmas que o PuLP passa ao executável: limite de tempo, presolve, gap, threads e modo de tempo)
+def _opcoes_cbc(configuracao):
+    opcoes = []
+    if configuracao["limite_tempo"] is not None:
+        opcoes.append(("sec", str(configuracao["limite_tempo"])))
+    if configuracao["presolve"] is not None:
+        opcoes.append(("presolve", "on" if configuracao["presolve"] else "off"))
+    for opcao in criar_solver().getOptions():
+        nome, valor = opcao.split(maxsplit=1)
+        opcoes.append((nome, valor))
+    return opcoes
+
+# Função que resolve com o CBC um modelo já gravado em MPS (sem montar o modelo no PuLP), com a configuração
+# atual, e grava a solução em caminho_solucao (formato "-printingOptions all" do CBC)
+# mip=False usa só o simplex (LP); variaveis e restricoes são repassadas à instrumentação
+# Com o pool de src/processos_cbc.py ligado, o modelo vai para um CBC iniciado de antemão; senão o executável
+# é iniciado na hora
+def resolver_mps(caminho_mps, caminho_solucao, maximizar=False, mip=True, variaveis=None, restricoes=None):
+    configuracao = obter_configuracao()
+    if configuracao["solver"] != 'cbc':
+        raise ValueError(f"resolver_mps só usa o CBC (solver configurado: {configuracao['solver']})")
+    opcoes = _opcoes_cbc(configuracao)  # Mesmas opções (threads, gap, modo de tempo) que os modelos do PuLP
+    pool = processos_cbc.obter_pool()
+    medindo = instrumentacao.medindo_agora()
+    iteracoes = nos = None
+    inicio = time.perf_counter()
+    if pool is not None:
+        if os.path.exists(caminho_solucao):
+            os.remove(caminho_solucao)  # Só vale a solução gravada por este modelo
+        texto = pool.resolver(caminho_mps, caminho_solucao, maximizar, mip, opcoes)
+        codigo = 0
+        if configuracao["mensagens"]:
+            print(texto, end="")
+        if medindo:
+            iteracoes, nos = _contagens_texto_cbc(texto)
+    else:
+        argumentos = [criar_solver().path, caminho_mps] + (["-max"] if maximizar else [])
+        for opcao, valor in opcoes:
+            argumentos += ["-" + opcao, valor]
+        argumentos += ["-solve" if mip else "-initialSolve", "-printingOptions", "all", "-solution", caminho_solucao]
+        caminho_log = None
+        if medindo:
+            descritor, caminho_log = tempfile.mkstemp(suffix="-cbc.log")
+            os.close(descritor)
+        try:
+            if caminho_log is not None:
+                with open(caminho_log, "w") as log:
+                    codigo = subprocess.call(argumentos, stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL)
+            else:
+                saida = None if configuracao["mensagens"] else subprocess.DEVNULL
+                codigo = subprocess.call(argumentos, stdout=saida, stderr=saida, stdin=subprocess.DEVNULL)
+            if caminho_log is not None:
+                iteracoes, nos, texto = _contagens_log_cbc(caminho_log)
+                if configuracao["mensagens"]:
+                    print(texto, end="")
+        finally:
+            if caminho_log is not None and os.path.exists(caminho_log):
+                os.remove(caminho_log)
+    fim = time.perf_counter()
+    if codigo != 0 or not os.path.exists(caminho_solucao):
+        raise pulp.PulpSolverError(f"Erro ao executar o CBC (código {codigo}) com o modelo {caminho_mps}")
+    if medindo:
+        instrumentacao.registrar_chamada_solver(inicio, fim, variaveis, restricoes, iteracoes, nos)
+
+# Função auxiliar que resolve um modelo do PuLP num processo do pool do CBC: grava o MPS (com nomes
+# trocados, como o PuLP) no diretório de trabalho em memória e lê a solução com o próprio leitor do PuLP
+def _resolver_pulp_pool(problema, diretorio):
+    cbc = criar_solver()
+    with tempfile.TemporaryDirectory(prefix="pulp-", dir=diretorio) as temporario:
+        caminho_mps, caminho_solucao = os.path.join(temporario, "modelo.mps"), os.path.join(temporario, "solucao.txt")
+        variaveis, nomes_variaveis, nomes_restricoes, _ = problema.writeMPS(caminho_mps, rename=1)
+        resolver_mps(caminho_mps, caminho_solucao, maximizar=problema.sense == pulp.LpMaximize, mip=cbc.mip,
+                     variaveis=problema.numVariables(), restricoes=problema.numConstraints())
+        status, valores, custos_reduzidos, duais, folgas, situacao = cbc.readsol_MPS(caminho_solucao, problema, variaveis,
+                                                                                    nomes_variaveis, nomes_restricoes)
+    problema.assignVarsVals(valores)
+    problema.assignVarsDj(custos_reduzidos)
+    problema.assignConsPi(duais)
+    problema.assignConsSlack(folgas, activity=True)
+    problema.assignStatus(status, situacao)
+
+# A configuração (sem o log) faz parte da chave do cache: resultados com limite de tempo ou gap diferentes não se misturam
+registrar_contexto(lambda: {chave: valor for chave, valor in obter_configuracao().items() if chave != "mensagens"})
@@ -0,0 +1,15 @@
+# Configuração comum dos testes: sem log do solver, sem cache de soluções e sem gráficos
+import os
+import pytest
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from src import solver, cache, graficos  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def ambiente_de_teste():
+    cache.configurar_cache(ativo=False)
+    with solver.usando_solver(mensagens=False):
+        yield
+    graficos.configurar_graficos(modo="janela")
@@ -0,0 +1,73 @@
+# Testes de src/assincrono.py
+import asyncio
+import time
+from concurrent.futures import Future
+import numpy as np
+import pytest
+from src import assincrono, graficos, matricial
+from src.problema_09_mochila import resolver_problema_mochila
+
+
+# MIP binário que o CBC leva bem mais que um segundo para provar ótimo
+def _mip_demorado():
+    rng = np.random.default_rng(0)
+    A = rng.integers(10, 100, (30, 120)).astype(float)
+    custos = -(A.sum(axis=0) + rng.integers(0, 20, 120))
+    return dict(c=custos, A=A, b=A.sum(axis=1) / 3, limites_superiores=1, inteiras=np.arange(120))
+
+
+@pytest.fixture
+def resolvedor():
+    resolvedor = assincrono.ResolvedorAssincrono(processos=2, usar_cache=False)
+    yield resolvedor
+    resolvedor.encerrar()
+
+
+# asyncio.gather devolve os mesmos resultados das chamadas diretas, na ordem das corrotinas
+def test_gather_igual_chamada_direta(resolvedor):
+    capacidades = [20, 35, 50, 60]
+
+    async def principal():
+        return await asyncio.gather(*(resolvedor.resolver(9, [60, 100, 120], [10, 20, 30], c) for c in capacidades))
+
+    resultados = asyncio.run(principal())
+    esperados = [resolver_problema_mochila([60, 100, 120], [10, 20, 30], c)["valor_total"] for c in capacidades]
+    assert [r["valor_total"] for r in resultados] == esperados
+
+
+# O erro do resolvedor chega como a própria exceção
+def test_erro_do_resolvedor(resolvedor):
+    with pytest.raises(ValueError):
+        asyncio.run(resolvedor.resolver(9, [1], [1], 5, metodo="desconhecido"))
+
+
+# Cancelamento e timeout encerram o trabalhador na hora, e o resolvedor continua utilizável
+def test_cancelamento_e_timeout_encerram_o_trabalhador(resolvedor):
+    async def principal():
+        tarefa = asyncio.create_task(resolvedor.executar(matricial.resolver_matricial, **_mip_demorado()))
+        await asyncio.sleep(0.5)
+        tarefa.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tarefa
+        inicio = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(resolvedor.executar(matricial.resolver_matricial, **_mip_demorado()), 0.5)
+        assert time.perf_counter() - inicio < 5
+        return await resolvedor.resolver(9, [60, 100, 120], [10, 20, 30], 50)
+
+    assert asyncio.run(principal())["valor_total"] == 220
+    assert resolvedor.cancelados == 2
+    assert not resolvedor._livres or all(p.is_alive() for p, _ in resolvedor._livres)
+
+
+# Figuras pendentes no processo principal não travam os trabalhadores
+def test_figura_pendente_no_pai(resolvedor):
+    pendente = Future()
+    with graficos._trava:
+        graficos._pendentes.append(pendente)
+    try:
+        resultado = asyncio.run(asyncio.wait_for(resolvedor.resolver(9, [60, 100, 120], [10, 20, 30], 50), 20))
+    finally:
+        with graficos._trava:
+            graficos._pendentes.remove(pendente)
+    assert resultado["valor_total"] == 220
@@ -0,0 +1,54 @@
+# Testes de src/benchmark.py: casos mínimos de todos os problemas e comparação de relatórios
+import pytest
+from src import benchmark
+
+
+# Cada problema roda no tamanho 'minimo' e devolve um registro completo, sem erro e com solução ótima
+@pytest.mark.parametrize("id_problema", sorted(benchmark.CASOS_BENCHMARK, key=int))
+def test_executar_caso_minimo(id_problema):
+    caso = benchmark.executar_caso(id_problema, "minimo", repeticoes=1)
+    assert caso["problema"] == id_problema and caso["tamanho"] == "minimo" and caso["erro"] is None
+    assert caso["status"] == "Optimal"
+    assert caso["repeticoes"] == 1 and len(caso["tempos_repeticoes"]) == 1
+    assert caso["tempos"]["total"] >= 0 and caso["tempo_total_minimo"] == caso["tempos_repeticoes"][0]
+
+
+# Um caso executado num processo isolado chega ao relatório e a ao_concluir
+def test_executar_benchmark_isolado():
+    concluidos = []
+    relatorio = benchmark.executar_benchmark(problemas=["9"], tamanhos=["minimo"], repeticoes=1, ao_concluir=concluidos.append)
+    assert relatorio["metadados"]["repeticoes"] == 1
+    assert [caso["problema"] for caso in relatorio["resultados"]] == ["9"]
+    assert concluidos == relatorio["resultados"] and concluidos[0]["erro"] is None
+    with pytest.raises(ValueError):
+        benchmark.executar_benchmark(tamanhos=["gigante"])
+
+
+# Função auxiliar que monta um registro sintético de um caso
+def _caso(problema, tempo=1.0, memoria=100.0, erro=None):
+    if erro is not None:
+        return {"problema": problema, "tamanho": "pequeno", "erro": erro}
+    return {"problema": problema, "tamanho": "pequeno", "tempos": {"total": tempo}, "memoria_base_mb": 50.0,
+            "memoria_pico_mb": memoria, "erro": None}
+
+
+# Regressões de tempo e de memória acima da tolerância e casos que passaram a falhar são apontados; variações
+# pequenas, casos novos e casos que já falhavam não são
+def test_comparar_benchmarks():
+    anterior = {"resultados": [_caso("1"), _caso("2"), _caso("3"), _caso("4"), _caso("5", erro="falhou"), _caso("6", tempo=0.001)]}
+    atual = {"resultados": [
+        _caso("1", tempo=1.5),  # Tempo 50% maior
+        _caso("2", memoria=200.0),  # Memória acima da base: 50 MB -> 150 MB
+        _caso("3", erro="Tempo limite de 600 s excedido"),  # Passou a falhar
+        _caso("4", tempo=1.1, memoria=102.0),  # Dentro da tolerância
+        _caso("5", tempo=9.0),  # Já falhava antes
+        _caso("6", tempo=0.001 + 0.5 * benchmark.TEMPO_MINIMO_REGRESSAO),  # Relativo grande, absoluto pequeno
+        _caso("7", tempo=50.0),  # Caso novo
+    ]}
+    regressoes = benchmark.comparar_benchmarks(anterior, atual)
+    assert {(r["problema"], r["medida"]) for r in regressoes} == {("1", "tempo_total"), ("2", "memoria_mb"), ("3", "erro")}
+    tempo = next(r for r in regressoes if r["medida"] == "tempo_total")
+    assert (tempo["antes"], tempo["depois"]) == (1.0, 1.5)
+    memoria = next(r for r in regressoes if r["medida"] == "memoria_mb")
+    assert (memoria["antes"], memoria["depois"]) == (50.0, 150.0)
+    assert benchmark.comparar_benchmarks(anterior, atual, tolerancia=1.5) == [r for r in regressoes if r["medida"] != "tempo_total"]
@@ -0,0 +1,42 @@
+# Testes de src/cache.py
+import numpy as np
+from src import cache, solver
+from src.problema_09_mochila import resolver_problema_mochila
+
+
+# Só resultados definitivos (ótimo comprovado ou inviável) ficam no cache
+def test_guarda_so_resultados_definitivos():
+    armazenamento = cache.CacheSolucoes()
+    chamadas = []
+
+    @cache.em_cache(cache=armazenamento)
+    def resolver(status, comprovado):
+        chamadas.append(status)
+        return {"status": status, "otimo_comprovado": comprovado}
+
+    for status, comprovado in [("Optimal", True), ("Infeasible", False), ("Optimal", False), ("Not Solved", False)]:
+        resolver(status, comprovado)
+        resolver(status, comprovado)
+    assert chamadas == ["Optimal", "Infeasible", "Optimal", "Optimal", "Not Solved", "Not Solved"]
+    assert armazenamento.estatisticas()["nao_comprovados"] == 4
+
+
+# A configuração do solver (menos o log) faz parte da chave
+def test_chave_inclui_configuracao_do_solver():
+    argumentos = ([60, 100, 120], [10, 20, 30], 50)
+    chave = resolver_problema_mochila.chave_cache(*argumentos)
+    with solver.usando_solver(mensagens=True):
+        assert resolver_problema_mochila.chave_cache(*argumentos) == chave
+    for ajuste in ({"limite_tempo": 1}, {"gap_relativo": 0.01}, {"threads": 2}, {"limite_denso": 0}):
+        with solver.usando_solver(**ajuste):
+            assert resolver_problema_mochila.chave_cache(*argumentos) != chave
+    assert resolver_problema_mochila.chave_cache(*argumentos) == chave
+
+
+# Inteiros acima de 2**53 entram na chave sem perder precisão (e continuam iguais aos floats equivalentes)
+def test_inteiros_grandes_exatos():
+    grande = 2 ** 60
+    assert cache.chave_canonica(np.array([grande])) != cache.chave_canonica(np.array([grande + 1]))
+    assert cache.chave_canonica([grande, 1]) != cache.chave_canonica([grande + 1, 1])
+    assert cache.chave_canonica(np.array([grande, 1])) == cache.chave_canonica(np.array([float(grande), 1.0]))
+    assert cache.chave_canonica([1, 2]) == cache.chave_canonica(np.array([1.0, 2.0]))
@@ -0,0 +1,33 @@
+# Testes de src/problema_13_clique_maxima.py: branch-and-bound com bitsets contra o modelo inteiro no CBC
+from itertools import combinations
+import numpy as np
+import pytest
+from src import solver
+from src.problema_13_clique_maxima import resolver_problema_clique
+
+
+# Em grafos aleatórios de várias densidades a clique do bitset é uma clique e tem o tamanho ótimo do modelo inteiro
+def test_bitset_igual_ao_mip():
+    rng = np.random.default_rng(5)
+    for _ in range(30):
+        n, densidade = int(rng.integers(1, 16)), float(rng.uniform(0.1, 0.9))
+        vertices = [f"v{i}" for i in range(n)]
+        arestas = [(u, v) for u, v in combinations(vertices, 2) if rng.random() < densidade]
+        bitset = resolver_problema_clique(vertices, arestas)
+        with solver.usando_solver(limite_denso=0):  # O modelo inteiro vai ao CBC (sem o simplex denso)
+            mip = resolver_problema_clique(vertices, arestas, metodo='mip')
+        assert bitset["status"] == mip["status"] == "Optimal" and bitset["otimo_comprovado"]
+        assert bitset["tamanho_clique"] == round(mip["tamanho_clique"])
+        adjacentes = set(arestas) | {(v, u) for u, v in arestas}
+        assert len(bitset["vertices_clique"]) == bitset["tamanho_clique"]
+        assert all((u, v) in adjacentes for u, v in combinations(bitset["vertices_clique"], 2))
+
+
+# Arestas como listas (como chegam de um arquivo JSON) são aceitas pelos dois métodos
+@pytest.mark.parametrize("metodo", ["bitset", "mip"])
+def test_arestas_em_listas(metodo):
+    vertices = ['A', 'B', 'C', 'D']
+    arestas = [['A', 'B'], ['B', 'C'], ['C', 'D'], ['A', 'C']]
+    resultado = resolver_problema_clique(vertices, arestas, metodo=metodo)
+    assert resultado["status"] == "Optimal"
+    assert round(resultado["tamanho_clique"]) == 3 and sorted(resultado["vertices_clique"]) == ['A', 'B', 'C']
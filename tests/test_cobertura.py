@@ -0,0 +1,35 @@
+# Testes de src/problema_08_cobertura.py: heurística gulosa + lagrangeana contra o modelo inteiro no CBC
+import numpy as np
+from src.problema_08_cobertura import resolver_problema_cobertura
+
+
+# A heurística devolve uma cobertura válida, nunca melhor que o ótimo, com limite inferior válido; quando se
+# declara ótima, empata com o modelo inteiro. Elementos sem subconjunto tornam os dois métodos inviáveis
+def test_heuristica_contra_mip():
+    rng = np.random.default_rng(7)
+    for _ in range(30):
+        elementos = list(range(int(rng.integers(1, 15))))
+        subconjuntos = {f"S{s}": [e for e in elementos if rng.random() < 0.3] for s in range(int(rng.integers(1, 10)))}
+        for e in elementos:
+            if rng.random() < 0.95:  # Quase todo elemento tem algum subconjunto (as instâncias costumam ser viáveis)
+                subconjuntos[f"S{int(rng.integers(len(subconjuntos)))}"].append(e)
+        mip = resolver_problema_cobertura(elementos, subconjuntos)
+        heuristica = resolver_problema_cobertura(elementos, subconjuntos, metodo='heuristico')
+        if mip["status"] == "Infeasible":
+            assert heuristica["status"] == "Infeasible"
+            continue
+        assert mip["status"] == "Optimal"
+        cobertos = {e for nome in heuristica["subconjuntos_escolhidos"] for e in subconjuntos[nome]}
+        assert cobertos >= set(elementos)
+        assert heuristica["total_subconjuntos"] == len(heuristica["subconjuntos_escolhidos"])
+        assert heuristica["limite_inferior"] <= mip["total_subconjuntos"] <= heuristica["total_subconjuntos"]
+        if heuristica["otimo_comprovado"]:
+            assert heuristica["total_subconjuntos"] == mip["total_subconjuntos"]
+
+
+# Elementos repetidos na lista de um subconjunto contam uma vez nos dois métodos
+def test_elementos_repetidos():
+    subconjuntos = {"A": [1, 1, 2], "B": [2, 3, 3], "C": [1, 2, 3, 3]}
+    for metodo in ('mip', 'heuristico'):
+        resultado = resolver_problema_cobertura([1, 2, 3], subconjuntos, metodo=metodo)
+        assert resultado["status"] == "Optimal" and resultado["subconjuntos_escolhidos"] == ["C"]
@@ -0,0 +1,55 @@
+# Testes de src/problema_02_dieta.py: consultas "e se" pela análise de sensibilidade contra o modelo no PuLP
+import numpy as np
+import pulp
+import pytest
+from src import problema_02_dieta
+from src.problema_02_dieta import ConsultasDieta, resolver_problema_dieta
+
+
+# Função auxiliar que resolve a dieta montada no PuLP e devolve o custo total (None se não for ótima)
+def _custo_pulp(matriz, precos, minimos):
+    problema = pulp.LpProblem("Dieta", pulp.LpMinimize)
+    x = [pulp.LpVariable(f"x{j}", 0) for j in range(len(precos))]
+    problema += pulp.lpSum(float(precos[j]) * x[j] for j in range(len(precos)))
+    for i, minimo in enumerate(minimos):
+        problema += pulp.lpSum(float(matriz[i][j]) * x[j] for j in range(len(precos))) >= minimo
+    problema.solve(pulp.PULP_CBC_CMD(msg=False))
+    return pulp.value(problema.objective) if pulp.LpStatus[problema.status] == "Optimal" else None
+
+
+# Dentro e fora das faixas, as consultas dão o mesmo custo que resolver o problema alterado no PuLP
+def test_consultas_iguais_ao_pulp():
+    rng = np.random.default_rng(19)
+    for _ in range(10):
+        m, n = int(rng.integers(1, 4)), int(rng.integers(2, 6))
+        matriz = rng.integers(0, 5, (m, n)).tolist()
+        for linha in matriz:
+            linha[int(rng.integers(n))] += 1  # Toda vitamina aparece em algum ingrediente
+        precos, minimos = rng.integers(1, 50, n).tolist(), rng.integers(1, 30, m).tolist()
+        consultas = ConsultasDieta(matriz, precos, minimos)
+        assert consultas.dados["custo_total"] == pytest.approx(_custo_pulp(matriz, precos, minimos))
+        for _ in range(4):
+            vitamina, novo_minimo = int(rng.integers(m)), float(rng.integers(0, 40))
+            alterados = list(minimos)
+            alterados[vitamina] = novo_minimo
+            resposta = consultas.com_minimo(vitamina, novo_minimo)
+            assert resposta["custo_total"] == pytest.approx(_custo_pulp(matriz, precos, alterados), rel=1e-6, abs=1e-6)
+            assert np.all(np.asarray(matriz) @ np.asarray(resposta["quantidades"]) >= np.asarray(alterados) - 1e-6)
+            ingrediente, novo_preco = int(rng.integers(n)), float(rng.integers(1, 60))
+            alterados = list(precos)
+            alterados[ingrediente] = novo_preco
+            resposta = consultas.com_preco(ingrediente, novo_preco)
+            assert resposta["custo_total"] == pytest.approx(_custo_pulp(matriz, alterados, minimos), rel=1e-6, abs=1e-6)
+
+
+# As consultas usam a análise devolvida por resolver_problema_dieta, sem calcular a sensibilidade de novo
+def test_consultas_reaproveitam_a_analise(monkeypatch):
+    chamadas = []
+    original = problema_02_dieta.sensibilidade
+    monkeypatch.setattr(problema_02_dieta, "sensibilidade", lambda *args: chamadas.append(args) or original(*args))
+    matriz, precos, minimos = [[1, 0, 2, 2, 1, 2], [0, 1, 3, 1, 3, 2]], [35, 30, 60, 50, 27, 22], [9, 19]
+    consultas = ConsultasDieta(matriz, precos, minimos)
+    assert len(chamadas) == 1
+    assert consultas.com_minimo(1, 20)["recalculado"] is False
+    assert len(chamadas) == 1 and consultas.recalculos == 0
+    assert resolver_problema_dieta(matriz, precos, minimos)["direcoes_minimos"] == consultas.dados["direcoes_minimos"]
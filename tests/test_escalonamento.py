@@ -0,0 +1,53 @@
+# Testes de src/problema_07_escalonamento.py: padrões de turno e lote contra o modelo original no PuLP/CBC
+import numpy as np
+import pulp
+import pytest
+from src.problema_07_escalonamento import (resolver_problema_escalonamento, resolver_escalonamento_lote, matriz_padroes,
+                                          DIAS_TRABALHO)
+
+
+# Função auxiliar com o modelo original: quem começa no dia i trabalha DIAS_TRABALHO dias seguidos (ciclo)
+def _total_pulp(demanda):
+    dias = len(demanda)
+    problema = pulp.LpProblem("Escalonamento", pulp.LpMinimize)
+    x = [pulp.LpVariable(f"x{i}", 0, cat='Integer') for i in range(dias)]
+    problema += pulp.lpSum(x)
+    for d in range(dias):
+        problema += pulp.lpSum(x[(d - k) % dias] for k in range(DIAS_TRABALHO)) >= demanda[d]
+    problema.solve(pulp.PULP_CBC_CMD(msg=False))
+    return pulp.value(problema.objective)
+
+
+# O turno padrão e a mesma cobertura escrita como matriz_padroes de um modelo semanal dão o total do modelo original
+def test_padrao_igual_ao_pulp():
+    rng = np.random.default_rng(10)
+    semana = [1] * DIAS_TRABALHO + [0] * (7 - DIAS_TRABALHO)
+    for _ in range(15):
+        demanda = rng.integers(0, 20, 7).tolist()
+        esperado = _total_pulp(demanda)
+        assert resolver_problema_escalonamento(demanda)["total_enfermeiras"] == pytest.approx(esperado)
+        generalizado = resolver_problema_escalonamento(demanda, cobertura=matriz_padroes(7, [semana]))
+        assert generalizado["status"] == "Optimal" and generalizado["total_enfermeiras"] == pytest.approx(esperado)
+
+
+# Com vários modelos de turno num horizonte de duas semanas, a solução atende a demanda de cada dia
+def test_varios_modelos_atendem_a_demanda():
+    rng = np.random.default_rng(100)
+    cobertura = matriz_padroes(14, [[1, 1, 1, 1, 1, 0, 0], [1, 1, 1, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0]])
+    for _ in range(10):
+        demanda = rng.integers(0, 15, 14)
+        resultado = resolver_problema_escalonamento(demanda.tolist(), cobertura=cobertura)
+        quantidades = np.array([resultado["inicio_enfermeiras"][j] for j in range(cobertura.shape[1])])
+        assert resultado["status"] == "Optimal"
+        assert np.all(cobertura @ quantidades >= demanda - 1e-9)
+
+
+# O lote em processos devolve, para cada ala, o mesmo total da chamada direta
+def test_lote_igual_as_chamadas_diretas():
+    rng = np.random.default_rng(1000)
+    demandas = {f"ala{i}": rng.integers(0, 20, 7).tolist() for i in range(5)}
+    demandas["repetida"] = demandas["ala0"]
+    resultados = resolver_escalonamento_lote(demandas, processos=2)
+    for nome, demanda in demandas.items():
+        assert resultados[nome]["total_enfermeiras"] == resolver_problema_escalonamento(demanda)["total_enfermeiras"]
+    assert resultados["repetida"] is not resultados["ala0"]
@@ -0,0 +1,56 @@
+# Testes de src/problema_11_facilidades.py: modelo em fluxo e heurística lagrangeana contra o modelo inteiro
+import numpy as np
+import pulp
+import pytest
+from src.problema_11_facilidades import resolver_problema_facilidades
+
+
+# Função auxiliar que resolve o modelo original das facilidades montado no PuLP: o objetivo soma custo fixo e custo
+# de atendimento sobre os pares local x cliente (o custo fixo de um local aberto entra uma vez por cliente)
+def _custo_pulp(fixos, matriz):
+    locais, clientes = range(matriz.shape[0]), range(matriz.shape[1])
+    problema = pulp.LpProblem("Facilidades", pulp.LpMinimize)
+    y = {l: pulp.LpVariable(f"y_{l}", cat='Binary') for l in locais}
+    x = {(l, c): pulp.LpVariable(f"x_{l}_{c}", cat='Binary') for l in locais for c in clientes}
+    problema += pulp.lpSum(fixos[l] * y[l] + matriz[l, c] * x[l, c] for l in locais for c in clientes)
+    for c in clientes:
+        problema += pulp.lpSum(x[l, c] for l in locais) == 1
+    for l in locais:
+        for c in clientes:
+            problema += x[l, c] <= y[l]
+    problema.solve(pulp.PULP_CBC_CMD(msg=False))
+    assert pulp.LpStatus[problema.status] == "Optimal"
+    return pulp.value(problema.objective)
+
+
+# Função auxiliar que sorteia uma instância (custos inteiros)
+def _instancia(rng):
+    locais, clientes = int(rng.integers(1, 6)), int(rng.integers(1, 8))
+    return rng.integers(0, 60, locais).astype(float), rng.integers(0, 40, (locais, clientes)).astype(float)
+
+
+# O modelo gravado em fluxo chega ao mesmo custo do modelo original no PuLP
+def test_mip_igual_ao_pulp():
+    rng = np.random.default_rng(18)
+    for _ in range(15):
+        fixos, matriz = _instancia(rng)
+        mip = resolver_problema_facilidades(fixos, matriz)
+        assert mip["status"] == "Optimal"
+        assert mip["custo_total"] == pytest.approx(_custo_pulp(fixos, matriz))
+        abertos = mip["locais_abertos"]
+        assert mip["custo_total"] == pytest.approx(matriz.shape[1] * fixos[abertos].sum() + sum(matriz[l, c] for l, c in mip["atendimentos"]))
+
+
+# A heurística usa o mesmo custo total do modelo inteiro: nunca fica abaixo dele e, quando se declara ótima, empata
+def test_heuristica_igual_ao_mip():
+    rng = np.random.default_rng(9)
+    for _ in range(30):
+        fixos, matriz = _instancia(rng)
+        mip = resolver_problema_facilidades(fixos, matriz)
+        heuristica = resolver_problema_facilidades(fixos, matriz, metodo='heuristico')
+        abertos = heuristica["locais_abertos"]
+        assert heuristica["custo_total"] == pytest.approx(matriz.shape[1] * fixos[abertos].sum() + sum(matriz[l, c] for l, c in heuristica["atendimentos"]))
+        assert heuristica["limite_inferior"] <= mip["custo_total"] + 1e-6
+        assert heuristica["custo_total"] >= mip["custo_total"] - 1e-6
+        if heuristica["otimo_comprovado"]:
+            assert heuristica["custo_total"] == pytest.approx(mip["custo_total"])
@@ -0,0 +1,37 @@
+# Testes de src/problema_06_fluxo_maximo.py: Dinic contra o modelo linear no PuLP/CBC
+import numpy as np
+import pytest
+from src import solver
+from src.problema_06_fluxo_maximo import resolver_problema_fluxo_maximo
+
+
+# Função auxiliar que sorteia uma rede (com arcos nos dois sentidos e arcos que voltam para a origem)
+def _rede(rng):
+    n = int(rng.integers(2, 8))
+    capacidades = {}
+    for u in range(n):
+        for v in range(n):
+            if u != v and rng.random() < 0.4:
+                capacidades.setdefault(f"n{u}", {})[f"n{v}"] = int(rng.integers(1, 20))
+    capacidades.setdefault("n0", {})
+    return capacidades, "n0", f"n{n - 1}"
+
+
+# Dinic e o modelo linear chegam ao mesmo fluxo máximo; o fluxo do Dinic é viável e o corte tem a mesma capacidade
+def test_dinic_igual_ao_lp():
+    rng = np.random.default_rng(3)
+    for _ in range(40):
+        capacidades, origem, destino = _rede(rng)
+        dinic = resolver_problema_fluxo_maximo(capacidades, origem, destino)
+        with solver.usando_solver(limite_denso=0):  # O modelo linear vai ao CBC (sem o simplex denso)
+            lp = resolver_problema_fluxo_maximo(capacidades, origem, destino, metodo='lp')
+        assert dinic["status"] == lp["status"] == "Optimal"
+        assert dinic["fluxo_total"] == pytest.approx(lp["fluxo_total"] or 0.0)
+        assert dinic["corte_minimo"]["capacidade"] == pytest.approx(dinic["fluxo_total"])
+        saldo = {}
+        for (u, v), fluxo in dinic["fluxos"].items():
+            assert 0 <= fluxo <= capacidades[u][v]
+            saldo[u] = saldo.get(u, 0) - fluxo
+            saldo[v] = saldo.get(v, 0) + fluxo
+        assert all(valor == 0 for no, valor in saldo.items() if no not in (origem, destino))
+        assert saldo.get(destino, 0) == pytest.approx(dinic["fluxo_total"])
@@ -0,0 +1,24 @@
+# Testes de src/problema_12_frequencia.py: limites heurísticos (DSATUR, tabu, clique) contra o modelo inteiro completo
+from itertools import combinations
+import numpy as np
+from src import solver
+from src.problema_12_frequencia import resolver_problema_frequencia
+
+
+# Com o pré-processamento o número de cores (ou a inviabilidade) é o mesmo do modelo inteiro completo no CBC
+def test_pre_processamento_igual_ao_mip():
+    rng = np.random.default_rng(6)
+    for _ in range(20):
+        n, densidade = int(rng.integers(1, 8)), float(rng.uniform(0.2, 0.9))
+        vertices = [f"v{i}" for i in range(n)]
+        arestas = [(u, v) for u, v in combinations(vertices, 2) if rng.random() < densidade]
+        cores = [f"c{i}" for i in range(int(rng.integers(1, n + 1)))]
+        rapido = resolver_problema_frequencia(vertices, arestas, cores, iteracoes_tabu=200, tempo_clique=0.5)
+        with solver.usando_solver(limite_denso=0):  # O modelo inteiro vai ao CBC (sem o simplex denso)
+            completo = resolver_problema_frequencia(vertices, arestas, cores, pre_processar=False)
+        assert rapido["status"] == completo["status"]
+        if completo["status"] != "Optimal":
+            continue
+        assert rapido["total_cores"] == round(completo["total_cores"])
+        assert len(set(rapido["cores_usadas"].values())) == rapido["total_cores"]
+        assert all(rapido["cores_usadas"][u] != rapido["cores_usadas"][v] for u, v in arestas)
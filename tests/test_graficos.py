@@ -0,0 +1,90 @@
+# Testes de src/graficos.py
+import inspect
+import multiprocessing
+import os
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+import matplotlib.pyplot as plt
+import networkx as nx
+import pytest
+from src import graficos, registro
+from src.problema_09_mochila import plotar_mochila
+from src.problema_13_clique_maxima import plotar_clique
+
+
+# Restaura os executores e a pasta padrão depois dos testes que mudam a configuração do modo 'arquivo'
+@pytest.fixture
+def modo_arquivo(tmp_path):
+    yield tmp_path
+    graficos.aguardar_graficos()
+    graficos.configurar_graficos(modo="janela", diretorio="graficos", processos=False)
+
+
+# Processo filho: troca o modo dos gráficos (espera as figuras pendentes do próprio processo)
+def _configurar_no_filho(fila):
+    graficos.configurar_graficos(modo="desligado")
+    fila.put(len(graficos._pendentes))
+
+
+# Um fork com uma figura ainda pendente no pai não pode travar o filho esperando por ela
+def test_fork_com_figura_pendente_nao_trava():
+    pendente = Future()  # Nunca termina: simula uma figura ainda sendo salva
+    with graficos._trava:
+        graficos._pendentes.append(pendente)
+    try:
+        contexto = multiprocessing.get_context("fork")
+        fila = contexto.Queue()
+        processo = contexto.Process(target=_configurar_no_filho, args=(fila,))
+        processo.start()
+        processo.join(timeout=10)
+        travou = processo.is_alive()
+        if travou:
+            processo.kill()
+        assert not travou
+        assert fila.get(timeout=1) == 0
+    finally:
+        with graficos._trava:
+            graficos._pendentes.remove(pendente)
+
+
+# No modo 'arquivo' cada exibir_figura grava um arquivo numerado (em ordem, sem repetir) e aguardar_graficos espera
+# todos; com processos=True as figuras serializáveis vão para processos e as demais (grafos do networkx) para threads
+@pytest.mark.parametrize("processos", [False, True])
+def test_modo_arquivo(modo_arquivo, processos):
+    graficos.configurar_graficos(modo="arquivo", diretorio=str(modo_arquivo), formato="png", processos=processos, trabalhadores=2)
+    titulos = []
+    for k in range(3):
+        plotar_mochila([60, 100, 120], [10, 20, 30], [1, 2], f"Mochila Ótima {k}")
+        plotar_clique(['A', 'B', 'C'], [('A', 'B'), ('B', 'C')], ['A', 'B'], f"Clique {k}")
+        titulos += [f"mochila_otima_{k}", f"clique_{k}"]
+    assert plt.get_fignums() == []  # As figuras saem do pyplot assim que são enviadas
+    assert isinstance(graficos._executor, ProcessPoolExecutor) == processos  # As barras foram para processos
+    caminhos = graficos.aguardar_graficos(timeout=60)
+    assert len(caminhos) == len(titulos) and graficos._pendentes == []
+    assert sorted(os.listdir(modo_arquivo)) == [os.path.basename(c) for c in caminhos]
+    numeros = [int(re.match(r"(\d{5})_", os.path.basename(c)).group(1)) for c in caminhos]
+    assert numeros == list(range(numeros[0], numeros[0] + len(titulos)))
+    for caminho, titulo in zip(caminhos, titulos):
+        assert caminho.endswith(f"_{titulo}.png") and os.path.getsize(caminho) > 0
+        with open(caminho, "rb") as arquivo:
+            assert arquivo.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+# No modo 'desligado' as funções plotar_* de todos os problemas retornam sem criar figuras (nem montar grafos)
+def test_modo_desligado_nao_cria_figuras(monkeypatch):
+    graficos.configurar_graficos(modo="desligado")
+
+    def proibido(*args, **kwargs):
+        raise AssertionError("figura criada com os gráficos desligados")
+
+    for nome in ("figure", "subplots", "bar", "imshow"):
+        monkeypatch.setattr(plt, nome, proibido)
+    monkeypatch.setattr(nx, "draw", proibido)
+    chamadas = 0
+    for id_problema in registro.PROBLEMAS:
+        modulo = registro.carregar_modulo(id_problema)
+        for nome, funcao in inspect.getmembers(modulo, inspect.isfunction):
+            if nome.startswith("plotar_") and funcao.__module__ == modulo.__name__:
+                assert funcao(*[None] * len(inspect.signature(funcao).parameters)) is None
+                chamadas += 1
+    assert chamadas >= 13 and plt.get_fignums() == []
@@ -0,0 +1,111 @@
+# Testes de src/lote.py
+import os
+import threading
+import time
+from concurrent.futures import Future
+from itertools import combinations
+import numpy as np
+import pytest
+from src import lote, graficos
+
+
+# Instâncias pequenas da mochila (problema 9)
+INSTANCIAS = [[[60, 100, 120], [10, 20, 30], capacidade] for capacidade in (30, 40, 50)]
+
+# Instâncias pequenas da clique máxima (problema 13), com o modelo inteiro no CBC (a maior clique tem 3 vértices)
+CLIQUES = [{"args": [['A', 'B', 'C', 'D'], [['A', 'B'], ['B', 'C'], ['C', 'D'], ['A', 'C']]], "kwargs": {"metodo": "mip"}}] * 3
+
+
+# Os resultados saem na ordem de entrada e iguais aos da chamada direta
+def test_lote_resolve_na_ordem():
+    from src.problema_09_mochila import resolver_problema_mochila
+    registros = list(lote.resolver_lote("9", INSTANCIAS, processos=2, usar_cache=False))
+    assert [r["indice"] for r in registros] == [0, 1, 2]
+    assert all(r["situacao"] == "ok" for r in registros)
+    for registro_instancia, instancia in zip(registros, INSTANCIAS):
+        assert registro_instancia["resultado"]["valor_total"] == resolver_problema_mochila(*instancia)["valor_total"]
+
+
+# Figuras pendentes no processo principal (modo 'arquivo') não podem travar os trabalhadores
+def test_lote_com_figura_pendente_no_pai():
+    pendente = Future()
+    with graficos._trava:
+        graficos._pendentes.append(pendente)
+    try:
+        registros = list(lote.resolver_lote("9", INSTANCIAS, processos=2, timeout=20, usar_cache=False))
+    finally:
+        with graficos._trava:
+            graficos._pendentes.remove(pendente)
+    assert [r["situacao"] for r in registros] == ["ok", "ok", "ok"]
+
+
+# Função auxiliar que lista os processos do CBC vivos que não são do processo dos testes (pool do pai)
+def _cbc_alheios():
+    encontrados = set()
+    for nome in os.listdir("/proc"):
+        if not nome.isdigit():
+            continue
+        try:
+            with open(f"/proc/{nome}/cmdline", "rb") as arquivo:
+                comando = arquivo.read().split(b"\0")[0]
+            with open(f"/proc/{nome}/stat") as arquivo:
+                campos = arquivo.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if os.path.basename(comando).lower().startswith(b"cbc") and campos[0] != "Z" and int(campos[1]) != os.getpid():
+            encontrados.add(int(nome))
+    return encontrados
+
+
+# Grafo em que o modelo inteiro da clique máxima leva muito mais que alguns segundos no CBC
+def _clique_demorada():
+    rng = np.random.default_rng(0)
+    vertices = list(range(150))
+    arestas = [(i, j) for i, j in combinations(vertices, 2) if rng.random() < 0.5]
+    return {"id": "demorada", "args": [vertices, arestas], "kwargs": {"metodo": "mip"}}
+
+
+# O erro de uma instância fica no registro dela e não impede as demais; "id" de um dicionário só de nomeados
+# identifica a instância e não vai para o resolvedor
+def test_lote_erro_por_instancia():
+    instancias = [INSTANCIAS[0], {"id": "ruim", "kwargs": {"inexistente": 1}},
+                  {"id": "nomeada", "valores": [60, 100], "pesos": [10, 20], "capacidade": 25}, INSTANCIAS[1]]
+    registros = list(lote.resolver_lote("9", instancias, processos=2, usar_cache=False))
+    assert [r["situacao"] for r in registros] == ["ok", "erro", "ok", "ok"]
+    assert registros[1]["id"] == "ruim" and registros[1]["erro"].startswith("TypeError") and registros[1]["resultado"] is None
+    assert registros[2]["id"] == "nomeada" and registros[2]["resultado"]["valor_total"] == 100
+
+
+# A instância que passa do tempo limite tem o trabalhador e o CBC encerrados; o substituto resolve as seguintes
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="lista os processos do CBC por /proc")
+def test_lote_timeout_substitui_trabalhador():
+    antes = _cbc_alheios()
+    vistos, parar = set(), threading.Event()
+
+    # Anota os processos do CBC que aparecem enquanto o lote roda
+    def observar():
+        while not parar.wait(0.2):
+            vistos.update(_cbc_alheios() - antes)
+
+    observador = threading.Thread(target=observar)
+    observador.start()
+    try:
+        registros = list(lote.resolver_lote("13", [_clique_demorada()] + CLIQUES, processos=1, timeout=4, usar_cache=False))
+    finally:
+        parar.set()
+        observador.join()
+    assert [r["situacao"] for r in registros] == ["timeout", "ok", "ok", "ok"]
+    assert registros[0]["id"] == "demorada" and registros[0]["tempo"] == 4
+    assert all(r["resultado"]["tamanho_clique"] == 3 for r in registros[1:])
+    assert vistos  # O CBC da instância demorada estava rodando quando o prazo acabou
+    time.sleep(0.5)
+    assert not (_cbc_alheios() & vistos)  # Nenhum CBC do trabalhador encerrado (nem dos substitutos) continua rodando
+
+
+# Com ordem='conclusao' as instâncias rápidas saem antes da que ficou presa até o tempo limite
+def test_lote_ordem_conclusao():
+    registros = list(lote.resolver_lote("13", [_clique_demorada()] + CLIQUES, processos=2, timeout=4, ordem='conclusao', usar_cache=False))
+    assert [r["indice"] for r in registros] == [1, 2, 3, 0]
+    assert [r["situacao"] for r in registros] == ["ok", "ok", "ok", "timeout"]
+    with pytest.raises(ValueError):
+        list(lote.resolver_lote("13", CLIQUES, ordem='aleatoria'))
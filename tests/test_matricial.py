@@ -0,0 +1,53 @@
+# Testes de src/matricial.py: modelo em matrizes contra o mesmo modelo montado no PuLP
+import numpy as np
+import pulp
+import pytest
+from src import matricial, solver
+
+
+# Função auxiliar que resolve c·x, A x (sentidos) b, 0 <= x <= superiores no PuLP (inteiras: índices)
+def _resolver_pulp(c, A, b, sentidos, superiores, inteiras=(), maximizar=False):
+    problema = pulp.LpProblem("Matricial", pulp.LpMaximize if maximizar else pulp.LpMinimize)
+    x = [pulp.LpVariable(f"x{j}", 0, superiores[j], cat='Integer' if j in inteiras else 'Continuous') for j in range(len(c))]
+    problema += pulp.lpSum(float(c[j]) * x[j] for j in range(len(c)))
+    for i, sentido in enumerate(sentidos):
+        expressao = pulp.lpSum(float(A[i, j]) * x[j] for j in range(len(c)))
+        problema += (expressao <= b[i]) if sentido == '<=' else (expressao >= b[i]) if sentido == '>=' else (expressao == b[i])
+    problema.solve(pulp.PULP_CBC_CMD(msg=False))
+    return pulp.LpStatus[problema.status], pulp.value(problema.objective)
+
+
+# Modelos aleatórios (LP e inteiros) dão o mesmo status e objetivo que o PuLP, pelo CBC e pelo caminho denso
+@pytest.mark.parametrize("limite_denso", [0, 50])
+def test_igual_ao_pulp(limite_denso):
+    rng = np.random.default_rng(17)
+    with solver.usando_solver(limite_denso=limite_denso):
+        for _ in range(20):
+            m, n = int(rng.integers(1, 5)), int(rng.integers(1, 6))
+            c, A = rng.integers(-9, 10, n).astype(float), rng.integers(-5, 9, (m, n)).astype(float)
+            b, superiores = rng.integers(0, 30, m).astype(float), rng.integers(1, 10, n).astype(float)
+            sentidos = [str(s) for s in rng.choice(['<=', '>=', '='], m)]
+            inteiras = [j for j in range(n) if rng.random() < 0.5]
+            r = matricial.resolver_matricial(c, A, b, sentidos, limites_superiores=superiores, inteiras=inteiras)
+            status, objetivo = _resolver_pulp(c, A, b, sentidos, superiores, inteiras)
+            assert r["status"] == status
+            if status == "Optimal":
+                assert r["objetivo"] == pytest.approx(objetivo or 0.0, abs=1e-6)
+
+
+# Sem restrições (m == 0) o modelo é resolvido direto dos limites e do sinal dos custos, sem chamar o CBC
+@pytest.mark.parametrize("limite_denso", [0, 50])
+def test_sem_restricoes(limite_denso):
+    with solver.usando_solver(limite_denso=limite_denso):
+        r = matricial.resolver_matricial([2.0, -1.0, 0.0], limites_inferiores=[1.0, 0.0, -3.0], limites_superiores=[5.0, 4.5, 2.0], inteiras=[1])
+        assert r["status"] == "Optimal" and r["otimo_comprovado"]
+        assert r["x"].tolist() == [1.0, 4.0, 0.0] and r["objetivo"] == -2.0
+        assert matricial.resolver_matricial([1.0, 1.0], maximizar=True, limites_superiores=[3.0, 4.0])["objetivo"] == 7.0
+        assert matricial.resolver_matricial([-1.0])["status"] == "Unbounded"
+        assert matricial.resolver_matricial([1.0], limites_inferiores=3.0, limites_superiores=1.0)["status"] == "Infeasible"
+        assert matricial.resolver_matricial([1.0], limites_inferiores=0.2, limites_superiores=0.8, inteiras=[0])["status"] == "Infeasible"
+
+    colunas = [{"custos": [-1.0, 1.0], "inicios": [0, 0, 0], "linhas": [], "valores": [], "superiores": 2.0, "inteiras": True},
+               {"custos": [3.0], "inicios": [0, 0], "linhas": [], "valores": [], "inferiores": 1.5}]
+    r = matricial.resolver_por_colunas([('<=', 0)], np.zeros(0), iter(colunas))
+    assert r["status"] == "Optimal" and r["x"].tolist() == [2.0, 0.0, 1.5] and r["objetivo"] == 2.5
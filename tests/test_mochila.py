@@ -0,0 +1,35 @@
+# Testes de src/problema_09_mochila.py: programação dinâmica e branch-and-bound contra o modelo inteiro no CBC
+import numpy as np
+import pytest
+from src import solver
+from src.problema_09_mochila import resolver_problema_mochila
+
+
+# Com pesos inteiros (incluindo zero), os três métodos chegam ao mesmo valor e respeitam a capacidade
+def test_pd_e_bb_iguais_ao_mip():
+    rng = np.random.default_rng(4)
+    for _ in range(40):
+        n = int(rng.integers(1, 12))
+        valores, pesos = rng.integers(0, 50, n).tolist(), rng.integers(0, 30, n).tolist()
+        capacidade = int(rng.integers(0, 100))
+        with solver.usando_solver(limite_denso=0):  # O modelo inteiro vai ao CBC (sem o simplex denso)
+            mip = resolver_problema_mochila(valores, pesos, capacidade, metodo='mip')
+        for metodo in ('pd', 'bb'):
+            resultado = resolver_problema_mochila(valores, pesos, capacidade, metodo=metodo)
+            assert resultado["status"] == mip["status"] == "Optimal"
+            assert resultado["valor_total"] == pytest.approx(mip["valor_total"])
+            assert resultado["peso_total"] <= capacidade
+
+
+# Com pesos fracionários o branch-and-bound (usado por 'auto') continua igual ao modelo inteiro
+def test_bb_pesos_fracionarios():
+    rng = np.random.default_rng(40)
+    for _ in range(30):
+        n = int(rng.integers(1, 15))
+        valores, pesos = rng.uniform(0, 50, n).tolist(), rng.uniform(0.5, 30, n).tolist()
+        capacidade = float(rng.uniform(0, 80))
+        with solver.usando_solver(limite_denso=0):
+            mip = resolver_problema_mochila(valores, pesos, capacidade, metodo='mip')
+        bb = resolver_problema_mochila(valores, pesos, capacidade)
+        assert bb["valor_total"] == pytest.approx(mip["valor_total"], rel=1e-6)
+        assert bb["peso_total"] <= capacidade + 1e-9
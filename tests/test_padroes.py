@@ -0,0 +1,85 @@
+# Testes de src/problema_10_padroes.py: programação dinâmica e geração de colunas contra o modelo inteiro
+import time
+import numpy as np
+import pulp
+import pytest
+from src import instrumentacao
+from src.problema_10_padroes import (resolver_problema_padroes, resolver_corte_bobinas, _memoria_pd, _reduzir_itens,
+                                     LIMITE_BYTES_PD)
+
+
+# A programação dinâmica e o modelo inteiro chegam ao mesmo lucro em instâncias aleatórias
+def test_pd_igual_ao_mip():
+    rng = np.random.default_rng(22)
+    for _ in range(25):
+        n = int(rng.integers(1, 6))
+        consumos = {f"p{i}": int(c) for i, c in enumerate(rng.integers(1, 40, n))}
+        lucros = {f"p{i}": float(l) for i, l in enumerate(rng.integers(0, 30, n))}
+        material = int(rng.integers(0, 500))
+        pd = resolver_problema_padroes(consumos, lucros, material, metodo='pd')
+        mip = resolver_problema_padroes(consumos, lucros, material, metodo='mip')
+        assert pd["status"] == mip["status"] == "Optimal"
+        assert pd["lucro_total"] == pytest.approx(mip["lucro_total"] or 0.0)
+        assert sum(consumos[p] * q for p, q in pd["quantidade_produtos"].items()) <= material
+
+
+# Capacidade enorme com pesos grandes: a tabela passaria do limite de memória, então 'auto' usa o modelo inteiro
+def test_capacidade_enorme_usa_mip():
+    consumos, lucros = {"a": 9001, "b": 9007}, {"a": 10.0, "b": 10.01}
+    itens = _reduzir_itens(np.array([10.0, 10.01]), np.array([9001, 9007]), 10**9)
+    assert _memoria_pd(itens) > LIMITE_BYTES_PD
+    eventos = []
+    with instrumentacao.observando(eventos.append):
+        inicio = time.perf_counter()
+        resultado = resolver_problema_padroes(consumos, lucros, 10**9)
+        assert time.perf_counter() - inicio < 10
+    assert eventos[-1]["metodo"] == "mip"
+    assert resultado["status"] == "Optimal"
+    assert 9001 * resultado["quantidade_produtos"]["a"] + 9007 * resultado["quantidade_produtos"]["b"] <= 10**9
+
+
+# Corte de bobinas: atende a demanda, respeita a largura da bobina e não fica abaixo do limite inferior
+@pytest.mark.parametrize("metodo", ["arredondamento", "mip"])
+def test_corte_bobinas(metodo):
+    larguras, demandas = [45, 36, 31, 14], [97, 610, 395, 211]
+    r = resolver_corte_bobinas(larguras, demandas, 100, metodo=metodo)
+    cortadas = np.array(r["padroes"]).T @ np.array(r["repeticoes"])
+    assert np.all(cortadas >= demandas)
+    assert all(np.dot(padrao, larguras) <= 100 for padrao in r["padroes"])
+    assert r["total_bobinas"] >= r["limite_inferior"] == 453
+
+
+# Função auxiliar com o modelo de corte de bobinas de Kantorovich (bobina k cortada ou não, peças de cada largura em
+# cada bobina), resolvido no CBC: o menor número de bobinas, sem geração de colunas
+def _bobinas_pulp(larguras, demandas, largura_bobina):
+    bobinas = range(int(sum(demandas)))  # Uma bobina por peça sempre basta
+    problema = pulp.LpProblem("Bobinas", pulp.LpMinimize)
+    usada = [pulp.LpVariable(f"y{k}", cat='Binary') for k in bobinas]
+    pecas = {(i, k): pulp.LpVariable(f"x{i}_{k}", 0, int(demandas[i]), cat='Integer') for i in range(len(larguras)) for k in bobinas}
+    problema += pulp.lpSum(usada)
+    for i, demanda in enumerate(demandas):
+        problema += pulp.lpSum(pecas[i, k] for k in bobinas) >= demanda
+    for k in bobinas:
+        problema += pulp.lpSum(larguras[i] * pecas[i, k] for i in range(len(larguras))) <= largura_bobina * usada[k]
+        if k > 0:
+            problema += usada[k] <= usada[k - 1]  # Quebra a simetria entre bobinas
+    problema.solve(pulp.PULP_CBC_CMD(msg=False))
+    return round(pulp.value(problema.objective))
+
+
+# Em instâncias pequenas, o ótimo do modelo de Kantorovich fica entre o limite inferior e o número de bobinas da
+# geração de colunas, e coincide com ele quando o resultado se diz ótimo
+@pytest.mark.parametrize("metodo", ["arredondamento", "mip"])
+def test_corte_bobinas_contra_pulp(metodo):
+    rng = np.random.default_rng(220)
+    for _ in range(10):
+        largura_bobina = int(rng.integers(10, 30))
+        larguras = rng.integers(2, largura_bobina + 1, int(rng.integers(1, 4))).tolist()
+        demandas = rng.integers(1, 5, len(larguras)).tolist()
+        r = resolver_corte_bobinas(larguras, demandas, largura_bobina, metodo=metodo)
+        otimo = _bobinas_pulp(larguras, demandas, largura_bobina)
+        assert r["limite_inferior"] <= otimo <= r["total_bobinas"]
+        if r["status"] == "Optimal":
+            assert r["total_bobinas"] == otimo
+        cortadas = np.array(r["padroes"]).T @ np.array(r["repeticoes"])
+        assert np.all(cortadas >= demandas)
@@ -0,0 +1,65 @@
+# Testes de src/problema_03_plantio.py: modelo vetorizado contra o modelo original montado no PuLP
+import numpy as np
+import pulp
+import pytest
+from src import solver
+from src.problema_03_plantio import resolver_problema_plantio, resolver_cenarios_plantio
+
+
+# Função auxiliar com o modelo original (proporções iguais em todas as fazendas), para qualquer número de culturas
+def _lucro_pulp(areas, aguas, maximos, consumos, lucros):
+    problema = pulp.LpProblem("Plantio", pulp.LpMaximize)
+    proporcoes = [pulp.LpVariable(f"p{i}", lowBound=0) for i in range(len(lucros))]
+    total = sum(areas)
+    problema += pulp.lpSum(lucros[i] * proporcoes[i] * (area / total) for area in areas for i in range(len(lucros)))
+    for area, agua in zip(areas, aguas):
+        problema += pulp.lpSum(p * (area / total) for p in proporcoes) <= area
+        problema += pulp.lpSum(p * consumos[i] * (area / total) for i, p in enumerate(proporcoes)) <= agua
+    for i, p in enumerate(proporcoes):
+        problema += p * total <= maximos[i]
+    problema.solve(pulp.PULP_CBC_CMD(msg=False))
+    return pulp.value(problema.objective)
+
+
+# Função auxiliar que sorteia fazendas e culturas
+def _instancia(rng):
+    fazendas, culturas = int(rng.integers(1, 6)), int(rng.integers(1, 5))
+    return (rng.integers(100, 1000, fazendas).tolist(), rng.integers(100, 3000, fazendas).tolist(),
+            rng.integers(100, 2000, culturas).tolist(), rng.integers(1, 8, culturas).tolist(), rng.integers(1, 20, culturas).tolist())
+
+
+# O modelo em matrizes dá o lucro do modelo original, pelo CBC e pelo simplex denso
+@pytest.mark.parametrize("limite_denso", [0, 50])
+def test_proporcoes_igual_ao_pulp(limite_denso):
+    rng = np.random.default_rng(20)
+    with solver.usando_solver(limite_denso=limite_denso):
+        for _ in range(15):
+            dados = _instancia(rng)
+            culturas = [f"cultura{i}" for i in range(len(dados[2]))]
+            resultado = resolver_problema_plantio(*dados, culturas=culturas)
+            assert resultado["status"] == "Optimal"
+            assert resultado["lucro_total"] == pytest.approx(_lucro_pulp(*dados), rel=1e-6)
+
+
+# A área livre por fazenda nunca lucra menos que as proporções fixas e respeita área, água e máximos
+def test_por_fazenda_respeita_limites():
+    rng = np.random.default_rng(200)
+    for _ in range(15):
+        areas, aguas, maximos, consumos, lucros = dados = _instancia(rng)
+        culturas = [f"cultura{i}" for i in range(len(maximos))]
+        livre = resolver_problema_plantio(*dados, culturas=culturas, modelo='por_fazenda')
+        fixas = resolver_problema_plantio(*dados, culturas=culturas)
+        assert livre["lucro_total"] >= fixas["lucro_total"] - 1e-6
+        plantadas = livre["areas"]
+        assert np.all(plantadas.sum(axis=1) <= np.array(areas) + 1e-6)
+        assert np.all(plantadas @ np.array(consumos) <= np.array(aguas) + 1e-6)
+        assert np.all(plantadas.sum(axis=0) <= np.array(maximos) + 1e-6)
+
+
+# Os cenários de água resolvidos em processos dão o mesmo lucro das chamadas diretas
+def test_cenarios_iguais_as_chamadas_diretas():
+    areas, maximos, consumos, lucros = [400, 650, 350], [660, 880, 400], [5.5, 4, 3.5], [5000, 4000, 1800]
+    cenarios = [[1800, 2200, 950], [900, 1100, 500], [3600, 4400, 1900]]
+    resultados = resolver_cenarios_plantio(areas, cenarios, maximos, consumos, lucros, processos=2)
+    for agua, resultado in zip(cenarios, resultados):
+        assert resultado["lucro_total"] == pytest.approx(resolver_problema_plantio(areas, agua, maximos, consumos, lucros)["lucro_total"])
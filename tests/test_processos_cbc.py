@@ -0,0 +1,125 @@
+# Testes de src/processos_cbc.py: modelos resolvidos pelos processos iniciados de antemão contra o CBC iniciado na hora
+import multiprocessing
+import threading
+import numpy as np
+import pulp
+import pytest
+from src import matricial, processos_cbc, solver
+
+
+# Cada teste parte do pool ligado com a configuração padrão e encerra os processos que abriu
+@pytest.fixture(autouse=True)
+def pool_padrao(monkeypatch):
+    monkeypatch.setattr(processos_cbc, "_configuracao", {"ativo": True, "processos": None})
+    processos_cbc.encerrar_processos()
+    yield
+    processos_cbc.encerrar_processos()
+
+
+# Função auxiliar que sorteia um modelo em matrizes (variáveis limitadas, parte delas inteiras)
+def _modelo(rng):
+    m, n = int(rng.integers(1, 6)), int(rng.integers(1, 8))
+    return {"c": rng.integers(-9, 10, n).astype(float), "A": rng.integers(-5, 9, (m, n)).astype(float),
+            "b": rng.integers(0, 30, m).astype(float), "sentidos": [str(s) for s in rng.choice(['<=', '>=', '='], m)],
+            "limites_superiores": rng.integers(1, 10, n).astype(float),
+            "inteiras": [j for j in range(n) if rng.random() < 0.5]}
+
+
+# Função auxiliar que resolve um modelo em matrizes no CBC (sem o simplex denso) e devolve (status, objetivo)
+def _resolver(modelo):
+    with solver.usando_solver(limite_denso=0):
+        resultado = matricial.resolver_matricial(**modelo)
+    return resultado["status"], resultado["objetivo"] if resultado["status"] == "Optimal" else None
+
+
+# Função auxiliar que monta o mesmo modelo no PuLP e o resolve com solver.resolver_modelo
+def _resolver_pulp(modelo):
+    c, A, b = modelo["c"], modelo["A"], modelo["b"]
+    problema = pulp.LpProblem("Pool", pulp.LpMinimize)
+    x = [pulp.LpVariable(f"x{j}", 0, float(modelo["limites_superiores"][j]),
+                         cat='Integer' if j in modelo["inteiras"] else 'Continuous') for j in range(c.size)]
+    problema += pulp.lpSum(float(c[j]) * x[j] for j in range(c.size))
+    for i, sentido in enumerate(modelo["sentidos"]):
+        expressao = pulp.lpSum(float(A[i, j]) * x[j] for j in range(c.size))
+        problema += (expressao <= b[i]) if sentido == '<=' else (expressao >= b[i]) if sentido == '>=' else (expressao == b[i])
+    with solver.usando_solver(limite_denso=0):
+        situacao = solver.resolver_modelo(problema)
+    return situacao["status"], pulp.value(problema.objective) if situacao["status"] == "Optimal" else None
+
+
+# Com o pool ligado, modelos em matrizes e do PuLP dão o mesmo status e objetivo que com o CBC iniciado na hora
+def test_pool_igual_ao_cbc_direto():
+    rng = np.random.default_rng(24)
+    modelos = [_modelo(rng) for _ in range(25)]
+    processos_cbc.configurar_processos(ativo=False)
+    esperados = [_resolver(modelo) for modelo in modelos]
+    processos_cbc.configurar_processos(ativo=True)
+    for modelo, (status, objetivo) in zip(modelos, esperados):
+        for obtido in (_resolver(modelo), _resolver_pulp(modelo)):
+            assert obtido[0] == status
+            if status == "Optimal":
+                assert (obtido[1] or 0.0) == pytest.approx(objetivo or 0.0, abs=1e-6)
+    estatisticas = processos_cbc.obter_pool().estatisticas()
+    assert estatisticas["modelos"] == 2 * len(modelos)  # Cada modelo foi para um processo do pool
+    assert estatisticas["iniciados"] >= estatisticas["modelos"]  # Um processo novo por modelo
+
+
+# Com mais threads que processos, cada modelo espera um processo livre e recebe a própria solução
+def test_threads_com_pool_pequeno():
+    processos_cbc.configurar_processos(processos=2)
+    rng = np.random.default_rng(240)
+    modelos = [_modelo(rng) for _ in range(12)]
+    processos_cbc.configurar_processos(ativo=False)
+    esperados = [_resolver(modelo) for modelo in modelos]
+    processos_cbc.configurar_processos(ativo=True)
+    obtidos = [None] * len(modelos)
+
+    def resolver(indice):
+        obtidos[indice] = _resolver(modelos[indice])
+
+    threads = [threading.Thread(target=resolver, args=(indice,)) for indice in range(len(modelos))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for (status, objetivo), obtido in zip(esperados, obtidos):
+        assert obtido[0] == status
+        if status == "Optimal":
+            assert (obtido[1] or 0.0) == pytest.approx(objetivo or 0.0, abs=1e-6)
+    estatisticas = processos_cbc.obter_pool().estatisticas()
+    assert estatisticas["modelos"] == len(modelos)
+    assert estatisticas["abertos"] <= 2
+
+
+# Um processo filho (fork) com o pool do pai já iniciado abre os próprios processos e resolve os mesmos modelos
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="sem fork nesta plataforma")
+def test_fork_usa_pool_proprio():
+    rng = np.random.default_rng(2400)
+    modelos = [_modelo(rng) for _ in range(5)]
+    esperados = [_resolver(modelo) for modelo in modelos]  # Deixa processos prontos no pool do pai
+    anteriores = processos_cbc.obter_pool().estatisticas()  # O filho herda os contadores do pai
+    fila = multiprocessing.get_context("fork").Queue()
+
+    def filho():
+        fila.put(([_resolver(modelo) for modelo in modelos], processos_cbc.obter_pool().estatisticas()))
+
+    processo = multiprocessing.get_context("fork").Process(target=filho)
+    processo.start()
+    obtidos, estatisticas = fila.get(timeout=60)
+    processo.join(timeout=60)
+    assert processo.exitcode == 0
+    assert estatisticas["modelos"] - anteriores["modelos"] == len(modelos)
+    assert estatisticas["iniciados"] - anteriores["iniciados"] >= len(modelos)  # Processos abertos pelo filho
+    for (status, objetivo), obtido in zip(esperados, obtidos):
+        assert obtido[0] == status
+        if status == "Optimal":
+            assert (obtido[1] or 0.0) == pytest.approx(objetivo or 0.0, abs=1e-6)
+    assert _resolver(modelos[0]) == esperados[0]  # O pool do pai continua funcionando depois do fork
+
+
+# O pool desligado não é criado, e o número de processos precisa ser pelo menos 1
+def test_configuracao():
+    processos_cbc.configurar_processos(ativo=False)
+    assert processos_cbc.obter_pool() is None and processos_cbc.diretorio_trabalho() is None
+    with pytest.raises(ValueError):
+        processos_cbc.configurar_processos(processos=0)
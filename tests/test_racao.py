@@ -0,0 +1,58 @@
+# Testes de src/problema_01_racao.py: varredura vetorizada contra o modelo inteiro no PuLP
+import time
+import numpy as np
+import pytest
+from src.problema_01_racao import resolver_problema_racao, varrer_problema_racao
+
+
+# Cada cenário da varredura tem o mesmo lucro do modelo inteiro resolvido no CBC
+def test_varredura_igual_ao_mip():
+    rng = np.random.default_rng(2)
+    parametros = {
+        "custo_cereal": rng.integers(1, 5, 30), "custo_carne": rng.integers(1, 8, 30),
+        "preco_amgs": rng.integers(5, 40, 30), "preco_re": rng.integers(5, 40, 30),
+        "consumo_amgs_cereal": rng.integers(0, 4, 30), "consumo_amgs_carne": rng.integers(1, 4, 30),
+        "consumo_re_cereal": rng.integers(1, 4, 30), "consumo_re_carne": rng.integers(0, 4, 30),
+        "disponibilidade_cereal": rng.integers(0, 60, 30), "disponibilidade_carne": rng.integers(0, 60, 30),
+    }
+    varredura = varrer_problema_racao(**parametros)
+    for i in range(30):
+        mip = resolver_problema_racao(**{nome: float(valores[i]) for nome, valores in parametros.items()})
+        assert varredura["status"][i] == mip["status"] == "Optimal"
+        assert varredura["lucro_total"][i] == pytest.approx(mip["lucro_total"] or 0.0)
+        consumo_cereal = parametros["consumo_amgs_cereal"][i] * varredura["quantidade_amgs"][i] + parametros["consumo_re_cereal"][i] * varredura["quantidade_re"][i]
+        assert consumo_cereal <= parametros["disponibilidade_cereal"][i]
+
+
+# Cada cenário enumera a sua ração de menor faixa, só até o próprio limite: cenários com a faixa grande em rações
+# diferentes não fazem a enumeração percorrer a faixa grande
+def test_limite_por_cenario():
+    pequeno, grande = 1.0, 1e-4  # Consumo de cereal: 100 unidades ou 1 milhão de unidades com 100 de estoque
+    inicio = time.perf_counter()
+    resultado = varrer_problema_racao(1, 1, 10, 10, [pequeno, grande], 0, [grande, pequeno], 0, 100, 100)
+    assert time.perf_counter() - inicio < 5
+    assert resultado["quantidade_amgs"].tolist() == [0, 1e6] and resultado["quantidade_re"].tolist() == [1e6, 0]
+
+
+# Com estoques grandes a enumeração fica na janela em volta do vértice da relaxação: o tempo não cresce com os
+# estoques e o lucro continua igual ao do modelo inteiro (inclusive com o lucro paralelo a uma restrição)
+def test_estoques_grandes():
+    rng = np.random.default_rng(20)
+    preco_amgs, preco_re = np.meshgrid(np.arange(5.0, 45.0, 0.4), np.arange(5.0, 45.0, 0.4))  # Grade de 100 x 100
+    inicio = time.perf_counter()
+    for estoque in (1e4, 1e6, 1e9):
+        varrer_problema_racao(2, 3, preco_amgs, preco_re, 1, 2, 2, 1, estoque, estoque)
+    assert time.perf_counter() - inicio < 5
+    parametros = {
+        "custo_cereal": rng.integers(1, 5, 10), "custo_carne": rng.integers(1, 8, 10),
+        "preco_amgs": rng.integers(5, 40, 10), "preco_re": rng.integers(5, 40, 10),
+        "consumo_amgs_cereal": rng.integers(0, 4, 10), "consumo_amgs_carne": rng.integers(1, 4, 10),
+        "consumo_re_cereal": rng.integers(1, 4, 10), "consumo_re_carne": rng.integers(0, 4, 10),
+        "disponibilidade_cereal": rng.integers(0, 10**6, 10), "disponibilidade_carne": rng.integers(0, 10**6, 10),
+    }
+    varredura = varrer_problema_racao(**parametros)
+    for i in range(10):
+        mip = resolver_problema_racao(**{nome: float(valores[i]) for nome, valores in parametros.items()})
+        assert varredura["lucro_total"][i] == pytest.approx(mip["lucro_total"] or 0.0)
+    paralelo = varrer_problema_racao(1, 1, 3, 6, 1, 0, 2, 0, 1e6 + 1, 0)  # Lucro por unidade de cereal igual nas duas
+    assert paralelo["lucro_total"] == 2e6 + 2
@@ -0,0 +1,65 @@
+# Testes do simplex denso (src/simplex.py) contra o CBC, pelo caminho de src/matricial.py
+import time
+import numpy as np
+import pytest
+from src import matricial, solver, simplex
+
+
+# Modelo aleatório pequeno com variáveis limitadas (o CBC 2.10.3 erra alguns modelos ilimitados ou com inteiras livres)
+def _modelo_aleatorio(rng, inteiras):
+    n, m = int(rng.integers(2, 12)), int(rng.integers(1, 10))
+    return dict(c=rng.integers(-9, 10, n).astype(float), A=rng.integers(-3, 8, (m, n)).astype(float),
+                b=rng.integers(-5, 40, m).astype(float), sentidos=list(rng.choice(['<=', '>=', '='], m, p=[.6, .3, .1])),
+                limites_superiores=rng.integers(1, 10, n).astype(float),
+                inteiras=np.flatnonzero(rng.random(n) < 0.5) if inteiras else None, maximizar=bool(rng.random() < .5))
+
+
+# Resolve com o simplex denso (limite_denso=50) e com o CBC (limite_denso=0)
+def _denso_e_cbc(modelo):
+    with solver.usando_solver(limite_denso=50):
+        denso = matricial.resolver_matricial(**modelo)
+    with solver.usando_solver(limite_denso=0):
+        cbc = matricial.resolver_matricial(**modelo)
+    return denso, cbc
+
+
+@pytest.mark.parametrize("inteiras", [False, True])
+def test_simplex_denso_igual_ao_cbc(inteiras):
+    rng = np.random.default_rng(23 + inteiras)
+    for _ in range(60):
+        modelo = _modelo_aleatorio(rng, inteiras)
+        denso, cbc = _denso_e_cbc(modelo)
+        assert denso["status"] == cbc["status"]
+        if cbc["status"] == "Optimal":
+            assert denso["objetivo"] == pytest.approx(cbc["objetivo"], rel=1e-6, abs=1e-6)
+            x = denso["x"]
+            assert np.all(x >= -1e-7) and np.all(x <= modelo["limites_superiores"] + 1e-7)
+            if modelo["inteiras"] is not None:
+                assert np.allclose(x[modelo["inteiras"]], np.round(x[modelo["inteiras"]]))
+
+
+# Duais de um LP conferem com as condições de otimalidade: custos reduzidos = c - A^T y
+def test_duais_e_custos_reduzidos():
+    c, A, b = np.array([3.0, 2.0, 4.0]), np.array([[1.0, 1.0, 2.0], [2.0, 0.0, 3.0]]), np.array([4.0, 5.0])
+    with solver.usando_solver(limite_denso=50):
+        r = matricial.resolver_matricial(c, A, b, sentidos='>=')
+    assert r["status"] == "Optimal"
+    assert np.allclose(r["custos_reduzidos"], c - A.T @ r["duais"])
+    assert r["objetivo"] == pytest.approx(b @ r["duais"])
+
+
+# MIP binário 40 x 30 com muitos nós: o branch-and-bound denso desiste cedo e o CBC resolve
+def test_mip_dificil_vai_para_o_cbc():
+    rng = np.random.default_rng(5)
+    A = rng.integers(1, 30, (30, 40)).astype(float)
+    modelo = dict(c=-rng.integers(5, 40, 40).astype(float), A=A, b=A.sum(axis=1) / 2, limites_superiores=1,
+                  inteiras=np.arange(40))
+    inicio = time.perf_counter()
+    with solver.usando_solver(limite_denso=50):
+        denso = matricial.resolver_matricial(**modelo)
+    assert time.perf_counter() - inicio < 10
+    with solver.usando_solver(limite_denso=0):
+        cbc = matricial.resolver_matricial(**modelo)
+    assert denso["objetivo"] == pytest.approx(cbc["objetivo"])
+    assert simplex.resolver_denso(modelo["c"], A, modelo["b"], np.full(30, 'L'), np.zeros(40), np.ones(40),
+                                  np.ones(40, dtype=bool)) is None
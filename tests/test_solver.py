@@ -0,0 +1,49 @@
+# Testes de src/solver.py
+import asyncio
+import threading
+from src import solver
+
+
+# Um bloco usando_solver numa thread não muda a configuração vista pelas outras
+def test_usando_solver_por_thread():
+    dentro, liberar, vistos = threading.Event(), threading.Event(), []
+
+    def ajustar():
+        with solver.usando_solver(limite_tempo=5):
+            dentro.set()
+            liberar.wait(10)
+            vistos.append(solver.obter_configuracao()["limite_tempo"])
+
+    thread = threading.Thread(target=ajustar)
+    thread.start()
+    dentro.wait(10)
+    vistos.append(solver.obter_configuracao()["limite_tempo"])
+    liberar.set()
+    thread.join()
+    assert vistos == [None, 5.0]
+
+
+# Tarefas asyncio concorrentes mantêm cada uma o seu ajuste, mesmo se alternando no mesmo laço
+def test_usando_solver_por_tarefa():
+    async def tarefa(limite):
+        with solver.usando_solver(limite_tempo=limite):
+            await asyncio.sleep(0.01)
+            solver.configurar_solver(threads=int(limite))
+            await asyncio.sleep(0.01)
+            configuracao = solver.obter_configuracao()
+            return configuracao["limite_tempo"], configuracao["threads"]
+
+    async def principal():
+        return await asyncio.gather(tarefa(1), tarefa(2), tarefa(3))
+
+    assert asyncio.run(principal()) == [(1.0, 1), (2.0, 2), (3.0, 3)]
+    assert solver.obter_configuracao()["limite_tempo"] is None and solver.obter_configuracao()["threads"] is None
+
+
+# configurar_solver dentro de um bloco usando_solver vale só até o fim do bloco
+def test_configurar_dentro_do_bloco():
+    with solver.usando_solver(gap_relativo=0.1):
+        solver.configurar_solver(presolve=False)
+        assert solver.obter_configuracao()["presolve"] is False
+    assert solver.obter_configuracao()["presolve"] is None
+    assert solver.obter_configuracao()["gap_relativo"] is None
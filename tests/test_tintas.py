@@ -0,0 +1,102 @@
+# Testes de src/problema_04_tintas.py: modelo geral de mistura contra o modelo montado no PuLP
+import numpy as np
+import pulp
+import pytest
+from src import solver
+from src.problema_04_tintas import (resolver_mistura, resolver_cenarios_mistura, resolver_problema_tintas,
+                                    PRODUTOS_TINTAS, TINTAS, EXIGENCIAS_PADRAO)
+
+
+# Função auxiliar com o modelo de mistura escrito variável por variável (None se inviável)
+def _custo_pulp(custos, composicao, minimos, demandas, maximos=None):
+    problema = pulp.LpProblem("Mistura", pulp.LpMinimize)
+    x = {(p, t): pulp.LpVariable(f"x_{p}_{t}", lowBound=0) for p in range(len(custos)) for t in range(len(demandas))}
+    problema += pulp.lpSum(custos[p] * x[p, t] for p, t in x)
+    for t, demanda in enumerate(demandas):
+        problema += pulp.lpSum(x[p, t] for p in range(len(custos))) == demanda
+        for a in range(composicao.shape[1]):
+            teor = pulp.lpSum(composicao[p, a] * x[p, t] for p in range(len(custos)))
+            if np.isfinite(minimos[t, a]):
+                problema += teor >= minimos[t, a] * demanda
+            if maximos is not None and np.isfinite(maximos[t, a]):
+                problema += teor <= maximos[t, a] * demanda
+    problema.solve(pulp.PULP_CBC_CMD(msg=False))
+    if pulp.LpStatus[problema.status] != "Optimal":
+        return None
+    return pulp.value(problema.objective) or 0.0
+
+
+# Função auxiliar que sorteia produtos, atributos e teores (alguns sem mínimo ou sem máximo)
+def _instancia(rng):
+    produtos, atributos, tintas = int(rng.integers(2, 7)), int(rng.integers(1, 4)), int(rng.integers(1, 4))
+    custos = rng.integers(1, 30, produtos).astype(float)
+    composicao = rng.uniform(0, 1, (produtos, atributos)).round(2)
+    minimos = rng.uniform(0, 0.6, (tintas, atributos)).round(2)
+    minimos[rng.random(minimos.shape) < 0.3] = -np.inf
+    maximos = minimos + rng.uniform(0.1, 0.5, minimos.shape).round(2)
+    maximos[~np.isfinite(maximos) | (rng.random(maximos.shape) < 0.5)] = np.inf
+    demandas = rng.integers(0, 50, tintas).astype(float)
+    return custos, composicao, minimos, demandas, maximos
+
+
+# O modelo em matrizes tem o custo do modelo do PuLP (e a mesma conclusão sobre a viabilidade), pelo CBC e pelo simplex denso
+@pytest.mark.parametrize("limite_denso", [0, 50])
+def test_mistura_igual_ao_pulp(limite_denso):
+    rng = np.random.default_rng(21)
+    with solver.usando_solver(limite_denso=limite_denso):
+        for _ in range(25):
+            custos, composicao, minimos, demandas, maximos = _instancia(rng)
+            esperado = _custo_pulp(custos, composicao, minimos, demandas, maximos)
+            resultado = resolver_mistura(custos, composicao, minimos, demandas, maximos)
+            if esperado is None:
+                assert resultado["status"] == "Infeasible"
+                continue
+            assert resultado["status"] == "Optimal"
+            assert (resultado["custo_total"] or 0.0) == pytest.approx(esperado, rel=1e-6, abs=1e-6)
+            quantidades = resultado["quantidades"]
+            assert quantidades.shape == (custos.size, demandas.size)
+            assert quantidades.sum(axis=0) == pytest.approx(demandas, abs=1e-6)
+            assert np.all(composicao.T @ quantidades >= np.nan_to_num(minimos.T, neginf=0) * demandas - 1e-6)
+
+
+# Cada cenário em lote tem o custo e a viabilidade do modelo do PuLP com a sua demanda
+def test_cenarios_iguais_ao_pulp():
+    rng = np.random.default_rng(210)
+    for _ in range(10):
+        custos, composicao, minimos, _, maximos = _instancia(rng)
+        cenarios = rng.integers(0, 50, (6, minimos.shape[0])).astype(float)
+        cenarios[0] = 0  # Cenário sem demanda: sempre viável, custo zero
+        resultados = resolver_cenarios_mistura(custos, composicao, minimos, cenarios, maximos)
+        assert len(resultados) == len(cenarios)
+        for demandas, resultado in zip(cenarios, resultados):
+            esperado = _custo_pulp(custos, composicao, minimos, demandas, maximos)
+            if esperado is None:
+                assert resultado["status"] == "Infeasible" and resultado["quantidades"] is None
+            else:
+                assert resultado["status"] == "Optimal"
+                assert resultado["custo_total"] == pytest.approx(esperado, rel=1e-6, abs=1e-6)
+
+
+# Demandas negativas ou infinitas são recusadas
+def test_cenarios_recusam_demanda_invalida():
+    with pytest.raises(ValueError):
+        resolver_cenarios_mistura([1, 2], [[0.5], [0.2]], [[0.3]], [[-1.0]])
+
+
+# O problema do enunciado dá o custo do modelo do PuLP com os mesmos dados
+def test_problema_tintas_igual_ao_pulp():
+    rng = np.random.default_rng(2021)
+    for _ in range(10):
+        custos = {p: float(rng.integers(1, 30)) for p in PRODUTOS_TINTAS}
+        sec = {p: round(float(rng.uniform(0, 1)), 2) for p in PRODUTOS_TINTAS}
+        cor = {p: round(float(rng.uniform(0, 1)), 2) for p in PRODUTOS_TINTAS}
+        demanda_sr, demanda_sn = (float(v) for v in rng.integers(1, 50, 2))
+        resultado = resolver_problema_tintas(custos, sec, cor, demanda_sr, demanda_sn)
+        esperado = _custo_pulp([custos[p] for p in PRODUTOS_TINTAS], np.array([[sec[p], cor[p]] for p in PRODUTOS_TINTAS]),
+                               np.array([EXIGENCIAS_PADRAO[t] for t in TINTAS]), [demanda_sr, demanda_sn])
+        if esperado is None:
+            assert resultado["status"] == "Infeasible"
+        else:
+            assert resultado["status"] == "Optimal"
+            assert resultado["custo_total"] == pytest.approx(esperado, rel=1e-6, abs=1e-6)
+            assert set(resultado["quantidades"]) == {(p, t) for p in PRODUTOS_TINTAS for t in TINTAS}
@@ -0,0 +1,72 @@
+# Testes de src/problema_05_transporte.py: simplex de transporte contra o modelo linear no CBC
+import numpy as np
+import pytest
+from src import instrumentacao
+from src.problema_05_transporte import resolver_problema_transporte, resolver_transporte_simplex
+
+
+# Função auxiliar que sorteia uma instância com oferta total maior ou igual à demanda total
+def _instancia(rng, custo_minimo=0):
+    m, n = int(rng.integers(1, 6)), int(rng.integers(1, 6))
+    demandas = {f"d{j}": int(v) for j, v in enumerate(rng.integers(0, 30, n))}
+    ofertas = {f"f{i}": int(v) for i, v in enumerate(rng.integers(0, 30, m))}
+    ofertas["f0"] += max(0, sum(demandas.values()) - sum(ofertas.values()))
+    custos = {f: {d: int(rng.integers(custo_minimo, 20)) for d in demandas} for f in ofertas}
+    return custos, ofertas, demandas
+
+
+# Com custos não negativos, o simplex de transporte e o modelo linear chegam ao mesmo custo
+def test_simplex_igual_ao_lp():
+    rng = np.random.default_rng(8)
+    for _ in range(40):
+        custos, ofertas, demandas = _instancia(rng)
+        simplex = resolver_problema_transporte(custos, ofertas, demandas)
+        lp = resolver_problema_transporte(custos, ofertas, demandas, metodo='lp')
+        assert simplex["status"] == lp["status"] == "Optimal"
+        assert simplex["custo_total"] == pytest.approx(lp["custo_total"] or 0.0)
+
+
+# Com custos negativos o método padrão usa o modelo linear, que pode mandar mais que a demanda
+def test_custos_negativos_usam_lp():
+    rng = np.random.default_rng(80)
+    for _ in range(40):
+        custos, ofertas, demandas = _instancia(rng, custo_minimo=-10)
+        custos["f0"]["d0"] = -5  # Pelo menos um custo negativo
+        eventos = []
+        with instrumentacao.observando(eventos.append):
+            padrao = resolver_problema_transporte(custos, ofertas, demandas)
+        lp = resolver_problema_transporte(custos, ofertas, demandas, metodo='lp')
+        assert padrao["status"] == lp["status"] == "Optimal"
+        assert padrao["custo_total"] == pytest.approx(lp["custo_total"] or 0.0)
+        assert eventos[-1]["metodo"] == 'lp'
+
+
+# O simplex de transporte chamado direto recusa custos negativos em vez de exigir a demanda exata
+def test_simplex_recusa_custos_negativos():
+    with pytest.raises(ValueError):
+        resolver_transporte_simplex(np.array([[1.0, -2.0]]), [10], [3, 4])
+
+
+# Instâncias médias (árvores da base mais profundas, vários blocos de preços): mesmo custo do modelo linear,
+# quantidades que respeitam ofertas e demandas e formato esparso igual ao denso
+def test_simplex_instancias_medias():
+    rng = np.random.default_rng(88)
+    for _ in range(6):
+        m, n = int(rng.integers(20, 70)), int(rng.integers(20, 70))
+        custos = rng.integers(0, 100, (m, n)).astype(float)
+        demandas = rng.integers(0, 50, n).astype(float)
+        ofertas = rng.integers(0, 50, m).astype(float)
+        ofertas[0] += max(0.0, demandas.sum() - ofertas.sum())
+        simplex = resolver_transporte_simplex(custos, ofertas, demandas)
+        lp = resolver_problema_transporte({f"f{i}": {f"d{j}": custos[i, j] for j in range(n)} for i in range(m)},
+                                          {f"f{i}": ofertas[i] for i in range(m)}, {f"d{j}": demandas[j] for j in range(n)}, metodo='lp')
+        assert simplex["status"] == lp["status"] == "Optimal"
+        assert simplex["custo_total"] == pytest.approx(lp["custo_total"] or 0.0)
+        quantidades = simplex["quantidades"]
+        assert np.all(quantidades >= -1e-9)
+        assert quantidades.sum(axis=0) == pytest.approx(demandas)
+        assert np.all(quantidades.sum(axis=1) <= ofertas + 1e-9)
+        esparso = resolver_transporte_simplex(custos, ofertas, demandas, formato='esparso')["quantidades"]
+        densa = np.zeros((m, n))
+        densa[esparso["linhas"], esparso["colunas"]] = esparso["valores"]
+        assert np.array_equal(densa, quantidades)